@@ -17,7 +17,8 @@ from __future__ import annotations
 import typing
 
 from olc.core.action import Action
-from olc.define import MAX_CHANNELS, is_int, is_non_nul_int
+from olc.define import is_int, is_non_nul_int
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from olc.core.app import CoreApplication
@@ -47,7 +48,7 @@ class SetChannelLevelAction(Action):
         """Configure the action with the target channel and level.
 
         Args:
-            channel: The 1-indexed channel number (1 to MAX_CHANNELS).
+            channel: The 1-indexed channel number (1 to LAYOUT.max_channels).
             level: The DMX intensity (0 to 255, or -1 to release override).
         """
         self.channel = channel
@@ -59,9 +60,10 @@ class SetChannelLevelAction(Action):
         level = self.level
 
         # Validate channel and level bounds
-        if not 1 <= channel <= MAX_CHANNELS:
+        if not 1 <= channel <= LAYOUT.max_channels:
             raise ValueError(
-                f"Channel index must be between 1 and {MAX_CHANNELS}. Got {channel}."
+                f"Channel index must be between 1 and {LAYOUT.max_channels}. "
+                f"Got {channel}."
             )
         if not -1 <= level <= 255:
             raise ValueError(f"DMX Level must be between -1 and 255. Got {level}.")
@@ -133,7 +135,7 @@ class SelectActiveChannelAction(Action):
         cmd_string = self.app.commandline.get_string()
         if is_non_nul_int(cmd_string):
             channel = int(cmd_string)
-            if 1 <= channel <= MAX_CHANNELS:
+            if 1 <= channel <= LAYOUT.max_channels:
                 self.new_selection = [channel]
                 self.new_last_selected = channel
             else:
@@ -186,7 +188,7 @@ class SelectThruChannelAction(Action):
 
             self.new_selection = list(self.old_selection)
             for ch in range(low, high + 1):
-                if 1 <= ch <= MAX_CHANNELS and ch not in self.new_selection:
+                if 1 <= ch <= LAYOUT.max_channels and ch not in self.new_selection:
                     self.new_selection.append(ch)
             self.new_last_selected = to_chan
         else:
@@ -230,7 +232,7 @@ class SelectAddChannelAction(Action):
         cmd_string = self.app.commandline.get_string()
         if is_non_nul_int(cmd_string):
             channel = int(cmd_string)
-            if 1 <= channel <= MAX_CHANNELS:
+            if 1 <= channel <= LAYOUT.max_channels:
                 self.new_selection = list(self.old_selection)
                 if channel not in self.new_selection:
                     self.new_selection.append(channel)
@@ -279,7 +281,7 @@ class SelectRemoveChannelAction(Action):
         cmd_string = self.app.commandline.get_string()
         if is_non_nul_int(cmd_string):
             channel = int(cmd_string)
-            if 1 <= channel <= MAX_CHANNELS:
+            if 1 <= channel <= LAYOUT.max_channels:
                 self.new_selection = list(self.old_selection)
                 if channel in self.new_selection:
                     self.new_selection.remove(channel)
@@ -328,7 +330,7 @@ class SelectAllChannelsAction(Action):
         backend = getattr(self.app, "backend", None)
         selected = []
         if backend and backend.dmx:
-            for ch in range(1, MAX_CHANNELS + 1):
+            for ch in range(1, LAYOUT.max_channels + 1):
                 level = int(backend.dmx.levels["user"][ch - 1])
                 if level > 0:
                     selected.append(ch)
@@ -675,7 +677,7 @@ class SetMultiChannelsLevelAction(Action):
         backend = getattr(self.app, "backend", None)
         if backend and backend.dmx:
             for channel, level in self.levels.items():
-                if 1 <= channel <= MAX_CHANNELS:
+                if 1 <= channel <= LAYOUT.max_channels:
                     self.old_levels[channel] = int(
                         backend.dmx.levels["user"][channel - 1]
                     )
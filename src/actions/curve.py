@@ -158,10 +158,9 @@ class CurveDeleteAction(Action):
 
             # Restore output links
             for univ, output in self.saved_outputs:
-                if univ in patch.outputs and output in patch.outputs[univ]:
-                    patch.outputs[univ][output][1] = self.curve_nb
+                if patch.get_output(output, univ) is not None:
+                    patch.set_curve(output, univ, self.curve_nb)
 
-            patch.invalidate_cache()
             self.app.lightshow.set_modified()
             self.app.emit("curve.changed", self.curve_nb)
 
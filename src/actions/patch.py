@@ -58,9 +58,8 @@ class PatchAddOutputAction(Action):
         patch = self.app.lightshow.patch
 
         # Save previous state of this output
-        if self.univ in patch.outputs and self.output in patch.outputs[self.univ]:
-            self.old_channel = patch.outputs[self.univ][self.output][0]
-            self.old_curve = patch.outputs[self.univ][self.output][1]
+        if (patched := patch.get_output(self.output, self.univ)) is not None:
+            self.old_channel, self.old_curve = patched
         else:
             self.old_channel = None
             self.old_curve = 0
@@ -118,9 +117,8 @@ class PatchUnpatchOutputAction(Action):
     def execute(self) -> None:
         """Execute the action, unpatching the configured output."""
         patch = self.app.lightshow.patch
-        if self.univ in patch.outputs and self.output in patch.outputs[self.univ]:
-            self.old_channel = patch.outputs[self.univ][self.output][0]
-            self.old_curve = patch.outputs[self.univ][self.output][1]
+        if (patched := patch.get_output(self.output, self.univ)) is not None:
+            self.old_channel, self.old_curve = patched
         else:
             self.old_channel = None
             self.old_curve = 0
@@ -256,10 +254,9 @@ class PatchSetOutputCurveAction(Action):
     def execute(self) -> None:
         """Execute the action, assigning the configured curve to the output."""
         patch = self.app.lightshow.patch
-        if self.univ in patch.outputs and self.output in patch.outputs[self.univ]:
-            self.old_curve = patch.outputs[self.univ][self.output][1]
-            patch.outputs[self.univ][self.output][1] = self.curve
-            patch.invalidate_cache()
+        if (patched := patch.get_output(self.output, self.univ)) is not None:
+            self.old_curve = patched[1]
+            patch.set_curve(self.output, self.univ, self.curve)
         else:
             raise ValueError(
                 f"Output {self.output} in universe {self.univ} is not patched."
@@ -270,17 +267,15 @@ class PatchSetOutputCurveAction(Action):
 
     def undo(self) -> None:
         patch = self.app.lightshow.patch
-        if self.univ in patch.outputs and self.output in patch.outputs[self.univ]:
-            patch.outputs[self.univ][self.output][1] = self.old_curve
-            patch.invalidate_cache()
+        if patch.get_output(self.output, self.univ) is not None:
+            patch.set_curve(self.output, self.univ, self.old_curve)
             self.app.lightshow.set_modified()
             self.app.emit("patch.changed")
 
     def redo(self) -> None:
         patch = self.app.lightshow.patch
-        if self.univ in patch.outputs and self.output in patch.outputs[self.univ]:
-            patch.outputs[self.univ][self.output][1] = self.curve
-            patch.invalidate_cache()
+        if patch.get_output(self.output, self.univ) is not None:
+            patch.set_curve(self.output, self.univ, self.curve)
             self.app.lightshow.set_modified()
             self.app.emit("patch.changed")
 
@@ -70,8 +70,8 @@ class PauseAction(Action):
         """Provides feedback state of the PAUSE state."""
         main_playback = self.app.lightshow.main_playback
         is_paused = False
-        if main_playback and main_playback.on_go and main_playback.thread:
-            is_paused = not main_playback.thread.pause.is_set()
+        if main_playback and main_playback.on_go and main_playback.transition:
+            is_paused = not main_playback.transition.pause.is_set()
         return {
             "active": is_paused,
             "label": "PAUSE",
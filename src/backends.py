@@ -55,8 +55,15 @@ class DMXBackend:
         if lightshow.app is not None and hasattr(lightshow.app.engine, "notify_enttec"):
             lightshow.app.engine.notify_enttec = self.notify_enttec
 
+        # Transitions advance on the engine output frames
+        self._engine = lightshow.app.engine if lightshow.app is not None else None
+        if self._engine is not None:
+            self._engine.add_tick_callback(self.dmx.fades.tick)
+
     def stop(self) -> None:
         """Stop backend"""
+        if self._engine is not None:
+            self._engine.remove_tick_callback(self.dmx.fades.tick)
         self.dmx.thread.stop()
 
     def notify_artnet(
@@ -14,7 +14,6 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-import threading
 import typing
 
 from olc.actions import register_all_actions
@@ -26,10 +25,12 @@ from olc.core.lightshow import LightShow
 from olc.core.registry import ActionRegistry
 from olc.core.selection import SelectionManager
 from olc.core.tabs import CoreTabs
+from olc.timer import SCHEDULER, Job
 
 if typing.TYPE_CHECKING:
     from olc.backends import DMXBackend
     from olc.core.engine import CoreEngine
+    from olc.core.journal import Journal
     from olc.midi import Midi
 
 
@@ -43,6 +44,7 @@ class CoreApplication(EventDispatcher):
 
     backend: typing.Optional[DMXBackend]
     engine: typing.Optional[CoreEngine]
+    journal: typing.Optional[Journal]
     midi: typing.Optional[Midi]
     crossfade: typing.Optional[CrossFade]
     commandline: CoreCommandLine
@@ -85,6 +87,8 @@ class CoreApplication(EventDispatcher):
         self.backend = None
         self.engine = None
         self.midi = None
+        # Journal of the show edits (attached by launcher or Gtk)
+        self.journal = None
 
         # For crossfade
         app_delegate = app if app is not None else self
@@ -110,7 +114,7 @@ class CoreApplication(EventDispatcher):
         self.tabs: CoreTabs = CoreTabs(typing.cast(typing.Any, self))
         self._is_zooming: bool = False
         self._zoom_start_level: float = 1.0
-        self._zoom_timer: typing.Optional[threading.Timer] = None
+        self._zoom_timer: typing.Optional[Job] = None
 
         # Auto-register action classes from the actions package
         self._register_actions()
@@ -190,8 +194,7 @@ class CoreApplication(EventDispatcher):
         if self._zoom_timer is not None:
             self._zoom_timer.cancel()
 
-        self._zoom_timer = threading.Timer(0.6, self._finalize_zoom)
-        self._zoom_timer.start()
+        self._zoom_timer = SCHEDULER.call_later(0.6, self._finalize_zoom)
 
     def _finalize_zoom(self) -> None:
         """Callback to finalize continuous zoom by executing Core Action."""
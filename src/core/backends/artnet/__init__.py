@@ -18,6 +18,7 @@ import asyncio
 import typing
 from typing import Callable
 
+import numpy as np
 from olc.core.backends.artnet.artnet import Discovery, Listeners, Sender
 from olc.core.backends.artnet.network import Network
 from olc.core.backends.artnet.protocol import PORT, OpCodes, get_opcode
@@ -36,7 +37,7 @@ class ArtNetManager:  # pylint: disable=too-many-instance-attributes
     def __init__(
         self,
         universe_map: UniverseMap,
-        on_dmx_received: Callable[[int, list[int]], None] | None = None,
+        on_dmx_received: Callable[[int, np.ndarray, np.ndarray], None] | None = None,
         notify: Callable | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
@@ -99,9 +100,11 @@ class ArtNetManager:  # pylint: disable=too-many-instance-attributes
         packet = b"Art-Net\x00" + b"\x00\x52" + b"\x00\x0e" + b"\x00\x00"
         self.network.send_broadcast(packet)
 
-    def _handle_incoming_dmx(self, universe: int, data: list[int]) -> None:
+    def _handle_incoming_dmx(
+        self, universe: int, data: np.ndarray, changed: np.ndarray
+    ) -> None:
         if self.on_dmx_received:
-            self.on_dmx_received(universe, data)
+            self.on_dmx_received(universe, data, changed)
 
     def _node_changed_callback(
         self, action: str, *args: object, **kwargs: object
@@ -581,7 +581,7 @@ class Listeners:
             except (ArtNetDecodeError, ArtNetSequenceError):
                 return
 
-            self.merger.update(artdmx.universe, addr[0], artdmx.data)
+            self.merger.update(artdmx.universe, addr[0], artdmx.view)
 
 
 class Artnet:
@@ -638,7 +638,7 @@ class Artnet:
         """Send Art-Net universe to nodes.
 
         Args:
-            universe: one in UNIVERSES
+            universe: one in LAYOUT.universes
             packet: DMX data
         """
         if self.senders.get(universe, None):
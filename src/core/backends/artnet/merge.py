@@ -16,6 +16,9 @@ import time
 from enum import Enum, auto
 from typing import Callable
 
+import numpy as np
+from olc.core.universe_data import NUM_CHANNELS
+
 
 class MergeMode(Enum):
     """Art-Net DMX Merge Modes"""
@@ -24,90 +27,131 @@ class MergeMode(Enum):
     LTP = auto()  # Latest Takes Precedence
 
 
+# Art-Net merges at most two sources per universe
+MAX_SOURCES = 2
+
+
+class UniverseSources:  # pylint: disable=too-many-instance-attributes
+    """Sources of an Art-Net universe, in a preallocated (2, 512) matrix.
+
+    `sources` maps the IP address of each active source to its matrix row.
+    """
+
+    def __init__(self) -> None:
+        self.sources: dict[str, int] = {}
+        self.levels = np.zeros((MAX_SOURCES, NUM_CHANNELS), dtype=np.uint8)
+        self.last_seen = np.zeros(MAX_SOURCES, dtype=np.float64)
+        self.active = np.zeros(MAX_SOURCES, dtype=np.bool_)
+        self.ips: list[str | None] = [None] * MAX_SOURCES
+
+        # Merge work buffers, allocated once
+        self.next = np.zeros(NUM_CHANNELS, dtype=np.uint8)
+        self.output = np.zeros(NUM_CHANNELS, dtype=np.uint8)
+        self.changed = np.zeros(NUM_CHANNELS, dtype=np.bool_)
+
+    def expire(self, now: float, timeout: float) -> None:
+        """Release the sources silent for more than `timeout` seconds."""
+        for row in np.flatnonzero(self.active & (now - self.last_seen > timeout)):
+            self.release(int(row))
+
+    def release(self, row: int) -> None:
+        """Free a source matrix row."""
+        ip = self.ips[row]
+        if ip is not None:
+            self.sources.pop(ip, None)
+        self.ips[row] = None
+        self.active[row] = False
+        self.levels[row] = 0
+
+    def acquire(self, ip: str) -> int | None:
+        """Return the matrix row of a source, allocating it if needed.
+
+        Returns:
+            None if two other sources are active
+        """
+        row = self.sources.get(ip)
+        if row is None:
+            free = np.flatnonzero(~self.active)
+            if not free.size:
+                return None
+            row = int(free[0])
+            self.sources[ip] = row
+            self.ips[row] = ip
+            self.active[row] = True
+        return row
+
+
 # pylint: disable=too-few-public-methods
 class ArtDmxMerger:
-    """Manages merging of multiple ArtDmx sources per universe."""
+    """Manages merging of the two ArtDmx sources allowed per universe.
+
+    The callback receives (universe, output, changed), only when the merged
+    universe changes: `output` is the merged universe and `changed` a boolean
+    mask of the slots modified by this merge. Both arrays are owned by the
+    merger and are overwritten by the next merge.
+    """
 
     mode: MergeMode
     timeout: float
-    callback: Callable | None
-    buffers: dict[int, dict[str, tuple[list[int], float]]]
+    callback: Callable[[int, np.ndarray, np.ndarray], None] | None
+    buffers: dict[int, UniverseSources]
 
     def __init__(
         self,
         mode: MergeMode = MergeMode.HTP,
         timeout: float = 4.0,
-        callback: Callable | None = None,
+        callback: Callable[[int, np.ndarray, np.ndarray], None] | None = None,
     ) -> None:
         self.mode = mode
         self.timeout = timeout
         self.callback = callback
-        # Dictionary organized by: {universe: {source_ip: (dmx_data_list, timestamp)}}
+        # Sources of each universe
         self.buffers = {}
+        self.dropped_packets = 0
 
-    def update(self, universe: int, source_ip: str, data: list[int]) -> None:
+    def update(
+        self, universe: int, source_ip: str, data: np.ndarray | list[int]
+    ) -> None:
         """Update source data and trigger merging/callback."""
         now = time.time()
 
-        if universe not in self.buffers:
-            self.buffers[universe] = {}
-
-        sources = self.buffers[universe]
-
-        # Art-Net merge rules: Limit to exactly 2 sources.
-        if source_ip not in sources and len(sources) >= 2:
-            self._cleanup_timeouts(universe, now)
-            if len(self.buffers[universe]) >= 2:
-                # Still 2 active sources, drop this 3rd source packet totally
-                return
-
-        # Update the buffer for this IP
-        sources[source_ip] = (data, now)
+        if (sources := self.buffers.get(universe)) is None:
+            sources = self.buffers[universe] = UniverseSources()
 
         # Remove dead sources
-        self._cleanup_timeouts(universe, now)
+        sources.expire(now, self.timeout)
 
-        # Merge available active sources
-        merged_data = self._merge(universe)
+        # Art-Net merge rules: a 3rd source is dropped while 2 sources are active
+        row = sources.acquire(source_ip)
+        if row is None:
+            self.dropped_packets += 1
+            return
 
-        if self.callback:
-            self.callback(universe, merged_data)
+        length = min(len(data), NUM_CHANNELS)
+        sources.levels[row, :length] = data[:length]
+        sources.levels[row, length:] = 0
+        sources.last_seen[row] = now
 
-    def _cleanup_timeouts(self, universe: int, now: float) -> None:
-        """Remove sources that have not sent data for self.timeout seconds."""
-        if universe not in self.buffers:
-            return
-        sources = self.buffers[universe]
-        dead_sources = [
-            ip for ip, (_, ts) in sources.items() if (now - ts) > self.timeout
-        ]
-        for ip in dead_sources:
-            del sources[ip]
-
-    def _merge(self, universe: int) -> list[int]:
-        """Perform HTP or LTP merge."""
-        sources = self.buffers[universe]
-
-        # No sources (should not happen since we just updated one, but safe guard)
-        if not sources:
-            return [0] * 512
-
-        # 1 single active source
-        if len(sources) == 1:
-            return list(sources.values())[0][0]
-
-        # 2 active sources
-        s1, s2 = list(sources.values())
-        data1, ts1 = s1
-        data2, ts2 = s2
-
-        # Ensure both are length 512 using padding
-        d1 = data1 + [0] * (512 - len(data1))
-        d2 = data2 + [0] * (512 - len(data2))
+        self._merge(universe, sources)
 
+    def _merge(self, universe: int, sources: UniverseSources) -> None:
+        """Perform HTP or LTP merge, and emit the output if it changed."""
         if self.mode == MergeMode.HTP:
-            # HTP: Compare each channel and take the maximum
-            return [max(v1, v2) for v1, v2 in zip(d1, d2, strict=True)]
-
-        # LTP: The source which received data most recently wins completely
-        return d1 if ts1 > ts2 else d2
+            # HTP: highest level of the active sources for each channel
+            np.max(
+                sources.levels,
+                axis=0,
+                out=sources.next,
+                where=sources.active[:, None],
+                initial=0,
+            )
+        else:
+            # LTP: the source which received data most recently wins completely
+            stamps = np.where(sources.active, sources.last_seen, -np.inf)
+            np.copyto(sources.next, sources.levels[int(np.argmax(stamps))])
+
+        np.not_equal(sources.next, sources.output, out=sources.changed)
+        if sources.changed.any():
+            np.copyto(sources.output, sources.next)
+            if self.callback:
+                self.callback(universe, sources.output, sources.changed)
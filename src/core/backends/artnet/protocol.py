@@ -18,6 +18,8 @@ import typing
 from enum import IntEnum
 from struct import pack, unpack
 
+import numpy as np
+
 HEADER = b"Art-Net\x00"
 PORT = 6454  # 0x1936
 
@@ -265,7 +267,7 @@ class ArtDmx(ArtCommon):
 
     sequence: typing.Any
     universe: int
-    data: list[int]
+    view: np.ndarray
     tracker: PacketTracker
 
     def __init__(self) -> None:
@@ -274,9 +276,18 @@ class ArtDmx(ArtCommon):
         self.opcode = OpCodes.OP_DMX
         self.sequence = itertools.cycle(range(1, 256))
         self.universe = 0
-        self.data = []
+        # Read-only view on the DMX slots of the last decoded packet (no copy)
+        self.view = np.zeros(0, dtype=np.uint8)
+        self._data: list[int] | None = None
         self.tracker = PacketTracker(alert_threshold=10.0)
 
+    @property
+    def data(self) -> list[int]:
+        """DMX slots of the last decoded packet as a list (built on demand)."""
+        if self._data is None:
+            self._data = self.view.tolist()
+        return self._data
+
     def encode(self, universe: int, data: bytes) -> bytes:
         """Fill ArtDmx packet
 
@@ -322,11 +333,12 @@ class ArtDmx(ArtCommon):
 
         self.universe = net << 8 | subuni
         length = unpack(">H", packet[16:18])[0]
-        self.data = list(packet[18:])
-        if length != len(self.data):
+        self.view = np.frombuffer(packet, dtype=np.uint8, offset=18)
+        self._data = None
+        if length != len(self.view):
             raise ArtNetDecodeError(
                 f"ArtDmx package corrupted, wrong length: "
-                f"{len(self.data)} instead of {length}"
+                f"{len(self.view)} instead of {length}"
             )
 
 
@@ -23,10 +23,12 @@ import typing
 import uuid
 from typing import Callable
 
+import numpy as np
 from olc.core.backends.sacn.merge import SacnMerger
 from olc.core.backends.sacn.network import SacnNetwork
 from olc.core.backends.sacn.protocol import (
     DISCOVERY_UNIVERSE,
+    START_CODE_PER_ADDRESS_PRIORITY,
     SacnDecodeError,
     SacnDiscoveryPacket,
     SacnPacket,
@@ -49,7 +51,7 @@ class SacnManager:
     def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         universe_map: UniverseMap,
-        on_dmx_received: Callable[[int, list[int]], None] | None = None,
+        on_dmx_received: Callable[[int, np.ndarray, np.ndarray], None] | None = None,
         notify: Callable | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
         no_transmit: bool = False,
@@ -91,7 +93,7 @@ class SacnManager:
         self._last_discovery_universes: list[int] = []
 
         # Queue for pending synchronized DMX packets
-        self.pending_dmx: dict[bytes, dict[int, list[int]]] = {}
+        self.pending_dmx: dict[bytes, dict[int, np.ndarray]] = {}
         self.pending_timestamps: dict[bytes, float] = {}
         self.pending_ips: dict[bytes, str] = {}
         self._sync_sequences: dict[int, int] = {}
@@ -340,11 +342,20 @@ class SacnManager:
             universe = packet.universe
             merger = self.mergers.get(universe)
             if merger:
+                if packet.start_code == START_CODE_PER_ADDRESS_PRIORITY:
+                    # Per-address priorities are never synchronized
+                    merger.update_priorities(
+                        cid=packet.cid,
+                        name=packet.source_name,
+                        priority=packet.priority,
+                        data=packet.view,
+                        ip=ip,
+                    )
                 # If packet has a non-zero synchronization address, queue it
-                if packet.sync_address > 0:
+                elif packet.sync_address > 0:
                     if packet.cid not in self.pending_dmx:
                         self.pending_dmx[packet.cid] = {}
-                    self.pending_dmx[packet.cid][universe] = packet.data
+                    self.pending_dmx[packet.cid][universe] = packet.view
                     if packet.cid not in self.pending_timestamps:
                         self.pending_timestamps[packet.cid] = time.time()
                     self.pending_ips[packet.cid] = ip
@@ -354,7 +365,7 @@ class SacnManager:
                         cid=packet.cid,
                         name=packet.source_name,
                         priority=packet.priority,
-                        data=packet.data,
+                        data=packet.view,
                         stream_terminated=packet.stream_terminated,
                         ip=ip,
                     )
@@ -440,6 +451,8 @@ class SacnManager:
         except SacnDecodeError:
             return False
 
-    def _handle_incoming_dmx(self, universe: int, data: list[int]) -> None:
+    def _handle_incoming_dmx(
+        self, universe: int, data: np.ndarray, changed: np.ndarray
+    ) -> None:
         if self.on_dmx_received:
-            self.on_dmx_received(universe, data)
+            self.on_dmx_received(universe, data, changed)
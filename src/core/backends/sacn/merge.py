@@ -16,6 +16,12 @@ import time
 from enum import Enum, auto
 from typing import Callable
 
+import numpy as np
+from olc.core.universe_data import NUM_CHANNELS
+
+# Priority value used in the merge matrix for slots a source does not drive
+_NOT_SOURCED = -1
+
 
 # pylint: disable=too-few-public-methods,too-many-nested-blocks
 # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -31,32 +37,114 @@ class Source:
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
-        self, cid: bytes, name: str, priority: int, data: list[int], ip: str = ""
+        self,
+        cid: bytes,
+        name: str,
+        priority: int,
+        data: np.ndarray,
+        ip: str = "",
+        row: int = 0,
     ) -> None:
         self.cid = cid
         self.name = name
         self.priority = priority
-        self.data = list(data)
+        # View on the merger source matrix row (no copy)
+        self.data = data
         self.ip = ip
+        self.row = row
         self.last_seen = time.time()
+        # Per-address priority (start code 0xDD) received from this source
+        self.per_address_priority = False
+        self.per_address_last_seen = 0.0
+
+
+class SacnMerger:  # pylint: disable=too-many-instance-attributes
+    """E1.31 sACN Merging logic supporting priorities and HTP/LTP fallbacks.
 
+    Sources are stored in a preallocated (max_sources, 512) matrix. Each slot of
+    each source has an effective priority (the universe priority, or the
+    per-address priority sent with start code 0xDD), so the whole merge is a
+    reduction over the source axis.
 
-class SacnMerger:
-    """E1.31 sACN Merging logic supporting priorities and HTP/LTP fallbacks."""
+    The callback receives (universe, output, changed) where `output` is the merged
+    universe and `changed` a boolean mask of the slots modified by this merge.
+    Both arrays are owned by the merger and are overwritten by the next merge.
+    """
 
     def __init__(
         self,
         universe: int,
         mode: MergeMode = MergeMode.HTP,
         timeout: float = 2.5,
-        callback: Callable[[int, list[int]], None] | None = None,
+        callback: Callable[[int, np.ndarray, np.ndarray], None] | None = None,
+        max_sources: int = 16,
     ) -> None:
         self.universe = universe
         self.mode = mode
         self.timeout = timeout
         self.callback = callback
+        self.max_sources = max_sources
         self.sources: dict[bytes, Source] = {}
-        self._last_merged: list[int] = [0] * 512
+        self.dropped_packets = 0
+
+        self._levels = np.zeros((max_sources, NUM_CHANNELS), dtype=np.uint8)
+        self._priorities = np.full(
+            (max_sources, NUM_CHANNELS), _NOT_SOURCED, dtype=np.int16
+        )
+        self._last_seen = np.zeros(max_sources, dtype=np.float64)
+        self._active = np.zeros(max_sources, dtype=np.bool_)
+        self._rows: list[bytes | None] = [None] * max_sources
+
+        # Merge work buffers, allocated once
+        self._top = np.empty(NUM_CHANNELS, dtype=np.int16)
+        self._winners = np.empty((max_sources, NUM_CHANNELS), dtype=np.bool_)
+        self._next = np.zeros(NUM_CHANNELS, dtype=np.uint8)
+        self._output = np.zeros(NUM_CHANNELS, dtype=np.uint8)
+        self._changed = np.zeros(NUM_CHANNELS, dtype=np.bool_)
+        self._idx = np.arange(NUM_CHANNELS)
+
+    @property
+    def output(self) -> np.ndarray:
+        """Last merged universe."""
+        return self._output
+
+    def _get_source(self, cid: bytes, name: str, priority: int, ip: str) -> Source:
+        """Return the source for a CID, allocating a matrix row if needed.
+
+        Raises:
+            IndexError: all rows are used by active sources
+        """
+        src = self.sources.get(cid)
+        if src is None:
+            free = np.flatnonzero(~self._active)
+            if not free.size:
+                raise IndexError(f"Too many sACN sources on universe {self.universe}")
+            row = int(free[0])
+            self._levels[row] = 0
+            self._rows[row] = cid
+            self._active[row] = True
+            src = Source(cid, name, priority, self._levels[row], ip, row)
+            self._priorities[row] = priority
+            self.sources[cid] = src
+        src.name = name
+        src.ip = ip
+        if src.priority != priority:
+            src.priority = priority
+            if not src.per_address_priority:
+                self._priorities[src.row] = priority
+        src.last_seen = time.time()
+        self._last_seen[src.row] = src.last_seen
+        return src
+
+    def _release(self, row: int) -> None:
+        """Free a source matrix row."""
+        cid = self._rows[row]
+        if cid is not None:
+            self.sources.pop(cid, None)
+        self._rows[row] = None
+        self._active[row] = False
+        self._priorities[row] = _NOT_SOURCED
+        self._levels[row] = 0
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def update(
@@ -64,67 +152,90 @@ class SacnMerger:
         cid: bytes,
         name: str,
         priority: int,
-        data: list[int],
+        data: list[int] | np.ndarray,
         stream_terminated: bool = False,
         ip: str = "",
     ) -> None:
         """Update a source's DMX values and trigger a merge."""
         if stream_terminated:
             # Terminate this source immediately
-            self.sources.pop(cid, None)
+            src = self.sources.get(cid)
+            if src is not None:
+                self._release(src.row)
         else:
-            if cid in self.sources:
-                src = self.sources[cid]
-                src.name = name
-                src.priority = priority
-                src.data = list(data)
-                src.ip = ip
-                src.last_seen = time.time()
-            else:
-                self.sources[cid] = Source(cid, name, priority, data, ip)
+            try:
+                src = self._get_source(cid, name, priority, ip)
+            except IndexError:
+                self.dropped_packets += 1
+                return
+            length = min(len(data), NUM_CHANNELS)
+            src.data[:length] = data[:length]
+            src.data[length:] = 0
 
         self.merge()
 
+    def update_priorities(
+        self,
+        cid: bytes,
+        name: str,
+        priority: int,
+        data: list[int] | np.ndarray,
+        ip: str = "",
+    ) -> None:
+        """Update a source's per-address priorities (start code 0xDD).
+
+        A per-address priority of 0 means the source does not drive the slot.
+        """
+        try:
+            src = self._get_source(cid, name, priority, ip)
+        except IndexError:
+            self.dropped_packets += 1
+            return
+        length = min(len(data), NUM_CHANNELS)
+        row = self._priorities[src.row]
+        row[:length] = data[:length]
+        row[length:] = 0
+        row[row == 0] = _NOT_SOURCED
+        src.per_address_priority = True
+        src.per_address_last_seen = src.last_seen
+
+        self.merge()
+
+    def _expire(self, now: float) -> None:
+        """Release timed out sources and stale per-address priorities."""
+        expired = np.flatnonzero(self._active & (now - self._last_seen >= self.timeout))
+        for row in expired:
+            self._release(int(row))
+        for src in self.sources.values():
+            if (
+                src.per_address_priority
+                and now - src.per_address_last_seen >= self.timeout
+            ):
+                # Back to the universe priority
+                src.per_address_priority = False
+                self._priorities[src.row] = src.priority
+
     def merge(self) -> None:
         """Merge all active sources according to sACN priority rules."""
-        now = time.time()
-        # Filter active sources (not timed out)
-        active_sources = [
-            src for src in self.sources.values() if now - src.last_seen < self.timeout
-        ]
+        self._expire(time.time())
 
-        # Cleanup timed out sources
-        self.sources = {src.cid: src for src in active_sources}
+        # Highest priority per slot and sources sharing it
+        np.max(self._priorities, axis=0, out=self._top)
+        np.equal(self._priorities, self._top, out=self._winners)
+        self._winners &= self._top != _NOT_SOURCED
 
-        if not active_sources:
-            merged = [0] * 512
+        if self.mode == MergeMode.HTP:
+            # Highest Takes Precedence between the winning sources
+            np.max(self._levels, axis=0, out=self._next, where=self._winners, initial=0)
         else:
-            # Find the highest priority among all active sources
-            max_priority = max(src.priority for src in active_sources)
-            highest_sources = [
-                src for src in active_sources if src.priority == max_priority
-            ]
-
-            if len(highest_sources) == 1:
-                # Sole highest priority source wins completely
-                merged = list(highest_sources[0].data)
-            else:
-                # Merge multiple sources sharing the highest priority
-                merged = [0] * 512
-                if self.mode == MergeMode.HTP:
-                    # Highest Takes Precedence
-                    for src in highest_sources:
-                        for i in range(512):
-                            if src.data[i] > merged[i]:
-                                merged[i] = src.data[i]
-                else:
-                    # Latest Takes Precedence
-                    # Find the source with the most recent timestamp
-                    newest_src = max(highest_sources, key=lambda s: s.last_seen)
-                    merged = list(newest_src.data)
+            # Latest Takes Precedence: the most recent winning source
+            stamps = np.where(self._winners, self._last_seen[:, None], -np.inf)
+            self._next[:] = self._levels[np.argmax(stamps, axis=0), self._idx]
+            self._next[self._top == _NOT_SOURCED] = 0
 
         # Trigger callback if merged DMX data has changed
-        if merged != self._last_merged:
-            self._last_merged = list(merged)
+        np.not_equal(self._next, self._output, out=self._changed)
+        if self._changed.any():
+            np.copyto(self._output, self._next)
             if self.callback:
-                self.callback(self.universe, merged)
+                self.callback(self.universe, self._output, self._changed)
@@ -15,6 +15,8 @@
 import struct
 import uuid
 
+import numpy as np
+
 PORT = 5568
 PREAMBLE = b"\x00\x10\x00\x00ASC-E1.17\x00\x00\x00"
 
@@ -29,6 +31,10 @@ VECTOR_E131_EXTENDED_DISCOVERY = 0x00000002
 VECTOR_UNIVERSE_DISCOVERY_UNIVERSE_LIST = 0x00000001
 DISCOVERY_UNIVERSE = 64214
 
+# DMX512 start codes carried by data packets
+START_CODE_DMX = 0x00
+START_CODE_PER_ADDRESS_PRIORITY = 0xDD
+
 
 class SacnDecodeError(Exception):
     """Exception raised when an sACN packet is corrupted or malformed."""
@@ -50,34 +56,47 @@ class SacnPacket:
         stream_terminated: bool = False,
         preview_data: bool = False,
         sync_address: int = 0,
+        start_code: int = START_CODE_DMX,
     ) -> None:
         self.cid = cid if cid else uuid.uuid4().bytes
         self.source_name = source_name
         self.universe = universe
         self.priority = priority
         self.sequence = sequence
-        self.data = data if data is not None else [0] * 512
+        # Read-only view on the DMX slots of a decoded packet (no copy)
+        self.view = np.zeros(0, dtype=np.uint8)
+        self._data = data if data is not None else [0] * 512
         self.stream_terminated = stream_terminated
         self.preview_data = preview_data
         self.sync_address = sync_address
+        self.start_code = start_code
+
+    @property
+    def data(self) -> list[int]:
+        """DMX slots as a list (built on demand for decoded packets)."""
+        if self._data is None:
+            self._data = self.view.tolist()
+        return self._data
+
+    @data.setter
+    def data(self, value: list[int]) -> None:
+        self._data = value
 
     def encode(self) -> bytes:
         """Encode the sACN packet into raw bytes."""
         dmx_length = len(self.data) + 1  # Start code + DMX slots
 
         # 1. DMP Layer (10 bytes header + DMX slots + 1 start code)
-        dmp = (
-            struct.pack(
-                ">HBBHHH",
-                0x7000 | (dmx_length + 10),  # PDU length from octet 115 to end (§7.1)
-                0x02,  # DMP Vector (VECTOR_DMP_SET_PROPERTY)
-                0xA1,  # Address Type & Data Type
-                0x0000,  # First Property Address
-                0x0001,  # Address Increment
-                dmx_length,  # Property Value Count
-            )
-            + b"\x00"
-        )  # DMX Start Code (0x00)
+        dmp = struct.pack(
+            ">HBBHHHB",
+            0x7000 | (dmx_length + 10),  # PDU length from octet 115 to end (§7.1)
+            0x02,  # DMP Vector (VECTOR_DMP_SET_PROPERTY)
+            0xA1,  # Address Type & Data Type
+            0x0000,  # First Property Address
+            0x0001,  # Address Increment
+            dmx_length,  # Property Value Count
+            self.start_code,  # DMX Start Code (0x00 levels, 0xDD priorities)
+        )
 
         # 2. Framing Layer (77 bytes including flags/length)
         source_name_bytes = self.source_name.encode("utf-8").ljust(64, b"\x00")[:64]
@@ -167,19 +186,20 @@ class SacnPacket:
         # DMP value count (First Property address increment etc. is at 118-122)
         prop_val_count = struct.unpack(">H", packet[123:125])[0]
 
-        start_code = packet[125]
-        if start_code != 0x00:
-            raise SacnDecodeError(f"Unsupported DMX Start Code: {start_code}")
+        self.start_code = packet[125]
+        if self.start_code not in (START_CODE_DMX, START_CODE_PER_ADDRESS_PRIORITY):
+            raise SacnDecodeError(f"Unsupported DMX Start Code: {self.start_code}")
 
         # DMX data length is prop_val_count - 1 (since it includes start code)
         dmx_len = prop_val_count - 1
         expected_total = 126 + dmx_len
-        if len(packet) < expected_total:
+        if dmx_len < 0 or len(packet) < expected_total:
             raise SacnDecodeError(
                 f"Packet truncated: got {len(packet)} bytes, expected {expected_total}"
             )
 
-        self.data = list(packet[126 : 126 + dmx_len])
+        self.view = np.frombuffer(packet, dtype=np.uint8, count=dmx_len, offset=126)
+        self._data = None
 
 
 # pylint: disable=too-many-instance-attributes
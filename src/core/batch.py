@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Batched UDP transmission of a whole DMX frame with sendmmsg() (Linux)."""
+
+from __future__ import annotations
+
+import ctypes
+import socket
+import sys
+import typing
+
+import numpy as np
+from olc.core.senders import _artnet_socket, _sacn_socket
+
+if typing.TYPE_CHECKING:
+    from olc.core.senders import ArtNetSender, SACNSender
+    from olc.core.universe_data import DMXUniverse
+
+# Maximum number of messages accepted by one sendmmsg() call (UIO_MAXIOV)
+_MAX_BATCH = 1024
+
+
+class _IoVec(ctypes.Structure):  # pylint: disable=too-few-public-methods
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _SockAddrIn(ctypes.Structure):  # pylint: disable=too-few-public-methods
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_uint32),
+        ("sin_zero", ctypes.c_char * 8),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):  # pylint: disable=too-few-public-methods
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):  # pylint: disable=too-few-public-methods
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_sendmmsg() -> typing.Any:
+    """Return the libc sendmmsg() function, or None if not available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.c_void_p,
+        ctypes.c_uint,
+        ctypes.c_int,
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+_sendmmsg = _load_sendmmsg()
+HAS_SENDMMSG = _sendmmsg is not None
+
+
+class DatagramBatch:
+    """UDP datagrams sent together on one socket with sendmmsg().
+
+    Datagrams are described once by scatter/gather buffers which must keep the
+    same memory location (bytearray headers, DMXUniverse arrays): the kernel
+    message vector is compiled once and each flush sends their current content.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self._datagrams: list[tuple[list[bytearray | np.ndarray], tuple[str, int]]] = []
+        self._msgs: ctypes.Array | None = None
+        # Compiled message vector seen as rows of bytes, to gather subsets
+        self._rows = np.zeros((0, ctypes.sizeof(_MMsgHdr)), dtype=np.uint8)
+        # ctypes objects referenced by the compiled message vector
+        self._refs: list[object] = []
+
+    def __len__(self) -> int:
+        return len(self._datagrams)
+
+    def add(self, buffers: list[bytearray | np.ndarray], dest: tuple[str, int]) -> None:
+        """Append a datagram to the batch."""
+        self._datagrams.append((buffers, dest))
+        self._msgs = None
+
+    def clear(self) -> None:
+        """Remove all datagrams."""
+        self._datagrams.clear()
+        self._msgs = None
+        self._refs.clear()
+
+    def _compile(self) -> None:
+        """Build the mmsghdr vector pointing to the datagram buffers."""
+        count = len(self._datagrams)
+        msgs = (_MMsgHdr * count)()
+        addrs = (_SockAddrIn * count)()
+        self._refs = [addrs]
+        for i, (buffers, dest) in enumerate(self._datagrams):
+            iovs = (_IoVec * len(buffers))()
+            for j, buf in enumerate(buffers):
+                if isinstance(buf, np.ndarray):
+                    iovs[j].iov_base = buf.ctypes.data
+                    iovs[j].iov_len = buf.nbytes
+                else:
+                    c_buf = (ctypes.c_char * len(buf)).from_buffer(buf)
+                    self._refs.append(c_buf)
+                    iovs[j].iov_base = ctypes.addressof(c_buf)
+                    iovs[j].iov_len = len(buf)
+            self._refs.append(iovs)
+
+            addrs[i].sin_family = socket.AF_INET
+            addrs[i].sin_port = socket.htons(dest[1])
+            addrs[i].sin_addr = int.from_bytes(socket.inet_aton(dest[0]), sys.byteorder)
+
+            hdr = msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(addrs[i])
+            hdr.msg_namelen = ctypes.sizeof(_SockAddrIn)
+            hdr.msg_iov = iovs
+            hdr.msg_iovlen = len(buffers)
+        self._msgs = msgs
+        self._rows = np.frombuffer(msgs, dtype=np.uint8).reshape(count, -1)
+
+    def flush(self, indices: np.ndarray | None = None) -> int:
+        """Send all datagrams, or only the ones at the given indices.
+
+        Returns:
+            Number of datagrams sent
+        """
+        if not self._datagrams or _sendmmsg is None:
+            return 0
+        if self._msgs is None:
+            self._compile()
+        if indices is None:
+            count = len(self._datagrams)
+            base = ctypes.addressof(self._msgs)
+        else:
+            # Gathered copies still point to the compiled buffers and addresses
+            subset = self._rows[indices]
+            count = len(subset)
+            base = subset.ctypes.data
+        size = ctypes.sizeof(_MMsgHdr)
+        fd = self.sock.fileno()
+        offset = 0
+        sent = 0
+        while offset < count:
+            result = _sendmmsg(
+                fd,
+                base + offset * size,
+                min(count - offset, _MAX_BATCH),
+                0,
+            )
+            if result < 0:
+                # Drop the failing datagram, as senders ignore OSError
+                offset += 1
+                continue
+            offset += result
+            sent += result
+        return sent
+
+
+class BatchTransmitter:
+    """Sends a whole DMX frame with a few sendmmsg() calls per socket.
+
+    Art-Net and sACN senders are staged on every tick: their sequence number is
+    patched in their prebuilt header, and their datagrams are registered in a
+    batch shared by all senders using the same kind of socket. The batches are
+    only rebuilt when a sender or a destination changes. Registered senders not
+    staged for a frame are left out of it.
+    """
+
+    def __init__(self) -> None:
+        self._sockets: dict[tuple[str, str], socket.socket] = {}
+        self._batches: dict[tuple[str, str], DatagramBatch] = {}
+        self._staged: dict[
+            int,
+            tuple[ArtNetSender | SACNSender, DMXUniverse, list[tuple[str, int]]],
+        ] = {}
+        # Datagram indices of each registered sender in the batches
+        self._indices: dict[int, list[tuple[tuple[str, str], int]]] = {}
+        # Senders staged for the next frame
+        self._frame: list[int] = []
+        self._dirty = True
+
+    def _get_batch(self, key: tuple[str, str]) -> DatagramBatch:
+        if (batch := self._batches.get(key)) is None:
+            kind, interface = key
+            sock = self._sockets.get(key)
+            if sock is None:
+                sock = _artnet_socket() if kind == "artnet" else _sacn_socket(interface)
+                self._sockets[key] = sock
+            batch = self._batches[key] = DatagramBatch(sock)
+        return batch
+
+    def stage(
+        self, sender: ArtNetSender | SACNSender, dmx_universe: DMXUniverse
+    ) -> None:
+        """Prepare the next frame of a sender."""
+        sender.next_sequence()
+        destinations = sender.destinations()
+        self._frame.append(id(sender))
+        staged = self._staged.get(id(sender))
+        if staged is None or staged[1] is not dmx_universe or staged[2] != destinations:
+            self._staged[id(sender)] = (sender, dmx_universe, destinations)
+            self._dirty = True
+
+    def invalidate(self) -> None:
+        """Forget staged senders (senders have been rebuilt)."""
+        self._staged.clear()
+        self._frame.clear()
+        self._dirty = True
+
+    def _rebuild(self) -> None:
+        for batch in self._batches.values():
+            batch.clear()
+        self._indices.clear()
+        for sender_id, (sender, dmx_universe, _) in self._staged.items():
+            indices = self._indices[sender_id] = []
+            for key, buffers, dest in sender.datagrams(dmx_universe):
+                batch = self._get_batch(key)
+                indices.append((key, len(batch)))
+                batch.add(buffers, dest)
+        self._dirty = False
+
+    def flush(self) -> int:
+        """Send the staged frame.
+
+        Returns:
+            Number of datagrams sent
+        """
+        if self._dirty:
+            self._rebuild()
+        frame, self._frame = self._frame, []
+        if len(frame) == len(self._staged):
+            return sum(batch.flush() for batch in self._batches.values())
+        selected: dict[tuple[str, str], list[int]] = {key: [] for key in self._batches}
+        for sender_id in frame:
+            for key, index in self._indices[sender_id]:
+                selected[key].append(index)
+        return sum(
+            self._batches[key].flush(np.array(indices, dtype=np.intp))
+            for key, indices in selected.items()
+            if indices
+        )
+
+    def close(self) -> None:
+        """Close the batch sockets."""
+        for sock in self._sockets.values():
+            sock.close()
+        self._sockets.clear()
+        self._batches.clear()
+        self._staged.clear()
+        self._indices.clear()
+        self._frame.clear()
+        self._dirty = True
@@ -15,7 +15,7 @@
 import typing
 
 import numpy as np
-from olc.define import MAX_CHANNELS
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from olc.step import Step
@@ -70,11 +70,11 @@ class CrossFade:
             # If Go is sent, stop it
             if (
                 self.manual
-                and self.app.core.lightshow.main_playback.thread
-                and self.app.core.lightshow.main_playback.thread.is_alive()
+                and self.app.core.lightshow.main_playback.transition
+                and self.app.core.lightshow.main_playback.transition.is_alive()
             ):
-                self.app.core.lightshow.main_playback.thread.stop()
-                self.app.core.lightshow.main_playback.thread.join()
+                self.app.core.lightshow.main_playback.transition.stop()
+                self.app.core.lightshow.main_playback.transition.join()
 
         if scale in (self.scale_a, self.scale_b):
             if self.app.core.lightshow.main_playback.last == 0:
@@ -111,7 +111,9 @@ class CrossFade:
         self.manual = False
         self.app.core.lightshow.main_playback.on_go = False
         # Empty array of levels enter by user
-        self.app.backend.dmx.levels["user"] = np.full(MAX_CHANNELS, -1, dtype=np.int16)
+        self.app.backend.dmx.levels["user"] = np.full(
+            LAYOUT.max_channels, -1, dtype=np.int16
+        )
         self.app.core.lightshow.main_playback.update_channels()
         # Go to next step
         next_step = self.app.core.lightshow.main_playback.position + 1
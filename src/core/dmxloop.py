@@ -12,11 +12,117 @@
 # GNU General Public License for more details.
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
+import bisect
+import ctypes
+import math
+import os
 import sys
 import threading
 import time
 from collections import deque
-from typing import Callable
+from typing import Any, Callable
+
+# Latency histograms: logarithmic bins from 1 µs to 10 s (about 12% wide)
+_HISTOGRAM_MIN = 1e-6
+_HISTOGRAM_DECADES = 7
+_HISTOGRAM_BINS_PER_DECADE = 20
+
+# clock_nanosleep() constants (Linux)
+_TIMER_ABSTIME = 1
+_EINTR = 4
+
+
+class _Timespec(ctypes.Structure):  # pylint: disable=too-few-public-methods
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+def _load_clock_nanosleep() -> Any:  # noqa: ANN401
+    """Return the libc clock_nanosleep() function, or None if not usable.
+
+    Deadlines are perf_counter() values, so the clock of perf_counter() must be
+    CLOCK_MONOTONIC.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    if time.get_clock_info("perf_counter").implementation != (
+        "clock_gettime(CLOCK_MONOTONIC)"
+    ):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.clock_nanosleep
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.POINTER(_Timespec),
+        ctypes.c_void_p,
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+_clock_nanosleep = _load_clock_nanosleep()
+HAS_ABSOLUTE_SLEEP = _clock_nanosleep is not None
+
+
+class LatencyHistogram:
+    """
+    Histogram of durations in seconds, in constant memory whatever the run
+    length. Percentiles are the upper bound of their bin (capped by the max).
+    """
+
+    def __init__(self) -> None:
+        num_edges = _HISTOGRAM_DECADES * _HISTOGRAM_BINS_PER_DECADE + 1
+        self._edges = [
+            _HISTOGRAM_MIN * 10 ** (i / _HISTOGRAM_BINS_PER_DECADE)
+            for i in range(num_edges)
+        ]
+        self._counts = [0] * (num_edges + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Adds a duration."""
+        self._counts[bisect.bisect_right(self._edges, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def reset(self) -> None:
+        """Forgets all durations."""
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def percentile(self, q: float) -> float:
+        """Returns the q-th percentile (0 to 100), 0.0 if empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(round(q * self.count / 100.0, 9)))
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                if index < len(self._edges):
+                    return min(self._edges[index], self.max)
+                break
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """Returns count, mean, p50, p99, p999 and max."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50.0),
+            "p99": self.percentile(99.0),
+            "p999": self.percentile(99.9),
+            "max": self.max,
+        }
 
 
 class DMXLoop:  # pylint: disable=too-many-instance-attributes
@@ -32,20 +138,32 @@ class DMXLoop:  # pylint: disable=too-many-instance-attributes
     Or via context manager:
         with DMXLoop(send_fn=my_send, hz=40):
             time.sleep(10)
+
+    With precise=True, the loop sleeps until absolute deadlines with
+    clock_nanosleep() (Linux, time.sleep() elsewhere) and skips the ticks it
+    missed instead of sending them in a burst. realtime_priority > 0 runs the
+    thread with the SCHED_FIFO policy (requires CAP_SYS_NICE).
+
+    Jitter and send duration histograms are available through stats().
     """
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
         send_fn: Callable[[], None],
         hz: float = 40.0,
         busywait_threshold: float = 0.002 if sys.platform == "win32" else 0.0,
         window_seconds: float = 30.0,
+        precise: bool = False,
+        realtime_priority: int = 0,
     ) -> None:
         self.send_fn = send_fn
         self.hz = hz
         self.period = 1.0 / hz
         self.busywait_threshold = busywait_threshold
         self.window_seconds = window_seconds
+        self.precise = precise
+        self.realtime_priority = realtime_priority
 
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
@@ -54,7 +172,11 @@ class DMXLoop:  # pylint: disable=too-many-instance-attributes
         self._frame_count: int = 0
         self._late_count: int = 0
         self._last_jitter: float = 0.0
+        self._missed_count: int = 0
         self._start_time: float | None = None
+        self._realtime = False
+        self._jitter_histogram = LatencyHistogram()
+        self._send_histogram = LatencyHistogram()
 
         # Sliding window: timestamps of recent frames
         self._frame_timestamps: deque[float] = deque(
@@ -69,7 +191,10 @@ class DMXLoop:  # pylint: disable=too-many-instance-attributes
         self._stop_event.clear()
         self._frame_count = 0
         self._late_count = 0
+        self._missed_count = 0
         self._frame_timestamps.clear()
+        self._jitter_histogram.reset()
+        self._send_histogram.reset()
 
         self._thread = threading.Thread(target=self._loop, name="DMXLoop", daemon=True)
         self._thread.start()
@@ -111,6 +236,32 @@ class DMXLoop:  # pylint: disable=too-many-instance-attributes
         with self._lock:
             return self._last_jitter
 
+    @property
+    def missed_count(self) -> int:
+        """Number of ticks skipped in precise mode (send slower than a period)."""
+        with self._lock:
+            return self._missed_count
+
+    def stats(self) -> dict[str, Any]:
+        """Timing statistics since start.
+
+        Jitter (delay of the send after its deadline) and send durations are
+        summarized in seconds with count, mean, p50, p99, p999 and max.
+        """
+        effective_hz = self.effective_hz
+        with self._lock:
+            return {
+                "hz": self.hz,
+                "effective_hz": effective_hz,
+                "frames": self._frame_count,
+                "late": self._late_count,
+                "missed": self._missed_count,
+                "precise": self.precise,
+                "realtime": self._realtime,
+                "jitter": self._jitter_histogram.summary(),
+                "send": self._send_histogram.summary(),
+            }
+
     @property
     def effective_hz(self) -> float:
         """Average real frequency since startup."""
@@ -149,7 +300,43 @@ class DMXLoop:  # pylint: disable=too-many-instance-attributes
 
         return (count - 1) / span
 
+    def _set_realtime(self) -> None:
+        """Switches the loop thread to the SCHED_FIFO policy."""
+        self._realtime = False
+        if self.realtime_priority <= 0:
+            return
+        try:
+            # On Linux, pid 0 is the calling thread
+            os.sched_setscheduler(  # type: ignore[attr-defined]
+                0,
+                os.SCHED_FIFO,  # type: ignore[attr-defined]
+                os.sched_param(self.realtime_priority),  # type: ignore[attr-defined]
+            )
+            self._realtime = True
+        except (AttributeError, OSError) as err:
+            print(
+                "[DMXLoop] Warning: SCHED_FIFO priority "
+                f"{self.realtime_priority} unavailable ({err})."
+            )
+
+    @staticmethod
+    def _sleep_until(deadline: float) -> None:
+        """Sleeps until an absolute perf_counter() deadline."""
+        if _clock_nanosleep is None:
+            sleep_for = deadline - time.perf_counter()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            return
+        seconds = math.floor(deadline)
+        request = _Timespec(seconds, int((deadline - seconds) * 1e9))
+        while (
+            _clock_nanosleep(time.CLOCK_MONOTONIC, _TIMER_ABSTIME, request, None)
+            == _EINTR
+        ):
+            pass
+
     def _loop(self) -> None:
+        self._set_realtime()
         next_tick = time.perf_counter()
         self._start_time = next_tick
 
@@ -157,6 +344,7 @@ class DMXLoop:  # pylint: disable=too-many-instance-attributes
             now = time.perf_counter()
             jitter = now - next_tick
             self.send_fn()
+            send_duration = time.perf_counter() - now
 
             with self._lock:
                 self._frame_count += 1
@@ -164,8 +352,21 @@ class DMXLoop:  # pylint: disable=too-many-instance-attributes
                 if jitter > self.period * 0.1:
                     self._late_count += 1
                 self._frame_timestamps.append(now)
+                self._jitter_histogram.record(max(jitter, 0.0))
+                self._send_histogram.record(send_duration)
 
             next_tick += self.period
+
+            if self.precise:
+                # Skip the deadlines already passed, keeping the tick phase
+                missed = math.floor((time.perf_counter() - next_tick) / self.period)
+                if missed > 0:
+                    next_tick += missed * self.period
+                    with self._lock:
+                        self._missed_count += missed
+                self._sleep_until(next_tick)
+                continue
+
             sleep_for = next_tick - time.perf_counter() - self.busywait_threshold
 
             if sleep_for > 0:
@@ -197,6 +398,7 @@ class DMXLoop:  # pylint: disable=too-many-instance-attributes
             f"target {self.hz}Hz | "
             f"{windowed_str} ({self.window_seconds:.0f}s) / "
             f"{self.effective_hz:.1f}Hz total | "
-            f"frames={self.frame_count} late={self.late_count} | "
+            f"frames={self.frame_count} late={self.late_count} "
+            f"missed={self.missed_count} | "
             f"jitter={self.last_jitter * 1000:.2f}ms>"
         )
@@ -13,28 +13,42 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 import asyncio
-import json
+import contextlib
 import threading
 import time
 from dataclasses import dataclass, field
 from typing import Callable
 
+import numpy as np
 from olc.core.backends.artnet import ArtNetManager
 from olc.core.backends.artnet.artnet import Sender as ArtNetSenderClass
 from olc.core.backends.enttec import DmxUsbProManager, resolve_port
 from olc.core.backends.sacn import SacnManager
 from olc.core.backends.sacn.merge import SacnMerger
+from olc.core.batch import HAS_SENDMMSG, BatchTransmitter
 from olc.core.dmxloop import DMXLoop
 from olc.core.mergers import HTPMerger, LTPMerger
+from olc.core.monitor import (
+    FLAG_ARTNET,
+    FLAG_ARTNET_SYNC,
+    FLAG_DMX_USB_PRO,
+    FLAG_SACN,
+    FLAG_SACN_SYNC,
+    MonitorPublisher,
+)
 from olc.core.osc import CoreOSCClient, EngineOSCServer
 from olc.core.senders import ArtNetSender, DmxUsbProSender, SACNSender
+from olc.core.sharding import ShardedOutput
 from olc.core.universe_config import (
     DmxUsbProSettings,
     Protocol,
     UniverseConfig,
     UniverseMap,
 )
-from olc.core.universe_data import DMXUniverse
+from olc.core.universe_data import NUM_CHANNELS, DMXUniverse, FrameStore
+
+# Consecutive frames carrying each change when unchanged universes are throttled
+CHANGE_BURST = 3
 
 
 class NetworkLoopThread(threading.Thread):
@@ -62,11 +76,19 @@ class _RuntimeSlot:
     """Groups all runtime components for a single DMX universe."""
 
     universe: DMXUniverse
+    # Frame read by the senders, updated from `universe` on every tick
+    frame: DMXUniverse
     htp_merger: HTPMerger | None = field(default=None)
     ltp_merger: LTPMerger | None = field(default=None)
     senders: list[ArtNetSender | SACNSender | DmxUsbProSender] = field(
         default_factory=list
     )
+    # Output throttling state and counters
+    sent_generation: int = -1
+    burst: int = 0
+    last_sent: float = 0.0
+    sent_frames: int = 0
+    skipped_frames: int = 0
 
 
 def _build_senders(  # pylint: disable=unexpected-keyword-arg,too-many-arguments,too-many-positional-arguments
@@ -119,6 +141,16 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
 
     A single DMXLoop thread drives all universes at the target frequency.
     Each universe has its own DMXUniverse buffer and optional merger components.
+    Writers publish complete frames to a triple-buffered FrameStore, so the
+    loop never blocks them and always sends consistent frames.
+
+    With refresh_hz > 0, a modified universe is sent at once and in the next
+    frames of its burst, then only at refresh_hz while it stays unchanged (the
+    keep-alive behaviour of sACN consoles).
+
+    precise_timing and realtime_priority select the scheduler mode of the
+    DMXLoop (absolute deadlines, SCHED_FIFO), whose jitter and send duration
+    histograms are exposed by timing_stats.
 
     Usage::
 
@@ -142,12 +174,27 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
         no_listen: bool = False,
         loopback: bool = False,
         no_transmit: bool = False,
+        batch_transmit: bool = False,
+        workers: int = 0,
+        refresh_hz: float = 0.0,
+        precise_timing: bool = False,
+        realtime_priority: int = 0,
     ) -> None:
         self._map = universe_map
+        self._refresh_interval = 1.0 / refresh_hz if refresh_hz > 0 else 0.0
         self._lock = threading.Lock()
         self._no_listen = no_listen
         self._loopback = loopback
         self._no_transmit = no_transmit
+        self._batch_transmit = batch_transmit
+        self._workers = workers
+        # Network senders share a few sockets and send a whole frame with
+        # sendmmsg() where available, instead of one syscall per datagram
+        self._batch = (
+            BatchTransmitter()
+            if batch_transmit and HAS_SENDMMSG and not no_transmit
+            else None
+        )
 
         self.osc_server = None
         self.osc_client = None
@@ -187,9 +234,35 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
         self._dmx_usb_pro_managers: dict[str, DmxUsbProManager] = {}
         self.notify_enttec: Callable | None = None
 
+        # Opt-in: Art-Net and sACN output sent by worker processes reading the
+        # universes from shared memory, DMX USB Pro stays in this process
+        self._shards = (
+            ShardedOutput(
+                universe_map,
+                workers,
+                dest_ip="127.0.0.1" if loopback else "255.255.255.255",
+                sacn_multicast=not loopback,
+                sacn_cid=self._sacn_manager._cid,
+                batch_transmit=batch_transmit,
+            )
+            if workers > 0 and not no_transmit and len(universe_map) > 0
+            else None
+        )
+        if self._shards is not None:
+            self._batch = None
+        # Stopped workers, kept while the frames live in their shared block
+        self._crashed_shards: ShardedOutput | None = None
+
+        # Latest complete frames, copied by the loop to the block read by the
+        # senders (the shared memory block of the workers in sharded mode)
+        self._frames = FrameStore(
+            len(universe_map),
+            output=None if self._shards is None else self._shards.frames,
+        )
+
         # Build one runtime slot per universe declared in the map
         self._slots: dict[int, _RuntimeSlot] = {}
-        for config in universe_map:
+        for row, config in enumerate(universe_map):
             dmx_usb_pro_manager = None
             if not no_transmit and Protocol.DMX_USB_PRO in config.protocols:
                 port = resolve_port(config.dmx_usb_pro.port)
@@ -209,41 +282,47 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
                     dmx_usb_pro_manager = self._dmx_usb_pro_managers[port]
 
             self._slots[config.universe_id] = _RuntimeSlot(
-                universe=DMXUniverse(config.universe_id),
+                universe=DMXUniverse(config.universe_id, store=self._frames, row=row),
+                frame=DMXUniverse(config.universe_id, buffer=self._frames.output[row]),
                 senders=[]
                 if no_transmit
-                else _build_senders(
-                    config,
-                    self._artnet_manager,
-                    dest_ip="127.0.0.1" if loopback else "255.255.255.255",
-                    sacn_multicast=not loopback,
-                    dmx_usb_pro_manager=dmx_usb_pro_manager,
-                    sacn_cid=self._sacn_manager._cid,
+                else self._local_senders(
+                    _build_senders(
+                        config,
+                        self._artnet_manager,
+                        dest_ip="127.0.0.1" if loopback else "255.255.255.255",
+                        sacn_multicast=not loopback,
+                        dmx_usb_pro_manager=dmx_usb_pro_manager,
+                        sacn_cid=self._sacn_manager._cid,
+                    )
                 ),
             )
 
-        self._loop = DMXLoop(send_fn=self._send_all, hz=hz)
+        # Called at the start of every tick, before the frames are read
+        self._tick_callbacks: list[Callable[[], None]] = []
 
-        # ZeroMQ monitoring setup
-        self._zmq_ctx = None
-        self._zmq_pub = None
-        self._monitor_interval = 1.0 / monitor_fps if monitor_fps > 0 else 0.0
-        self._last_monitor_time = 0.0
+        self._loop = DMXLoop(
+            send_fn=self._send_all,
+            hz=hz,
+            precise=precise_timing,
+            realtime_priority=realtime_priority,
+        )
 
+        # ZeroMQ monitoring setup
+        self._monitor: MonitorPublisher | None = None
         if monitor_port is not None:
             try:
-                import zmq  # pylint: disable=import-outside-toplevel
-
-                self._zmq_ctx = zmq.Context()
-                self._zmq_pub = self._zmq_ctx.socket(zmq.PUB)
-                self._zmq_pub.bind(f"tcp://127.0.0.1:{monitor_port}")
+                self._monitor = MonitorPublisher(
+                    monitor_port,
+                    [config.universe_id for config in universe_map],
+                    self._monitor_flags,
+                    fps=monitor_fps,
+                )
             except Exception as err:  # pylint: disable=broad-exception-caught
                 print(
                     "[ZMQ] Warning: Failed to bind to monitor port"
                     f" {monitor_port} ({err})."
                 )
-                self._zmq_pub = None
-                self._zmq_ctx = None
 
     def start(self) -> None:
         """Start the DMX output loop."""
@@ -257,6 +336,8 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
             self._sacn_manager.start()
         for manager in self._dmx_usb_pro_managers.values():
             manager.start()
+        if self._shards is not None:
+            self._shards.start()
         if not self._no_transmit:
             self._loop.start()
 
@@ -264,6 +345,12 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
         """Stop the DMX output loop."""
         self.stop_osc()
         self._loop.stop(timeout=timeout)
+        if self._shards is not None:
+            self._shards.stop(timeout=timeout)
+        elif self._loop.frame_count > 0:
+            with self._lock:
+                for slot in self._slots.values():
+                    self._terminate_sacn(slot)
         if self._artnet_manager is not None:
             self._artnet_manager.stop()
         if self._sacn_manager is not None:
@@ -272,10 +359,11 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
             manager.stop()
         if self._network_thread is not None:
             self._network_thread.stop()
-        if self._zmq_pub is not None:
-            self._zmq_pub.close()
-        if self._zmq_ctx is not None:
-            self._zmq_ctx.term()
+        if self._batch is not None:
+            self._batch.close()
+        if self._monitor is not None:
+            self._monitor.close()
+            self._monitor = None
 
     @property
     def is_running(self) -> bool:
@@ -299,6 +387,119 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
     def __exit__(self, *_: object) -> None:
         self.stop()
 
+    @property
+    def workers(self) -> int:
+        """Number of output worker processes (0: output sent by this process)."""
+        return 0 if self._shards is None else self._shards.workers
+
+    def grow_universes(self, num_universes: int) -> None:
+        """Declare universes (without protocol) up to `num_universes` - 1.
+
+        The frames of all universes are reallocated together, the universes
+        already declared keep their slot, senders and last frame. In sharded
+        mode, the workers are restarted on a block holding all universes.
+        """
+        with self._lock:
+            first = len(self._map)
+            if num_universes <= first:
+                return
+            with contextlib.ExitStack() as stack:
+                # No writer publishes while the frames move
+                for slot in self._slots.values():
+                    stack.enter_context(slot.universe.lock)
+                self._map.grow(num_universes)
+                # The block of the old workers is released once no frame uses it
+                old_shards = shards = self._shards
+                started = False
+                if old_shards is not None:
+                    started = old_shards.is_running or old_shards.crashed
+                    old_shards.stop(timeout=0.5)
+                    shards = self._shards = ShardedOutput(
+                        self._map,
+                        self._workers,
+                        dest_ip="127.0.0.1" if self._loopback else "255.255.255.255",
+                        sacn_multicast=not self._loopback,
+                        sacn_cid=self._sacn_manager._cid,
+                        batch_transmit=self._batch_transmit,
+                    )
+                self._frames.resize(
+                    num_universes, output=None if shards is None else shards.frames
+                )
+                self._crashed_shards = None
+                for row, config in enumerate(self._map):
+                    uid = config.universe_id
+                    if row >= first:
+                        self._slots[uid] = _RuntimeSlot(
+                            universe=DMXUniverse(uid, store=self._frames, row=row),
+                            frame=DMXUniverse(uid, buffer=self._frames.output[row]),
+                        )
+                    else:
+                        self._slots[uid].frame = DMXUniverse(
+                            uid, buffer=self._frames.output[row]
+                        )
+                if self._batch is not None:
+                    self._batch.invalidate()
+                del old_shards
+                if shards is not None and started:
+                    shards.start()
+            if self._monitor is not None:
+                self._monitor.add_universes(list(range(first, num_universes)))
+
+    def _stop_sharding(self) -> None:
+        """Send the network output from this process after a worker died.
+
+        Called once, with the engine lock held.
+        """
+        shards = self._shards
+        if shards is None:
+            return
+        print("[CoreEngine] Output worker died, sending from the main process")
+        shards.stop(timeout=0.5)
+        self._shards = None
+        self._crashed_shards = shards
+        if self._batch_transmit and HAS_SENDMMSG:
+            self._batch = BatchTransmitter()
+        dest_ip = "127.0.0.1" if self._loopback else "255.255.255.255"
+        for uid, slot in self._slots.items():
+            slot.senders = [
+                s for s in slot.senders if isinstance(s, DmxUsbProSender)
+            ] + _build_senders(
+                self._map[uid],
+                self._artnet_manager,
+                dest_ip=dest_ip,
+                sacn_multicast=not self._loopback,
+                sacn_cid=self._sacn_manager._cid,
+            )
+
+    def _local_senders(
+        self, senders: list[ArtNetSender | SACNSender | DmxUsbProSender]
+    ) -> list[ArtNetSender | SACNSender | DmxUsbProSender]:
+        """Keep the senders not handled by the output workers."""
+        if self._shards is None:
+            return senders
+        for sender in senders:
+            if not isinstance(sender, DmxUsbProSender):
+                sender.close()
+        return [s for s in senders if isinstance(s, DmxUsbProSender)]
+
+    @property
+    def send_counters(self) -> dict[int, dict[str, int]]:
+        """Frames sent and skipped (unchanged) for each universe."""
+        return {
+            uid: {"sent": slot.sent_frames, "skipped": slot.skipped_frames}
+            for uid, slot in self._slots.items()
+        }
+
+    @staticmethod
+    def _terminate_sacn(slot: _RuntimeSlot) -> None:
+        """Send the sACN stream termination of a universe."""
+        for sender in slot.senders:
+            if isinstance(sender, SACNSender):
+                try:
+                    sender.terminate(slot.frame)
+                except OSError:
+                    pass
+
     def universe(self, uid: int) -> DMXUniverse:
         """Return the DMXUniverse buffer for a given universe id."""
         return self._get_slot(uid).universe
@@ -436,17 +637,26 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
         new_senders = (
             []
             if self._no_transmit
-            else _build_senders(
-                config,
-                self._artnet_manager,
-                dest_ip=dest_ip,
-                sacn_multicast=sacn_multicast,
-                dmx_usb_pro_manager=dmx_usb_pro_manager,
-                sacn_cid=self._sacn_manager._cid,
+            else self._local_senders(
+                _build_senders(
+                    config,
+                    self._artnet_manager,
+                    dest_ip=dest_ip,
+                    sacn_multicast=sacn_multicast,
+                    dmx_usb_pro_manager=dmx_usb_pro_manager,
+                    sacn_cid=self._sacn_manager._cid,
+                )
             )
         )
         with self._lock:
-            self._get_slot(uid).senders = new_senders
+            slot = self._get_slot(uid)
+            if Protocol.SACN not in config.protocols:
+                self._terminate_sacn(slot)
+            slot.senders = new_senders
+            if self._batch is not None:
+                self._batch.invalidate()
+            if self._shards is not None:
+                self._shards.reload(config)
 
         self._reload_artnet(uid, config)
         self._reload_sacn(uid, config)
@@ -459,6 +669,15 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
         """Write a dict of {channel: value} to a universe."""
         self._get_slot(uid).universe.set_channels(channels)
 
+    def set_universe(self, uid: int, data: bytes | memoryview) -> None:
+        """Write consecutive channel values from the first channel of a universe.
+
+        `data` is read in place (e.g. an OSC blob in the received datagram), up
+        to 512 channels.
+        """
+        levels = np.frombuffer(data, dtype=np.uint8)[:NUM_CHANNELS]
+        self._get_slot(uid).universe.apply_array(levels)
+
     def _htp_write(self, uid: int, source_id: int, channels: dict[int, int]) -> None:
         """
         Write channels for a source via the HTP merger.
@@ -470,8 +689,13 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
                 f"Universe {uid} has no HTPMerger."
                 f" Call add_htp_merger({uid}, ...) first."
             )
-        slot.htp_merger.write(source_id, channels)
-        slot.htp_merger.get_output(out=slot.universe.array)
+        merger = slot.htp_merger
+
+        def merge(data: np.ndarray) -> None:
+            merger.write(source_id, channels)
+            merger.get_output(out=data)
+
+        slot.universe.write_from(merge)
 
     def _ltp_write(self, uid: int, source_id: int, channels: dict[int, int]) -> None:
         """
@@ -484,8 +708,13 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
                 f"Universe {uid} has no LTPMerger."
                 f" Call add_ltp_merger({uid}, ...) first."
             )
-        slot.ltp_merger.write(source_id, channels)
-        slot.ltp_merger.get_output(out=slot.universe.array)
+        merger = slot.ltp_merger
+
+        def merge(data: np.ndarray) -> None:
+            merger.write(source_id, channels)
+            merger.get_output(out=data)
+
+        slot.universe.write_from(merge)
 
     @property
     def frame_count(self) -> int:
@@ -497,6 +726,23 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
         """Average output frequency since start."""
         return self._loop.effective_hz
 
+    @property
+    def timing_stats(self) -> dict:
+        """DMX loop timing statistics (see DMXLoop.stats)."""
+        return self._loop.stats()
+
+    def add_tick_callback(self, callback: Callable[[], None]) -> None:
+        """Register a function called on every DMX loop tick, before sending.
+
+        Writes done by the callback go out in the same frame.
+        """
+        if callback not in self._tick_callbacks:
+            self._tick_callbacks = [*self._tick_callbacks, callback]
+
+    def remove_tick_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister a tick callback."""
+        self._tick_callbacks = [c for c in self._tick_callbacks if c != callback]
+
     def start_osc(self, host: str, client_port: int, server_port: int) -> None:
         """Start the OSC server and client asynchronously in the network loop."""
         with self._lock:
@@ -560,18 +806,49 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
                 self.osc_client.send(path, *args)
 
     def _send_all(self) -> None:
-        """Called by DMXLoop on every tick. Dispatches to senders."""
+        """Called by DMXLoop on every tick. Dispatches to senders.
+
+        The engine lock only guards the senders against configuration changes,
+        writers never wait for the loop.
+        """
         # pylint: disable=too-many-locals
+        for callback in self._tick_callbacks:
+            try:
+                callback()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                print(f"[DMXLoop] Tick callback failed: {err}")
+
         with self._lock:
+            if self._shards is not None and self._shards.crashed:
+                self._stop_sharding()
+
             active_sync_addresses = set()
             artnet_sync_needed = False
 
-            for slot in self._slots.values():
+            now = time.monotonic()
+            due_slots = []
+            for uid, slot in self._slots.items():
+                due = self._is_due(slot, now)
+                if self._shards is not None:
+                    self._shards.set_due(uid, due)
+                if not due:
+                    slot.skipped_frames += 1
+                    continue
+                slot.sent_frames += 1
+                due_slots.append(slot)
+
+            # Generations are read first: the frames sent are at least as recent
+            self._frames.acquire()
+
+            for slot in due_slots:
                 for sender in slot.senders:
                     try:
-                        sender.send(slot.universe)
                         is_sacn = isinstance(sender, SACNSender)
                         is_artnet = isinstance(sender, ArtNetSender)
+                        if self._batch is not None and (is_sacn or is_artnet):
+                            self._batch.stage(sender, slot.frame)
+                        else:
+                            sender.send(slot.frame)
                         if is_sacn and getattr(sender, "_sync_address", 0) > 0:
                             active_sync_addresses.add(sender._sync_address)
                         elif is_artnet and getattr(sender, "_sync_active", False):
@@ -579,6 +856,14 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
                     except OSError:
                         pass
 
+            if self._batch is not None:
+                self._batch.flush()
+
+            if self._shards is not None:
+                self._shards.tick(self._artnet_manager.get_node_ips)
+                active_sync_addresses |= self._shards.sync_addresses
+                artnet_sync_needed |= self._shards.artnet_sync
+
             # Send a synchronization packet for each active sync address
             if active_sync_addresses and self._sacn_manager is not None:
                 for sync_addr in active_sync_addresses:
@@ -588,49 +873,59 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
             if artnet_sync_needed and self._artnet_manager is not None:
                 self._artnet_manager.send_sync()
 
-            # ZeroMQ Monitoring Publisher
-            if self._zmq_pub is None:
-                return
-            now = time.monotonic()
-            if now - self._last_monitor_time < self._monitor_interval:
-                return
-            self._last_monitor_time = now
-            for uid, slot in self._slots.items():
-                protocols = []
-                if uid in self._map:
-                    config = self._map[uid]
-                    for p in config.protocols:
-                        if p.name == "ARTNET":
-                            name = "Art-Net"
-                            if config.artnet.sync_active:
-                                name += " [bold yellow](Sync)[/bold yellow]"
-                            protocols.append(name)
-                        elif p.name == "SACN":
-                            name = "sACN"
-                            if config.sacn.sync_address > 0:
-                                name += " [bold yellow](Sync)[/bold yellow]"
-                            protocols.append(name)
-                        else:
-                            protocols.append(p.name)
-                metadata = {
-                    "hz": self.effective_hz,
-                    "frames": self.frame_count,
-                    "protocols": protocols,
-                }
-                meta_bytes = json.dumps(metadata).encode("utf-8")
-                topic = f"universe:{uid}".encode("ascii")
-                # Multipart: [Topic, Metadata JSON, Raw DMX Bytes]
-                self._zmq_pub.send_multipart(
-                    [topic, meta_bytes, slot.universe.array.tobytes()]
-                )
+        # Snapshot for the monitor stream, published by its own thread
+        monitor = self._monitor
+        if monitor is not None and monitor.ready():
+            monitor.offer(self._frames.output, self.frame_count, self.effective_hz)
+
+    def _monitor_flags(self, uid: int) -> int:
+        """Protocol flags of a universe for the monitor stream."""
+        if uid not in self._map:
+            return 0
+        config = self._map[uid]
+        flags = 0
+        if Protocol.ARTNET in config.protocols:
+            flags |= FLAG_ARTNET
+            if config.artnet.sync_active:
+                flags |= FLAG_ARTNET_SYNC
+        if Protocol.SACN in config.protocols:
+            flags |= FLAG_SACN
+            if config.sacn.sync_address > 0:
+                flags |= FLAG_SACN_SYNC
+        if Protocol.DMX_USB_PRO in config.protocols:
+            flags |= FLAG_DMX_USB_PRO
+        return flags
+
+    def _is_due(self, slot: _RuntimeSlot, now: float) -> bool:
+        """Whether a universe must be sent on this tick."""
+        if not self._refresh_interval:
+            return True
+        generation = slot.universe.generation
+        if generation != slot.sent_generation:
+            slot.sent_generation = generation
+            slot.burst = CHANGE_BURST - 1
+        elif slot.burst > 0:
+            slot.burst -= 1
+        elif now - slot.last_sent < self._refresh_interval:
+            return False
+        slot.last_sent = now
+        return True
 
     def _get_slot(self, uid: int) -> _RuntimeSlot:
         if uid not in self._slots:
             raise KeyError(f"Universe {uid} is not registered in this CoreEngine.")
         return self._slots[uid]
 
-    def _on_artnet_dmx_received(self, universe_id: int, data: list[int]) -> None:
-        """Callback when an external ArtDmx packet is received."""
+    def _on_artnet_dmx_received(
+        self,
+        universe_id: int,
+        data: np.ndarray | list[int],
+        changed: np.ndarray | None = None,
+    ) -> None:
+        """Callback when an external ArtDmx packet is received.
+
+        Only the slots flagged in the `changed` mask of the merger are written.
+        """
         if self._no_listen:
             return
         try:
@@ -638,12 +933,21 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
         except KeyError:
             return
 
-        channels = dict(enumerate(data))
-        with self._lock:
-            slot.universe.set_channels(channels)
+        if changed is None:
+            slot.universe.apply_array(data)
+        else:
+            slot.universe.apply_mask(data, changed)
 
-    def _on_sacn_dmx_received(self, universe_id: int, data: list[int]) -> None:
-        """Callback when an external sACN packet is received."""
+    def _on_sacn_dmx_received(
+        self,
+        universe_id: int,
+        data: np.ndarray | list[int],
+        changed: np.ndarray | None = None,
+    ) -> None:
+        """Callback when an external sACN packet is received.
+
+        Only the slots flagged in the `changed` mask of the merger are written.
+        """
         if self._no_listen:
             return
         try:
@@ -651,6 +955,7 @@ class CoreEngine:  # pylint: disable=too-many-instance-attributes,too-many-branc
         except KeyError:
             return
 
-        channels = dict(enumerate(data))
-        with self._lock:
-            slot.universe.set_channels(channels)
+        if changed is None:
+            slot.universe.apply_array(data)
+        else:
+            slot.universe.apply_mask(data, changed)
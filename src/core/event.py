@@ -15,7 +15,56 @@
 from __future__ import annotations
 
 import threading
+import time
 import typing
+from collections import OrderedDict, deque
+
+from olc.core.dmxloop import LatencyHistogram
+
+# Default maximum number of pending payloads of an asynchronous event
+DEFAULT_BACKLOG = 1024
+
+
+def latest(*_args: object, **_kwargs: object) -> None:
+    """Coalescing key keeping only the latest payload of an event."""
+    return None
+
+
+def _listener_name(callback: typing.Callable[..., None]) -> str:
+    """Name of a listener in the statistics (lambdas by their line)."""
+    name = getattr(callback, "__qualname__", None) or repr(callback)
+    code = getattr(callback, "__code__", None)
+    if code is not None and name.endswith("<lambda>"):
+        name += f":{code.co_firstlineno}"
+    return name
+
+
+class _ListenerStats:
+    """Latency (emit to call) and duration of the calls of a listener."""
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.duration = LatencyHistogram()
+
+
+class _EventQueue:  # pylint: disable=too-few-public-methods
+    """Pending payloads of an asynchronous event, by coalescing key."""
+
+    def __init__(
+        self,
+        coalesce: typing.Callable[..., typing.Hashable] | None,
+        max_backlog: int,
+    ) -> None:
+        self.coalesce = coalesce
+        self.max_backlog = max_backlog
+        # key: (emit time, args, kwargs), in order of emission
+        self.pending: OrderedDict[
+            typing.Hashable, tuple[float, tuple, dict[str, object]]
+        ] = OrderedDict()
+        self.emitted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.listeners: dict[str, _ListenerStats] = {}
 
 
 class EventDispatcher:
@@ -24,11 +73,25 @@ class EventDispatcher:
     Allows different parts of the application (Core, MIDI, OSC, GTK) to
     communicate via decoupled publish/subscribe events without graphical
     loop dependencies.
+
+    Events are delivered synchronously on the emitting thread, unless they are
+    set asynchronous with set_async(): their payloads are then queued and
+    delivered in order by a dispatch thread. A coalescing key replaces the
+    pending payload of the same key (e.g. the level of a channel) instead of
+    queueing a new one, and the backlog of each event is bounded (the oldest
+    payloads are dropped).
     """
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._listeners: dict[str, list[typing.Callable[..., None]]] = {}
+        # Asynchronous dispatch
+        self._queues: dict[str, _EventQueue] = {}
+        self._condition = threading.Condition()
+        self._ready: deque[tuple[str, _EventQueue]] = deque()
+        self._busy = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
 
     def subscribe(self, event_name: str, callback: typing.Callable[..., None]) -> None:
         """Subscribe a callback to an event name.
@@ -58,14 +121,110 @@ class EventDispatcher:
                 except ValueError:
                     pass
 
+    def set_async(
+        self,
+        event_name: str,
+        coalesce: typing.Callable[..., typing.Hashable] | None = None,
+        max_backlog: int = DEFAULT_BACKLOG,
+    ) -> None:
+        """Deliver an event on the dispatch thread instead of the emitting one.
+
+        Listeners must then be thread-safe, and payloads must not be modified
+        after emission.
+
+        Args:
+            event_name: The name of the event.
+            coalesce: Returns the key of a payload (called with the event
+                arguments): a pending payload with the same key is replaced.
+                `latest` keeps only the last payload. None queues them all.
+            max_backlog: Maximum number of pending payloads.
+        """
+        with self._condition:
+            self._queues[event_name] = _EventQueue(coalesce, max(1, max_backlog))
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(
+                    target=self._run, name="EventDispatcher", daemon=True
+                )
+                self._thread.start()
+
+    def set_sync(self, event_name: str) -> None:
+        """Deliver an event on the emitting thread again.
+
+        Payloads already queued are still delivered by the dispatch thread.
+        """
+        with self._condition:
+            self._queues.pop(event_name, None)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for the delivery of the queued payloads.
+
+        Returns:
+            False if payloads are still pending after `timeout` seconds
+        """
+        if self._thread is threading.current_thread():
+            return False
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._ready and not self._busy, timeout
+            )
+
+    def stop_dispatch(self) -> None:
+        """Deliver the queued payloads and stop the dispatch thread.
+
+        All events are delivered synchronously afterwards.
+        """
+        with self._condition:
+            thread = self._thread
+            self._stopping = True
+            self._condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._condition:
+            self._thread = None
+            self._queues.clear()
+
+    def dispatch_stats(self) -> dict[str, dict[str, typing.Any]]:
+        """Statistics of the asynchronous events.
+
+        For each event: emitted, coalesced and dropped payloads, and for each
+        listener the latency (emit to call) and the duration of its calls, in
+        seconds with count, mean, p50, p99, p999 and max.
+        """
+        with self._condition:
+            return {
+                event_name: {
+                    "emitted": queue.emitted,
+                    "coalesced": queue.coalesced,
+                    "dropped": queue.dropped,
+                    "pending": len(queue.pending),
+                    "listeners": {
+                        name: {
+                            "latency": stats.latency.summary(),
+                            "duration": stats.duration.summary(),
+                        }
+                        for name, stats in queue.listeners.items()
+                    },
+                }
+                for event_name, queue in self._queues.items()
+            }
+
     def emit(self, event_name: str, *args: object, **kwargs: object) -> None:
-        """Emit an event to all subscribers synchronously on the calling thread.
+        """Emit an event to all subscribers.
+
+        Subscribers are called synchronously on the calling thread, unless the
+        event was set asynchronous.
 
         Args:
             event_name: The name of the event.
             *args: Arguments to pass to the callbacks.
             **kwargs: Keyword arguments to pass to the callbacks.
         """
+        queue = self._queues.get(event_name)
+        if queue is not None:
+            self._enqueue(event_name, queue, args, kwargs)
+            return
+
         with self._lock:
             # Copy listeners to avoid race conditions or modifications
             # to subscriptions during execution of the callbacks.
@@ -76,3 +235,79 @@ class EventDispatcher:
                 callback(*args, **kwargs)
             except Exception as err:  # pylint: disable=broad-exception-caught
                 print(f"[EventDispatcher] Error in callback for '{event_name}': {err}")
+
+    def _enqueue(
+        self,
+        event_name: str,
+        queue: _EventQueue,
+        args: tuple,
+        kwargs: dict[str, object],
+    ) -> None:
+        key: typing.Hashable = None
+        coalesce = queue.coalesce
+        if coalesce is not None:
+            try:
+                key = coalesce(*args, **kwargs)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                print(f"[EventDispatcher] Bad coalescing key for '{event_name}': {err}")
+                coalesce = None
+        if coalesce is None:
+            # Never superseded
+            key = object()
+        with self._condition:
+            queue.emitted += 1
+            if key in queue.pending:
+                # Superseded payload, delivered at its place in the queue
+                queue.coalesced += 1
+            elif len(queue.pending) >= queue.max_backlog:
+                queue.pending.popitem(last=False)
+                queue.dropped += 1
+            was_empty = not queue.pending
+            queue.pending[key] = (time.monotonic(), args, kwargs)
+            if was_empty:
+                self._ready.append((event_name, queue))
+                self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._ready and not self._stopping:
+                    self._condition.wait()
+                if not self._ready:
+                    break
+                event_name, queue = self._ready.popleft()
+                batch = queue.pending
+                queue.pending = OrderedDict()
+                self._busy = True
+            try:
+                self._deliver(event_name, queue, batch)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _deliver(
+        self,
+        event_name: str,
+        queue: _EventQueue,
+        batch: OrderedDict[typing.Hashable, tuple[float, tuple, dict[str, object]]],
+    ) -> None:
+        with self._lock:
+            listeners = list(self._listeners.get(event_name, []))
+        for emitted, args, kwargs in batch.values():
+            for callback in listeners:
+                name = _listener_name(callback)
+                stats = queue.listeners.get(name)
+                if stats is None:
+                    stats = queue.listeners[name] = _ListenerStats()
+                start = time.monotonic()
+                try:
+                    callback(*args, **kwargs)
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    print(
+                        f"[EventDispatcher] Error in callback for '{event_name}': {err}"
+                    )
+                end = time.monotonic()
+                with self._condition:
+                    stats.latency.record(start - emitted)
+                    stats.duration.record(end - start)
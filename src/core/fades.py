@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Timed transitions (Go, Go Back, chasers) evaluated on the DMX loop tick.
+
+A FadeScheduler holds the running transitions. On every tick of the CoreEngine
+DMXLoop, it computes the time spent by each of them from their start deadline,
+updates their levels and renders the output frame once for all of them. No
+thread is needed per transition, and fades advance once per output frame.
+
+Without engine ticks (no engine, output disabled), the scheduler is polled by
+the Dmx timer.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class Transition:
+    """A timed transition run by a FadeScheduler.
+
+    Keeps the interface of a thread for its owners: start(), stop(), join(),
+    is_alive() and the `pause` event (cleared while paused).
+
+    Subclasses implement:
+
+    - begin(): called on the first tick, returns False to drop the transition
+    - update(elapsed): called on every tick with the time spent in ms (pauses
+      excluded), returns True once the transition is over
+    - finish(): called after the last update
+    - cancel(): called when the transition is stopped before its end
+    """
+
+    def __init__(self, scheduler: FadeScheduler) -> None:
+        self.scheduler = scheduler
+        self.pause = threading.Event()
+        self.pause.set()
+        self._done = threading.Event()
+        self._started = False
+        self._start_time = 0.0
+        self._pause_start: float | None = None
+        self._pause_time = 0.0
+
+    def start(self) -> None:
+        """Register the transition, it starts on the next tick"""
+        self.scheduler.add(self)
+
+    def stop(self) -> None:
+        """Stop the transition"""
+        self.scheduler.cancel(self)
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the end of the transition"""
+        if not self.scheduler.in_tick():
+            self._done.wait(timeout)
+
+    def is_alive(self) -> bool:
+        """Returns True if the transition is registered and not over"""
+        return self.scheduler.is_active(self)
+
+    def elapsed(self, now: float) -> float | None:
+        """Time spent in ms at `now`, None while paused"""
+        if not self._started:
+            self._started = True
+            self._start_time = now
+        if not self.pause.is_set():
+            if self._pause_start is None:
+                self._pause_start = now
+            return None
+        if self._pause_start is not None:
+            self._pause_time += now - self._pause_start
+            self._pause_start = None
+        return (now - self._start_time - self._pause_time) * 1000
+
+    def begin(self) -> bool:
+        """Called on the first tick
+
+        Returns:
+            False to drop the transition without finishing it
+        """
+        return True
+
+    def update(self, elapsed: float) -> bool:
+        """Update levels
+
+        Args:
+            elapsed: Time spent in ms
+
+        Returns:
+            True if the transition is over
+        """
+        raise NotImplementedError
+
+    def finish(self) -> None:
+        """Called at the end of the transition"""
+
+    def cancel(self) -> None:
+        """Called when the transition is stopped before its end"""
+
+
+class FadeScheduler:
+    """Runs the transitions on the DMX loop tick.
+
+    Args:
+        render: Called once per tick after the transitions updated the levels
+    """
+
+    def __init__(self, render: Callable[[], None] | None = None) -> None:
+        self.render = render
+        self._transitions: list[Transition] = []
+        self._lock = threading.RLock()
+        self._ticking: int | None = None
+        self._last_tick = 0.0
+
+    def __len__(self) -> int:
+        return len(self._transitions)
+
+    def add(self, transition: Transition) -> None:
+        """Register a transition"""
+        with self._lock:
+            if transition not in self._transitions:
+                transition._done.clear()  # pylint: disable=protected-access
+                self._transitions.append(transition)
+
+    def cancel(self, transition: Transition) -> None:
+        """Stop a transition before its end"""
+        with self._lock:
+            if transition not in self._transitions:
+                return
+            self._transitions.remove(transition)
+            try:
+                transition.cancel()
+            finally:
+                transition._done.set()  # pylint: disable=protected-access
+
+    def is_active(self, transition: Transition) -> bool:
+        """Returns True if the transition is registered"""
+        return transition in self._transitions
+
+    def in_tick(self) -> bool:
+        """Returns True if called from a transition during a tick"""
+        return self._ticking == threading.get_ident()
+
+    def clear(self) -> None:
+        """Stop all transitions"""
+        with self._lock:
+            for transition in list(self._transitions):
+                self.cancel(transition)
+
+    def tick(self, now: float | None = None) -> None:
+        """Advance all transitions to `now` and render the frame once."""
+        with self._lock:
+            if now is None:
+                now = time.monotonic()
+            self._last_tick = now
+            if not self._transitions:
+                return
+            self._ticking = threading.get_ident()
+            try:
+                self._advance(now)
+            finally:
+                self._ticking = None
+
+    def poll(self, timeout: float) -> None:
+        """Tick if no tick happened during `timeout` seconds (fallback clock)."""
+        now = time.monotonic()
+        if now - self._last_tick >= timeout:
+            self.tick(now)
+
+    def _advance(self, now: float) -> None:
+        updated = False
+        # Transitions added during the tick (auto Go) start on the next one
+        for transition in list(self._transitions):
+            if transition not in self._transitions:
+                continue
+            try:
+                updated |= self._step(transition, now)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                # Dropped, instead of failing again on every tick
+                print(f"[FadeScheduler] Error in {type(transition).__name__}: {err}")
+                updated = True
+                self._end(transition)
+        if updated and self.render is not None:
+            self.render()
+
+    def _step(self, transition: Transition, now: float) -> bool:
+        """Advance a transition to `now`
+
+        Returns:
+            True if the transition updated levels
+        """
+        # pylint: disable=protected-access
+        first = not transition._started
+        elapsed = transition.elapsed(now)
+        if first and not transition.begin():
+            self._end(transition)
+            return False
+        if elapsed is None:
+            return False
+        if transition.update(elapsed):
+            self._transitions.remove(transition)
+            try:
+                transition.finish()
+            finally:
+                transition._done.set()
+        return True
+
+    def _end(self, transition: Transition) -> None:
+        """Unregister a transition without finishing it"""
+        if transition in self._transitions:
+            self._transitions.remove(transition)
+        transition._done.set()  # pylint: disable=protected-access
@@ -14,11 +14,14 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+import contextlib
 import typing
 
+from olc.core.action import Action
+
 if typing.TYPE_CHECKING:
-    from olc.core.action import Action
     from olc.core.app import CoreApplication
+    from olc.core.selection import SelectionAction
 
 
 class HistoryManager:
@@ -52,7 +55,8 @@ class HistoryManager:
 
         action = self._undo_stack.pop()
         try:
-            action.undo()
+            with self._journal(action, "undo"):
+                action.undo()
             self._redo_stack.append(action)
             self.notify_ui_and_controllers()
         except Exception as err:  # pylint: disable=broad-exception-caught
@@ -67,13 +71,28 @@ class HistoryManager:
 
         action = self._redo_stack.pop()
         try:
-            action.redo()
+            with self._journal(action, "redo"):
+                action.redo()
             self._undo_stack.append(action)
             self.notify_ui_and_controllers()
         except Exception as err:  # pylint: disable=broad-exception-caught
             print(f"[HistoryManager] Error during redo of '{action.name}': {err}")
             self._redo_stack.append(action)
 
+    @contextlib.contextmanager
+    def _journal(
+        self, action: Action | SelectionAction, op: str
+    ) -> typing.Iterator[None]:
+        """Journal an undo or a redo of a show edit once it succeeded"""
+        journal = getattr(self.app, "journal", None)
+        # Selection changes are not show edits
+        if journal is None or not isinstance(action, Action):
+            yield
+            return
+        with journal.lock:
+            yield
+            journal.record_history(action, op)
+
     def notify_ui_and_controllers(self) -> None:
         """Update states of Undo/Redo triggers on physical surfaces and GUI."""
         self.app.emit(
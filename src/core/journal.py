@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Append-only journal of the show edits, for crash recovery.
+
+Every undoable action executed through the ActionRegistry, and every undo or
+redo of such an action, is appended to the journal as one JSON line:
+
+    {"op": "do", "name": "group.new", "args": [1.0], "kwargs": {}}
+    {"op": "undo"}
+
+A background compactor periodically folds the journal into a full snapshot of
+the show (binary .olcb container): the current journal segment is closed, a
+new one is opened, the snapshot is written and the older segments and
+snapshots are removed. Each edit only costs one appended line.
+
+The show is collected on the thread editing it (through `dispatch`, the Gtk
+main loop in the application), so that the snapshot is never taken in the
+middle of an edit. Only the snapshot is packed and written by the compactor.
+
+After a crash, the show is recovered by loading the last complete snapshot and
+replaying the records of the following segments.
+
+Files of the journal directory:
+
+- snapshot-<generation>.olcb: show before the records of the same generation
+- journal-<generation>.log: records
+"""
+
+from __future__ import annotations
+
+import enum
+import importlib
+import json
+import numbers
+import os
+import threading
+import time
+import typing
+import weakref
+from collections import deque
+from typing import Any, Callable, NamedTuple
+
+if typing.TYPE_CHECKING:
+    from olc.core.action import Action
+    from olc.core.app import CoreApplication
+
+SNAPSHOT = "snapshot-{:08d}.olcb"
+SEGMENT = "journal-{:08d}.log"
+
+
+class Record(NamedTuple):
+    """Journal record"""
+
+    op: str  # "do", "undo" or "redo"
+    name: str = ""
+    args: tuple = ()
+    kwargs: dict[str, Any] = {}
+
+
+class Recovery(NamedTuple):
+    """Show state left by a previous session"""
+
+    snapshot: str | None  # Path of the last complete snapshot
+    records: list[Record]  # Records to replay on the snapshot
+
+
+def encode(value: Any) -> Any:  # noqa: ANN401
+    """Encode an action argument as JSON, keeping tuples, enums and dict keys
+
+    Raises:
+        TypeError: the value can not be journaled
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, enum.Enum):
+        cls = type(value)
+        return {"enum": f"{cls.__module__}:{cls.__qualname__}", "value": value.value}
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, list):
+        return [encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"tuple": [encode(item) for item in value]}
+    if isinstance(value, dict):
+        return {"dict": [[encode(k), encode(v)] for k, v in value.items()]}
+    raise TypeError(f"{type(value).__name__} can not be journaled")
+
+
+def decode(value: Any) -> Any:  # noqa: ANN401
+    """Decode an action argument encoded by encode()
+
+    Raises:
+        ValueError: the value is not a valid encoded argument
+    """
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "tuple" in value:
+        return tuple(decode(item) for item in value["tuple"])
+    if "dict" in value:
+        return {decode(k): decode(v) for k, v in value["dict"]}
+    if "enum" in value:
+        module, _, name = value["enum"].partition(":")
+        # Only enums of the application are rebuilt
+        if module.split(".")[0] == "olc":
+            cls = importlib.import_module(module)
+            for attr in name.split("."):
+                cls = getattr(cls, attr, None)
+            if isinstance(cls, type) and issubclass(cls, enum.Enum):
+                return cls(value["value"])
+        raise ValueError(f"Unknown enum {value['enum']}")
+    raise ValueError(f"Invalid journal value {value}")
+
+
+def _generation(filename: str, pattern: str) -> int | None:
+    prefix, _, suffix = pattern.partition("{:08d}")
+    if filename.startswith(prefix) and filename.endswith(suffix):
+        number = filename[len(prefix) : len(filename) - len(suffix)]
+        if number.isdigit():
+            return int(number)
+    return None
+
+
+def _files(directory: str, pattern: str) -> dict[int, str]:
+    """Files of a kind by generation"""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return {}
+    files = {}
+    for name in names:
+        generation = _generation(name, pattern)
+        if generation is not None:
+            files[generation] = os.path.join(directory, name)
+    return files
+
+
+def _read_segment(path: str) -> list[Record]:
+    """Records of a journal segment, up to the first incomplete one"""
+    records = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.endswith("\n"):
+                # Interrupted while writing
+                break
+            try:
+                data = json.loads(line)
+                records.append(
+                    Record(
+                        data["op"],
+                        data.get("name", ""),
+                        tuple(decode(data.get("args", []))),
+                        {k: decode(v) for k, v in data.get("kwargs", {}).items()},
+                    )
+                )
+            except (ValueError, KeyError, TypeError, ImportError) as error:
+                print(f"[Journal] Invalid record in {path}: {error}")
+                break
+    return records
+
+
+def replay(app: CoreApplication, records: list[Record]) -> int:
+    """Apply journal records to the show
+
+    Returns:
+        Number of records replayed
+    """
+    replayed = 0
+    for record in records:
+        try:
+            if record.op == "do":
+                app.action_registry.execute(record.name, *record.args, **record.kwargs)
+            elif record.op == "undo":
+                app.history.undo()
+            elif record.op == "redo":
+                app.history.redo()
+            else:
+                continue
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            print(f"[Journal] Error replaying '{record.op} {record.name}': {err}")
+            continue
+        replayed += 1
+    return replayed
+
+
+class Journal:  # pylint: disable=too-many-instance-attributes
+    """Append-only journal of the undoable show edits.
+
+    Edits hold `lock` while they execute and append their record, so that a
+    compaction never splits an edit from its record. Only the actions executed
+    by the ActionRegistry and their undo and redo take `lock`: other changes
+    of the show (windows editing it directly) are only excluded if the show is
+    collected on their thread, through `dispatch`.
+
+    Args:
+        directory: Directory of the journal segments and snapshots
+        collect: Returns the show document (as written in .olc files)
+        compact_every: Number of records that triggers a compaction
+        idle: Seconds without edit after which pending records are compacted
+        dispatch: Calls a function on the thread editing the show
+            (GLib.idle_add). Without it, the compactor collects the show.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        collect: Callable[[], dict[str, Any]],
+        compact_every: int = 1000,
+        idle: float = 30.0,
+        dispatch: Callable[[Callable[[], bool]], object] | None = None,
+    ) -> None:
+        self.directory = directory
+        self.collect = collect
+        self.compact_every = compact_every
+        self.idle = idle
+        self.dispatch = dispatch
+        self._dispatched = False
+        self.lock = threading.RLock()
+        self._generation = 0
+        self._file: typing.TextIO | None = None
+        self._pending = 0
+        self._requested = False
+        self._dirty = False
+        self._last_record = 0.0
+        # Snapshots collected, waiting to be written by the compactor
+        self._snapshots: deque[tuple[int, dict[str, Any]]] = deque()
+        self._write_lock = threading.Lock()
+        self._written = 0
+        # Generation in which each action was last done, undone or redone
+        self._actions: weakref.WeakKeyDictionary[Action, int] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of records since the last compaction"""
+        return self._pending
+
+    @staticmethod
+    def recover(directory: str) -> Recovery | None:
+        """Show state left by a previous session, None if there is nothing"""
+        snapshots = _files(directory, SNAPSHOT)
+        segments = _files(directory, SEGMENT)
+        start = max(snapshots, default=0)
+        records = []
+        for generation in sorted(segments):
+            if generation >= start:
+                records.extend(_read_segment(segments[generation]))
+        if not records:
+            return None
+        return Recovery(snapshots.get(start), records)
+
+    def start(self) -> None:
+        """Discard the previous journal and snapshot the show"""
+        os.makedirs(self.directory, exist_ok=True)
+        self._remove_older(None)
+        self.compact(wait=True)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="JournalCompactor", daemon=True
+        )
+        self._thread.start()
+
+    def close(self, discard: bool = False) -> None:
+        """Stop the compactor and close the journal
+
+        Args:
+            discard: Remove the journal files (show saved or abandoned)
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self.lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if discard:
+                self._remove_older(None)
+
+    def record_action(
+        self, action: Action, name: str, args: tuple, kwargs: dict[str, Any]
+    ) -> None:
+        """Append an executed action (called with `lock` held)"""
+        try:
+            record = {
+                "op": "do",
+                "name": name,
+                "args": encode(list(args)),
+                "kwargs": {k: encode(v) for k, v in kwargs.items()},
+            }
+        except TypeError as err:
+            # The snapshot stands for the record
+            print(f"[Journal] {name}: {err}")
+            self.compact()
+            return
+        self._append(record)
+        self._actions[action] = self._generation
+
+    def record_history(self, action: Action, op: str) -> None:
+        """Append an undo or a redo of an action (called with `lock` held)"""
+        if self._actions.get(action, -1) < self._generation:
+            # The action is older than the snapshot, replay could not find it
+            self.compact()
+            return
+        self._append({"op": op})
+        self._actions[action] = self._generation
+
+    def request_compaction(self) -> None:
+        """Compact on the compactor thread"""
+        self._requested = True
+        self._wake.set()
+
+    def compact(self, wait: bool = False) -> bool:
+        """Start a new journal segment on a snapshot of the show
+
+        The show is collected in the calling thread, which must be the one
+        editing the show. The snapshot is written by the caller if `wait`,
+        else by the compactor thread.
+
+        Returns:
+            False if the show could not be collected
+        """
+        with self.lock:
+            try:
+                document = self.collect()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                # Journal kept on the previous snapshot
+                print(f"[Journal] Unable to collect the show: {err!r}")
+                return False
+            self._generation += 1
+            if self._file is not None:
+                self._file.close()
+            self._file = open(  # pylint: disable=consider-using-with
+                os.path.join(self.directory, SEGMENT.format(self._generation)),
+                "a",
+                encoding="utf-8",
+            )
+            self._pending = 0
+            self._requested = False
+            self._dirty = False
+            generation = self._generation
+        if wait:
+            self._write_snapshot(generation, document)
+        else:
+            self._snapshots.append((generation, document))
+            self._wake.set()
+        return True
+
+    def _append(self, record: dict[str, Any]) -> None:
+        if self._file is None:
+            return
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._pending += 1
+        self._dirty = True
+        self._last_record = time.monotonic()
+        if self._pending >= self.compact_every:
+            self._wake.set()
+
+    def _write_snapshot(self, generation: int, document: dict[str, Any]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from olc.files.olc.binary import pack_show
+
+        path = os.path.join(self.directory, SNAPSHOT.format(generation))
+        with self._write_lock:
+            if generation < self._written:
+                # A newer snapshot was written meanwhile
+                return
+            try:
+                data = pack_show(document)
+                with open(path + ".tmp", "wb") as file:
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(path + ".tmp", path)
+            except (OSError, TypeError, ValueError) as err:
+                print(f"[Journal] Error writing snapshot: {err}")
+                return
+            self._written = generation
+            self._remove_older(generation)
+
+    def _remove_older(self, generation: int | None) -> None:
+        """Remove the files older than a snapshot (all files if None)"""
+        for pattern in (SNAPSHOT, SEGMENT):
+            for number, path in _files(self.directory, pattern).items():
+                if generation is None or number < generation:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+    def _write_snapshots(self) -> None:
+        while self._snapshots:
+            self._write_snapshot(*self._snapshots.popleft())
+
+    def _sync(self) -> None:
+        with self.lock:
+            if self._file is not None and self._dirty:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._dirty = False
+
+    def _compact_dispatched(self) -> bool:
+        self._dispatched = False
+        self.compact()
+        # Called once by the main loop
+        return False
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(timeout=min(1.0, self.idle))
+            self._wake.clear()
+            self._write_snapshots()
+            if self._stop.is_set():
+                break
+            idle = time.monotonic() - self._last_record >= self.idle
+            if (
+                self._requested
+                or self._pending >= self.compact_every
+                or (self._pending and idle)
+            ):
+                if self.dispatch is None:
+                    if self.compact():
+                        self._write_snapshots()
+                elif not self._dispatched:
+                    self._dispatched = True
+                    self.dispatch(self._compact_dispatched)
+            else:
+                try:
+                    self._sync()
+                except OSError as err:
+                    print(f"[Journal] Error syncing journal: {err}")
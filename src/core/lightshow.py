@@ -19,12 +19,12 @@ import typing
 
 from olc.cue import Cues
 from olc.curve import Curves
-from olc.define import UNIVERSES
 from olc.fader_bank import FaderBank
 from olc.group import Groups
 from olc.independent import Independents
+from olc.layout import LAYOUT
 from olc.patch import DMXPatch, PatchByOutputs
-from olc.sequence import Sequence
+from olc.sequence import Chasers, Sequence
 
 if typing.TYPE_CHECKING:
     import olc.core.lightshow
@@ -74,7 +74,7 @@ class LightShow(ShowFile):
     curves: Curves
     main_playback: Sequence
     cues: Cues
-    chasers: list
+    chasers: Chasers
     groups: Groups
     fader_bank: FaderBank
     independents: Independents
@@ -92,7 +92,7 @@ class LightShow(ShowFile):
         # List of global memories
         self.cues = Cues(self)
         # List of chasers
-        self.chasers = []
+        self.chasers = Chasers()
         # List of groups
         self.groups = Groups(lightshow_type)
         # Faders
@@ -100,10 +100,41 @@ class LightShow(ShowFile):
         # Independents
         self.independents = Independents(lightshow_type)
         # Patch
-        self.patch = DMXPatch(UNIVERSES)
+        self.patch = DMXPatch(LAYOUT.universes)
         self.patch_by_outputs = PatchByOutputs(
             typing.cast(typing.Any, app or self.app), self.patch
         )
+        LAYOUT.connect(self._layout_changed)
+
+    @property
+    def universes(self) -> list[int]:
+        """Universes of the show"""
+        return LAYOUT.universes
+
+    @property
+    def max_channels(self) -> int:
+        """Number of channels of the show"""
+        return LAYOUT.max_channels
+
+    def set_layout(self, universes: typing.Iterable[int], max_channels: int) -> None:
+        """Set universes and number of channels of the show
+
+        Levels arrays are reallocated, channels and outputs outside of the new
+        layout are unpatched.
+
+        Args:
+            universes: Universes numbers
+            max_channels: Number of channels (1 - 512 * number of universes)
+
+        Raises:
+            ValueError: invalid layout
+        """
+        LAYOUT.resize(universes, max_channels)
+
+    def _layout_changed(self) -> None:
+        self.patch.resize(LAYOUT.universes, LAYOUT.max_channels)
+        self.fader_bank.resize(LAYOUT.max_channels)
+        self.independents.resize(LAYOUT.max_channels)
 
     def get_cue(self, number: float) -> None | Cue:
         """Get Cue with his number
@@ -136,10 +167,7 @@ class LightShow(ShowFile):
         Returns:
             Chaser or None
         """
-        for chaser in self.chasers:
-            if chaser.index == number:
-                return chaser
-        return None
+        return self.chasers.get(number)
 
     def reset(self) -> None:
         """Reset all"""
@@ -147,10 +175,10 @@ class LightShow(ShowFile):
         del self.main_playback.steps[1:]
         self.cues.clear()
         for chaser in self.chasers:
-            if chaser.run and chaser.thread:
+            if chaser.run and chaser.transition:
                 chaser.run = False
-                chaser.thread.stop()
-                chaser.thread.join()
+                chaser.transition.stop()
+                chaser.transition.join()
         del self.chasers[:]
         self.groups.clear()
         self.fader_bank.reset_faders()
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Binary ZeroMQ monitor stream of the CoreEngine output.
+
+Messages are published as [topic, packet]:
+
+- topic b"s": status, STATUS struct (frames, hz).
+- topic b"u" + universe (uint16 big-endian): HEADER struct followed by the
+  512 channels (FULL), or by `count` channel indices (uint16 little-endian)
+  then `count` values (DELTA against the previous packet of the universe).
+
+Subscribers select universes with ZeroMQ topic prefixes (b"u" for all of
+them); the publisher only encodes the universes someone subscribed to. A full
+frame is sent on subscription and every KEYFRAME_INTERVAL seconds.
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from collections import deque
+from typing import Callable, NamedTuple
+
+import numpy as np
+from olc.core.universe_data import NUM_CHANNELS
+
+MAGIC = b"OLCM"
+VERSION = 1
+# magic, version, kind, universe, frames, hz, protocol flags, channel count
+HEADER = struct.Struct("<4sBBHIfBH")
+# frames, hz
+STATUS = struct.Struct("<If")
+
+FULL = 0
+DELTA = 1
+
+# Protocol flags of a universe
+FLAG_ARTNET = 0x01
+FLAG_SACN = 0x02
+FLAG_DMX_USB_PRO = 0x04
+FLAG_ARTNET_SYNC = 0x10
+FLAG_SACN_SYNC = 0x20
+
+TOPIC_STATUS = b"s"
+TOPIC_UNIVERSES = b"u"
+
+# Seconds between two full frames of a universe
+KEYFRAME_INTERVAL = 1.0
+
+
+def universe_topic(universe: int) -> bytes:
+    """ZeroMQ topic of a universe."""
+    return TOPIC_UNIVERSES + universe.to_bytes(2, "big")
+
+
+class MonitorHeader(NamedTuple):
+    """Decoded header of a universe packet."""
+
+    kind: int
+    universe: int
+    frames: int
+    hz: float
+    flags: int
+    count: int
+
+
+def encode_universe(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    universe: int,
+    frame: np.ndarray,
+    frames: int,
+    hz: float,
+    flags: int,
+    previous: np.ndarray | None = None,
+) -> bytes:
+    """Encode a universe packet, as a delta against `previous` if smaller."""
+    if previous is not None:
+        indices = np.flatnonzero(frame != previous)
+        # Each changed channel costs 3 bytes (index and value)
+        if len(indices) * 3 < NUM_CHANNELS:
+            return b"".join(
+                (
+                    HEADER.pack(
+                        MAGIC, VERSION, DELTA, universe, frames, hz, flags, len(indices)
+                    ),
+                    indices.astype("<u2").tobytes(),
+                    frame[indices].tobytes(),
+                )
+            )
+    return (
+        HEADER.pack(MAGIC, VERSION, FULL, universe, frames, hz, flags, NUM_CHANNELS)
+        + frame.tobytes()
+    )
+
+
+def decode_universe(packet: bytes, frame: np.ndarray) -> MonitorHeader:
+    """Decode a universe packet into `frame` (the previous frame for a delta).
+
+    Raises:
+        ValueError: the packet is not a valid monitor packet
+    """
+    if len(packet) < HEADER.size:
+        raise ValueError("Monitor packet too short")
+    magic, version, kind, universe, frames, hz, flags, count = HEADER.unpack_from(
+        packet
+    )
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Unknown monitor packet")
+    payload = np.frombuffer(packet, dtype=np.uint8, offset=HEADER.size)
+    if kind == FULL and len(payload) == NUM_CHANNELS:
+        frame[:] = payload
+    elif kind == DELTA and len(payload) == count * 3:
+        indices = payload[: count * 2].view("<u2")
+        frame[indices] = payload[count * 2 :]
+    else:
+        raise ValueError("Malformed monitor packet")
+    return MonitorHeader(kind, universe, frames, hz, flags, count)
+
+
+class MonitorPublisher:  # pylint: disable=too-many-instance-attributes
+    """Publishes the output frames on a ZeroMQ XPUB socket.
+
+    The DMX loop offers snapshots at most `fps` times per second. Encoding and
+    publishing run on a dedicated thread, which only keeps the latest snapshot
+    if it falls behind.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        port: int,
+        universe_ids: list[int],
+        flags_fn: Callable[[int], int],
+        fps: float = 15.0,
+        host: str = "127.0.0.1",
+    ) -> None:
+        import zmq  # pylint: disable=import-outside-toplevel
+
+        self._zmq = zmq
+        self._ctx = zmq.Context()
+        self._sock = self._ctx.socket(zmq.XPUB)
+        try:
+            self._sock.bind(f"tcp://{host}:{port}")
+        except Exception:
+            self._sock.close()
+            self._ctx.term()
+            raise
+        self._universe_ids = universe_ids
+        self._topics = [universe_topic(uid) for uid in universe_ids]
+        self._rows = {topic: row for row, topic in enumerate(self._topics)}
+        self._flags_fn = flags_fn
+        self._interval = 1.0 / fps if fps > 0 else 0.0
+        self._last_offer = 0.0
+
+        # Rows subscribed to, and rows waiting for a full frame
+        self._wanted = np.zeros(len(universe_ids), dtype=bool)
+        self._keyframe = np.zeros(len(universe_ids), dtype=bool)
+        self._subscriptions: set[bytes] = set()
+        self._last_keyframe = 0.0
+        self._previous = np.zeros((len(universe_ids), NUM_CHANNELS), dtype=np.uint8)
+
+        self._snapshots: deque[tuple[np.ndarray, int, float]] = deque(maxlen=1)
+        # Universes added by the engine, declared by the publisher thread
+        self._added: deque[int] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="MonitorPublisher", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Returns True if someone listens to the stream."""
+        return bool(self._subscriptions)
+
+    def ready(self) -> bool:
+        """Returns True if a snapshot is expected (rate limit, subscribers)."""
+        return (
+            bool(self._subscriptions)
+            and time.monotonic() - self._last_offer >= self._interval
+        )
+
+    def add_universes(self, universe_ids: list[int]) -> None:
+        """Publish universes added after the first ones (next rows of the frames)."""
+        self._added.extend(universe_ids)
+        self._wake.set()
+
+    def offer(self, frames: np.ndarray, frame_count: int, hz: float) -> None:
+        """Queue a snapshot of the output frames (called by the DMX loop)."""
+        self._last_offer = time.monotonic()
+        self._snapshots.append((frames.copy(), frame_count, hz))
+        self._wake.set()
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Stop the publisher thread and close the socket."""
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=timeout)
+        self._sock.close(linger=0)
+        self._ctx.term()
+
+    def _declare_added(self) -> None:
+        """Add the rows of the universes added by add_universes()."""
+        added = []
+        while self._added:
+            added.append(self._added.popleft())
+        if not added:
+            return
+        self._universe_ids = self._universe_ids + added
+        self._topics = [universe_topic(uid) for uid in self._universe_ids]
+        self._rows = {topic: row for row, topic in enumerate(self._topics)}
+        rows = len(self._universe_ids)
+        # Wanted rows are computed from the subscriptions
+        self._wanted = np.zeros(rows, dtype=bool)
+        self._keyframe = np.concatenate(
+            (self._keyframe, np.ones(len(added), dtype=bool))
+        )
+        previous = np.zeros((rows, NUM_CHANNELS), dtype=np.uint8)
+        previous[: len(self._previous)] = self._previous
+        self._previous = previous
+
+    def _update_subscriptions(self) -> None:
+        """Read the (un)subscriptions received by the XPUB socket."""
+        while True:
+            try:
+                message = self._sock.recv(self._zmq.NOBLOCK)
+            except self._zmq.Again:
+                break
+            if not message:
+                continue
+            topic = message[1:]
+            if message[0] == 1:
+                self._subscriptions.add(topic)
+            else:
+                self._subscriptions.discard(topic)
+            if topic in self._rows:
+                self._keyframe[self._rows[topic]] = True
+            elif TOPIC_UNIVERSES.startswith(topic):
+                self._keyframe[:] = True
+
+        self._wanted[:] = False
+        for topic in self._subscriptions:
+            if TOPIC_UNIVERSES.startswith(topic):
+                self._wanted[:] = True
+                break
+            if topic in self._rows:
+                self._wanted[self._rows[topic]] = True
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(timeout=0.05)
+            self._wake.clear()
+            try:
+                self._declare_added()
+                self._update_subscriptions()
+                if self._snapshots:
+                    self._publish(*self._snapshots.popleft())
+            except self._zmq.ZMQError:
+                if self._stop.is_set():
+                    break
+
+    def _publish(self, snapshot: np.ndarray, frame_count: int, hz: float) -> None:
+        if len(snapshot) != len(self._universe_ids):
+            # Taken before universes were added
+            return
+        send = self._sock.send_multipart
+        send([TOPIC_STATUS, STATUS.pack(frame_count & 0xFFFFFFFF, hz)])
+
+        now = time.monotonic()
+        if now - self._last_keyframe >= KEYFRAME_INTERVAL:
+            self._last_keyframe = now
+            self._keyframe[:] = True
+        keyframe = self._keyframe & self._wanted
+        changed = (snapshot != self._previous).any(axis=1) & self._wanted
+        for row in np.flatnonzero(keyframe | changed):
+            uid = self._universe_ids[row]
+            packet = encode_universe(
+                uid,
+                snapshot[row],
+                frame_count & 0xFFFFFFFF,
+                hz,
+                self._flags_fn(uid),
+                None if keyframe[row] else self._previous[row],
+            )
+            send([self._topics[row], packet])
+        self._keyframe &= ~self._wanted
+        np.copyto(self._previous, snapshot)
@@ -18,9 +18,14 @@ import asyncio
 import fnmatch
 import inspect
 import json
+import re
 import socket
 import struct
-from typing import Any, Callable, Optional, cast
+from typing import Any, Callable, Iterator, Optional, cast
+
+BUNDLE = b"#bundle\x00"
+# Maximum number of addresses remembered by the dispatcher
+DISPATCH_CACHE_SIZE = 4096
 
 
 def _pad(data: bytes) -> bytes:
@@ -38,9 +43,16 @@ def _decode_string(data: bytes, offset: int) -> tuple[str, int]:
     return s, (end + 1 + 3) & ~3
 
 
-def parse_message(data: bytes) -> tuple[str, list]:
-    """Parse a raw OSC message into (address, args)."""
-    address, offset = _decode_string(data, 0)
+def parse_message(
+    data: bytes, start: int = 0, end: int | None = None
+) -> tuple[str, list]:
+    """Parse a raw OSC message into (address, args).
+
+    The message may be a part of `data` (`start` to `end`, e.g. in a bundle).
+    Blobs are returned as memoryviews of `data` (no copy).
+    """
+    end = len(data) if end is None else end
+    address, offset = _decode_string(data, start)
     tags, offset = _decode_string(data, offset)
     args = []
     for tag in tags[1:]:  # Skip leading comma
@@ -57,9 +69,39 @@ def parse_message(data: bytes) -> tuple[str, list]:
             args.append(True)
         elif tag == "F":
             args.append(False)
+        elif tag == "b":
+            size = struct.unpack_from(">i", data, offset)[0]
+            offset += 4
+            if size < 0 or offset + size > end:
+                raise ValueError(f"Invalid blob size {size}")
+            args.append(memoryview(data)[offset : offset + size])
+            offset += (size + 3) & ~3
     return address, args
 
 
+def parse_packet(
+    data: bytes, start: int = 0, end: int | None = None
+) -> Iterator[tuple[str, list]]:
+    """Parse a raw OSC packet (message or bundle) into (address, args).
+
+    Bundles are unpacked recursively, in order. Time tags are ignored: the
+    messages are dispatched as soon as they are received.
+    """
+    end = len(data) if end is None else end
+    if not data.startswith(BUNDLE, start):
+        yield parse_message(data, start, end)
+        return
+    # Skip the bundle header and time tag
+    offset = start + len(BUNDLE) + 8
+    while offset + 4 <= end:
+        size = struct.unpack_from(">i", data, offset)[0]
+        offset += 4
+        if size < 0 or offset + size > end:
+            raise ValueError(f"Invalid bundle element size {size}")
+        yield from parse_packet(data, offset, offset + size)
+        offset += size
+
+
 def build_message(address: str, *args: object) -> bytes:
     """Build a raw binary OSC message from an address and arguments."""
     tags, encoded = ",", b""
@@ -75,9 +117,22 @@ def build_message(address: str, *args: object) -> bytes:
         elif isinstance(arg, str):
             tags += "s"
             encoded += _encode_string(arg)
+        elif isinstance(arg, (bytes, bytearray, memoryview)):
+            tags += "b"
+            blob = bytes(arg)
+            encoded += struct.pack(">i", len(blob)) + _pad(blob)
     return _encode_string(address) + _encode_string(tags) + encoded
 
 
+def build_bundle(*elements: bytes) -> bytes:
+    """Build a raw OSC bundle (time tag: immediately) from messages or bundles."""
+    return (
+        BUNDLE
+        + struct.pack(">Q", 1)
+        + b"".join(struct.pack(">i", len(e)) + e for e in elements)
+    )
+
+
 def make_method(address: str | None, typetags: str | None = None) -> Callable:
     """
     Decorator to register a method as an OSC handler.
@@ -127,6 +182,9 @@ class CoreOSCServer:
     """
     Subclassable asynchronous OSC Server.
     Dispatches exact matches, glob patterns, and fallbacks.
+
+    Exact addresses are looked up in a dict. Glob patterns are compiled once,
+    in registration order, and the handler found for an address is cached.
     """
 
     _handler_map: list[tuple[str | None, Callable]] = []
@@ -150,6 +208,25 @@ class CoreOSCServer:
         self._delegate: Optional[object] = None
         # Copy the harvested class handlers to this instance's handler table
         self._handlers = list(self._handler_map)
+        self._exact: dict[str, Callable] = {}
+        self._patterns: list[tuple[re.Pattern[str], Callable]] = []
+        self._fallback: Optional[Callable] = None
+        self._cache: dict[str, Optional[Callable]] = {}
+        self._index_handlers()
+
+    def _index_handlers(self) -> None:
+        """Build the dispatch tables from the handler list."""
+        self._exact = {}
+        self._patterns = []
+        self._fallback = None
+        for pattern, handler in self._handlers:
+            if pattern is None:
+                self._fallback = handler
+            elif not any(c in pattern for c in "*?["):
+                self._exact.setdefault(pattern, handler)
+            else:
+                self._patterns.append((re.compile(fnmatch.translate(pattern)), handler))
+        self._cache.clear()
 
     def register_delegate(self, delegate: object) -> None:
         """Dynamically harvest and register OSC handlers from a delegate instance."""
@@ -162,21 +239,36 @@ class CoreOSCServer:
                         self._handlers.append((address, attr))
             except AttributeError:
                 continue
+        self._index_handlers()
+
+    def _resolve(self, address: str) -> Optional[Callable]:
+        """Handler of an address (exact match, then first matching pattern)."""
+        handler = self._exact.get(address)
+        if handler is not None:
+            return handler
+        try:
+            return self._cache[address]
+        except KeyError:
+            pass
+        for regex, pattern_handler in self._patterns:
+            if regex.match(address):
+                handler = pattern_handler
+                break
+        if len(self._cache) >= DISPATCH_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[address] = handler
+        return handler
 
     def dispatch(self, address: str, args: list) -> None:
         """Route the received message to matching handlers."""
-        fallback = None
-        for pattern, handler in self._handlers:
-            if pattern is None:
-                fallback = handler
-            elif pattern == address:
-                self._invoke_handler(handler, address, args)
-                return
-            elif fnmatch.fnmatch(address, pattern):
-                self._invoke_handler(handler, address, args)
-                return
-        if fallback:
-            self._invoke_handler(fallback, address, args)
+        handler = self._resolve(address) or self._fallback
+        if handler:
+            self._invoke_handler(handler, address, args)
+
+    def dispatch_packet(self, data: bytes) -> None:
+        """Route the messages of a raw OSC packet (message or bundle)."""
+        for address, args in parse_packet(data):
+            self.dispatch(address, args)
 
     def _invoke_handler(self, handler: Callable, address: str, args: list) -> None:
         """Invoke a handler, passing the instance if unbound."""
@@ -208,8 +300,7 @@ class _OSCProtocol(asyncio.DatagramProtocol):
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
         try:
-            address, args = parse_message(data)
-            self._server.dispatch(address, args)
+            self._server.dispatch_packet(data)
         except Exception as err:  # pylint: disable=broad-exception-caught
             print(f"[OSC Server] Warning: Parse error from {addr}: {err}")
 
@@ -224,13 +315,17 @@ class EngineOSCServer(CoreOSCServer):
         try:
             parts = address.split("/")
             universe_id = int(parts[3])
+            if args and isinstance(args[0], memoryview):
+                # Whole universe from the first channel, written in place
+                self._engine.set_universe(universe_id, args[0])  # type: ignore
+                return
             if args and isinstance(args[0], str):
                 channels = {int(k): int(v) for k, v in json.loads(args[0]).items()}
             else:
-                channels = {}
-                for i in range(0, len(args), 2):
-                    if i + 1 < len(args):
-                        channels[int(args[i])] = int(args[i + 1])
+                channels = {
+                    int(channel): int(value)
+                    for channel, value in zip(args[::2], args[1::2])
+                }
             # Direct channel assignment via CoreEngine
             self._engine.set_channels(universe_id, channels)  # type: ignore
         except Exception as err:  # pylint: disable=broad-exception-caught
@@ -246,3 +341,31 @@ class EngineOSCServer(CoreOSCServer):
             self._engine.blackout(universe_id)  # type: ignore
         except Exception as err:  # pylint: disable=broad-exception-caught
             print(f"[OSC Engine] Error in blackout: {err}")
+
+    @make_method("/olc/engine/stats")
+    def _stats(self, _address: str, _args: list) -> None:
+        """Reply with the DMX loop timing statistics.
+
+        Arguments: target Hz, effective Hz, frames, late, missed, then jitter
+        and send duration p50, p99, p999 and max in milliseconds.
+        """
+        if self._engine is None:
+            return
+        try:
+            stats = self._engine.timing_stats  # type: ignore
+            histograms = [
+                stats[name][key] * 1000.0
+                for name in ("jitter", "send")
+                for key in ("p50", "p99", "p999", "max")
+            ]
+            self._engine.send_osc(  # type: ignore
+                "/olc/engine/stats",
+                float(stats["hz"]),
+                float(stats["effective_hz"]),
+                stats["frames"],
+                stats["late"],
+                stats["missed"],
+                *histograms,
+            )
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            print(f"[OSC Engine] Error in stats: {err}")
@@ -14,6 +14,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+import contextlib
 import typing
 
 if typing.TYPE_CHECKING:
@@ -78,10 +79,14 @@ class ActionRegistry:
         configure = getattr(action, "configure", None)
         if callable(configure):
             configure(*args, **kwargs)
-        result = action.execute()
-
-        if action.can_undo:
-            self.app.history.push(action)
+        journal = getattr(self.app, "journal", None) if action.can_undo else None
+        with journal.lock if journal is not None else contextlib.nullcontext():
+            result = action.execute()
+
+            if action.can_undo:
+                self.app.history.push(action)
+                if journal is not None:
+                    journal.record_action(action, name, args, kwargs)
 
         self._actions[name] = action
         self.trigger_feedback(name)
@@ -19,7 +19,8 @@ from __future__ import annotations
 import typing
 from abc import ABC, abstractmethod
 
-from olc.define import MAX_CHANNELS, is_non_nul_int
+from olc.define import is_non_nul_int
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from olc.core.commandline import CoreCommandLine
@@ -137,7 +138,7 @@ class SelectActiveAction(SelectionAction):
                 return
         self.channel = chan
 
-        if 1 <= chan <= MAX_CHANNELS:
+        if 1 <= chan <= LAYOUT.max_channels:
             self.manager.selected_channels = [chan]
             self.manager.last_selected_channel = chan
             self.manager.commandline.set_string("")
@@ -179,7 +180,7 @@ class SelectAddAction(SelectionAction):
                 return
         self.channel = chan
 
-        if 1 <= chan <= MAX_CHANNELS:
+        if 1 <= chan <= LAYOUT.max_channels:
             new_sel = list(self.old_selection)
             if chan not in new_sel:
                 new_sel.append(chan)
@@ -224,7 +225,7 @@ class SelectRemoveAction(SelectionAction):
                 return
         self.channel = chan
 
-        if 1 <= chan <= MAX_CHANNELS:
+        if 1 <= chan <= LAYOUT.max_channels:
             new_sel = list(self.old_selection)
             if chan in new_sel:
                 new_sel.remove(chan)
@@ -269,7 +270,7 @@ class SelectThruAction(SelectionAction):
                 return
         self.to_channel = to_chan
 
-        if self.old_last is not None and 1 <= to_chan <= MAX_CHANNELS:
+        if self.old_last is not None and 1 <= to_chan <= LAYOUT.max_channels:
             from_chan = self.old_last
             low = min(from_chan, to_chan)
             high = max(from_chan, to_chan)
@@ -304,7 +305,7 @@ class SelectAllAction(SelectionAction):
 
         new_sel = []
         if self.manager.get_level_callback is not None:
-            for ch in range(1, MAX_CHANNELS + 1):
+            for ch in range(1, LAYOUT.max_channels + 1):
                 if self.manager.get_level_callback(ch) > 0:
                     new_sel.append(ch)
         self.manager.selected_channels = new_sel
@@ -20,6 +20,7 @@ import sys
 import typing
 import uuid
 
+import numpy as np
 from olc.core.backends.network_utils import get_local_ips
 from olc.core.universe_data import NUM_CHANNELS, DMXUniverse
 
@@ -51,11 +52,41 @@ def _build_artnet_header(sequence: int, universe: int) -> bytes:
     )
 
 
+def _artnet_socket() -> socket.socket:
+    """Create the non-blocking broadcast UDP socket used to send ArtDmx."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    sock.setblocking(False)
+    return sock
+
+
+def _sacn_socket(interface: str = "") -> socket.socket:
+    """Create a non-blocking UDP multi-cast socket used to send sACN.
+
+    Args:
+        interface: IP address of the multi-cast interface ("" for the default one)
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 20)
+    try:
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+    except OSError:
+        pass
+    if interface:
+        sock.setsockopt(
+            socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface)
+        )
+    sock.setblocking(False)
+    return sock
+
+
 class ArtNetSender:
     """
     Sends a DMX universe over Art-Net 4 via UDP.
     Uses send-msg() + memory-view on Linux/macOS (zero-copy).
     Falls back to send-to() on Windows.
+
+    The ArtDmx header is built once, only the sequence byte is patched per frame.
     """
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -73,47 +104,48 @@ class ArtNetSender:
         self._manager = manager
         self._sequence = 0
         self._sync_active = sync_active
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        self._sock.setblocking(False)
+        self._header = bytearray(_build_artnet_header(0, universe))
+        self._sock = _artnet_socket()
 
-    def send(self, dmx_universe: DMXUniverse) -> None:
-        """Send one DMX frame."""
+    def next_sequence(self) -> None:
+        """Increment the sequence number and patch it into the header."""
         self._sequence = (self._sequence + 1) & 0xFF
-        header = _build_artnet_header(self._sequence, self._universe)
+        self._header[12] = self._sequence
 
+    def destinations(self) -> list[tuple[str, int]]:
+        """Return the discovered active nodes, or the broadcast address."""
         ips = self._manager.get_node_ips(self._universe) if self._manager else []
-
         if ips:
-            # Unicast to all discovered active nodes
-            for ip in ips:
-                if _HAS_SENDMSG and sys.platform != "win32":
-                    try:
-                        self._sock.sendmsg(
-                            [header, dmx_universe.view], [], 0, (ip, self._port)
-                        )
-                    except OSError:
-                        pass
-                else:
-                    try:
-                        self._sock.sendto(
-                            header + bytes(dmx_universe.view), (ip, self._port)
-                        )
-                    except OSError:
-                        pass
-        else:
-            # Fallback to broadcast
+            return [(ip, self._port) for ip in ips]
+        return [(self._ip, self._port)]
+
+    def datagrams(
+        self, dmx_universe: DMXUniverse
+    ) -> list[tuple[tuple[str, str], list[bytearray | np.ndarray], tuple[str, int]]]:
+        """Describe the datagrams of one frame for a batched transmission.
+
+        Returns:
+            (socket key, scatter/gather buffers, destination) for each datagram
+        """
+        return [
+            (("artnet", ""), [self._header, dmx_universe.array], dest)
+            for dest in self.destinations()
+        ]
+
+    def send(self, dmx_universe: DMXUniverse) -> None:
+        """Send one DMX frame."""
+        self.next_sequence()
+        # Unicast to all discovered active nodes, or fallback to broadcast
+        for dest in self.destinations():
             if _HAS_SENDMSG and sys.platform != "win32":
                 try:
-                    self._sock.sendmsg(
-                        [header, dmx_universe.view], [], 0, (self._ip, self._port)
-                    )
+                    self._sock.sendmsg([self._header, dmx_universe.view], [], 0, dest)
                 except OSError:
                     pass
             else:
                 try:
                     self._sock.sendto(
-                        header + bytes(dmx_universe.view), (self._ip, self._port)
+                        bytes(self._header) + bytes(dmx_universe.view), dest
                     )
                 except OSError:
                     pass
@@ -123,6 +155,15 @@ class ArtNetSender:
         self._sock.close()
 
 
+# Offsets of the patched bytes in the E1.31 data packet header
+_SACN_PRIORITY_OFFSET = 108
+_SACN_SEQUENCE_OFFSET = 111
+_SACN_OPTIONS_OFFSET = 112
+_SACN_STREAM_TERMINATED = 0x40
+# Packets sent with the Stream_Terminated option when a source stops
+SACN_TERMINATE_COUNT = 3
+
+
 def _sacn_multicast_ip(universe: int) -> str:
     """Return the sACN multi-cast address for a given universe."""
     hi = (universe >> 8) & 0xFF
@@ -187,6 +228,8 @@ class SACNSender:
     Sends a DMX universe over sACN (E1.31) via UDP multi-cast.
     Uses send-msg() + memory-view on Linux/macOS (zero-copy).
     Falls back to send-to() on Windows.
+
+    The E1.31 header is built once, only the sequence byte is patched per frame.
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -210,7 +253,23 @@ class SACNSender:
             (_sacn_multicast_ip(universe), SACN_PORT) if multicast else (ip, SACN_PORT)
         )
 
+        self._header = bytearray(
+            b"".join(
+                _build_sacn_buffers(
+                    cid=self._cid,
+                    source=source,
+                    universe=universe,
+                    sequence=0,
+                    priority=priority,
+                    payload=memoryview(b""),
+                    sync_address=sync_address,
+                )[:3]
+            )
+        )
+
         self._socks: list[socket.socket] = []
+        # Multi-cast interface of each socket ("" for the default one)
+        self._interfaces: list[str] = []
 
         if multicast:
             try:
@@ -227,23 +286,8 @@ class SACNSender:
             if physical_ips:
                 for ip_addr in physical_ips:
                     try:
-                        sock = socket.socket(
-                            socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
-                        )
-                        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 20)
-                        try:
-                            sock.setsockopt(
-                                socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1
-                            )
-                        except OSError:
-                            pass
-                        sock.setsockopt(
-                            socket.IPPROTO_IP,
-                            socket.IP_MULTICAST_IF,
-                            socket.inet_aton(ip_addr),
-                        )
-                        sock.setblocking(False)
-                        self._socks.append(sock)
+                        self._socks.append(_sacn_socket(ip_addr))
+                        self._interfaces.append(ip_addr)
                     except OSError as err:
                         print(
                             f"[sACN] Warning: Failed to set multicast interface "
@@ -253,45 +297,62 @@ class SACNSender:
         # Fallback to single default socket if not multicast,
         # or if no physical interfaces found
         if not self._socks:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 20)
-            try:
-                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
-            except OSError:
-                pass
-            sock.setblocking(False)
-            self._socks.append(sock)
+            self._socks.append(_sacn_socket())
+            self._interfaces.append("")
+
+    def next_sequence(self) -> None:
+        """Increment the sequence number and patch it into the header."""
+        self._sequence = (self._sequence + 1) & 0xFF
+        self._header[_SACN_SEQUENCE_OFFSET] = self._sequence
+        # Priority may be changed at runtime by SacnManager.send()
+        self._header[_SACN_PRIORITY_OFFSET] = self._priority
+
+    def destinations(self) -> list[tuple[str, int]]:
+        """Return the multi-cast group (or unicast address) of the universe."""
+        return [self._dest]
+
+    def datagrams(
+        self, dmx_universe: DMXUniverse
+    ) -> list[tuple[tuple[str, str], list[bytearray | np.ndarray], tuple[str, int]]]:
+        """Describe the datagrams of one frame for a batched transmission.
+
+        Returns:
+            (socket key, scatter/gather buffers, destination) for each datagram
+        """
+        return [
+            (("sacn", interface), [self._header, dmx_universe.array], self._dest)
+            for interface in self._interfaces
+        ]
 
     def send(self, dmx_universe: DMXUniverse) -> None:
         """Send one DMX frame."""
-        self._sequence = (self._sequence + 1) & 0xFF
-        buffers = _build_sacn_buffers(
-            cid=self._cid,
-            source=self._source,
-            universe=self._universe,
-            sequence=self._sequence,
-            priority=self._priority,
-            payload=dmx_universe.view,
-            sync_address=self._sync_address,
-        )
+        self.next_sequence()
 
         for sock in self._socks:
             if _HAS_SENDMSG and sys.platform != "win32":
                 try:
-                    sock.sendmsg(buffers, [], 0, self._dest)
+                    sock.sendmsg([self._header, dmx_universe.view], [], 0, self._dest)
                 except OSError:
                     pass
             else:
                 try:
                     sock.sendto(
-                        b"".join(
-                            b if isinstance(b, bytes) else bytes(b) for b in buffers
-                        ),
-                        self._dest,
+                        bytes(self._header) + bytes(dmx_universe.view), self._dest
                     )
                 except OSError:
                     pass
 
+    def terminate(self, dmx_universe: DMXUniverse) -> None:
+        """Send the last frame with the Stream_Terminated option, so receivers
+        release the universe at once instead of waiting for the timeout.
+        """
+        self._header[_SACN_OPTIONS_OFFSET] |= _SACN_STREAM_TERMINATED
+        try:
+            for _ in range(SACN_TERMINATE_COUNT):
+                self.send(dmx_universe)
+        finally:
+            self._header[_SACN_OPTIONS_OFFSET] &= ~_SACN_STREAM_TERMINATED & 0xFF
+
     def close(self) -> None:
         """Close the underlying UDP sockets."""
         for sock in self._socks:
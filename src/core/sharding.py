@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Network DMX output sharded across worker processes.
+
+The DMX data of all universes lives in one shared memory block: the main
+process writes it through the DMXUniverse API, the workers own the Art-Net and
+sACN senders of their shard and read it. On every DMXLoop tick, the main
+process gives each worker a "go" token, the workers send the universes flagged
+as due in the block and give back a "done" token once the frame is out.
+
+The number of the tick and the last tick sent by each worker are kept in the
+block: a late worker stops sending when the main process gave up on its tick,
+and tokens of a previous tick are ignored. Semaphores (not barriers) are used
+so that a dead worker never blocks the others nor the main process.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import threading
+import time
+import weakref
+from multiprocessing import shared_memory
+from typing import Callable
+
+import numpy as np
+from olc.core.universe_config import Protocol, UniverseConfig
+from olc.core.universe_data import NUM_CHANNELS, DMXUniverse
+
+# fork keeps the worker imports working when olc is not installed (tests)
+_CONTEXT = multiprocessing.get_context(
+    "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Interval in seconds between two updates of the discovered Art-Net nodes
+NODES_INTERVAL = 1.0
+
+
+def _artnet_universe(config: UniverseConfig) -> int:
+    """Art-Net port address of a universe (net/sub/universe)."""
+    return (config.artnet.net << 8) | (config.artnet.sub << 4) | config.universe_id
+
+
+class _NodeTable:  # pylint: disable=too-few-public-methods
+    """Discovered Art-Net nodes, as sent by the main process to a worker.
+
+    Stands for the ArtNetManager given to the ArtNetSenders of a worker.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: dict[int, list[str]] = {}
+
+    def get_node_ips(self, universe: int) -> list[str]:
+        """Return the IP addresses of the nodes of an Art-Net universe."""
+        return self.nodes.get(universe, [])
+
+
+def _tick_offset(num_rows: int) -> int:
+    """Offset of the tick number in the shared block (after frames and flags).
+
+    The last tick sent by each worker follows.
+    """
+    return -(-num_rows * (NUM_CHANNELS + 1) // 8) * 8
+
+
+def _release_block(shm: shared_memory.SharedMemory) -> None:
+    """Remove the shared memory block (views may still map it)."""
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+def _worker_main(
+    shm_name: str,
+    num_rows: int,
+    rows: dict[int, int],
+    configs: list[UniverseConfig],
+    options: dict,
+    index: int,
+    go: threading.Semaphore,
+    done: threading.Semaphore,
+    stop_event: threading.Event,
+    commands: multiprocessing.Queue,
+) -> None:
+    """Entry point of a worker process: send its universes on every tick."""
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from olc.core.batch import HAS_SENDMMSG, BatchTransmitter
+    from olc.core.engine import _build_senders
+    from olc.core.senders import ArtNetSender, SACNSender
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((num_rows, NUM_CHANNELS), dtype=np.uint8, buffer=shm.buf)
+    due = np.ndarray(
+        (num_rows,), dtype=np.uint8, buffer=shm.buf, offset=num_rows * NUM_CHANNELS
+    )
+    tick = np.ndarray(
+        (1,), dtype=np.int64, buffer=shm.buf, offset=_tick_offset(num_rows)
+    )
+    acked = np.ndarray(
+        (1,),
+        dtype=np.int64,
+        buffer=shm.buf,
+        offset=_tick_offset(num_rows) + 8 * (index + 1),
+    )
+    nodes = _NodeTable()
+
+    def terminate(sender: ArtNetSender | SACNSender, universe: DMXUniverse) -> None:
+        if isinstance(sender, SACNSender):
+            try:
+                sender.terminate(universe)
+            except OSError:
+                pass
+
+    def build(config: UniverseConfig) -> list[ArtNetSender | SACNSender]:
+        return _build_senders(
+            config,
+            nodes,  # type: ignore[arg-type]
+            dest_ip=options["dest_ip"],
+            sacn_multicast=options["sacn_multicast"],
+            sacn_cid=options["sacn_cid"],
+        )
+
+    slots = {
+        config.universe_id: (
+            DMXUniverse(config.universe_id, buffer=frames[rows[config.universe_id]]),
+            build(config),
+        )
+        for config in configs
+    }
+    sent = False
+    batch = BatchTransmitter() if options["batch_transmit"] and HAS_SENDMMSG else None
+
+    last = -1
+    while True:
+        go.acquire()
+        if stop_event.is_set():
+            break
+        current = int(tick[0])
+        if current == last:
+            # Token of a tick already sent
+            continue
+        last = current
+        # Apply configuration changes between two frames
+        while True:
+            try:
+                command, arg = commands.get_nowait()
+            except queue.Empty:
+                break
+            if command == "reload":
+                universe, senders = slots[arg.universe_id]
+                for sender in senders:
+                    if Protocol.SACN not in arg.protocols and sent:
+                        terminate(sender, universe)
+                    sender.close()
+                slots[arg.universe_id] = (universe, build(arg))
+                if batch is not None:
+                    batch.invalidate()
+            elif command == "nodes":
+                nodes.nodes = arg
+        for universe, senders in slots.values():
+            if tick[0] != current:
+                # The main process gave up on this tick
+                break
+            if not due[rows[universe.universe_id]]:
+                continue
+            for sender in senders:
+                try:
+                    if batch is not None:
+                        batch.stage(sender, universe)
+                    else:
+                        sender.send(universe)
+                except OSError:
+                    pass
+        if batch is not None:
+            batch.flush()
+        sent = True
+        acked[0] = current
+        done.release()
+
+    if batch is not None:
+        batch.close()
+    for universe, senders in slots.values():
+        for sender in senders:
+            if sent:
+                terminate(sender, universe)
+            sender.close()
+    del frames, due, tick, acked, slots
+    shm.close()
+
+
+class ShardedOutput:  # pylint: disable=too-many-instance-attributes
+    """Sends the Art-Net and sACN output of a UniverseMap from worker processes.
+
+    Universes are spread round-robin over the workers, which send the rows of
+    the shared `frames` block.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        universe_map: list[UniverseConfig],
+        workers: int,
+        dest_ip: str = "255.255.255.255",
+        sacn_multicast: bool = True,
+        sacn_cid: bytes = b"",
+        batch_transmit: bool = False,
+        tick_timeout: float = 1.0,
+    ) -> None:
+        configs = list(universe_map)
+        self.workers = max(1, min(workers, len(configs)))
+        self.tick_timeout = tick_timeout
+        self._rows = {config.universe_id: row for row, config in enumerate(configs)}
+        self._shards = [configs[i :: self.workers] for i in range(self.workers)]
+        self._owner = {
+            config.universe_id: index
+            for index, shard in enumerate(self._shards)
+            for config in shard
+        }
+        self._artnet_universes = {
+            config.universe_id: _artnet_universe(config) for config in configs
+        }
+        self._options = {
+            "dest_ip": dest_ip,
+            "sacn_multicast": sacn_multicast,
+            "sacn_cid": sacn_cid,
+            "batch_transmit": batch_transmit,
+        }
+
+        # Frames of all universes, their "due" flag, the tick number and the
+        # last tick sent by each worker
+        self._shm = shared_memory.SharedMemory(
+            create=True,
+            size=_tick_offset(max(1, len(configs))) + 8 * (self.workers + 1),
+        )
+        weakref.finalize(self, _release_block, self._shm)
+        self._frames = np.ndarray(
+            (len(configs), NUM_CHANNELS), dtype=np.uint8, buffer=self._shm.buf
+        )
+        self._frames[:] = 0
+        self._due = np.ndarray(
+            (len(configs),),
+            dtype=np.uint8,
+            buffer=self._shm.buf,
+            offset=len(configs) * NUM_CHANNELS,
+        )
+        self._due[:] = 1
+        self._tick = np.ndarray(
+            (1,),
+            dtype=np.int64,
+            buffer=self._shm.buf,
+            offset=_tick_offset(len(configs)),
+        )
+        self._tick[0] = 0
+        self._acked = np.ndarray(
+            (self.workers,),
+            dtype=np.int64,
+            buffer=self._shm.buf,
+            offset=_tick_offset(len(configs)) + 8,
+        )
+
+        self._go: list[threading.Semaphore] = []
+        self._done: list[threading.Semaphore] = []
+        self._stop_event = _CONTEXT.Event()
+        self._commands: list[multiprocessing.Queue] = []
+        self._processes: list[multiprocessing.Process] = []
+        self._nodes: list[dict[int, list[str]]] = [{} for _ in self._shards]
+        self._last_nodes_time = 0.0
+        self.missed_ticks = 0
+
+        self.sync_addresses: set[int] = set()
+        self.artnet_sync = False
+        self._sync_configs = {config.universe_id: config for config in configs}
+        self._update_sync()
+
+    @property
+    def frames(self) -> np.ndarray:
+        """Shared block of the frames sent by the workers, one row per universe."""
+        return self._frames
+
+    def set_due(self, uid: int, due: bool) -> None:
+        """Select whether a universe is sent on the next tick."""
+        self._due[self._rows[uid]] = due
+
+    @property
+    def is_running(self) -> bool:
+        """Returns True if the worker processes are alive."""
+        return bool(self._processes) and all(p.is_alive() for p in self._processes)
+
+    @property
+    def crashed(self) -> bool:
+        """Returns True if a started worker process is no longer alive."""
+        return any(not p.is_alive() for p in self._processes)
+
+    def start(self) -> None:
+        """Spawn the worker processes."""
+        if self._processes:
+            return
+        self._stop_event.clear()
+        self._last_nodes_time = 0.0
+        self._acked[:] = -1
+        self._go = [_CONTEXT.Semaphore(0) for _ in self._shards]
+        self._done = [_CONTEXT.Semaphore(0) for _ in self._shards]
+        for index, shard in enumerate(self._shards):
+            commands = _CONTEXT.Queue()
+            process = _CONTEXT.Process(
+                target=_worker_main,
+                args=(
+                    self._shm.name,
+                    len(self._rows),
+                    self._rows,
+                    shard,
+                    self._options,
+                    index,
+                    self._go[index],
+                    self._done[index],
+                    self._stop_event,
+                    commands,
+                ),
+                name=f"DMXShard-{index}",
+                daemon=True,
+            )
+            process.start()
+            self._commands.append(commands)
+            self._processes.append(process)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the worker processes."""
+        self._stop_event.set()
+        for go in self._go:
+            go.release()
+        for process in self._processes:
+            process.join(timeout=timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=timeout)
+        for commands in self._commands:
+            commands.close()
+        self._processes.clear()
+        self._commands.clear()
+
+    def reload(self, config: UniverseConfig) -> None:
+        """Rebuild the senders of a universe in the worker owning it."""
+        self._artnet_universes[config.universe_id] = _artnet_universe(config)
+        self._sync_configs[config.universe_id] = config
+        self._update_sync()
+        if self._processes:
+            self._commands[self._owner[config.universe_id]].put(("reload", config))
+
+    def _update_sync(self) -> None:
+        configs = self._sync_configs.values()
+        self.sync_addresses = {
+            c.sacn.sync_address
+            for c in configs
+            if Protocol.SACN in c.protocols and c.sacn.sync_address > 0
+        }
+        self.artnet_sync = any(
+            Protocol.ARTNET in c.protocols and c.artnet.sync_active for c in configs
+        )
+
+    def update_nodes(self, get_node_ips: Callable[[int], list[str]]) -> None:
+        """Forward the discovered Art-Net nodes to the workers when they change."""
+        for index, shard in enumerate(self._shards):
+            nodes = {}
+            for config in shard:
+                universe = self._artnet_universes[config.universe_id]
+                if ips := get_node_ips(universe):
+                    nodes[universe] = ips
+            if nodes != self._nodes[index]:
+                self._nodes[index] = nodes
+                self._commands[index].put(("nodes", nodes))
+
+    def tick(self, get_node_ips: Callable[[int], list[str]] | None = None) -> bool:
+        """Let the workers send one frame and wait until it is sent.
+
+        Returns:
+            False if a worker missed the tick or died
+        """
+        if not self._processes or self.crashed:
+            return False
+        now = time.monotonic()
+        if get_node_ips is not None and now - self._last_nodes_time >= NODES_INTERVAL:
+            self._last_nodes_time = now
+            self.update_nodes(get_node_ips)
+        self._tick[0] += 1
+        current = self._tick[0]
+        for go in self._go:
+            go.release()
+        deadline = now + self.tick_timeout
+        for index, done in enumerate(self._done):
+            # Tokens of a previous tick (sent late) are dropped
+            while self._acked[index] != current:
+                if not done.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                    self.missed_ticks += 1
+                    # Late workers stop sending this tick
+                    self._tick[0] += 1
+                    return False
+        return True
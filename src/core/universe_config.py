@@ -147,6 +147,11 @@ class UniverseMap:
     def __len__(self) -> int:
         return len(self._universes)
 
+    def grow(self, num_universes: int) -> None:
+        """Add universes (without protocol) up to `num_universes` - 1"""
+        for uid in range(len(self._universes), num_universes):
+            self._universes[uid] = UniverseConfig(uid)
+
     def set_protocols(self, universe_id: int, protocols: set[Protocol]) -> None:
         """Replace the active protocol set entirely"""
         self._universes[universe_id].set_protocols(protocols)
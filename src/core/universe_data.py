@@ -12,48 +12,206 @@
 # GNU General Public License for more details.
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
+import threading
+from typing import Callable
+
 import numpy as np
 
 NUM_CHANNELS = 512
 
+# Buffers per universe in a FrameStore: published, claimed by the reader, back
+_NUM_BUFFERS = 3
+
+
+class FrameStore:
+    """
+    Triple-buffered frames of several universes, shared by the writers and the
+    DMX loop without a common lock.
+
+    A writer copies its complete frame into a free buffer of the universe and
+    publishes it by swapping the front index. The DMX loop claims the front
+    buffers, copies them to the output block (what the senders read) and
+    releases them. A writer never picks the published nor the claimed buffer,
+    so the loop always sends complete frames.
+    """
+
+    def __init__(self, num_universes: int, output: np.ndarray | None = None) -> None:
+        self._frames = np.zeros(
+            (_NUM_BUFFERS * num_universes, NUM_CHANNELS), dtype=np.uint8
+        )
+        self._num_universes = num_universes
+        self._rows = np.arange(num_universes, dtype=np.intp)
+        # Published buffer of each universe (row in _frames)
+        self._front = self._rows.copy()
+        # Buffer claimed by the reader (-1: none)
+        self._reading = np.full(num_universes, -1, dtype=np.intp)
+        self._claim = np.zeros(num_universes, dtype=np.intp)
+        if output is None:
+            output = np.zeros((num_universes, NUM_CHANNELS), dtype=np.uint8)
+        elif output.shape != (num_universes, NUM_CHANNELS):
+            raise ValueError("Output block must have one row per universe.")
+        self.output = output
+
+    def resize(self, num_universes: int, output: np.ndarray | None = None) -> None:
+        """Adds universes, keeping the published frames of the others.
+
+        Writers and the reader must be stopped (e.g. locks of all the universes
+        and of the reader held).
+
+        Args:
+            num_universes: New number of universes (not less than the current)
+            output: New output block, allocated if None
+        """
+        if num_universes < self._num_universes:
+            raise ValueError("A FrameStore can not lose universes.")
+        frames = np.zeros((_NUM_BUFFERS * num_universes, NUM_CHANNELS), dtype=np.uint8)
+        frames[: self._num_universes] = self._frames[self._front]
+        if output is None:
+            output = np.zeros((num_universes, NUM_CHANNELS), dtype=np.uint8)
+        elif output.shape != (num_universes, NUM_CHANNELS):
+            raise ValueError("Output block must have one row per universe.")
+        output[: self._num_universes] = self.output
+        self._frames = frames
+        self._num_universes = num_universes
+        self._rows = np.arange(num_universes, dtype=np.intp)
+        self._front = self._rows.copy()
+        self._reading = np.full(num_universes, -1, dtype=np.intp)
+        self._claim = np.zeros(num_universes, dtype=np.intp)
+        self.output = output
+
+    def publish(self, row: int, data: np.ndarray) -> None:
+        """Publishes a complete frame (writers of a universe are serialized)."""
+        front = self._front[row]
+        reading = self._reading[row]
+        back = row
+        while back in (front, reading):
+            back += self._num_universes
+        np.copyto(self._frames[back], data)
+        self._front[row] = back
+
+    def acquire(self) -> None:
+        """Copies the latest published frame of every universe to the output."""
+        claim = self._claim
+        np.copyto(claim, self._front)
+        self._reading[:] = claim
+        # A frame published between the read and the claim may be overwritten
+        for row in np.flatnonzero(self._front != claim):
+            for _ in range(_NUM_BUFFERS):
+                claim[row] = self._front[row]
+                self._reading[row] = claim[row]
+                if self._front[row] == claim[row]:
+                    break
+        np.take(self._frames, claim, axis=0, out=self.output, mode="clip")
+        self._reading[:] = -1
+
 
 class DMXUniverse:
     """
     Represents the raw data of a DMX512 universe.
+
+    The data is stored in its own array, or in an existing uint8 buffer of 512
+    channels (e.g. a row of a shared memory block).
+
+    Every write increments `generation`, so that the engine can skip the
+    universes left unchanged since their last transmission. Code writing
+    directly into `array` must call touch(), or write with write_from() when
+    other writers may use the universe at the same time.
+
+    With a FrameStore, every write also publishes the complete frame, read
+    by the DMX loop without locking the writers.
     """
 
-    def __init__(self, universe_id: int = 0) -> None:
+    def __init__(
+        self,
+        universe_id: int = 0,
+        buffer: np.ndarray | None = None,
+        store: FrameStore | None = None,
+        row: int = 0,
+    ) -> None:
         self.universe_id = universe_id
-        self._data = np.zeros(NUM_CHANNELS, dtype=np.uint8)
+        if buffer is None:
+            buffer = np.zeros(NUM_CHANNELS, dtype=np.uint8)
+        elif buffer.shape != (NUM_CHANNELS,) or buffer.dtype != np.uint8:
+            raise ValueError(f"Buffer must be {NUM_CHANNELS} uint8 channels.")
+        self._data = buffer
         self._mv = memoryview(self._data)
+        self._store = store
+        self._row = row
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def _publish(self) -> None:
+        if self._store is not None:
+            self._store.publish(self._row, self._data)
+        self.generation += 1
 
     def __getitem__(self, ch: int) -> int:
         return int(self._data[ch])
 
     def __setitem__(self, ch: int, val: int) -> None:
-        self._data[ch] = np.clip(val, 0, 255)
+        with self._lock:
+            self._data[ch] = np.clip(val, 0, 255)
+            self._publish()
 
     def set_channel(self, ch: int, val: int) -> None:
         """Applies a raw value without clipping (for performance)."""
-        self._data[ch] = val
+        with self._lock:
+            self._data[ch] = val
+            self._publish()
 
     def set_channels(self, channels: dict[int, int]) -> None:
         """Applies a dictionary of channels."""
         idx = np.array(list(channels.keys()), dtype=np.intp)
         val = np.array(list(channels.values()), dtype=np.uint8)
-        self._data[idx] = val
+        with self._lock:
+            self._data[idx] = val
+            self._publish()
 
     def set_all(self, val: int) -> None:
         """Applies the same value to all channels."""
-        self._data[:] = val
+        with self._lock:
+            self._data[:] = val
+            self._publish()
 
     def apply_array(self, arr: np.ndarray) -> None:
-        """Copies an entire array without allocation."""
-        np.copyto(self._data, arr)
+        """Copies an array (up to 512 channels from the first one) without
+        allocation. The generation only changes if the channels differ.
+        """
+        with self._lock:
+            data = self._data[: len(arr)]
+            if not np.array_equal(data, arr):
+                np.copyto(data, arr)
+                self._publish()
+
+    def apply_mask(self, arr: np.ndarray, mask: np.ndarray) -> None:
+        """Copies only the channels selected by a boolean mask without allocation."""
+        with self._lock:
+            np.copyto(self._data, arr, where=mask)
+            self._publish()
 
     def blackout(self) -> None:
         """Resets the universe to zero."""
-        self._data[:] = 0
+        with self._lock:
+            self._data[:] = 0
+            self._publish()
+
+    def write_from(self, fill: Callable[[np.ndarray], object]) -> None:
+        """Fills the channels in place and publishes, serialized with the
+        other writers (e.g. a merger writing its output).
+        """
+        with self._lock:
+            fill(self._data)
+            self._publish()
+
+    def touch(self) -> None:
+        """Marks the universe as modified after a direct write into `array`."""
+        with self._lock:
+            self._publish()
+
+    @property
+    def lock(self) -> threading.Lock:
+        """Lock serializing the writers of the universe."""
+        return self._lock
 
     @property
     def array(self) -> np.ndarray:
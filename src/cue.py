@@ -14,46 +14,321 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+import bisect
+import threading
 import typing
+import weakref
 
 import numpy as np
-from olc.define import MAX_CHANNELS
 from olc.editor import TempChannelsEditor
+from olc.layout import LAYOUT, resized
 
 if typing.TYPE_CHECKING:
     from olc.core.lightshow import LightShow
 
 
-class CueChannels(dict[int, int]):
-    """Custom dictionary to keep the array cache in sync with in-place changes."""
+class CueStore:
+    """Levels of the cues in one (rows, channels) array.
 
-    # pylint: disable=protected-access
+    Each cue owns a row, released when the cue is garbage collected. `levels`
+    holds the levels (0 for the channels not in the cue) and `present` the
+    channels recorded in the cue. Channels outside of the arrays are kept aside
+    in `extra` (they are saved, but not played). The arrays are reallocated
+    when they are full or resized: views of the rows must not be kept while
+    cues are created.
+    """
+
+    def __init__(self, capacity: int = 64, channels: int | None = None) -> None:
+        capacity = max(1, capacity)
+        self.channels = LAYOUT.max_channels if channels is None else channels
+        self.levels = np.zeros((capacity, self.channels), dtype=np.uint8)
+        self.present = np.zeros((capacity, self.channels), dtype=np.bool_)
+        self.extra: dict[int, dict[int, int]] = {}
+        self._free = list(range(capacity - 1, -1, -1))
+        # Reentrant: a garbage collection during an allocation releases rows
+        self.lock = threading.RLock()
 
-    def __init__(self, cue: "Cue", *args: object, **kwargs: object) -> None:
-        super().__init__(*args, **kwargs)
-        self.cue = cue
+    def __len__(self) -> int:
+        """Number of rows in use"""
+        return len(self.levels) - len(self._free)
+
+    def allocate(self) -> int:
+        """Row for a new cue (empty)"""
+        with self.lock:
+            if not self._free:
+                capacity = len(self.levels)
+                self.levels = resized(self.levels, 2 * capacity)
+                self.present = resized(self.present, 2 * capacity)
+                self._free.extend(range(2 * capacity - 1, capacity - 1, -1))
+            row = self._free.pop()
+            self.extra.pop(row, None)
+            self.levels[row] = 0
+            self.present[row] = False
+            return row
+
+    def release(self, row: int) -> None:
+        """Give back the row of a deleted cue"""
+        with self.lock:
+            self.extra.pop(row, None)
+            self._free.append(row)
+
+    def resize(self, channels: int) -> None:
+        """Change the number of channels, levels are moved to or from `extra`"""
+        with self.lock:
+            if channels < self.channels:
+                rows, columns = np.nonzero(self.present[:, channels:])
+                for row, column, level in zip(
+                    rows.tolist(),
+                    (columns + channels + 1).tolist(),
+                    self.levels[rows, columns + channels].tolist(),
+                ):
+                    self.extra.setdefault(row, {})[column] = level
+            width = min(channels, self.channels)
+            levels = np.zeros((len(self.levels), channels), dtype=np.uint8)
+            present = np.zeros((len(self.levels), channels), dtype=np.bool_)
+            levels[:, :width] = self.levels[:, :width]
+            present[:, :width] = self.present[:, :width]
+            self.levels, self.present, self.channels = levels, present, channels
+            for row, extra in list(self.extra.items()):
+                for channel in [c for c in extra if 1 <= c <= channels]:
+                    levels[row, channel - 1] = extra.pop(channel)
+                    present[row, channel - 1] = True
+                if not extra:
+                    del self.extra[row]
+
+    def matrix(self, cues: typing.Iterable[Cue | None]) -> np.ndarray:
+        """Levels of cues, one row per cue (zeros for None)
+
+        Returns:
+            (number of cues, channels) uint8 array (a copy)
+        """
+        cues = list(cues)
+        # pylint: disable=protected-access
+        if any(cue is not None and cue._store is not self for cue in cues):
+            # Cues of other storages
+            empty = np.zeros(self.channels, dtype=np.uint8)
+            return np.stack(
+                [cue.channels_array if cue is not None else empty for cue in cues]
+            )
+        rows = np.fromiter(
+            (cue._row if cue is not None else -1 for cue in cues),
+            dtype=np.intp,
+            count=len(cues),
+        )
+        missing = rows < 0
+        with self.lock:
+            matrix = self.levels[np.where(missing, 0, rows)]
+        matrix[missing] = 0
+        return matrix
+
+
+# Levels of the cues of the show
+CUE_STORE = CueStore()
+LAYOUT.connect(lambda: CUE_STORE.resize(LAYOUT.max_channels))
+
+
+class CueChannels(typing.MutableMapping[int, int]):
+    """Channels levels of a cue, as a dictionary view of its CueStore row.
+
+    The view owns the row, released when the view is garbage collected. It
+    refers weakly to its cue (to count the changes), so that cues are freed
+    as soon as they are deleted, without waiting for a cyclic collection.
+    """
+
+    __slots__ = ("_cue", "_store", "_row", "__weakref__")
+
+    def __init__(self, cue: Cue, store: CueStore, row: int) -> None:
+        self._cue = weakref.ref(cue)
+        self._store = store
+        self._row = row
+        weakref.finalize(self, store.release, row)
+
+    def _changed(self) -> None:
+        cue = self._cue()
+        if cue is not None:
+            cue.generation += 1
+
+    def _load(self, channels: typing.Mapping[int, int]) -> None:
+        """Replace the levels (without changing the generation)"""
+        if isinstance(channels, PackedLevels):
+            numbers = channels.channels.astype(np.intp)
+            levels = channels.levels
+        else:
+            numbers = np.fromiter(channels.keys(), dtype=np.intp, count=len(channels))
+            levels = np.fromiter(
+                channels.values(), dtype=np.int64, count=len(channels)
+            ).astype(np.uint8)
+        store, row = self._store, self._row
+        with store.lock:
+            valid = (numbers >= 1) & (numbers <= store.channels)
+            store.levels[row] = 0
+            store.present[row] = False
+            store.levels[row, numbers[valid] - 1] = levels[valid]
+            store.present[row, numbers[valid] - 1] = True
+            if valid.all():
+                store.extra.pop(row, None)
+            else:
+                store.extra[row] = dict(
+                    zip(numbers[~valid].tolist(), levels[~valid].tolist())
+                )
+
+    def to_dict(self) -> dict[int, int]:
+        """Channels levels dictionary, in channel order"""
+        store, row = self._store, self._row
+        with store.lock:
+            indexes = np.flatnonzero(store.present[row])
+            levels = store.levels[row, indexes]
+            extra = store.extra.get(row)
+        channels = dict(zip((indexes + 1).tolist(), levels.tolist()))
+        if extra:
+            channels.update(extra)
+        return channels
+
+    def __getitem__(self, key: int) -> int:
+        store, row = self._store, self._row
+        # Arrays are reallocated by allocate() and resize()
+        with store.lock:
+            if 1 <= key <= store.channels:
+                if store.present[row, key - 1]:
+                    return int(store.levels[row, key - 1])
+                raise KeyError(key)
+            return store.extra.get(row, {})[key]
 
     def __setitem__(self, key: int, value: int) -> None:
-        super().__setitem__(key, value)
-        if self.cue._channels_array is not None:
-            if 1 <= key <= MAX_CHANNELS:
-                self.cue._channels_array[key - 1] = value
+        store, row = self._store, self._row
+        with store.lock:
+            if 1 <= key <= store.channels:
+                store.levels[row, key - 1] = value
+                store.present[row, key - 1] = True
+            else:
+                store.extra.setdefault(row, {})[key] = value
+        self._changed()
 
     def __delitem__(self, key: int) -> None:
-        super().__delitem__(key)
-        self.cue._channels_array = None
+        store, row = self._store, self._row
+        with store.lock:
+            if 1 <= key <= store.channels:
+                if not store.present[row, key - 1]:
+                    raise KeyError(key)
+                store.levels[row, key - 1] = 0
+                store.present[row, key - 1] = False
+            else:
+                extra = store.extra.get(row, {})
+                del extra[key]
+                if not extra:
+                    store.extra.pop(row, None)
+        self._changed()
+
+    def __contains__(self, key: object) -> bool:
+        store, row = self._store, self._row
+        with store.lock:
+            if isinstance(key, (int, np.integer)) and 1 <= key <= store.channels:
+                return bool(store.present[row, key - 1])
+            return key in store.extra.get(row, {})
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self.to_dict())
 
-    def clear(self) -> None:
-        super().clear()
-        self.cue._channels_array = None
+    def __len__(self) -> int:
+        store, row = self._store, self._row
+        with store.lock:
+            count = int(np.count_nonzero(store.present[row]))
+            return count + len(store.extra.get(row, {}))
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __copy__(self) -> dict[int, int]:
+        return self.to_dict()
+
+    def __deepcopy__(self, _memo: dict) -> dict[int, int]:
+        return self.to_dict()
+
+    def __reduce__(self) -> tuple[type, tuple[dict[int, int]]]:
+        # Pickled as a dictionary
+        return dict, (self.to_dict(),)
+
+    def copy(self) -> dict[int, int]:
+        """Channels levels dictionary"""
+        return self.to_dict()
+
+    def get(self, key: int, default: typing.Any = None) -> typing.Any:  # noqa: ANN401
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> typing.KeysView[int]:
+        return self.to_dict().keys()
 
-    def update(  # ty: ignore[invalid-method-override]
+    def values(self) -> typing.ValuesView[int]:
+        return self.to_dict().values()
+
+    def items(self) -> typing.ItemsView[int, int]:
+        return self.to_dict().items()
+
+    def clear(self) -> None:
+        store, row = self._store, self._row
+        with store.lock:
+            store.levels[row] = 0
+            store.present[row] = False
+            store.extra.pop(row, None)
+        self._changed()
+
+    def update(  # type: ignore[override]
         self,
         m: typing.Mapping[int, int] | typing.Iterable[tuple[int, int]] = (),
         /,
     ) -> None:
-        super().update(m)
-        self.cue._channels_array = None
+        channels = self.to_dict()
+        channels.update(m)
+        self._load(channels)
+        self._changed()
+
+
+class PackedLevels(typing.Mapping[int, int]):
+    """Cue levels stored as packed arrays of channels (uint16) and levels (uint8).
+
+    The arrays may be views of a memory-mapped show file: they are only read
+    when the levels are used.
+    """
+
+    __slots__ = ("channels", "levels")
+
+    def __init__(self, channels: np.ndarray, levels: np.ndarray) -> None:
+        self.channels = channels
+        self.levels = levels
+
+    @classmethod
+    def from_dict(cls, channels: typing.Mapping[int, int]) -> PackedLevels:
+        """Pack a channels levels dictionary, keeping its order"""
+        return cls(
+            np.fromiter((int(c) for c in channels), dtype="<u2", count=len(channels)),
+            np.fromiter(channels.values(), dtype=np.uint8, count=len(channels)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self.channels.tolist())
+
+    def __getitem__(self, channel: int) -> int:
+        index = np.flatnonzero(self.channels == channel)
+        if not len(index):
+            raise KeyError(channel)
+        return int(self.levels[index[-1]])
+
+    def to_dict(self) -> dict[int, int]:
+        """Channels levels dictionary"""
+        return dict(zip(self.channels.tolist(), self.levels.tolist()))
+
+    def to_array(self) -> np.ndarray:
+        """Levels of all channels, as Cue.channels_array"""
+        array = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
+        valid = (self.channels >= 1) & (self.channels <= LAYOUT.max_channels)
+        array[self.channels[valid].astype(np.intp) - 1] = self.levels[valid]
+        return array
 
 
 class Cue:
@@ -66,64 +341,66 @@ class Cue:
     number: float  # Cue number
     _channels: CueChannels  # Channels levels
     text: str  # Cue text
-    _channels_array: np.ndarray | None
+    generation: int  # Incremented on every change of the channels levels
+    _store: CueStore  # Levels storage
+    _row: int  # Row of the levels in the storage
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
         sequence: int,
         number: float,
-        channels: dict[int, int] | None = None,
+        channels: typing.Mapping[int, int] | None = None,
         text: str = "",
+        store: CueStore | None = None,
     ) -> None:
         self.sequence = sequence
         self.number = number
-        self._channels_array = None
-        self._channels = CueChannels(self, channels or {})
+        self.generation = 0
+        self._store = CUE_STORE if store is None else store
+        self._row = self._store.allocate()
+        # Owner of the row
+        self._channels = CueChannels(self, self._store, self._row)
+        if channels:
+            self._channels._load(channels)  # pylint: disable=protected-access
         self.text = text
 
     @property
-    def channels(self) -> dict[int, int]:
+    def channels(self) -> CueChannels:
         """Get the channel levels dictionary."""
         return self._channels
 
     @channels.setter
-    def channels(self, value: dict[int, int]) -> None:
-        self._channels = CueChannels(self, value)
-        self._channels_array = None
+    def channels(self, value: typing.Mapping[int, int]) -> None:
+        if value is not self._channels:
+            self._channels._load(value)  # pylint: disable=protected-access
+        self.generation += 1
 
     @property
     def channels_array(self) -> np.ndarray:
-        """Cached array representation of cue channels for block calculations."""
-        if self._channels_array is None:
-            arr = np.zeros(MAX_CHANNELS, dtype=np.uint8)
-            for channel, level in self.channels.items():
-                if 1 <= channel <= MAX_CHANNELS:
-                    arr[channel - 1] = level
-            self._channels_array = arr
-        return self._channels_array
+        """Levels of all channels (view of the CueStore row, not to be kept)."""
+        return self._store.levels[self._row]
 
     def set_level(self, channel: int, level: int) -> None:
         """Set level of a channel.
 
         Args :
-            channel: channel number (1-MAX_CHANNELS)
+            channel: channel number (1-LAYOUT.max_channels)
             level: level (0 - 255)
         """
         if (
             isinstance(level, int)
             and 0 <= level < 256
             and isinstance(channel, int)
-            and 0 < channel <= MAX_CHANNELS
+            and 0 < channel <= LAYOUT.max_channels
         ):
             self.channels[channel] = level
-            if self._channels_array is not None:
-                self._channels_array[channel - 1] = level
 
     def get_level(self, channel: int) -> int:
         """Get channel's level
 
         Args:
-            channel: channel number (1-MAX_CHANNELS)
+            channel: channel number (1-LAYOUT.max_channels)
 
         Returns:
             channel's level (0-255)
@@ -136,11 +413,15 @@ class Cues:
 
     Wraps a list of Cue objects and acts as a proxy list while providing
     high-level methods for lookup, sorted insertion, and validation.
+    Cues are indexed by (number, sequence), and their numbers are kept in a
+    parallel sorted list for insertions.
     """
 
     def __init__(self, _lightshow: object = None) -> None:
         """Initialize the Cues container."""
         self._cues: list[Cue] = []
+        self._numbers: list[float] = []
+        self._index: dict[tuple[float, int], Cue] = {}
         self._lightshow = _lightshow
         self.cue_editor = CueEditor(typing.cast("LightShow | None", _lightshow))
 
@@ -160,12 +441,20 @@ class Cues:
 
     def __delitem__(self, index: int | slice) -> None:
         """Delete Cue(s) at list position or slice."""
+        removed = self._cues[index]
         del self._cues[index]
+        del self._numbers[index]
+        for cue in removed if isinstance(removed, list) else [removed]:
+            self._unindex(cue)
 
     def __iter__(self) -> typing.Iterator[Cue]:
         """Iterate over all cues."""
         return iter(self._cues)
 
+    def _unindex(self, cue: Cue) -> None:
+        if self._index.get((cue.number, cue.sequence)) is cue:
+            del self._index[cue.number, cue.sequence]
+
     def get(self, number: float, sequence: int) -> Cue | None:
         """Retrieve a Cue by its number and sequence index.
 
@@ -176,10 +465,7 @@ class Cues:
         Returns:
             The matching Cue or None.
         """
-        for cue in self._cues:
-            if cue.number == number and cue.sequence == sequence:
-                return cue
-        return None
+        return self._index.get((number, sequence))
 
     def add(self, cue: Cue) -> None:
         """Add a Cue in sorted number order.
@@ -194,12 +480,10 @@ class Cues:
             raise ValueError(f"Cue {cue.number} (seq {cue.sequence}) already exists.")
 
         # Find insertion index to maintain sorted order
-        insert_idx = len(self._cues)
-        for i, c in enumerate(self._cues):
-            if cue.number < c.number:
-                insert_idx = i
-                break
+        insert_idx = bisect.bisect_right(self._numbers, cue.number)
         self._cues.insert(insert_idx, cue)
+        self._numbers.insert(insert_idx, cue.number)
+        self._index[cue.number, cue.sequence] = cue
 
     def append(self, cue: Cue) -> None:
         """Append a Cue (adds in sorted order).
@@ -215,8 +499,12 @@ class Cues:
         Args:
             cue: Cue object to remove.
         """
-        if cue in self._cues:
-            self._cues.remove(cue)
+        start = bisect.bisect_left(self._numbers, cue.number)
+        end = bisect.bisect_right(self._numbers, cue.number)
+        for i in range(start, end):
+            if self._cues[i] is cue:
+                del self[i]
+                return
 
     def insert(self, _idx: int, cue: Cue) -> None:
         """Insert a Cue (adds in sorted order).
@@ -236,11 +524,15 @@ class Cues:
         Returns:
             The popped Cue.
         """
-        return self._cues.pop(idx)
+        cue = self._cues[idx]
+        del self[idx]
+        return cue
 
     def clear(self) -> None:
         """Clear all cues."""
         self._cues.clear()
+        self._numbers.clear()
+        self._index.clear()
 
 
 class _CueTempChannelsEditor(TempChannelsEditor[tuple[float, int]]):
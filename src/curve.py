@@ -381,10 +381,7 @@ class Curves:
             curve_nb: Curve number
         """
         # First, change each output using deleted curve to LinearCurve (0)
-        for value in self.lightshow.patch.outputs.values():
-            for chan_dic in value.values():
-                if chan_dic[1] == curve_nb:
-                    chan_dic[1] = 0
+        self.lightshow.patch.replace_curve(curve_nb, 0)
         # Delete Curve from self.curves
         self.curves.pop(curve_nb, None)
 
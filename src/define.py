@@ -18,6 +18,7 @@ import unicodedata
 
 from gi.repository import Gio
 
+# Default layout of a show, the current one is olc.layout.LAYOUT
 UNIVERSES = [1, 2, 3, 4]
 NB_UNIVERSES = len(UNIVERSES)
 
@@ -25,6 +26,9 @@ MAX_CHANNELS = 1024
 # Can't have more channels than outputs
 MAX_CHANNELS = min(MAX_CHANNELS, NB_UNIVERSES * 512)
 
+# Highest universe number of a show
+MAX_UNIVERSE = 255
+
 MAX_FADER_PAGE = 10
 MAX_FADER_PER_PAGE = 10
 
@@ -14,14 +14,17 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+import threading
 import typing
 from typing import Callable, Optional
 
 import numpy as np
 from gi.repository import GLib
-from olc.define import DMX_INTERVAL, MAX_CHANNELS, NB_UNIVERSES, UNIVERSES
+from olc.core.fades import FadeScheduler
+from olc.define import DMX_INTERVAL
+from olc.layout import LAYOUT, resized
 from olc.main_fader import MainFader
-from olc.patch import DMXPatch
+from olc.patch import DMXPatch, PatchPipeline
 from olc.timer import RepeatedTimer
 
 if typing.TYPE_CHECKING:
@@ -51,6 +54,7 @@ class Dmx:
     frame: list[np.ndarray]
     user_outputs: dict[tuple[int, int], int]
     thread: RepeatedTimer
+    fades: FadeScheduler
     output_callbacks: list[Callable[[int, list[int]], None]]
     notification_callbacks: list[Callable[[str, str], None]]
 
@@ -62,29 +66,58 @@ class Dmx:
         # Dimmers levels
         self.levels = DmxLevels(
             {
-                "sequence": np.zeros(MAX_CHANNELS, dtype=np.uint8),
-                "user": np.full(MAX_CHANNELS, -1, dtype=np.int16),
-                "faders": np.zeros(MAX_CHANNELS, dtype=np.uint8),
+                "sequence": np.zeros(LAYOUT.max_channels, dtype=np.uint8),
+                "user": np.full(LAYOUT.max_channels, -1, dtype=np.int16),
+                "faders": np.zeros(LAYOUT.max_channels, dtype=np.uint8),
             }
         )
-        # DMX values
-        self.frame = [np.zeros(512, dtype=np.uint8) for _ in range(NB_UNIVERSES)]
-        self._old_frame = [np.zeros(512, dtype=np.uint8) for _ in range(NB_UNIVERSES)]
-        self._old_channel_levels = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+        # Compiled patch and curves, DMX values are rows of its output buffer
+        self._pipeline = PatchPipeline(
+            self.patch,
+            lambda number: self.lightshow.curves.get_curve(number),
+            LAYOUT.nb_universes,
+        )
+        self.frame = list(self._pipeline.output)
+        self._composite = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
+        self._user_mask = np.zeros(LAYOUT.max_channels, dtype=bool)
+        self._old_frame = np.zeros((LAYOUT.nb_universes, 512), dtype=np.uint8)
+        self._old_channel_levels = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
         # To test outputs
         self.user_outputs = {}
         # Callbacks for UI updates
         self.output_callbacks = []
         # Callbacks for notifications
         self.notification_callbacks = []
+        # Go, Go Back and chasers, run on the CoreEngine ticks
+        self.fades = FadeScheduler(self.render_fades)
+        self._send_lock = threading.Lock()
         # Thread to send DMX every DMX_INTERVAL ms
         self.thread = RepeatedTimer(DMX_INTERVAL / 1000, self.send)
+        LAYOUT.connect(self._layout_changed)
+
+    def _layout_changed(self) -> None:
+        """Reallocate the levels arrays and the frames for the show layout"""
+        channels = LAYOUT.max_channels
+        with self._send_lock:
+            for key, levels in self.levels.items():
+                self.levels[key] = resized(levels, channels, -1 if key == "user" else 0)
+            self._composite = resized(self._composite, channels)
+            self._user_mask = resized(self._user_mask, channels)
+            self._old_channel_levels = resized(self._old_channel_levels, channels)
+            self._pipeline.resize(LAYOUT.nb_universes)
+            self.frame = list(self._pipeline.output)
+            self._old_frame = resized(self._old_frame, LAYOUT.nb_universes)
+            self.user_outputs = {
+                (output, universe): level
+                for (output, universe), level in self.user_outputs.items()
+                if universe in LAYOUT.universes
+            }
 
     def get_composite_level(self, channel_idx: int) -> tuple[int, dict[str, float]]:
         """Get the composite level and state color for a channel (0-indexed).
 
         Args:
-            channel_idx: Channel index (0 to MAX_CHANNELS - 1)
+            channel_idx: Channel index (0 to LAYOUT.max_channels - 1)
 
         Returns:
             Tuple of (composite_level, color_dict)
@@ -104,56 +137,45 @@ class Dmx:
             color_level = {"red": 0.4, "green": 0.4, "blue": 0.7}
         return int(level), color_level
 
-    def get_all_composite_levels(self) -> np.ndarray:
+    def get_all_composite_levels(self, out: np.ndarray | None = None) -> np.ndarray:
         """Get composite levels for all channels simultaneously by block.
 
+        Args:
+            out: Array receiving the levels (a new array by default)
+
         Returns:
             Array of composite levels.
         """
-        composite = self.levels["sequence"].copy()
-        composite = np.maximum(composite, self.levels["faders"])
-        composite = np.maximum(composite, self.lightshow.independents.dmx)
+        composite = (
+            np.zeros(LAYOUT.max_channels, dtype=np.uint8) if out is None else out
+        )
+        np.maximum(self.levels["sequence"], self.levels["faders"], out=composite)
+        np.maximum(composite, self.lightshow.independents.dmx, out=composite)
         if not self.lightshow.main_playback.on_go:
-            user_mask = self.levels["user"] != -1
-            composite[user_mask] = self.levels["user"][user_mask]
+            user = self.levels["user"]
+            np.not_equal(user, -1, out=self._user_mask)
+            np.copyto(composite, user, casting="unsafe", where=self._user_mask)
         return composite
 
     def set_levels(self) -> None:
         """Set DMX frame levels"""
-        composite = self.get_all_composite_levels()
-
-        self.patch.update_numpy_cache_if_dirty()
-
-        # Extract levels for each patched output slot
-        out_levels = composite[self.patch.map_src_channels].astype(np.float64)
-
-        # Apply curves by block
-        unique_curves = np.unique(self.patch.map_dst_curves)
-        for curve_numb in unique_curves:
-            if curve_numb != 0:
-                curve = self.lightshow.curves.get_curve(curve_numb)
-                if curve:
-                    curve_mask = self.patch.map_dst_curves == curve_numb
-                    out_levels[curve_mask] = curve.values_array[
-                        out_levels[curve_mask].astype(np.uint8)
-                    ]
-
-        # Scale by Main Fader
-        out_levels = np.round(out_levels * self.main_fader.value).astype(np.uint8)
-
-        # Distribute levels to self.frame using advanced indexing
-        for index in range(NB_UNIVERSES):
-            univ_mask = self.patch.map_dst_universes == index
-            if np.any(univ_mask):
-                self.frame[index][self.patch.map_dst_outputs[univ_mask]] = out_levels[
-                    univ_mask
-                ]
-
-    def send(self) -> None:
-        """Send DMX values to CoreEngine"""
-        if self.lightshow.app is not None and self.lightshow.app.engine is not None:
-            engine = self.lightshow.app.engine
-            for index, universe in enumerate(UNIVERSES):
+        with LAYOUT.lock:
+            composite = self.get_all_composite_levels(out=self._composite)
+            # Curves and main fader through the compiled patch, into self.frame
+            self._pipeline.render(composite, self.main_fader.value)
+
+    def render_fades(self) -> None:
+        """Output the levels of the running transitions (called on each tick)"""
+        self.set_levels()
+        self.send_frames()
+
+    def send_frames(self) -> None:
+        """Send DMX frames to CoreEngine"""
+        if self.lightshow.app is None or self.lightshow.app.engine is None:
+            return
+        engine = self.lightshow.app.engine
+        with self._send_lock:
+            for index, universe in enumerate(LAYOUT.universes):
                 current_frame = self.frame[index]
                 old_frame = self._old_frame[index]
                 if not np.array_equal(current_frame, old_frame):
@@ -162,28 +184,36 @@ class Dmx:
                         GLib.idle_add(
                             self.trigger_output_callbacks, universe, changed_outputs
                         )
-                    np.copyto(self._old_frame[index], current_frame)
+                    np.copyto(old_frame, current_frame)
                 engine.universe(universe).apply_array(current_frame)
 
-            # Compute composite levels for all channels to check for modifications
-            self.patch.update_numpy_cache_if_dirty()
+    def send(self) -> None:
+        """Send DMX values to CoreEngine"""
+        # Runs the transitions if the engine does not tick
+        self.fades.poll(2 * DMX_INTERVAL / 1000)
+        if self.lightshow.app is not None and self.lightshow.app.engine is not None:
+            with LAYOUT.lock:
+                self.send_frames()
 
-            composite = self.get_all_composite_levels()
-            current_display_levels = np.round(composite * self.main_fader.value).astype(
-                np.uint8
-            )
+                # Compute composite levels for all channels to check for modifications
+                self.patch.update_numpy_cache_if_dirty()
 
-            changed_indices = np.where(
-                (current_display_levels != self._old_channel_levels)
-                & self.patch.is_patched_mask
-            )[0]
+                composite = self.get_all_composite_levels()
+                current_display_levels = np.round(
+                    composite * self.main_fader.value
+                ).astype(np.uint8)
 
-            if len(changed_indices) > 0:
-                self._old_channel_levels[changed_indices] = current_display_levels[
-                    changed_indices
-                ]
-                changed_channels = (changed_indices + 1).tolist()
-                GLib.idle_add(self.trigger_channels_update, changed_channels)
+                changed_indices = np.where(
+                    (current_display_levels != self._old_channel_levels)
+                    & self.patch.is_patched_mask
+                )[0]
+
+                if len(changed_indices) > 0:
+                    self._old_channel_levels[changed_indices] = current_display_levels[
+                        changed_indices
+                    ]
+                    changed_channels = (changed_indices + 1).tolist()
+                    GLib.idle_add(self.trigger_channels_update, changed_channels)
 
     def trigger_channels_update(self, changed_channels: list[int]) -> None:
         """Trigger channel widgets updates on the main thread."""
@@ -204,7 +234,7 @@ class Dmx:
 
     def all_outputs_at_zero(self) -> None:
         """All DMX outputs to 0"""
-        for index, universe in enumerate(UNIVERSES):
+        for index, universe in enumerate(LAYOUT.universes):
             self.frame[index].fill(0)
             if self.lightshow.app is not None and self.lightshow.app.engine is not None:
                 self.lightshow.app.engine.universe(universe).blackout()
@@ -214,16 +244,16 @@ class Dmx:
 
         Args:
             output: Output number (1-512)
-            universe: Universe number (one in UNIVERSES)
+            universe: Universe number (one in LAYOUT.universes)
             level: Output level (0-255)
         """
         self.user_outputs[(output, universe)] = level
-        index = UNIVERSES.index(universe)
+        index = LAYOUT.universe_index(universe)
         self.frame[index][output - 1] = level
         if not level:
             self.user_outputs.pop((output, universe))
         if self.lightshow.app is not None and self.lightshow.app.engine is not None:
-            self.lightshow.app.engine.universe(universe).array[output - 1] = level
+            self.lightshow.app.engine.universe(universe).set_channel(output - 1, level)
 
     def add_output_callback(self, callback: Callable[[int, list[int]], None]) -> None:
         """Register a callback for output level changes."""
@@ -19,7 +19,7 @@ from __future__ import annotations
 import typing
 
 import numpy as np
-from olc.define import MAX_CHANNELS
+from olc.layout import LAYOUT, resized
 
 if typing.TYPE_CHECKING:
     from olc.core.lightshow import LightShow
@@ -37,7 +37,7 @@ class TempChannelsEditor(typing.Generic[K]):
             lightshow: The LightShow model instance.
         """
         self.lightshow = lightshow
-        # Temporary overrides: maps entity key to an ndarray of MAX_CHANNELS levels
+        # Temporary overrides: maps entity key to an ndarray of the channels levels
         self._temp_overrides: dict[K, np.ndarray] = {}
 
     def _get_levels_internal(self, key: K) -> np.ndarray:
@@ -49,9 +49,15 @@ class TempChannelsEditor(typing.Generic[K]):
         Returns:
             An ndarray containing DMX levels (-1 representing no modification).
         """
-        if key not in self._temp_overrides:
-            self._temp_overrides[key] = np.full(MAX_CHANNELS, -1, dtype=np.int16)
-        return self._temp_overrides[key]
+        levels = self._temp_overrides.get(key)
+        if levels is None:
+            levels = np.full(LAYOUT.max_channels, -1, dtype=np.int16)
+            self._temp_overrides[key] = levels
+        elif len(levels) != LAYOUT.max_channels:
+            # The show layout changed
+            levels = resized(levels, LAYOUT.max_channels, -1)
+            self._temp_overrides[key] = levels
+        return levels
 
     def get_levels(self, key: K) -> np.ndarray:
         """Retrieve the temporary channel overrides for a specific key.
@@ -72,7 +78,7 @@ class TempChannelsEditor(typing.Generic[K]):
             channel: Channel number (1-based).
             level: The temporary DMX level (0-255).
         """
-        if 1 <= channel <= MAX_CHANNELS:
+        if 1 <= channel <= LAYOUT.max_channels:
             levels = self._get_levels_internal(key)
             levels[channel - 1] = level
             self._notify_changed(key)
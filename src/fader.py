@@ -14,16 +14,17 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-import threading
-import time
 import typing
 from enum import IntEnum
 
 import numpy as np
-from olc.define import MAX_CHANNELS
+from olc.core.fades import Transition
+from olc.cue import CUE_STORE
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from olc.core.app import CoreApplication
+    from olc.core.fades import FadeScheduler
     from olc.cue import Cue
     from olc.fader_bank import FaderBank
     from olc.group import Group
@@ -154,7 +155,7 @@ class FaderGroup(Fader):
     ) -> None:
         super().__init__(index, fader_bank)
         self.contents = group
-        self.dmx = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+        self.dmx = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
         # Channels used by fader
         self.channels = set()
         if group:
@@ -208,7 +209,7 @@ class FaderPreset(Fader):
     ) -> None:
         super().__init__(index, fader_bank)
         self.contents = cue
-        self.dmx = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+        self.dmx = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
         # Channels used by fader
         self.channels = set()
         if cue:
@@ -262,7 +263,7 @@ class FaderChannels(Fader):
     ) -> None:
         super().__init__(index, fader_bank)
         self.contents = channels
-        self.dmx = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+        self.dmx = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
         # Channels used by fader
         self.channels = set()
         if self.contents:
@@ -315,7 +316,7 @@ class FaderSequence(Fader):
     ) -> None:
         super().__init__(index, fader_bank)
         self.contents = chaser
-        self.dmx = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+        self.dmx = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
         # Channels used by fader
         self.channels = set()
         if chaser:
@@ -349,69 +350,137 @@ class FaderSequence(Fader):
         if self.contents is None:
             return
         chaser = typing.cast(typing.Any, self.contents)
+        backend = getattr(self.app, "backend", None) if self.app else None
         # If it was not running and fader > 0
         if self.level and chaser.run is False:
+            # Chasers run on the DMX output clock
+            if backend is None:
+                return
             # Start chaser
             chaser.run = True
-            chaser.thread = ThreadChaser(self)
-            chaser.thread.start()
+            chaser.transition = ChaserTransition(self, backend.dmx.fades)
+            chaser.transition.start()
         # If it was running and fader > 0
         elif self.level and chaser.run is True:
             # Update max level
-            chaser.thread.level_scale = round(self.level * 255)
+            chaser.transition.level_scale = round(self.level * 255)
         # If it was running and fader go to 0
         elif self.level == 0 and chaser.run is True:
             # Stop chaser
             chaser.run = False
-            chaser.thread.stop()
-            chaser.thread.join()
+            chaser.transition.stop()
+            chaser.transition.join()
             for channel in self.channels:
                 self.dmx[channel - 1] = 0
             self.fader_bank.update_levels()
-            if self.app and hasattr(self.app, "backend") and self.app.backend:
-                self.app.backend.dmx.set_levels()
+            if backend:
+                backend.dmx.set_levels()
 
 
-class ThreadChaser(threading.Thread):
-    """Thread for chasers"""
+# pylint: disable=too-many-instance-attributes
+class ChaserTransition(Transition):
+    """Endless transition running a chaser
 
-    def __init__(self, fader: FaderSequence) -> None:
-        super().__init__()
+    Levels of the steps on the fader channels are stacked in a matrix (one
+    row per step), rebuilt when a step, a cue or the channels change. Each
+    tick interpolates two rows of it.
+    """
+
+    def __init__(self, fader: FaderSequence, scheduler: FadeScheduler) -> None:
+        super().__init__(scheduler)
         self.fader = fader
-        self._stopevent = threading.Event()
+        self.level_scale = round(fader.level * 255)
+        self.position = 0
+        # Start of the current step and its duration (ms)
+        self._step_start = 0.0
+        self._step_time = 0.0
+        self._time_in = 0.0
+        self._time_out = 0.0
+        # Compiled steps levels
+        self._key: tuple | None = None
+        self.channels = np.zeros(0, dtype=np.intp)
+        self.matrix = np.zeros((0, 0), dtype=np.int32)
+        self._seq = np.zeros(0, dtype=np.int32)
+        self._old = np.zeros(0, dtype=np.int32)
+        self._next = np.zeros(0, dtype=np.int32)
+        self._levels = np.zeros(0, dtype=np.float64)
+
+    def compile(self, chaser: Sequence) -> None:
+        """Stack the steps levels of the fader channels, if they changed"""
+        key = (
+            frozenset(self.fader.channels),
+            tuple(
+                (id(step.cue), step.cue.generation) if step.cue else None
+                for step in chaser.steps
+            ),
+        )
+        if key == self._key:
+            return
+        self._key = key
+        self.channels = (
+            np.array(
+                sorted(c for c in self.fader.channels if 1 <= c <= LAYOUT.max_channels),
+                dtype=np.intp,
+            )
+            - 1
+        )
+        levels = CUE_STORE.matrix(step.cue for step in chaser.steps)
+        self.matrix = levels[:, self.channels].astype(np.int32)
+        size = len(self.channels)
+        self._seq = np.zeros(size, dtype=np.int32)
+        self._old = np.zeros(size, dtype=np.int32)
+        self._next = np.zeros(size, dtype=np.int32)
+        self._levels = np.zeros(size, dtype=np.float64)
+
+    def _set_step_times(self, chaser: Sequence) -> None:
+        """Times of the transition from the current step to the next one"""
+        if self.position != chaser.last - 1:
+            step = chaser.steps[self.position + 1]
+        else:
+            step = chaser.steps[1]
+        self._time_in = step.time_in * 1000
+        self._time_out = step.time_out * 1000
+        self._step_time = max(self._time_in, self._time_out)
 
-    def run(self) -> None:
-        position = 0
-        chaser = typing.cast(typing.Any, self.fader.contents)
+    def begin(self) -> bool:
+        chaser = self.fader.contents
         if chaser is None:
-            return
-        while chaser.run:
-            if position != chaser.last - 1:
-                t_in = chaser.steps[position + 1].time_in
-                t_out = chaser.steps[position + 1].time_out
-            else:
-                t_in = chaser.steps[1].time_in
-                t_out = chaser.steps[1].time_out
-            t_max = max([t_in, t_out])
-
-            start_time = time.time() * 1000
-            delay = t_max * 1000
-            delay_in = t_in * 1000
-            delay_out = t_out * 1000
-            i = (time.time() * 1000) - start_time
-
-            while i < delay and chaser.run:
-                self.update_levels(delay_in, delay_out, i, position)
-                time.sleep(0.025)
-                i = (time.time() * 1000) - start_time
-
-            position += 1
-            if position == chaser.last:
-                position = 1
-
-    def stop(self) -> None:
-        """Stop thread"""
-        self._stopevent.set()
+            return False
+        self.compile(chaser)
+        self._set_step_times(chaser)
+        return True
+
+    def update(self, elapsed: float) -> bool:
+        chaser = self.fader.contents
+        if chaser is None or not chaser.run:
+            return True
+        # Next steps start at their deadline, whatever the frame rate
+        for _ in range(chaser.last):
+            if elapsed - self._step_start < self._step_time:
+                break
+            self._step_start += self._step_time
+            self.position += 1
+            if self.position == chaser.last:
+                self.position = 1
+            self._set_step_times(chaser)
+        else:
+            # Steps without time: restart from now
+            self._step_start = elapsed
+        self.compile(chaser)
+        self.update_levels(
+            self._time_in, self._time_out, elapsed - self._step_start, self.position
+        )
+        return False
+
+    def _sequence_levels(self) -> np.ndarray:
+        """Main playback levels of the fader channels"""
+        self._seq.fill(0)
+        lightshow = self.fader.fader_bank.lightshow
+        if lightshow and lightshow.main_playback:
+            step = lightshow.main_playback.steps[lightshow.main_playback.position]
+            if step and step.cue:
+                np.take(step.cue.channels_array, self.channels, out=self._seq)
+        return self._seq
 
     def update_levels(
         self, delay_in: float, delay_out: float, i: float, position: int
@@ -427,51 +496,28 @@ class ThreadChaser(threading.Thread):
         chaser = typing.cast(typing.Any, self.fader.contents)
         if chaser is None:
             return
-        # Only fader channels
-        for channel in self.fader.channels:
-            cue = chaser.steps[position].cue
-            old_level = cue.channels.get(channel, 0) if cue else 0
-            lightshow = self.fader.fader_bank.lightshow
-            if lightshow and lightshow.main_playback:
-                step_obj = lightshow.main_playback.steps[
-                    lightshow.main_playback.position
-                ]
-                if step_obj and step_obj.cue:
-                    seq_level = step_obj.cue.channels.get(channel, 0)
-                else:
-                    seq_level = 0
-            else:
-                seq_level = 0
-            old_level = max(old_level, seq_level)
-            # Loop on cues
-            if position < chaser.last - 1:
-                next_cue = chaser.steps[position + 1].cue
-                next_level = next_cue.channels.get(channel, 0) if next_cue else 0
-                next_level = max(next_level, seq_level)
-            else:
-                next_cue = chaser.steps[1].cue
-                next_level = next_cue.channels.get(channel, 0) if next_cue else 0
-                next_level = max(next_level, seq_level)
-                chaser.position = 1
-            # If level increases, use time in
-            if next_level > old_level and i < delay_in:
-                level = int(((next_level - old_level + 1) / delay_in) * i) + old_level
-            # If level decreases, use time out
-            elif next_level < old_level and i < delay_out:
-                level = old_level - abs(
-                    int(((next_level - old_level - 1) / delay_out) * i)
-                )
-            # Else, level is already good
-            else:
-                level = next_level
-            # Apply fader level
-            level = round(level * self.fader.level)
-            # Update fader level
-            self.fader.dmx[channel - 1] = level
+        # Loop on cues
+        if position < chaser.last - 1:
+            next_position = position + 1
+        else:
+            next_position = 1
+            chaser.position = 1
+        seq_levels = self._sequence_levels()
+        old = np.maximum(self.matrix[position], seq_levels, out=self._old)
+        new = np.maximum(self.matrix[next_position], seq_levels, out=self._next)
+        levels = self._levels
+        levels[:] = new
+        # If level increases, use time in (int() rounds towards 0)
+        if i < delay_in:
+            up = new > old
+            levels[up] = np.trunc((new[up] - old[up] + 1) / delay_in * i) + old[up]
+        # If level decreases, use time out
+        if i < delay_out:
+            down = new < old
+            levels[down] = old[down] - np.abs(
+                np.trunc((new[down] - old[down] - 1) / delay_out * i)
+            )
+        # Apply fader level
+        np.round(levels * self.fader.level, out=levels)
+        self.fader.dmx[self.channels] = levels
         self.fader.fader_bank.update_levels()
-        if (
-            self.fader.app
-            and hasattr(self.fader.app, "backend")
-            and self.fader.app.backend
-        ):
-            self.fader.app.backend.dmx.set_levels()
@@ -27,6 +27,7 @@ from olc.fader import (
     FaderSequence,
     FaderType,
 )
+from olc.layout import resized
 
 if typing.TYPE_CHECKING:
     import olc.fader_bank
@@ -261,6 +262,17 @@ class FaderBank:
                     self.active_faders.add(fader)
                     self.channels = self.channels | fader.channels
 
+    def resize(self, channels: int) -> None:
+        """Reallocate faders DMX levels for a number of channels
+
+        Args:
+            channels: Number of channels
+        """
+        for page in self.faders.values():
+            for fader in page.values():
+                if hasattr(fader, "dmx"):
+                    fader.dmx = resized(fader.dmx, channels)
+
     def update_levels(self) -> None:
         """Update faders levels for DMX"""
         if self.app and hasattr(self.app, "backend") and self.app.backend:
@@ -19,9 +19,10 @@ import typing
 from enum import Enum, auto
 
 from olc.curve import LimitCurve
-from olc.define import MAX_CHANNELS, NB_UNIVERSES, UNIVERSES, string_to_time
+from olc.define import string_to_time
 from olc.fader import FaderType
 from olc.files.read import ReadFile
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from olc.files.import_file import ImportFile
@@ -98,7 +99,19 @@ class AsciiParser(ReadFile):
 
     def parse(self) -> None:
         """Parse file line by line"""
-        for line in self.contents.splitlines():
+        self.parse_lines(self.contents.splitlines())
+
+    def parse_stream(self, text: typing.TextIO) -> None:
+        """Parse file line by line while it is decoded"""
+        self.parse_lines(text)
+
+    def parse_lines(self, lines: typing.Iterable[str]) -> None:
+        """Parse lines
+
+        Args:
+            lines: Lines of the file
+        """
+        for line in lines:
             line = line.strip()
             if line:
                 loop = self._do_parse(line)
@@ -196,14 +209,14 @@ class AsciiParser(ReadFile):
         """Add patch info to stored data
 
         Args:
-            channel: Channel (1 - MAX_CHANNELS)
-            dimmer: Dimmer (1 - 512 * NB_UNIVERSES)
+            channel: Channel (1 - LAYOUT.max_channels)
+            dimmer: Dimmer (1 - LAYOUT.outputs)
             level: Proportional level (1 - 255)
         """
         univ_index = int((dimmer - 1) / 512)
-        if univ_index < NB_UNIVERSES:
-            univ = UNIVERSES[univ_index]
-            if channel <= MAX_CHANNELS:
+        if univ_index < LAYOUT.nb_universes:
+            univ = LAYOUT.universes[univ_index]
+            if channel <= LAYOUT.max_channels:
                 address = dimmer - (512 * univ_index)
                 curve_nb = 0
                 if level != 255:
@@ -301,7 +314,7 @@ class AsciiParser(ReadFile):
         if self.keyword == "chan":
             for index in range(0, len(self.args), 2):
                 channel = int(self.args[index])
-                if channel <= MAX_CHANNELS:
+                if channel <= LAYOUT.max_channels:
                     level = self._get_level(self.args[index + 1])
                     cues[self.current["cue"]]["channels"][channel] = level
         elif self.keyword == "down":
@@ -17,9 +17,10 @@ from __future__ import annotations
 import typing
 
 from olc.curve import LimitCurve
-from olc.define import UNIVERSES, strip_accents
+from olc.define import strip_accents
 from olc.fader import FaderType
 from olc.files.write import WriteFile
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from gi.repository import Gio
@@ -228,7 +229,7 @@ class AsciiWriter(WriteFile):
                 univ = values[1]
                 if univ is None or output is None:
                     continue
-                index = UNIVERSES.index(univ)
+                index = LAYOUT.universe_index(univ)
                 limit = 255
                 curve_num = self.lightshow.patch.outputs[univ][output][1]
                 curve = self.lightshow.curves.get_curve(curve_num)
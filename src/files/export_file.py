@@ -19,7 +19,7 @@ import typing
 from gi.repository import Gio
 from olc.files.ascii.writer import AsciiWriter
 from olc.files.file_type import FileType
-from olc.files.olc.writer import OlcWriter
+from olc.files.olc.writer import OlcBinaryWriter, OlcWriter
 
 if typing.TYPE_CHECKING:
     from olc.core.lightshow import LightShow
@@ -45,6 +45,8 @@ class ExportFile:
 
         if self.file_type is FileType.ASCII:
             self.writer = AsciiWriter(self.file, lightshow)
+        elif self.file_type is FileType.OLC_BINARY:
+            self.writer = OlcBinaryWriter(self.file, lightshow, midi)
         else:
             self.writer = OlcWriter(self.file, lightshow, midi)
 
@@ -56,6 +58,6 @@ class ExportFile:
         """Get file type
 
         Returns:
-            "ascii" or "olc"
+            "ascii", "olc" or binary "olc"
         """
         return self.file_type
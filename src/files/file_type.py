@@ -12,6 +12,7 @@
 # GNU General Public License for more details.
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
+import pathlib
 from enum import Enum, auto
 
 
@@ -20,3 +21,35 @@ class FileType(Enum):
 
     ASCII = auto()
     OLC = auto()
+    OLC_BINARY = auto()
+
+    @classmethod
+    def from_name(cls, name: str | None) -> "FileType | None":
+        """File type from a file name extension
+
+        Args:
+            name: File name
+
+        Returns:
+            File type, None if the extension is unknown
+        """
+        if name is None:
+            return None
+        extension = "".join(
+            [s for s in pathlib.Path(name).suffixes if " " not in s]
+        ).lower()
+        return EXTENSIONS.get(extension)
+
+
+EXTENSIONS = {
+    ".asc": FileType.ASCII,
+    ".olc": FileType.OLC,
+    ".olcb": FileType.OLC_BINARY,
+}
+
+
+def show_file_type(name: str | None) -> FileType:
+    """Format of a show file: binary for .olcb files, .olc otherwise"""
+    if FileType.from_name(name) is FileType.OLC_BINARY:
+        return FileType.OLC_BINARY
+    return FileType.OLC
@@ -22,10 +22,11 @@ gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk  # noqa: E402
 from olc.core.universe_config import Protocol  # noqa: E402
 from olc.cue import Cue  # noqa: E402
+from olc.define import MAX_CHANNELS, UNIVERSES  # noqa: E402
 from olc.files.ascii.parser import AsciiParser  # noqa: E402
 from olc.files.file_type import FileType  # noqa: E402
 from olc.files.import_dialog import Action, DialogData  # noqa: E402
-from olc.files.olc.parser import OlcParser  # noqa: E402
+from olc.files.olc.parser import OlcBinaryParser, OlcParser  # noqa: E402
 from olc.files.parsed_data import ParsedData  # noqa: E402
 from olc.independent import Independents  # noqa: E402
 from olc.step import Step  # noqa: E402
@@ -129,7 +130,8 @@ class ImportFile:
                 importation=importation,
             )
         else:
-            self.parser = OlcParser(
+            parser = OlcBinaryParser if file_type is FileType.OLC_BINARY else OlcParser
+            self.parser = parser(
                 typing.cast("olc.files.import_file.ImportFile", self),
                 window=self.window,
                 importation=importation,
@@ -165,10 +167,14 @@ class ImportFile:
         self._do_import_independents()
         self._do_import_presets()
         self._do_import_faders()
-        if self.file_type is FileType.OLC:
+        if self.file_type in (FileType.OLC, FileType.OLC_BINARY):
             self._do_import_midi()
             self._do_import_universes()
         self._update_ui()
+        app = self.lightshow.app
+        if app is not None and app.core.journal is not None:
+            # The show changed outside of the journaled actions
+            app.core.journal.compact()
 
     def _do_import_curves(self) -> None:
         if self.actions["curves"] is Action.IGNORE:
@@ -181,6 +187,13 @@ class ImportFile:
         if self.actions["patch"] is Action.IGNORE:
             return
         if self.actions["patch"] is Action.REPLACE:
+            if self.file_type in (FileType.OLC, FileType.OLC_BINARY):
+                # Shows saved without layout use the default one
+                layout = self.data.data.get("layout") or {}
+                self.lightshow.set_layout(
+                    layout.get("universes", UNIVERSES),
+                    layout.get("channels", MAX_CHANNELS),
+                )
             self.lightshow.patch.patch_empty()
         # Import patch
         self.data.import_patch()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Binary show container (.olcb).
+
+The show is stored as the .olc JSON document, except for the cue levels:
+
+- HEADER: magic, version, flags, number of cue blocks, metadata size.
+- Metadata: the .olc document (UTF-8 JSON), where the channels of a cue are
+  replaced by {"block": index}.
+- Block table: offset and channel count of each cue block (BLOCK dtype).
+- Cue blocks: channels (uint16 little-endian) followed by levels (uint8),
+  padded to an even size.
+
+Blocks are read as views of the file buffer (a memory map for local files),
+so the levels of a cue are only read when the cue is loaded.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import typing
+from typing import Any, Callable
+
+import numpy as np
+from olc.cue import PackedLevels
+
+MAGIC = b"OLCB"
+VERSION = 1
+# magic, version, flags, blocks, metadata size
+HEADER = struct.Struct("<4sHHIQ")
+BLOCK = np.dtype([("offset", "<u8"), ("count", "<u4"), ("reserved", "<u4")])
+
+
+def _cue_sections(data: dict[str, Any]) -> typing.Iterator[dict]:
+    """Cues dictionaries of a show document (sequences and presets)"""
+    for sequence in (data.get("sequences") or {}).values():
+        yield sequence.get("cues") or {}
+    yield data.get("cues") or {}
+
+
+def _block_size(channels: int) -> int:
+    """Size of a cue block, channels stay aligned on 2 bytes"""
+    return 3 * channels + (channels & 1)
+
+
+def pack_show(data: dict[str, Any]) -> bytes:
+    """Encode a show document (as written in .olc files)
+
+    Cue channels may be dictionaries or PackedLevels. `data` is not modified.
+    """
+    blocks: list[PackedLevels] = []
+    document = dict(data)
+    if "sequences" in data:
+        document["sequences"] = {
+            index: dict(sequence, cues=dict(sequence.get("cues") or {}))
+            for index, sequence in data["sequences"].items()
+        }
+    if "cues" in data:
+        document["cues"] = dict(data["cues"])
+    for cues in _cue_sections(document):
+        for number, cue in cues.items():
+            channels = cue["channels"]
+            if not isinstance(channels, PackedLevels):
+                channels = PackedLevels.from_dict(channels)
+            cues[number] = dict(cue, channels={"block": len(blocks)})
+            blocks.append(channels)
+
+    metadata = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    table = np.zeros(len(blocks), dtype=BLOCK)
+    offset = HEADER.size + len(metadata) + table.nbytes
+    for index, block in enumerate(blocks):
+        table[index] = (offset, len(block), 0)
+        offset += _block_size(len(block))
+    parts = [HEADER.pack(MAGIC, VERSION, 0, len(blocks), len(metadata)), metadata]
+    parts.append(table.tobytes())
+    for block in blocks:
+        parts.append(block.channels.astype("<u2", copy=False).tobytes())
+        parts.append(block.levels.astype(np.uint8, copy=False).tobytes())
+        parts.append(b"\0" * (len(block) & 1))
+    return b"".join(parts)
+
+
+def unpack_show(
+    buffer: typing.Any,  # noqa: ANN401
+    object_hook: Callable[[dict], Any] | None = None,
+) -> dict[str, Any]:
+    """Decode a show document, cue channels are PackedLevels views of `buffer`
+
+    Args:
+        buffer: File contents (bytes, memoryview or mmap)
+        object_hook: Applied to the JSON objects of the metadata
+
+    Raises:
+        ValueError: not a valid binary show
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError("Binary show too short")
+    magic, version, _flags, count, size = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Unknown binary show")
+    start = HEADER.size + size + count * BLOCK.itemsize
+    if start > len(buffer):
+        raise ValueError("Truncated binary show")
+    metadata = bytes(memoryview(buffer)[HEADER.size : HEADER.size + size])
+    try:
+        document = json.loads(metadata.decode("utf-8"), object_hook=object_hook)
+    except (UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise ValueError(f"Invalid binary show metadata: {error}") from error
+    table = np.frombuffer(buffer, dtype=BLOCK, count=count, offset=HEADER.size + size)
+    if count and int(
+        (table["offset"] + 3 * table["count"].astype(np.uint64)).max()
+    ) > len(buffer):
+        raise ValueError("Truncated binary show")
+    for cues in _cue_sections(document):
+        for cue in cues.values():
+            try:
+                block = table[cue["channels"]["block"]]
+            except (IndexError, KeyError, TypeError) as error:
+                raise ValueError(f"Invalid cue block: {error}") from error
+            offset, channels = int(block["offset"]), int(block["count"])
+            cue["channels"] = PackedLevels(
+                np.frombuffer(buffer, dtype="<u2", count=channels, offset=offset),
+                np.frombuffer(
+                    buffer, dtype=np.uint8, count=channels, offset=offset + 2 * channels
+                ),
+            )
+    return document
+
+
+def _unpacked(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, PackedLevels):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def binary_to_json(buffer: typing.Any) -> str:  # noqa: ANN401
+    """JSON text of a binary show, as written by OlcWriter"""
+    return json.dumps(
+        unpack_show(buffer), indent=2, ensure_ascii=False, default=_unpacked
+    )
+
+
+def json_to_binary(text: str) -> bytes:
+    """Binary show of a .olc JSON text"""
+    return pack_show(json.loads(text))
@@ -15,10 +15,13 @@
 from __future__ import annotations
 
 import json
+import mmap
 import typing
 
 from olc.define import is_float, is_int
+from olc.files.olc.binary import unpack_show
 from olc.files.read import ReadFile
+from olc.files.stream import iter_json_members
 
 if typing.TYPE_CHECKING:
     from gi.repository import Gtk
@@ -48,6 +51,20 @@ class OlcParser(ReadFile):
         except json.decoder.JSONDecodeError:
             self._error_dialog("Input file is not a valid file: JSONDecodeError")
             return
+        self._store(contents)
+
+    def parse_stream(self, text: typing.TextIO) -> None:
+        """Parse file one section at a time while it is decoded"""
+        try:
+            contents = dict(iter_json_members(text, object_hook=self._key_to_number))
+        except json.decoder.JSONDecodeError:
+            self._error_dialog("Input file is not a valid file: JSONDecodeError")
+            return
+        self._store(contents)
+
+    def _store(self, contents: dict) -> None:
+        """Store parsed sections"""
+        self.data["layout"] = contents.get("layout")
         self.data["curves"] = contents.get("curves")
         self.data["patch"] = contents.get("patch")
         self.data["sequences"] = contents.get("sequences")
@@ -67,3 +84,45 @@ class OlcParser(ReadFile):
 
     def _key_to_number(self, obj: dict) -> dict:
         return {self._int_float_str(k): v for k, v in obj.items()}
+
+
+class OlcBinaryParser(OlcParser):
+    """Parse binary olc files
+
+    Local files are memory-mapped, the cue levels are read when cues are loaded.
+    """
+
+    def __init__(
+        self,
+        imported: ImportFile,
+        window: Gtk.Window | None = None,
+        importation: bool = False,
+    ) -> None:
+        super().__init__(imported, window=window, importation=importation)
+        self.compressed = False
+
+    def _read_data(self, data: bytes) -> bool:
+        return self.parse_buffer(data)
+
+    def _read_file(self, path: str) -> bool:
+        try:
+            with open(path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as error:
+            self._error_dialog(str(error))
+            return False
+        return self.parse_buffer(buffer)
+
+    def parse_buffer(self, buffer: bytes | mmap.mmap) -> bool:
+        """Parse file contents
+
+        Returns:
+            False if the file is not a binary show
+        """
+        try:
+            contents = unpack_show(buffer, object_hook=self._key_to_number)
+        except ValueError as error:
+            self._error_dialog(f"Input file is not a valid file: {error}")
+            return False
+        self._store(contents)
+        return True
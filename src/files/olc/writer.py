@@ -19,6 +19,7 @@ import typing
 
 from olc.curve import InterpolateCurve, LimitCurve, SegmentsCurve
 from olc.fader import FaderType
+from olc.files.olc.binary import pack_show
 from olc.files.write import WriteFile
 
 if typing.TYPE_CHECKING:
@@ -44,6 +45,16 @@ class OlcWriter(WriteFile):
         self.data = {"application": "olc", "version": "0.8.5.beta"}
 
     def export(self) -> None:
+        self.collect()
+
+        json_str = json.dumps(self.data, indent=2, ensure_ascii=False, sort_keys=False)
+
+        if self.stream:
+            self.stream.write(bytes(json_str, "utf-8"))
+
+    def collect(self) -> dict[str, typing.Any]:
+        """Collect the show document, as written in the file"""
+        self._layout()
         self._curves()
         self._patch()
         self._sequences()
@@ -53,11 +64,13 @@ class OlcWriter(WriteFile):
         self._independents()
         self._midi()
         self._universes()
+        return self.data
 
-        json_str = json.dumps(self.data, indent=2, ensure_ascii=False, sort_keys=False)
-
-        if self.stream:
-            self.stream.write(bytes(json_str, "utf-8"))
+    def _layout(self) -> None:
+        self.data["layout"] = {
+            "universes": list(self.lightshow.universes),
+            "channels": self.lightshow.max_channels,
+        }
 
     def _patch(self) -> None:
         self.data["patch"] = {}
@@ -126,7 +139,7 @@ class OlcWriter(WriteFile):
                 self.data["sequences"][seq_index]["steps"][index]["label"] = step.text
             self.data["sequences"][seq_index]["cues"][step.cue.number] = {
                 "label": step.cue.text,
-                "channels": step.cue.channels,
+                "channels": step.cue.channels.to_dict(),
             }
 
     def _cues(self) -> None:
@@ -134,7 +147,7 @@ class OlcWriter(WriteFile):
         for cue in self.lightshow.cues:
             self.data["cues"][cue.number] = {
                 "label": cue.text,
-                "channels": cue.channels,
+                "channels": cue.channels.to_dict(),
             }
 
     def _groups(self) -> None:
@@ -236,8 +249,8 @@ class OlcWriter(WriteFile):
         engine = app.engine
         for config in engine.universe_map:
             u = config.universe_id
-            # We only serialize configured universes (like 1 to 4)
-            if u == 0:
+            # We only serialize configured universes and those of the show
+            if u == 0 or (not config.protocols and u not in self.lightshow.universes):
                 continue
             protocols = [p.name for p in config.protocols]
             self.data["universes"][str(u)] = {
@@ -257,3 +270,18 @@ class OlcWriter(WriteFile):
                     "model": config.dmx_usb_pro.model,
                 },
             }
+
+
+class OlcBinaryWriter(OlcWriter):
+    """Write binary olc file, cue levels are stored as packed arrays"""
+
+    def __init__(
+        self, file: Gio.File, lightshow: LightShow, midi: Midi | None = None
+    ) -> None:
+        super().__init__(file, lightshow, midi)
+        self.compressed = False
+
+    def export(self) -> None:
+        self.collect()
+        if self.stream:
+            self.stream.write(pack_show(self.data))
@@ -46,6 +46,7 @@ class ParsedData:
         self.midi = midi
         self.data = {
             "console": {"console": "", "manufacturer": ""},
+            "layout": {},
             "curves": {},
             "patch": {},
             "sequences": {1: {"label": "", "mode": "normal", "steps": {}, "cues": {}}},
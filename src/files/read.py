@@ -20,6 +20,7 @@ from gettext import gettext as _
 
 from charset_normalizer import from_bytes
 from gi.repository import GLib, Gtk
+from olc.files.stream import open_show
 
 if typing.TYPE_CHECKING:
     from gi.repository import Gio
@@ -58,14 +59,52 @@ class ReadFile:
         except GLib.GError as error:
             self._error_dialog(str(error))
             return
+        if self._read_data(data):
+            self._loaded()
+
+    def _read_data(self, data: bytes) -> bool:
+        """Decode and parse the contents of a file
+
+        Returns:
+            False if the file can not be read
+        """
         if self.compressed:
             try:
                 data = gzip.decompress(data)
             except gzip.BadGzipFile:
                 self._error_dialog("Input file is not a valid file: BadGzipFile")
-                return
+                return False
         self.contents = str(from_bytes(data).best())
         self.parse()
+        return True
+
+    def _read_stream(self, path: str) -> bool:
+        self.read_now(path)
+        return GLib.SOURCE_REMOVE
+
+    def read_now(self, path: str) -> None:
+        """Read and load a local file synchronously"""
+        if self._read_file(path):
+            self._loaded()
+
+    def _read_file(self, path: str) -> bool:
+        """Decode and parse a local file while it is read
+
+        Returns:
+            False if the file can not be read
+        """
+        try:
+            with open_show(path, self.compressed) as text:
+                self.parse_stream(text)
+        except gzip.BadGzipFile:
+            self._error_dialog("Input file is not a valid file: BadGzipFile")
+            return False
+        except (OSError, EOFError) as error:
+            self._error_dialog(str(error))
+            return False
+        return True
+
+    def _loaded(self) -> None:
         self.imported.data.clean()
         if self.importation:
             self.imported.select_data()
@@ -73,8 +112,15 @@ class ReadFile:
             self.imported.load_all()
 
     def read(self) -> None:
-        """Read all file"""
-        self.imported.file.load_contents_async(None, self._load_cb, None)
+        """Read all file
+
+        Local files are streamed, others are loaded at once.
+        """
+        path = self.imported.file.get_path()
+        if path is None:
+            self.imported.file.load_contents_async(None, self._load_cb, None)
+        else:
+            GLib.idle_add(self._read_stream, path)
 
     def parse(self) -> None:
         """Parse file
@@ -84,6 +130,17 @@ class ReadFile:
         """
         raise NotImplementedError
 
+    def parse_stream(self, text: typing.TextIO) -> None:
+        """Parse file while it is decoded
+
+        Subclasses parse incrementally, by default the whole text is parsed.
+
+        Args:
+            text: Decoded file
+        """
+        self.contents = text.read()
+        self.parse()
+
     def _error_dialog(self, message: str) -> None:
         dialog = Gtk.MessageDialog(
             transient_for=self.window,
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Streaming reading of show files.
+
+The encoding is detected on a bounded prefix of the file, the rest is decoded
+while it is parsed: ASCII shows line by line, .olc shows one top-level JSON
+member at a time.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import re
+import typing
+from typing import BinaryIO, Callable, Iterator, TextIO
+
+from charset_normalizer import from_bytes
+
+# Bytes read to detect the encoding
+PREFIX_SIZE = 64 * 1024
+# Characters read at once by the JSON reader
+CHUNK_SIZE = 256 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that may follow a complete JSON value
+_DELIMITERS = " \t\n\r,:]}"
+
+
+def detect_encoding(prefix: bytes) -> str:
+    """Encoding of a file from its first bytes
+
+    Args:
+        prefix: First bytes of the file
+
+    Returns:
+        Python codec name (utf-8 if unknown)
+    """
+    # Do not cut a multi-byte character at the end of the prefix
+    end = prefix.rfind(b"\n")
+    if end > 0:
+        prefix = prefix[: end + 1]
+    match = from_bytes(prefix).best()
+    if match is None or match.encoding == "ascii":
+        # ASCII prefix, non ASCII characters may come later
+        return "utf-8"
+    return match.encoding
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Replays the bytes already read before the rest of a stream"""
+
+    def __init__(self, prefix: bytes, stream: BinaryIO) -> None:
+        super().__init__()
+        self._prefix = memoryview(prefix)
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: typing.Any) -> int:  # noqa: ANN401
+        if self._prefix:
+            size = min(len(buffer), len(self._prefix))
+            buffer[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        data = self._stream.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def open_text(stream: BinaryIO, prefix_size: int = PREFIX_SIZE) -> TextIO:
+    """Decode a binary stream, with the encoding detected on its prefix
+
+    Undecodable bytes are replaced, as with a detection on the whole file.
+    """
+    prefix = stream.read(prefix_size)
+    encoding = detect_encoding(prefix)
+    reader = io.BufferedReader(_PrefixedReader(prefix, stream))
+    return io.TextIOWrapper(reader, encoding=encoding, errors="replace", newline="")
+
+
+def open_show(path: str, compressed: bool = False) -> TextIO:
+    """Open a show file as a decoded text stream
+
+    Raises:
+        OSError: the file can not be read (gzip.BadGzipFile if not compressed)
+    """
+    stream: BinaryIO = (
+        typing.cast(BinaryIO, gzip.open(path, "rb")) if compressed else open(path, "rb")  # pylint: disable=consider-using-with
+    )
+    try:
+        return open_text(stream)
+    except Exception:
+        stream.close()
+        raise
+
+
+def iter_json_members(
+    text: TextIO,
+    object_hook: Callable[[dict], typing.Any] | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    depth: int = 3,
+) -> Iterator[tuple[str, typing.Any]]:
+    """Decode the members of a top-level JSON object one by one
+
+    Objects nested up to `depth` levels are also decoded member by member, so
+    that large sections (sequences, cues) are never decoded again when more
+    text is needed: only the innermost values are decoded at once.
+
+    Raises:
+        json.JSONDecodeError: invalid or truncated JSON
+    """
+    decoder = json.JSONDecoder(object_hook=object_hook)
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill(size: int) -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        data = text.read(size)
+        if not data:
+            eof = True
+            return False
+        buffer = buffer[pos:] + data
+        pos = 0
+        return True
+
+    def skip_whitespace() -> str:
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill(chunk_size):
+                raise json.JSONDecodeError("Unexpected end of data", buffer, pos)
+
+    def decode() -> typing.Any:  # noqa: ANN401
+        nonlocal pos
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Incomplete value: read as much again (amortized linear)
+                if not fill(max(chunk_size, len(buffer) - pos)):
+                    raise
+                continue
+            # A number may continue in the next chunk ("-12" of "-12.5e3")
+            if (end == len(buffer) or buffer[end] not in _DELIMITERS) and fill(
+                chunk_size
+            ):
+                continue
+            pos = end
+            return value
+
+    def members(level: int) -> Iterator[tuple[str, typing.Any]]:
+        nonlocal pos
+        if skip_whitespace() != "{":
+            raise json.JSONDecodeError("Expecting '{'", buffer, pos)
+        pos += 1
+        if skip_whitespace() == "}":
+            pos += 1
+            return
+        while True:
+            if skip_whitespace() != '"':
+                raise json.JSONDecodeError("Expecting property name", buffer, pos)
+            key = decode()
+            if skip_whitespace() != ":":
+                raise json.JSONDecodeError("Expecting ':' delimiter", buffer, pos)
+            pos += 1
+            if level < depth and skip_whitespace() == "{":
+                value = dict(members(level + 1))
+                yield key, value if object_hook is None else object_hook(value)
+            else:
+                skip_whitespace()
+                yield key, decode()
+            separator = skip_whitespace()
+            pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos - 1)
+
+    yield from members(0)
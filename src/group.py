@@ -14,6 +14,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+import bisect
 import typing
 from dataclasses import dataclass
 
@@ -66,6 +67,8 @@ class Groups:
 
     Wraps a list of Group objects and acts as a proxy list while providing
     high-level methods for lookup, insertion, and index management.
+    Groups are indexed by number, and their numbers are kept in a parallel
+    sorted list for insertions.
     """
 
     def __init__(self, lightshow: LightShow) -> None:
@@ -76,6 +79,8 @@ class Groups:
         """
         self.lightshow = lightshow
         self._groups: list[Group] = []
+        self._keys: list[float] = []
+        self._index: dict[float, Group] = {}
         self.group_editor = GroupEditor(lightshow)
 
     def __len__(self) -> int:
@@ -88,7 +93,12 @@ class Groups:
 
     def __delitem__(self, index: int | slice) -> None:
         """Delete Group(s) at list position or slice."""
+        removed = self._groups[index]
         del self._groups[index]
+        del self._keys[index]
+        for group in removed if isinstance(removed, list) else [removed]:
+            if self._index.get(group.index) is group:
+                del self._index[group.index]
 
     def __iter__(self) -> typing.Iterator[Group]:
         """Iterate over all groups."""
@@ -103,10 +113,7 @@ class Groups:
         Returns:
             The matching Group or None.
         """
-        for group in self._groups:
-            if group.index == index:
-                return group
-        return None
+        return self._index.get(index)
 
     def add(self, group: Group) -> None:
         """Add a Group in sorted index order.
@@ -121,12 +128,10 @@ class Groups:
             raise ValueError(f"Group with index {group.index} already exists.")
 
         # Find the insertion index to maintain sorted order
-        insert_idx = len(self._groups)
-        for i, g in enumerate(self._groups):
-            if g.index > group.index:
-                insert_idx = i
-                break
+        insert_idx = bisect.bisect_right(self._keys, group.index)
         self._groups.insert(insert_idx, group)
+        self._keys.insert(insert_idx, group.index)
+        self._index[group.index] = group
 
     def append(self, group: Group) -> None:
         """Append a Group (adds in sorted order).
@@ -142,8 +147,9 @@ class Groups:
         Args:
             group: Group object to remove.
         """
-        if group in self._groups:
-            self._groups.remove(group)
+        position = bisect.bisect_left(self._keys, group.index)
+        if position < len(self._groups) and self._groups[position] is group:
+            del self[position]
 
     def insert(self, _idx: int, group: Group) -> None:
         """Insert a Group at a specific list index (adds in sorted order instead).
@@ -164,11 +170,15 @@ class Groups:
         Returns:
             The popped Group object.
         """
-        return self._groups.pop(idx)
+        group = self._groups[idx]
+        del self[idx]
+        return group
 
     def clear(self) -> None:
         """Clear all groups."""
         self._groups.clear()
+        self._keys.clear()
+        self._index.clear()
 
     def get_next_index(self) -> float:
         """Calculate the next available group index.
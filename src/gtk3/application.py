@@ -12,6 +12,7 @@
 # GNU General Public License for more details.
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
+import os
 import pathlib
 import sys
 import typing
@@ -31,11 +32,13 @@ from olc.core.app import CoreApplication  # noqa: E402
 from olc.core.backends.osc.delegate import OSCDelegate  # noqa: E402
 from olc.core.binding import MidiBinding, OscBinding  # noqa: E402
 from olc.core.engine import CoreEngine  # noqa: E402
+from olc.core.journal import Journal, Recovery, replay  # noqa: E402
 from olc.core.universe_config import Protocol, UniverseMap  # noqa: E402
-from olc.define import UNIVERSES  # noqa: E402
+from olc.define import MAX_CHANNELS, UNIVERSES  # noqa: E402
 from olc.files.export_file import ExportFile  # noqa: E402
-from olc.files.file_type import FileType  # noqa: E402
+from olc.files.file_type import FileType, show_file_type  # noqa: E402
 from olc.files.import_file import ImportFile  # noqa: E402
+from olc.files.olc.writer import OlcWriter  # noqa: E402
 from olc.gtk3.channel_time import ChanneltimeTab  # noqa: E402
 from olc.gtk3.cue import CuesEditionTab  # noqa: E402
 from olc.gtk3.curve import CurvesTab  # noqa: E402
@@ -53,6 +56,7 @@ from olc.gtk3.track_channels import TrackChannelsTab  # noqa: E402
 from olc.gtk3.virtual_console import VirtualConsoleWindow  # noqa: E402
 from olc.gtk3.window import Window  # noqa: E402
 from olc.independent import Independents  # noqa: E402
+from olc.layout import LAYOUT  # noqa: E402
 from olc.midi import Midi  # noqa: E402
 from olc.sequence import Sequence  # noqa: E402
 from olc.settings import SettingsTab  # noqa: E402
@@ -261,7 +265,7 @@ class Application(Gtk.Application):
                     imported = ImportFile(
                         self.core.lightshow,
                         self.core.lightshow.file,
-                        FileType.OLC,
+                        show_file_type(self.core.lightshow.file.get_basename()),
                         window=self.window,
                         midi=self.midi,
                         settings=self.settings,
@@ -270,11 +274,12 @@ class Application(Gtk.Application):
                     imported.parse()
             return False
 
-        # Set up UniverseMap for CoreEngine
-        universe_map = UniverseMap(max(UNIVERSES) + 1)
-        for u in range(1, 5):
+        # Set up UniverseMap for CoreEngine, grown with the show universes
+        universe_map = UniverseMap(max(LAYOUT.universes) + 1)
+        for u in LAYOUT.universes:
             universe_map.enable_protocol(u, Protocol.ARTNET)
             universe_map.enable_protocol(u, Protocol.SACN)
+        LAYOUT.connect(self._layout_changed)
 
         self.engine = CoreEngine(universe_map, monitor_port=5555, no_listen=True)
         self.core.engine = self.engine
@@ -307,13 +312,14 @@ class Application(Gtk.Application):
         self.backend.dmx.add_notification_callback(self.on_backend_notification)
         # Activate olc
         self.activate()
+        recovered = self._start_journal()
         arguments = command_line.get_arguments()
-        if len(arguments) > 1:
+        if len(arguments) > 1 and not recovered:
             self.core.lightshow.file = command_line.create_file_for_arg(arguments[1])
             imported = ImportFile(
                 self.core.lightshow,
                 self.core.lightshow.file,
-                FileType.OLC,
+                show_file_type(self.core.lightshow.file.get_basename()),
                 window=self.window,
                 midi=self.midi,
                 settings=self.settings,
@@ -322,6 +328,71 @@ class Application(Gtk.Application):
             imported.parse()
         return False
 
+    def _layout_changed(self) -> None:
+        """Send the universes added to the show"""
+        if self.engine is None:
+            return
+        self.engine.grow_universes(max(LAYOUT.universes) + 1)
+        for universe in LAYOUT.universes:
+            config = self.engine.universe_map[universe]
+            if not config.protocols:
+                config.set_protocols({Protocol.ARTNET, Protocol.SACN})
+                self.engine.reload_universe(universe)
+
+    def _start_journal(self) -> bool:
+        """Journal the show edits, after recovering those of a crashed session
+
+        Returns:
+            True if a show was recovered
+        """
+        directory = os.path.join(GLib.get_user_cache_dir(), "olc", "journal")
+        recovery = Journal.recover(directory)
+        recovered = False
+        if recovery is not None and self.window is not None:
+            dialog = ConfirmationDialog(
+                _(
+                    "The previous session was not closed properly.\n"
+                    "Recover its unsaved changes?"
+                ),
+                self.window,
+            )
+            response = dialog.run()
+            dialog.destroy()
+            if response == Gtk.ResponseType.OK:
+                self._recover(recovery)
+                recovered = True
+        journal = Journal(directory, self._show_document, dispatch=GLib.idle_add)
+        try:
+            journal.start()
+        except OSError as err:
+            print(f"[Journal] Unable to start: {err}")
+            return recovered
+        self.core.journal = journal
+        return recovered
+
+    def _recover(self, recovery: Recovery) -> None:
+        """Load the last snapshot of a crashed session and replay its edits"""
+        if recovery.snapshot is not None:
+            imported = ImportFile(
+                self.core.lightshow,
+                Gio.File.new_for_path(recovery.snapshot),
+                FileType.OLC_BINARY,
+                window=self.window,
+                midi=self.midi,
+                settings=self.settings,
+                tabs=self.tabs,
+            )
+            imported.parser.read_now(recovery.snapshot)
+        replay(self.core, recovery.records)
+        self.core.lightshow.set_modified()
+
+    def _show_document(self) -> dict[str, typing.Any]:
+        """Show document snapshotted by the journal"""
+        writer = OlcWriter(
+            typing.cast(Gio.File, None), self.core.lightshow, midi=self.midi
+        )
+        return writer.collect()
+
     def on_backend_notification(self, title: str, body: str) -> None:
         """Handle notifications triggered by backend (Dmx)."""
         notification = Gio.Notification()
@@ -386,16 +457,17 @@ class Application(Gtk.Application):
         assert self.tabs is not None
         # Stop Chasers
         for chaser in self.core.lightshow.chasers:
-            if chaser.run and chaser.thread:
+            if chaser.run and chaser.transition:
                 chaser.run = False
-                chaser.thread.stop()
-                chaser.thread.join()
+                chaser.transition.stop()
+                chaser.transition.join()
         # All channels at 0
         if self.backend:
             self.backend.dmx.levels["user"][:] = -1
             self.backend.dmx.set_levels()
         self.window.live_view.channels_view.flowbox.unselect_all()
-        # Reset Patch
+        # Default layout and Patch
+        self.core.lightshow.set_layout(UNIVERSES, MAX_CHANNELS)
         self.core.lightshow.patch.patch_1on1()
         # Reset Main Playback
         self.core.lightshow.main_playback = Sequence(1, "Main Playback")
@@ -418,6 +490,9 @@ class Application(Gtk.Application):
         self.tabs.refresh_all()
 
         self.window.live_view.channels_view.last_selected_channel = ""
+        # The journal restarts from the empty show
+        if self.core.journal is not None:
+            self.core.journal.compact()
 
     def _open(self, _action: Gio.SimpleAction, _parameter: GLib.Variant | None) -> None:
         """create a file chooser dialog to open:
@@ -435,6 +510,7 @@ class Application(Gtk.Application):
         filter_text = Gtk.FileFilter()
         filter_text.set_name(_("OLC Files"))
         filter_text.add_pattern("*.[Oo][Ll][Cc]")
+        filter_text.add_pattern("*.[Oo][Ll][Cc][Bb]")
         open_dialog.add_filter(filter_text)
         filter_text = Gtk.FileFilter()
         filter_text.set_name(_("All Files"))
@@ -454,7 +530,7 @@ class Application(Gtk.Application):
             imported = ImportFile(
                 self.core.lightshow,
                 self.core.lightshow.file,
-                FileType.OLC,
+                show_file_type(self.core.lightshow.file.get_basename()),
                 window=self.window,
                 midi=self.midi,
                 settings=self.settings,
@@ -488,6 +564,7 @@ class Application(Gtk.Application):
         filter_text = Gtk.FileFilter()
         filter_text.set_name(_("OLC Files"))
         filter_text.add_pattern("*.[Oo][Ll][Cc]")
+        filter_text.add_pattern("*.[Oo][Ll][Cc][Bb]")
         open_dialog.add_filter(filter_text)
         filter_text = Gtk.FileFilter()
         filter_text.set_name(_("All Files"))
@@ -501,14 +578,8 @@ class Application(Gtk.Application):
             filename = open_dialog.get_filename()
             if filename is None:
                 return
-            extension = "".join(
-                [s for s in pathlib.Path(filename).suffixes if " " not in s]
-            ).lower()
-            if extension == ".asc":
-                file_type = FileType.ASCII
-            elif extension == ".olc":
-                file_type = FileType.OLC
-            else:
+            file_type = FileType.from_name(filename)
+            if file_type is None:
                 print("Extension non connue")
                 open_dialog.destroy()
                 return
@@ -554,7 +625,7 @@ class Application(Gtk.Application):
         if self.core.lightshow.file is not None:
             exported = ExportFile(
                 self.core.lightshow.file,
-                FileType.OLC,
+                show_file_type(self.core.lightshow.file.get_basename()),
                 self.core.lightshow,
                 midi=self.midi,
             )
@@ -598,7 +669,7 @@ class Application(Gtk.Application):
             # save to file
             exported = ExportFile(
                 self.core.lightshow.file,
-                FileType.OLC,
+                show_file_type(self.core.lightshow.file.get_basename()),
                 self.core.lightshow,
                 midi=self.midi,
             )
@@ -824,16 +895,20 @@ class Application(Gtk.Application):
                 self._save(None, None)
         self.core.lightshow.main_playback.stop()
         for chaser in self.core.lightshow.chasers:
-            if chaser.run and chaser.thread:
+            if chaser.run and chaser.transition:
                 chaser.run = False
-                chaser.thread.stop()
-                chaser.thread.join()
+                chaser.transition.stop()
+                chaser.transition.join()
         if self.midi:
             self.midi.stop()
         if self.backend:
             self.backend.stop()
         if self.engine is not None:
             self.engine.stop()
+        self.core.stop_dispatch()
+        if self.core.journal is not None:
+            # Clean exit: nothing to recover
+            self.core.journal.close(discard=True)
         self.quit()
         return False
 
@@ -237,6 +237,7 @@ class ChanneltimeTab(Gtk.Paned):
             time = self.step.channel_time[channel].time
             if delay == 0.0 and time == 0.0:
                 del self.step.channel_time[channel]
+        self.step.update_total_time()
         self.tabs.close("channel_time")
 
     def on_key_press_event(
@@ -291,6 +292,7 @@ class ChanneltimeTab(Gtk.Paned):
             time = self.step.channel_time[channel].time
             if delay == 0.0 and time == 0.0:
                 del self.step.channel_time[channel]
+        self.step.update_total_time()
         self.tabs.close("channel_time")
 
     def _keypress_backspace(self) -> None:
@@ -334,6 +336,7 @@ class ChanneltimeTab(Gtk.Paned):
                 # If not already exist
                 if channel not in self.step.channel_time:
                     self.step.channel_time[channel] = ChannelTime(0.0, 0.0)
+                    self.step.update_total_time()
                     self.repopulate_liststore()
                     # select the newly added row at the end of liststore
                     path = Gtk.TreePath.new_from_indices([len(self.liststore) - 1])
@@ -358,7 +361,7 @@ class CTChannelsView(ChannelsView):
         """Channel at level
 
         Args:
-            channel: Channel number (1 - MAX_CHANNELS)
+            channel: Channel number (1 - LAYOUT.max_channels)
             level: DMX level (0 - 255)
         """
 
@@ -18,9 +18,10 @@ import typing
 from typing import Callable
 
 from gi.repository import Gdk, Gtk
-from olc.define import MAX_CHANNELS, is_float, is_int
+from olc.define import is_float, is_int
 from olc.gtk3.dialog import ConfirmationDialog
 from olc.gtk3.widgets.channels_view import VIEW_MODES, ChannelsView
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from gi.repository import Gio
@@ -270,7 +271,7 @@ class CuesEditionTab(Gtk.Paned):
             channels_dict = {}
             cue_editor = self.lightshow.cues.cue_editor
             temp_levels = cue_editor.get_levels(cue.number, cue.sequence)
-            for chan in range(MAX_CHANNELS):
+            for chan in range(LAYOUT.max_channels):
                 channel_widget = self.channels_view.get_channel_widget(chan + 1)
                 if channel_widget is not None:
                     if (chan + 1 in cue.channels) or (temp_levels[chan] != -1):
@@ -303,7 +304,7 @@ class CuesEditionTab(Gtk.Paned):
 
     def _update_live_view_channels(self, i: int) -> None:
         channels_dict = self.lightshow.cues[i].channels
-        for channel_num in range(1, MAX_CHANNELS + 1):
+        for channel_num in range(1, LAYOUT.max_channels + 1):
             widget = self.window.live_view.channels_view.get_channel_widget(channel_num)
             if widget:
                 widget.next_level = channels_dict.get(channel_num, 0)
@@ -443,7 +444,7 @@ class CueChannelsView(ChannelsView):
         """Set level channel via temporary action.
 
         Args:
-            channel: Channel number (1 - MAX_CHANNELS)
+            channel: Channel number (1 - LAYOUT.max_channels)
             level: DMX level (0 - 255)
         """
         if self.tabs is None or self.lightshow is None or self.window is None:
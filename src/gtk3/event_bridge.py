@@ -19,8 +19,8 @@ from __future__ import annotations
 import typing
 
 from gi.repository import GLib, Gtk, Pango
+from olc.core.event import latest
 from olc.curve import LimitCurve, PointsCurve
-from olc.define import MAX_CHANNELS
 from olc.fader import FaderType
 from olc.gtk3.channel_time import ChanneltimeTab
 from olc.gtk3.fader import FaderTab
@@ -28,6 +28,7 @@ from olc.gtk3.patch_outputs import PatchOutputsTab
 from olc.gtk3.widgets.channel import ChannelWidget
 from olc.gtk3.widgets.channels_view import ChannelsView
 from olc.independent import IndependentType
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from olc.group import Group
@@ -65,6 +66,18 @@ class GuiEventBridge:
         self._seq_plus_timeout_id: int | None = None
         self._seq_minus_timeout_id: int | None = None
 
+        # Frequent events only displayed by the GUI are delivered by the
+        # dispatch thread, so that playback never waits for their listeners.
+        # A pending level or progress is replaced by the newer one.
+        core = self.app.core
+        core.set_async("channel.level_changed", coalesce=lambda channel, _: channel)
+        core.set_async("fader.level_changed", coalesce=lambda index, _: index)
+        core.set_async("crossfade.scale_updated", coalesce=lambda name, *_: name)
+        core.set_async("playback.transition_progress", coalesce=latest)
+        core.set_async("playback.goback_progress", coalesce=latest)
+        core.set_async("playback.go_triggered")
+        core.set_async("playback.go_back_triggered")
+
         # Setup GUI-safe event callbacks from Core
         self.app.core.subscribe(
             "group.created", lambda _: self._run_idle(self._safe_refresh_groups)
@@ -528,7 +541,7 @@ class GuiEventBridge:
         ):
             return
 
-        for channel in range(1, MAX_CHANNELS + 1):
+        for channel in range(1, LAYOUT.max_channels + 1):
             widget = self.app.window.live_view.channels_view.get_channel_widget(channel)
             if widget:
                 widget.next_level = active_cue.get_level(channel)
@@ -906,8 +919,8 @@ class GuiEventBridge:
 
         # 2. Sync PAUSE button
         is_paused = False
-        if main_playback.on_go and main_playback.thread:
-            is_paused = not main_playback.thread.pause.is_set()
+        if main_playback.on_go and main_playback.transition:
+            is_paused = not main_playback.transition.pause.is_set()
 
         self._on_pause_triggered({"active": is_paused})
 
@@ -1357,7 +1370,7 @@ def update_ui(subtitle: str, app: Application | None = None) -> None:
         if app.window.live_view:
             main_playback = app.core.lightshow.main_playback
             step = main_playback.steps[main_playback.position]
-            for channel in range(1, MAX_CHANNELS + 1):
+            for channel in range(1, LAYOUT.max_channels + 1):
                 seq_level = 0
                 if step.cue is not None:
                     seq_level = step.cue.channels.get(channel, 0)
@@ -18,11 +18,12 @@ import typing
 from typing import Callable
 
 from gi.repository import Gdk, GLib, Gtk
-from olc.define import MAX_CHANNELS, is_int, is_non_nul_float
+from olc.define import is_int, is_non_nul_float
 from olc.group import Group
 from olc.gtk3.widgets.channel import ChannelWidget
 from olc.gtk3.widgets.channels_view import VIEW_MODES, ChannelsView
 from olc.gtk3.widgets.group import GroupWidget
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from gi.repository import Gio
@@ -74,7 +75,7 @@ class GroupChannelsView(ChannelsView):
         """Set channel level via temporary action.
 
         Args:
-            channel: Channel number (1 - MAX_CHANNELS)
+            channel: Channel number (1 - LAYOUT.max_channels)
             level: DMX level (0 - 255)
         """
         if not self.tabs or not self.lightshow or not self.window:
@@ -503,7 +504,7 @@ class GroupTab(Gtk.Paned):
                 group_editor = self.lightshow.groups.group_editor
                 temp_levels = group_editor.get_levels(group_nb)
                 channels_dict = {}
-                for chan in range(MAX_CHANNELS):
+                for chan in range(LAYOUT.max_channels):
                     channel_widget = self.channels_view.get_channel_widget(chan + 1)
                     if channel_widget is not None:
                         if (chan + 1 in group.channels) or (temp_levels[chan] != -1):
@@ -19,9 +19,9 @@ from typing import Callable
 
 import numpy as np
 from gi.repository import Gdk, Gtk
-from olc.define import MAX_CHANNELS
 from olc.gtk3.widgets.channels_view import VIEW_MODES, ChannelsView
 from olc.independent import IndependentType
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     import olc.gtk3.independent
@@ -60,7 +60,7 @@ class IndependentsTab(Gtk.Paned):
         self.commandline = app.core.commandline
 
         # Channels modified by user
-        self.user_channels = np.full(MAX_CHANNELS, -1, dtype=np.int16)
+        self.user_channels = np.full(LAYOUT.max_channels, -1, dtype=np.int16)
 
         Gtk.Paned.__init__(self, orientation=Gtk.Orientation.VERTICAL)
         self.set_position(600)
@@ -104,7 +104,7 @@ class IndependentsTab(Gtk.Paned):
     def on_changed(self, _treeview: Gtk.TreeView) -> None:
         """Select independent"""
         self.channels_view.flowbox.unselect_all()
-        self.user_channels = np.full(MAX_CHANNELS, -1, dtype=np.int16)
+        self.user_channels = np.full(LAYOUT.max_channels, -1, dtype=np.int16)
         self.channels_view.update()
 
     def refresh(self) -> None:
@@ -229,7 +229,7 @@ class IndependentsTab(Gtk.Paned):
             number = self.liststore[row][0]
             # Update channels level
             channels = {}
-            for channel in range(MAX_CHANNELS):
+            for channel in range(LAYOUT.max_channels):
                 channel_widget = self.channels_view.get_channel_widget(channel + 1)
                 if channel_widget is not None:
                     widget = channel_widget
@@ -248,7 +248,7 @@ class IndependentsTab(Gtk.Paned):
             self.channels_view.update()
 
             # Reset user modifications
-            self.user_channels = np.full(MAX_CHANNELS, -1, dtype=np.int16)
+            self.user_channels = np.full(LAYOUT.max_channels, -1, dtype=np.int16)
 
 
 class IndeChannelsView(ChannelsView):
@@ -261,7 +261,7 @@ class IndeChannelsView(ChannelsView):
         """Set channel level
 
         Args:
-            channel: Channel number (1 - MAX_CHANNELS)
+            channel: Channel number (1 - LAYOUT.max_channels)
             level: DMX level (0 - 255)
         """
         if self.tabs is not None:
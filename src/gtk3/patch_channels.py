@@ -18,8 +18,8 @@ import typing
 from typing import Callable
 
 from gi.repository import Gdk, Gtk
-from olc.define import MAX_CHANNELS, UNIVERSES
 from olc.gtk3.widgets.patch_channels import PatchChannelHeader, PatchChannelWidget
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     import olc.gtk3.patch_channels
@@ -78,7 +78,7 @@ class PatchChannelsTab(Gtk.Box):
 
         self.channels = []
 
-        for channel in range(MAX_CHANNELS):
+        for channel in range(LAYOUT.max_channels):
             self.channels.append(
                 PatchChannelWidget(
                     channel + 1,
@@ -168,7 +168,7 @@ class PatchChannelsTab(Gtk.Box):
             if child is not None:
                 self.flowbox.select_child(child)
                 self.last_chan_selected = "0"
-        elif int(self.last_chan_selected) < MAX_CHANNELS - 1:
+        elif int(self.last_chan_selected) < LAYOUT.max_channels - 1:
             self.flowbox.unselect_all()
             child = self.flowbox.get_child_at_index(int(self.last_chan_selected) + 1)
             if child is not None:
@@ -200,7 +200,7 @@ class PatchChannelsTab(Gtk.Box):
         keystring = self.commandline.get_string()
         if keystring != "" and "." not in keystring:
             channel = int(keystring) - 1
-            if 0 <= channel < MAX_CHANNELS:
+            if 0 <= channel < LAYOUT.max_channels:
                 child = self.flowbox.get_child_at_index(channel)
                 if child is not None:
                     self.flowbox.select_child(child)
@@ -297,7 +297,7 @@ class PatchChannelsTab(Gtk.Box):
                     # "output", use first universe
                     output = int(keystring)
 
-                    universe = UNIVERSES[0]
+                    universe = LAYOUT.universes[0]
 
                 if output is not None and universe is not None:
                     if 0 < output + i <= 512:
@@ -312,7 +312,7 @@ class PatchChannelsTab(Gtk.Box):
                         self.channels[channel - 1].queue_draw()
 
                     # Update list of channels
-                    index = UNIVERSES.index(universe)
+                    index = LAYOUT.universe_index(universe)
                     level = self.backend.dmx.frame[index][output]
                     widget_chan = (
                         self.window.live_view.channels_view.get_channel_widget(channel)
@@ -323,7 +323,7 @@ class PatchChannelsTab(Gtk.Box):
                     self.window.live_view.channels_view.update()
 
         # Select next channel
-        if sel and channel < MAX_CHANNELS:
+        if sel and channel < LAYOUT.max_channels:
             self.flowbox.unselect_all()
             child = self.flowbox.get_child_at_index(channel)
             if child is not None:
@@ -359,7 +359,7 @@ class PatchChannelsTab(Gtk.Box):
             else:
                 # "output", use first universe
                 output = int(keystring)
-                universe = UNIVERSES[0]
+                universe = LAYOUT.universes[0]
 
             if output is not None and universe is not None:
                 if 0 < output <= 512:
@@ -404,7 +404,7 @@ class PatchChannelsTab(Gtk.Box):
                 # "output", use first universe
                 output = int(keystring)
 
-                universe = UNIVERSES[0]
+                universe = LAYOUT.universes[0]
 
             if output is not None and universe is not None:
                 if (
@@ -18,8 +18,9 @@ import typing
 from typing import Callable
 
 from gi.repository import Gdk, Gtk
-from olc.define import NB_UNIVERSES, UNIVERSES, is_int, is_non_nul_int
+from olc.define import is_int, is_non_nul_int
 from olc.gtk3.widgets.patch_outputs import PatchWidget
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     import olc.gtk3.patch_outputs
@@ -91,7 +92,7 @@ class PatchOutputsTab(Gtk.Box):
         self.outputs = []
         self.channels = []
 
-        for universe in UNIVERSES:
+        for universe in LAYOUT.universes:
             for out in range(1, 513):
                 output = PatchWidget(
                     universe,
@@ -278,7 +279,7 @@ class PatchOutputsTab(Gtk.Box):
                 self.flowbox.select_child(child)
                 self.commandline.set_string("1")
                 self.patch_by_outputs.select_output()
-        elif self.patch_by_outputs.last < (NB_UNIVERSES * 512):
+        elif self.patch_by_outputs.last < LAYOUT.outputs:
             old_output = self.patch_by_outputs.last
             new_output = old_output + 1
             output, universe = self.patch_by_outputs.get_output_universe(new_output)
@@ -378,7 +379,7 @@ class PatchOutputsTab(Gtk.Box):
             univ = output[1]
             self.backend.dmx.send_user_output(out, univ, level)
 
-            index = UNIVERSES.index(univ)
+            index = LAYOUT.universe_index(univ)
             self.outputs[out - 1 + (512 * index)].queue_draw()
         self.commandline.set_string("")
 
@@ -401,7 +402,7 @@ class PatchOutputsTab(Gtk.Box):
             univ = output[1]
             self.backend.dmx.send_user_output(out, univ, level)
 
-            index = UNIVERSES.index(univ)
+            index = LAYOUT.universe_index(univ)
             self.outputs[out - 1 + (512 * index)].queue_draw()
         self.test = True
         self.commandline.set_string("")
@@ -488,7 +489,7 @@ class PatchOutputsTab(Gtk.Box):
             if self.patch.outputs.get(universe) and self.patch.outputs[universe].get(
                 output + 1
             ):
-                idx = UNIVERSES.index(universe)
+                idx = LAYOUT.universe_index(universe)
                 self.outputs[output + (idx * 512)].queue_draw()
 
 
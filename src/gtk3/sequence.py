@@ -18,9 +18,10 @@ import typing
 from typing import Callable, Optional
 
 from gi.repository import Gdk, Gtk
-from olc.define import MAX_CHANNELS, is_int, string_to_time, time_to_string
+from olc.define import is_int, string_to_time, time_to_string
 from olc.gtk3.dialog import ConfirmationDialog
 from olc.gtk3.widgets.channels_view import VIEW_MODES, ChannelsView
+from olc.layout import LAYOUT
 from olc.sequence import Sequence
 
 if typing.TYPE_CHECKING:
@@ -484,7 +485,7 @@ class SequenceTab(Gtk.Grid):
         user_channels = cue_editor.get_levels(cue.number, cue.sequence)
 
         new_channels = dict(cue.channels)
-        for channel in range(MAX_CHANNELS):
+        for channel in range(LAYOUT.max_channels):
             widget_ch = self.channels_view.get_channel_widget(channel + 1)
             if widget_ch is not None:
                 channel_widget = widget_ch
@@ -544,7 +545,7 @@ class SequenceTab(Gtk.Grid):
     def _create_cue(self, sequence: Sequence, mem: float, step: int) -> None:
         """Create new cue inside the sequence"""
         channels = {}
-        for channel in range(MAX_CHANNELS):
+        for channel in range(LAYOUT.max_channels):
             widget_ch = self.channels_view.get_channel_widget(channel + 1)
             if widget_ch is not None:
                 channel_widget = widget_ch
@@ -574,7 +575,7 @@ class SequenceTab(Gtk.Grid):
         user_channels = cue_editor.get_levels(cue.number, cue.sequence)
 
         new_channels = dict(cue.channels)
-        for channel in range(MAX_CHANNELS):
+        for channel in range(LAYOUT.max_channels):
             widget_ch = self.channels_view.get_channel_widget(channel + 1)
             if widget_ch is not None:
                 channel_widget = widget_ch
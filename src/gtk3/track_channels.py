@@ -18,8 +18,8 @@ import typing
 from typing import Callable
 
 from gi.repository import Gdk, Gtk
-from olc.define import MAX_CHANNELS
 from olc.gtk3.widgets.track_channels import TrackChannelsHeader, TrackChannelsWidget
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     import olc.gtk3.track_channels
@@ -320,7 +320,7 @@ class TrackChannelsTab(Gtk.Grid):
 
         if self.commandline.get_string() not in ["", "0"]:
             channel = int(self.commandline.get_string()) - 1
-            if 0 <= channel < MAX_CHANNELS:
+            if 0 <= channel < LAYOUT.max_channels:
                 child = self.window.live_view.channels_view.flowbox.get_child_at_index(
                     channel
                 )
@@ -409,7 +409,7 @@ class TrackChannelsTab(Gtk.Grid):
             return
 
         channel = int(keystring) - 1
-        if 0 <= channel < MAX_CHANNELS:
+        if 0 <= channel < LAYOUT.max_channels:
             child = self.window.live_view.channels_view.flowbox.get_child_at_index(
                 channel
             )
@@ -431,7 +431,7 @@ class TrackChannelsTab(Gtk.Grid):
             return
 
         channel = int(keystring) - 1
-        if 0 <= channel < MAX_CHANNELS:
+        if 0 <= channel < LAYOUT.max_channels:
             child = self.window.live_view.channels_view.flowbox.get_child_at_index(
                 channel
             )
@@ -27,8 +27,9 @@ from olc.core.selection import (
     SelectRemoveAction,
     SelectThruAction,
 )
-from olc.define import MAX_CHANNELS, is_int, is_non_nul_int
+from olc.define import is_int, is_non_nul_int
 from olc.gtk3.widgets.channel import ChannelWidget
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from gi.repository import Gio
@@ -111,22 +112,35 @@ class ChannelsView(Gtk.Box):
         self.flowbox.set_selection_mode(Gtk.SelectionMode.MULTIPLE)
         self.flowbox.set_filter_func(self.filter_channels, None)
         if self.lightshow and self.settings and self.window and self.tabs:
-            for i in range(MAX_CHANNELS):
-                self.flowbox.add(
-                    ChannelWidget(
-                        i + 1,
-                        0,
-                        0,
-                        self.app,
-                        window=self.window,
-                        tabs=self.tabs,
-                    )
-                )
+            self._add_channel_widgets(0, LAYOUT.max_channels)
+            LAYOUT.connect(self._layout_changed)
         self.scrolled.add(self.flowbox)
 
         self.pack_start(self.scrolled, True, True, 0)
         self.combo.set_active(0)
 
+    def _add_channel_widgets(self, start: int, end: int) -> None:
+        for i in range(start, end):
+            self.flowbox.add(
+                ChannelWidget(
+                    i + 1,
+                    0,
+                    0,
+                    self.app,
+                    window=self.window,
+                    tabs=self.tabs,
+                )
+            )
+
+    def _layout_changed(self) -> None:
+        """One ChannelWidget per channel of the show"""
+        children = self.flowbox.get_children()
+        for child in children[LAYOUT.max_channels :]:
+            child.destroy()
+        self._add_channel_widgets(len(children), LAYOUT.max_channels)
+        self.flowbox.show_all()
+        self.flowbox.invalidate_filter()
+
     def _get_channel_level_for_select(self, channel: int) -> int:
         """Helper callback to read the level from a ChannelWidget."""
         widget = self.get_channel_widget(channel)
@@ -138,7 +152,7 @@ class ChannelsView(Gtk.Box):
         try:
             self.flowbox.unselect_all()
             for ch in selected_channels:
-                if 1 <= ch <= MAX_CHANNELS:
+                if 1 <= ch <= LAYOUT.max_channels:
                     flowboxchild = self.flowbox.get_child_at_index(ch - 1)
                     if flowboxchild:
                         self.flowbox.select_child(flowboxchild)
@@ -179,7 +193,7 @@ class ChannelsView(Gtk.Box):
         """Channel at level
 
         Args:
-            channel: Channel number (1 - MAX_CHANNELS)
+            channel: Channel number (1 - LAYOUT.max_channels)
             level: DMX level (0 - 255)
 
         Raises:
@@ -195,12 +209,12 @@ class ChannelsView(Gtk.Box):
         """Get ChannelWidget of channel number
 
         Args:
-            channel: Channel (1-MAX_CHANNELS)
+            channel: Channel (1-LAYOUT.max_channels)
 
         Returns:
             Channel widget
         """
-        if 0 < channel <= MAX_CHANNELS:
+        if 0 < channel <= LAYOUT.max_channels:
             flowboxchild = self.flowbox.get_child_at_index(channel - 1)
             if flowboxchild:
                 channelwidget = typing.cast("ChannelWidget", flowboxchild.get_child())
@@ -279,7 +293,7 @@ class ChannelsView(Gtk.Box):
             channel_index = (
                 int(self.last_selected_channel) if self.last_selected_channel else 0
             )
-            if channel_index > MAX_CHANNELS - 1:
+            if channel_index > LAYOUT.max_channels - 1:
                 channel_index = 0
 
         target_channel = channel_index + 1
@@ -304,7 +318,7 @@ class ChannelsView(Gtk.Box):
             if flowboxchild.get_visible() and idx >= start:
                 channel_index = idx
                 break
-        if channel_index + 1 >= MAX_CHANNELS:
+        if channel_index + 1 >= LAYOUT.max_channels:
             channel_index = self.__get_first_active_channel()
         return channel_index
 
@@ -319,11 +333,11 @@ class ChannelsView(Gtk.Box):
         )
 
         channel_index = start
-        for idx in range(start, MAX_CHANNELS):
+        for idx in range(start, LAYOUT.max_channels):
             if self.lightshow.patch.is_patched(idx + 1):
                 channel_index = idx
                 break
-        if channel_index + 1 >= MAX_CHANNELS:
+        if channel_index + 1 >= LAYOUT.max_channels:
             channel_index = self.lightshow.patch.get_first_patched_channel() - 1
         return channel_index
 
@@ -344,7 +358,7 @@ class ChannelsView(Gtk.Box):
                 int(self.last_selected_channel) - 2 if self.last_selected_channel else 0
             )
             if channel_index < 0:
-                channel_index = MAX_CHANNELS - 1
+                channel_index = LAYOUT.max_channels - 1
 
         target_channel = channel_index + 1
 
@@ -469,7 +483,7 @@ class ChannelsView(Gtk.Box):
         """Return first active channel index
 
         Returns:
-            Channel index (from 0 to MAX_CHANNELS - 1)
+            Channel index (from 0 to LAYOUT.max_channels - 1)
         """
         child = None
         children = self.flowbox.get_children()
@@ -484,7 +498,7 @@ class ChannelsView(Gtk.Box):
         """Return last active channel index
 
         Returns:
-            Channel index (from 0 to MAX_CHANNELS - 1)
+            Channel index (from 0 to LAYOUT.max_channels - 1)
         """
         child = None
         children = self.flowbox.get_children()
@@ -19,9 +19,9 @@ import typing
 import cairo
 from gi.repository import Gdk, Gtk
 from olc.curve import LimitCurve
-from olc.define import UNIVERSES
 from olc.gtk3.widgets.common import rounded_rectangle, rounded_rectangle_fill
 from olc.gtk3.widgets.curve import CurveWidget
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from olc.backends import DMXBackend
@@ -115,7 +115,7 @@ class PatchWidget(Gtk.DrawingArea):
         Args:
             event: Event with Keyboard modifiers
         """
-        index = UNIVERSES.index(self.universe)
+        index = LAYOUT.universe_index(self.universe)
         widget_index = self.output - 1 + (512 * index)
         accel_mask = Gtk.accelerator_get_default_mod_mask()
         if event.state & accel_mask == Gdk.ModifierType.SHIFT_MASK:
@@ -287,7 +287,7 @@ class PatchWidget(Gtk.DrawingArea):
             # Unpatched output
             cr.set_source_rgb(0.6, 0.4, 0.1)
             rounded_rectangle(cr, area, 10)
-        index = UNIVERSES.index(self.universe)
+        index = LAYOUT.universe_index(self.universe)
         if self.backend.dmx.frame[index][self.output - 1]:
             level = self.backend.dmx.frame[index][self.output - 1]
             # cr.move_to(0, 0)
@@ -346,7 +346,7 @@ class PatchWidget(Gtk.DrawingArea):
             cr: Cairo context
             allocation: Widget allocation
         """
-        index = UNIVERSES.index(self.universe)
+        index = LAYOUT.universe_index(self.universe)
         if self.backend.dmx.frame[index][self.output - 1]:
             cr.set_source_rgb(0.7, 0.7, 0.7)
             cr.select_font_face("Monaco", cairo.FontSlant.NORMAL, cairo.FontWeight.BOLD)
@@ -19,7 +19,8 @@ import typing
 
 import cairo
 from gi.repository import Gdk, Gtk
-from olc.define import MAX_CHANNELS, time_to_string
+from olc.define import time_to_string
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from olc.core.lightshow import LightShow
@@ -240,7 +241,7 @@ class SequentialWidget(Gtk.Widget):
     ) -> None:
         ct_nb = 0
         for channel in sorted(self.channel_time.keys(), reverse=True):
-            if channel > MAX_CHANNELS:
+            if channel > LAYOUT.max_channels:
                 continue
             delay = self.channel_time[channel].delay
             time = self.channel_time[channel].time
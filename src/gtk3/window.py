@@ -20,10 +20,11 @@ from typing import Callable
 
 from gi.repository import Gdk, Gio, GLib, Gtk
 from olc.cue import Cue
-from olc.define import MAX_CHANNELS, UNIVERSES, string_to_time, time_to_string
+from olc.define import string_to_time, time_to_string
 from olc.gtk3.widgets.main_fader import MainFaderWidget
 from olc.gtk3.window_channels import LiveView
 from olc.gtk3.window_playback import MainPlaybackView
+from olc.layout import LAYOUT
 from olc.step import Step
 
 if typing.TYPE_CHECKING:
@@ -316,7 +317,7 @@ class Window(Gtk.ApplicationWindow):
         next_step_obj = self.app.core.lightshow.main_playback.steps[step + 1]
         next_cue = next_step_obj.cue
 
-        for channel in range(1, MAX_CHANNELS + 1):
+        for channel in range(1, LAYOUT.max_channels + 1):
             level = cue.channels.get(channel, 0) if cue is not None else 0
             next_level = (
                 next_cue.channels.get(channel, 0) if next_cue is not None else 0
@@ -480,7 +481,7 @@ class Window(Gtk.ApplicationWindow):
                     output = values[0]
                     univ = values[1]
                     if univ is not None and output is not None:
-                        index = UNIVERSES.index(univ)
+                        index = LAYOUT.universe_index(univ)
                         if level := self.app.backend.dmx.frame[index][output - 1]:
                             channels[channel] = level
         cue = Cue(1, mem, channels)
@@ -514,10 +515,10 @@ class Window(Gtk.ApplicationWindow):
         i -= 1
 
         if self.app.backend is not None and self.app.backend.dmx is not None:
-            for univ in UNIVERSES:
+            for univ in LAYOUT.universes:
                 for output in range(512):
                     channel = self.app.core.lightshow.patch.outputs[univ][output + 1][0]
-                    index = UNIVERSES.index(univ)
+                    index = LAYOUT.universe_index(univ)
                     level = self.app.backend.dmx.frame[index][output]
 
                     self.app.core.lightshow.cues[i].channels[channel] = level
@@ -527,7 +528,7 @@ class Window(Gtk.ApplicationWindow):
             memories_tab = typing.cast(typing.Any, self.app.tabs.tabs["memories"])
             nb_chan = sum(
                 bool(self.app.core.lightshow.cues[i].channels.get(chan, 0))
-                for chan in range(1, MAX_CHANNELS + 1)
+                for chan in range(1, LAYOUT.max_channels + 1)
             )
 
             treeiter = memories_tab.liststore.get_iter(i)
@@ -557,7 +558,7 @@ class Window(Gtk.ApplicationWindow):
                     univ = outputs[0][1]
                     if out is not None and univ is not None:
                         output = out - 1
-                        index = UNIVERSES.index(univ)
+                        index = LAYOUT.universe_index(univ)
                         if (
                             self.app.backend is not None
                             and self.app.backend.dmx is not None
@@ -18,8 +18,9 @@ import typing
 from typing import Callable
 
 from gi.repository import Gdk, Gtk
-from olc.define import UNIVERSES, is_int
+from olc.define import is_int
 from olc.gtk3.widgets.channels_view import VIEW_MODES, ChannelsView
+from olc.layout import LAYOUT
 
 if typing.TYPE_CHECKING:
     from olc.gtk3.application import Application
@@ -53,7 +54,7 @@ class LiveView(Gtk.Notebook):
         """Update display of channel widget
 
         Args:
-            channel: Index of channel (from 1 to MAX_CHANNELS)
+            channel: Index of channel (from 1 to LAYOUT.max_channels)
             next_level: Channel next level (from 0 to 255)
         """
         widget = self.channels_view.get_channel_widget(channel)
@@ -146,7 +147,7 @@ class LiveChannelsView(ChannelsView):
         """Get Channel next level
 
         Args:
-            channel: Channel number (1 - MAX_CHANNELS)
+            channel: Channel number (1 - LAYOUT.max_channels)
             channel_widget: Channel widget
 
         Returns:
@@ -254,7 +255,7 @@ class LiveChannelsView(ChannelsView):
                 out = output[0]
                 univ = output[1]
                 if out is not None and univ is not None:
-                    index = UNIVERSES.index(univ)
+                    index = LAYOUT.universe_index(univ)
                     level = self.app.backend.dmx.frame[index][out - 1]
             if level is not None:
                 if direction == Gdk.ScrollDirection.UP:
@@ -18,7 +18,7 @@ import typing
 from enum import StrEnum
 
 import numpy as np
-from olc.define import MAX_CHANNELS
+from olc.layout import LAYOUT, resized
 
 
 class IndependentType(StrEnum):
@@ -64,7 +64,7 @@ class Independent:
         self.levels = levels or {}
         self.text = text
         self.inde_type = inde_type
-        self.dmx = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+        self.dmx = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
 
         self.update_channels()
 
@@ -119,7 +119,7 @@ class Independents:
         self.lightshow = lightshow
         self.independents: list[Independent] = []
         self.channels = set()
-        self.dmx = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+        self.dmx = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
 
         # Create 9 Independents
         for i in range(6):
@@ -138,6 +138,16 @@ class Independents:
         for inde in self.independents:
             self.dmx = np.maximum(self.dmx, inde.dmx)
 
+    def resize(self, channels: int) -> None:
+        """Reallocate DMX levels for a number of channels
+
+        Args:
+            channels: Number of channels
+        """
+        for inde in self.independents:
+            inde.dmx = resized(inde.dmx, channels)
+        self.dmx = resized(self.dmx, channels)
+
     def add(self, independent: Independent) -> bool:
         """Add an independent
 
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import typing
+from typing import Iterable, SupportsIndex, TypeVar
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+class IndexedList(list[T]):
+    """List with lookup tables, rebuilt on the first lookup after a change.
+
+    Every modification of the list increments a version. Subclasses build
+    their tables in _build_index(), called by _ensure_index() when the list
+    changed since the last build.
+    """
+
+    def __init__(self, iterable: Iterable[T] = ()) -> None:
+        super().__init__(iterable)
+        self._version = 0
+        self._index_version = -1
+
+    def _build_index(self) -> None:
+        """Build the lookup tables from the items"""
+        raise NotImplementedError
+
+    def _ensure_index(self) -> None:
+        version = self._version
+        if self._index_version != version:
+            self._build_index()
+            # A change during the build is seen on the next lookup
+            self._index_version = version
+
+    def _changed(self) -> None:
+        self._version += 1
+
+    def append(self, item: T) -> None:
+        super().append(item)
+        self._changed()
+
+    def extend(self, items: Iterable[T]) -> None:
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index: SupportsIndex, item: T) -> None:
+        super().insert(index, item)
+        self._changed()
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def remove(self, item: T) -> None:
+        super().remove(item)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, index: typing.Any, value: typing.Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, items: Iterable[T]) -> IndexedList[T]:  # type: ignore[misc]
+        super().__iadd__(items)
+        self._changed()
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> IndexedList[T]:
+        super().__imul__(count)
+        self._changed()
+        return self
+
+
+class IndexedDict(dict[K, T]):
+    """Dictionary with lookup tables, rebuilt on the first lookup after a change.
+
+    Same as IndexedList: subclasses build their tables in _build_index(),
+    called by _ensure_index() when the dictionary changed since the last build.
+    Values are not watched, replace them instead of modifying them.
+    """
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._version = 0
+        self._index_version = -1
+
+    def _build_index(self) -> None:
+        """Build the lookup tables from the items"""
+        raise NotImplementedError
+
+    def _ensure_index(self) -> None:
+        version = self._version
+        if self._index_version != version:
+            self._build_index()
+            self._index_version = version
+
+    def _changed(self) -> None:
+        self._version += 1
+
+    def __setitem__(self, key: K, value: T) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: K) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key: K, default: typing.Any = None) -> T:
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def pop(self, key: K, *default: typing.Any) -> typing.Any:
+        value = super().pop(key, *default)
+        self._changed()
+        return value
+
+    def popitem(self) -> tuple[K, T]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def __ior__(self, other: typing.Any) -> IndexedDict[K, T]:  # type: ignore[misc]
+        super().__ior__(other)
+        self._changed()
+        return self
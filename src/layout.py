@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Universes and number of channels of the show."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Callable, Iterable
+
+import numpy as np
+from olc.define import MAX_CHANNELS, MAX_UNIVERSE, UNIVERSES
+
+
+class ShowLayout:
+    """Universes and number of channels of the show
+
+    Levels arrays are allocated from the layout. Objects keeping such arrays
+    register a callback with connect(), called after each change (bound methods
+    are weakly referenced). Frames are computed under `lock`, held during the
+    change and the callbacks.
+
+    Attributes:
+        universes: Universes numbers, in outputs order
+        max_channels: Number of channels (1 - 512 * number of universes)
+    """
+
+    universes: list[int]
+    max_channels: int
+
+    def __init__(self, universes: Iterable[int], max_channels: int) -> None:
+        self.lock = threading.RLock()
+        self._callbacks: list[Callable[[], Callable[[], None] | None]] = []
+        self.universes, self.max_channels = self._check(universes, max_channels)
+        self._indexes = {universe: i for i, universe in enumerate(self.universes)}
+
+    @staticmethod
+    def _check(universes: Iterable[int], max_channels: int) -> tuple[list[int], int]:
+        universes = [int(universe) for universe in universes]
+        if not universes:
+            raise ValueError("A show needs at least one universe")
+        if len(set(universes)) != len(universes):
+            raise ValueError(f"Duplicate universes: {universes}")
+        if not all(1 <= universe <= MAX_UNIVERSE for universe in universes):
+            raise ValueError(f"Universes must be between 1 and {MAX_UNIVERSE}")
+        max_channels = int(max_channels)
+        # Can't have more channels than outputs
+        if not 1 <= max_channels <= len(universes) * 512:
+            raise ValueError(
+                f"Channels must be between 1 and {len(universes) * 512}. "
+                f"Got {max_channels}."
+            )
+        return universes, max_channels
+
+    @property
+    def nb_universes(self) -> int:
+        """Number of universes"""
+        return len(self.universes)
+
+    @property
+    def outputs(self) -> int:
+        """Number of outputs of all universes"""
+        return len(self.universes) * 512
+
+    def universe_index(self, universe: int) -> int:
+        """Index of a universe (row of the DMX frames)
+
+        Raises:
+            ValueError: universe not in the layout
+        """
+        try:
+            return self._indexes[universe]
+        except KeyError:
+            raise ValueError(f"{universe} is not in {self.universes}") from None
+
+    def connect(self, callback: Callable[[], None]) -> None:
+        """Call `callback` after each change of the layout"""
+        if hasattr(callback, "__self__"):
+            self._callbacks.append(weakref.WeakMethod(callback))  # type: ignore[arg-type]
+        else:
+            self._callbacks.append(lambda: callback)
+
+    def disconnect(self, callback: Callable[[], None]) -> None:
+        """Remove a callback added with connect()"""
+        self._callbacks = [
+            ref for ref in self._callbacks if ref() not in (None, callback)
+        ]
+
+    def resize(self, universes: Iterable[int], max_channels: int) -> bool:
+        """Change the layout
+
+        Change it when no transition is running (new show, show loading).
+
+        Returns:
+            True if the layout changed
+
+        Raises:
+            ValueError: invalid universes or number of channels
+        """
+        universes, max_channels = self._check(universes, max_channels)
+        with self.lock:
+            if universes == self.universes and max_channels == self.max_channels:
+                return False
+            self.universes = universes
+            self.max_channels = max_channels
+            self._indexes = {universe: i for i, universe in enumerate(universes)}
+            self._callbacks = [ref for ref in self._callbacks if ref() is not None]
+            for ref in list(self._callbacks):
+                callback = ref()
+                if callback is not None:
+                    callback()
+        return True
+
+
+def resized(array: np.ndarray, size: int, fill: int = 0) -> np.ndarray:
+    """Copy of a levels array with `size` items (first axis)
+
+    Args:
+        array: Levels array
+        size: New size
+        fill: Value of the added items
+
+    Returns:
+        New array (the same one if the size does not change)
+    """
+    if len(array) == size:
+        return array
+    new = np.full((size, *array.shape[1:]), fill, dtype=array.dtype)
+    count = min(size, len(array))
+    new[:count] = array[:count]
+    return new
+
+
+# Layout of the current show
+LAYOUT = ShowLayout(UNIVERSES, MAX_CHANNELS)
@@ -14,11 +14,8 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-import threading
 import typing
-from collections import deque
 from dataclasses import dataclass
-from typing import Deque
 
 import mido
 from olc.midi.control_change import MidiControlChanges
@@ -27,8 +24,9 @@ from olc.midi.lcd import MackieLCD
 from olc.midi.notes import MidiNotes
 from olc.midi.pitchwheel import MidiPitchWheel
 from olc.midi.ports import MidiPorts
+from olc.midi.send import MidiSend
 from olc.midi.xfade import MidiXFade
-from olc.timer import RepeatedTimer
+from olc.timer import SCHEDULER, Job
 
 if typing.TYPE_CHECKING:
     import olc.midi
@@ -36,38 +34,6 @@ if typing.TYPE_CHECKING:
     from olc.gtk3.application import Application
 
 
-class Queue:
-    """Queue implementation based on deque"""
-
-    _elements: Deque[mido.Message]
-
-    def __init__(self) -> None:
-        self._elements = deque()
-
-    def __len__(self) -> int:
-        return len(self._elements)
-
-    def __iter__(self) -> typing.Iterator:
-        while len(self) > 0:
-            yield self.dequeue()
-
-    def enqueue(self, element: mido.Message) -> None:
-        """Add a element
-
-        Args:
-            element: Element to add
-        """
-        self._elements.append(element)
-
-    def dequeue(self) -> mido.Message:
-        """Remove first element
-
-        Returns:
-            The first element
-        """
-        return self._elements.popleft()
-
-
 @dataclass
 class MidiMessages:
     """MIDI Messages"""
@@ -110,28 +76,6 @@ class MidiFaders:
             self.inde_faders.append(MIDIFader())
 
 
-# pylint: disable=too-few-public-methods
-class MidiSend:
-    """Send MIDI messages"""
-
-    ports: MidiPorts
-    queue: Queue
-    thread: RepeatedTimer
-
-    def __init__(self, ports: MidiPorts) -> None:
-        self.ports = ports
-        # Send MIDI messages every 25 milliseconds
-        self.queue = Queue()
-        self.thread = RepeatedTimer(0.025, self.send)
-
-    def send(self) -> None:
-        """Send MIDI messages from the queue"""
-        for msg in self.queue:
-            for port in self.ports.ports:
-                # print("MIDI sent:", msg)
-                port.port.send(msg)
-
-
 # pylint: disable=too-many-instance-attributes
 class Midi:
     """MIDI messages from controllers"""
@@ -142,7 +86,7 @@ class Midi:
     xfade: MidiXFade
     ports: MidiPorts
     send: MidiSend
-    _pause_blink_timer: RepeatedTimer | None
+    _pause_blink_timer: Job | None
     _pause_blink_state: bool
 
     def __init__(
@@ -172,10 +116,10 @@ class Midi:
     def stop(self) -> None:
         """Stop MIDI"""
         if self._pause_blink_timer is not None:
-            self._pause_blink_timer.stop()
+            self._pause_blink_timer.cancel()
             self._pause_blink_timer = None
         self.ports.poll.stop()
-        self.send.thread.stop()
+        self.send.stop()
         self.controler_reset()
         self.ports.close()
 
@@ -185,7 +129,7 @@ class Midi:
         Args:
             msg: MIDI message
         """
-        self.send.queue.enqueue(msg)
+        self.send.enqueue(msg)
 
     def learn(self, msg: mido.Message) -> None:
         """Learn new MIDI control
@@ -251,6 +195,8 @@ class Midi:
                     )
                     port.port.send(msg)
             port.port.reset()
+        # Controllers no longer show the values sent
+        self.send.forget()
 
     def update_faders(self) -> None:
         """Send faders value and update LCD display"""
@@ -307,14 +253,14 @@ class Midi:
         """
         if action == "playback.pause":
             if self._pause_blink_timer is not None:
-                self._pause_blink_timer.stop()
+                self._pause_blink_timer.cancel()
             self._pause_blink_state = True
             self.messages.notes.send("playback.pause", 127)
-            self._pause_blink_timer = RepeatedTimer(0.5, self._blink_pause_led)
+            self._pause_blink_timer = SCHEDULER.call_every(0.5, self._blink_pause_led)
         else:
             self.messages.notes.send(action, 127)
             if timer:
-                threading.Timer(timer, self.messages.notes.send, [action, 0]).start()
+                SCHEDULER.call_later(timer, self.messages.notes.send, action, 0)
 
     def button_off(self, action: str) -> None:
         """Light off button
@@ -324,7 +270,7 @@ class Midi:
         """
         if action == "playback.pause":
             if self._pause_blink_timer is not None:
-                self._pause_blink_timer.stop()
+                self._pause_blink_timer.cancel()
                 self._pause_blink_timer = None
             self.messages.notes.send("playback.pause", 0)
         else:
@@ -18,6 +18,7 @@ import typing
 
 import mido
 from gi.repository import Gdk, GLib
+from olc.midi.dispatch import Handler, IdleCoalescer, MidiMap
 
 if typing.TYPE_CHECKING:
     from olc.gtk3.application import Application
@@ -28,13 +29,15 @@ if typing.TYPE_CHECKING:
 class MidiControlChanges:
     """MIDI control change messages from controllers"""
 
-    control_change: dict[str, list[int]]
+    control_change: MidiMap[list[int]]
 
     def __init__(self, midi: Midi, app_delegate: Application) -> None:
         self.midi = midi
         self.app_delegate = app_delegate
+        # Latest position of the moved faders
+        self.pending = IdleCoalescer()
         # Default MIDI control change values : "action": Channel, CC
-        self.control_change = {
+        control_change = {
             "wheel": [0, 60],
             "inde_1": [0, 16],
             "inde_2": [0, 17],
@@ -55,13 +58,49 @@ class MidiControlChanges:
             "crossfade_in": [0, 9],
         }
         for i in range(1, 101):
-            self.control_change[f"fader_{i}"] = [0, -1]
+            control_change[f"fader_{i}"] = [0, -1]
+        self.control_change = MidiMap(
+            control_change,
+            lambda value: None if value[1] == -1 else (value[0], value[1]),
+            self._resolve,
+        )
 
     def reset(self) -> None:
         """Remove all MIDI control change"""
         for action in self.control_change:
             self.control_change[action] = [0, -1]
 
+    def _resolve(self, key: str) -> Handler | None:
+        """Handler of a MIDI action, called with the port name and the message
+
+        Faders positions are coalesced, relative controls are all applied.
+        """
+        if key[:6] == "fader_":
+            # We need to pass fader number to faders function
+            index = int(key[6:])
+            return lambda _port, msg: self.pending.post(
+                key, self._function_fader, msg, index
+            )
+        if key[:9] == "inde_led_":
+            # Knobs LEDs, output only
+            return None
+        if key[:5] == "inde_":
+            index = int(key[5:])
+            return lambda port, msg: GLib.idle_add(
+                self._function_inde, port, msg, index
+            )
+        if key[:13] == "crossfade_out":
+            return lambda _port, msg: self.pending.post(
+                key, self.midi.xfade.moved, msg, self.midi.xfade.fader_out
+            )
+        if key[:12] == "crossfade_in":
+            return lambda _port, msg: self.pending.post(
+                key, self.midi.xfade.moved, msg, self.midi.xfade.fader_in
+            )
+        if func := getattr(self, f"_function_{key}", None):
+            return lambda port, msg: GLib.idle_add(func, port, msg)
+        return None
+
     def scan(self, port: str, msg: mido.Message) -> None:
         """Scan MIDI control changes
 
@@ -69,19 +108,8 @@ class MidiControlChanges:
             port: MIDI port name
             msg: MIDI message
         """
-        for key, value in list(self.control_change.items()):
-            if msg.channel == value[0] and msg.control == value[1]:
-                if key[:6] == "fader_":
-                    # We need to pass fader number to faders function
-                    GLib.idle_add(self._function_fader, msg, int(key[6:]))
-                elif key[:5] == "inde_":
-                    GLib.idle_add(self._function_inde, port, msg, int(key[5:]))
-                elif key[:13] == "crossfade_out":
-                    GLib.idle_add(self.midi.xfade.moved, msg, self.midi.xfade.fader_out)
-                elif key[:12] == "crossfade_in":
-                    GLib.idle_add(self.midi.xfade.moved, msg, self.midi.xfade.fader_in)
-                elif func := getattr(self, f"_function_{key}", None):
-                    GLib.idle_add(func, port, msg)
+        for handler in self.control_change.handlers((msg.channel, msg.control)):
+            handler(port, msg)
 
     def send(self, midi_name: str, value: int) -> None:
         """Send MIDI control change message
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import threading
+import typing
+from typing import Callable, Hashable, Optional, TypeVar
+
+from gi.repository import GLib
+from olc.indexed_list import IndexedDict
+
+V = TypeVar("V")
+Handler = Callable[..., None]
+
+
+class MidiMap(IndexedDict[str, V]):
+    """Learnt MIDI messages of the actions: "action": value
+
+    Incoming messages are looked up by address (channel and note or control,
+    or channel) in a reverse table of the handlers of the actions, rebuilt
+    after each change of the mapping.
+    """
+
+    def __init__(
+        self,
+        items: dict[str, V],
+        address: Callable[[V], Optional[Hashable]],
+        resolve: Callable[[str], Optional[Handler]],
+        exclusive: Callable[[str], bool] | None = None,
+    ) -> None:
+        """
+        Args:
+            items: Default values of the actions
+            address: Address of a value, None if not learnt
+            resolve: Handler of an action, None if the action has no handler
+            exclusive: True if the next actions on the same address are ignored
+        """
+        super().__init__(items)
+        self._address = address
+        self._resolve = resolve
+        self._exclusive = exclusive
+        self._handlers: dict[Hashable, tuple[Handler, ...]] = {}
+
+    def _build_index(self) -> None:
+        handlers: dict[Hashable, list[Handler]] = {}
+        closed: set[Hashable] = set()
+        for action, value in list(self.items()):
+            address = self._address(value)
+            if address is None or address in closed:
+                continue
+            handler = self._resolve(action)
+            if handler is not None:
+                handlers.setdefault(address, []).append(handler)
+                if self._exclusive is not None and self._exclusive(action):
+                    closed.add(address)
+        self._handlers = {key: tuple(value) for key, value in handlers.items()}
+
+    def handlers(self, address: Hashable) -> tuple[Handler, ...]:
+        """Handlers of the actions learnt on an address
+
+        Args:
+            address: Message address
+
+        Returns:
+            Handlers, in actions order
+        """
+        self._ensure_index()
+        return self._handlers.get(address, ())
+
+
+class IdleCoalescer:
+    """Call the latest callback posted for each key, once, on the main loop.
+
+    Absolute controls (faders, pitch wheels) send a flood of messages when
+    moved: only the last value of each control is applied.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[Hashable, tuple[Handler, tuple[typing.Any, ...]]] = {}
+        self._scheduled = False
+        self.posted = 0
+        self.coalesced = 0
+
+    def post(self, key: Hashable, callback: Handler, *args: typing.Any) -> None:
+        """Replace the pending callback of `key`
+
+        Args:
+            key: Control key
+            callback: Called on the main loop with args
+        """
+        with self._lock:
+            self.posted += 1
+            if key in self._pending:
+                self.coalesced += 1
+            self._pending[key] = (callback, args)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        GLib.idle_add(self.flush)
+
+    def flush(self) -> bool:
+        """Call the pending callbacks
+
+        Returns:
+            False, to be removed from the main loop
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._scheduled = False
+        for callback, args in pending.values():
+            callback(*args)
+        return False
@@ -14,10 +14,12 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+import functools
 import typing
 
 import mido
 from olc.define import MAX_FADER_PAGE
+from olc.midi.dispatch import Handler, MidiMap
 
 if typing.TYPE_CHECKING:
     from olc.gtk3.application import Application
@@ -62,12 +64,17 @@ SIMPLE_ACTION_MAPPING = {
 }
 
 
+def _address(value: list[int]) -> tuple[int, int] | None:
+    """(channel, note or control) of a learnt value"""
+    return None if value[1] == -1 else (value[0], value[1])
+
+
 # pylint: disable=too-many-public-methods
 class MidiNotes:
     """MIDI messages from controllers"""
 
-    notes: dict[str, list[int]]
-    cc_notes: dict[str, list[int]]
+    notes: MidiMap[list[int]]
+    cc_notes: MidiMap[list[int]]
     zoom: bool
 
     def __init__(self, midi: Midi, app_delegate: Application) -> None:
@@ -75,7 +82,7 @@ class MidiNotes:
         self.app_delegate = app_delegate
         self.zoom = False
         # Default MIDI notes values : "action": Channel, Note
-        self.notes = {
+        notes = {
             "playback.go": [0, 94],
             "playback.go_back": [0, 86],
             "playback.pause": [0, 93],
@@ -123,20 +130,23 @@ class MidiNotes:
             "v_minus": [0, 96],
         }
         for i in range(10):
-            self.notes[f"number_{i}"] = [0, -1]
+            notes[f"number_{i}"] = [0, -1]
         for i in range(10):
             for j in range(10):
                 if j < 8:
-                    self.notes[f"flash_{j + i * 10 + 1}"] = [0, 24 + j]
+                    notes[f"flash_{j + i * 10 + 1}"] = [0, 24 + j]
                 elif j == 8:
-                    self.notes[f"flash_{j + i * 10 + 1}"] = [0, 84]
+                    notes[f"flash_{j + i * 10 + 1}"] = [0, 84]
                 else:
-                    self.notes[f"flash_{j + i * 10 + 1}"] = [0, -1]
+                    notes[f"flash_{j + i * 10 + 1}"] = [0, -1]
                 if j < 8:
-                    self.notes[f"fader_{j + i * 10 + 1}"] = [0, 104 + j]
+                    notes[f"fader_{j + i * 10 + 1}"] = [0, 104 + j]
                 else:
-                    self.notes[f"fader_{j + i * 10 + 1}"] = [0, -1]
-        self.cc_notes = {action: [0, -1] for action in self.notes}
+                    notes[f"fader_{j + i * 10 + 1}"] = [0, -1]
+        self.notes = MidiMap(notes, _address, self._resolve)
+        self.cc_notes = MidiMap(
+            {action: [0, -1] for action in notes}, _address, self._resolve
+        )
 
     def reset(self) -> None:
         """Remove all MIDI note"""
@@ -145,44 +155,50 @@ class MidiNotes:
         for action in self.cc_notes:
             self.cc_notes[action] = [0, -1]
 
-    # pylint: disable=too-many-branches
-    def _dispatch(self, key: str, msg: mido.Message) -> None:
-        """Dispatch a MIDI action to its handler
+    # pylint: disable=too-many-return-statements
+    def _resolve(self, key: str) -> Handler | None:
+        """Handler of a MIDI action
 
         Args:
             key: Action key
-            msg: (Simulated) MIDI note message
+
+        Returns:
+            Function called with the (simulated) MIDI note message
         """
         if key[:6] == "flash_":
             # We need to pass fader number to flash function
-            fader_index = int(key[6:])
-            page = int((fader_index - 1) / 10)
-            fader = int(fader_index - (page * 10))
-            if page + 1 == self.app_delegate.core.lightshow.fader_bank.active_page:
-                self.flash(msg, fader)
-        elif key[:6] == "fader_":
-            fader_index = int(key[6:])
-            page = int((fader_index - 1) / 10)
-            fader = int(fader_index - (page * 10))
-            if page + 1 == self.app_delegate.core.lightshow.fader_bank.active_page:
-                self.fader(msg, fader)
-        elif key[:5] == "inde_":
-            self._function_inde_button(msg, int(key[5:]))
-        elif key[:4] == "zoom":
-            self._toggle_zoom(msg)
-        elif key[:6] == "h_plus" or key[:6] == "v_plus":
-            self._zoom_plus(msg)
-        elif key[:7] == "h_minus" or key[:7] == "v_minus":
-            self._zoom_minus(msg)
-        elif key in SIMPLE_ACTION_MAPPING:
-            self._execute_midi_action(key, msg)
-        else:
-            method_name = key.rsplit(".", maxsplit=1)[-1]
-            func = getattr(self, f"_function_{method_name}", None) or getattr(
-                self, method_name, None
-            )
-            if func:
-                func(msg)
+            return functools.partial(self._page_fader, self.flash, int(key[6:]))
+        if key[:6] == "fader_":
+            return functools.partial(self._page_fader, self.fader, int(key[6:]))
+        if key[:5] == "inde_":
+            return functools.partial(self._inde_button, int(key[5:]))
+        if key[:4] == "zoom":
+            return self._toggle_zoom
+        if key[:6] in ("h_plus", "v_plus"):
+            return self._zoom_plus
+        if key[:7] in ("h_minus", "v_minus"):
+            return self._zoom_minus
+        if key in SIMPLE_ACTION_MAPPING:
+            return functools.partial(self._execute_midi_action, key)
+        method_name = key.rsplit(".", maxsplit=1)[-1]
+        return getattr(self, f"_function_{method_name}", None) or getattr(
+            self, method_name, None
+        )
+
+    def _page_fader(
+        self,
+        func: typing.Callable[[mido.Message, int], None],
+        fader_index: int,
+        msg: mido.Message,
+    ) -> None:
+        """Call func with the fader number if it is on the active page"""
+        page = int((fader_index - 1) / 10)
+        fader = int(fader_index - (page * 10))
+        if page + 1 == self.app_delegate.core.lightshow.fader_bank.active_page:
+            func(msg, fader)
+
+    def _inde_button(self, independent: int, msg: mido.Message) -> None:
+        self._function_inde_button(msg, independent)
 
     def scan(self, msg: mido.Message) -> None:
         """Scan MIDI notes
@@ -190,9 +206,8 @@ class MidiNotes:
         Args:
             msg: MIDI message
         """
-        for key, value in list(self.notes.items()):
-            if msg.channel == value[0] and msg.note == value[1]:
-                self._dispatch(key, msg)
+        for handler in self.notes.handlers((msg.channel, msg.note)):
+            handler(msg)
 
     def scan_cc(self, msg: mido.Message) -> None:
         """Scan MIDI CC for button actions
@@ -200,18 +215,20 @@ class MidiNotes:
         Args:
             msg: MIDI message
         """
-        for key, value in list(self.cc_notes.items()):
-            if msg.channel == value[0] and msg.control == value[1]:
-                note_type = "note_on" if msg.value > 0 else "note_off"
-                velocity = 127 if msg.value > 0 else 0
-                simulated_msg = mido.Message(
-                    note_type,
-                    channel=msg.channel,
-                    note=0,
-                    velocity=velocity,
-                    time=msg.time,
-                )
-                self._dispatch(key, simulated_msg)
+        handlers = self.cc_notes.handlers((msg.channel, msg.control))
+        if not handlers:
+            return
+        note_type = "note_on" if msg.value > 0 else "note_off"
+        velocity = 127 if msg.value > 0 else 0
+        simulated_msg = mido.Message(
+            note_type,
+            channel=msg.channel,
+            note=0,
+            velocity=velocity,
+            time=msg.time,
+        )
+        for handler in handlers:
+            handler(simulated_msg)
 
     def send(self, midi_name: str, value: int) -> None:
         """Send MIDI note or CC message
@@ -18,6 +18,7 @@ import typing
 
 import mido
 from gi.repository import GLib
+from olc.midi.dispatch import Handler, IdleCoalescer, MidiMap
 
 if typing.TYPE_CHECKING:
     from olc.gtk3.application import Application
@@ -27,42 +28,59 @@ if typing.TYPE_CHECKING:
 class MidiPitchWheel:
     """MIDI pitchwheel messages from controllers"""
 
-    pitchwheel: dict[str, int]
+    pitchwheel: MidiMap[int]
 
     def __init__(self, midi: Midi, app_delegate: Application) -> None:
         self.midi = midi
         self.app_delegate = app_delegate
+        # Latest position of the moved faders
+        self.pending = IdleCoalescer()
         # Default MIDI pitchwheel values : "action": Channel
-        self.pitchwheel = {
+        pitchwheel = {
             "crossfade_out": -1,
             "crossfade_in": -1,
         }
         for i in range(10):
             for j in range(9):
-                self.pitchwheel[f"fader_{j + i * 10 + 1}"] = j
+                pitchwheel[f"fader_{j + i * 10 + 1}"] = j
+        # Only the first fader of a channel is moved
+        self.pitchwheel = MidiMap(
+            pitchwheel,
+            lambda channel: None if channel == -1 else channel,
+            self._resolve,
+            lambda key: key[:6] == "fader_",
+        )
 
     def reset(self) -> None:
         """Remove all MIDI pitchwheel"""
         for action in self.pitchwheel:
             self.pitchwheel[action] = -1
 
+    def _resolve(self, key: str) -> Handler | None:
+        """Handler of a MIDI action, called with the message"""
+        if key[:6] == "fader_":
+            index = int(key[6:]) - 1
+            return lambda msg: self.pending.post(key, self._update_fader, msg, index)
+        if key[:13] == "crossfade_out":
+            return lambda msg: self.pending.post(
+                key, self.midi.xfade.moved, msg, self.midi.xfade.fader_out
+            )
+        if key[:12] == "crossfade_in":
+            return lambda msg: self.pending.post(
+                key, self.midi.xfade.moved, msg, self.midi.xfade.fader_in
+            )
+        if func := getattr(self, f"_function_{key}", None):
+            return lambda msg: GLib.idle_add(func, None, msg)
+        return None
+
     def scan(self, msg: mido.Message) -> None:
         """Scan MIDI pitchwheel messages
 
         Args:
             msg: MIDI message
         """
-        for key, value in list(self.pitchwheel.items()):
-            if msg.channel == value:
-                if key[:6] == "fader_":
-                    GLib.idle_add(self._update_fader, msg, int(key[6:]) - 1)
-                    break
-                if key[:13] == "crossfade_out":
-                    GLib.idle_add(self.midi.xfade.moved, msg, self.midi.xfade.fader_out)
-                elif key[:12] == "crossfade_in":
-                    GLib.idle_add(self.midi.xfade.moved, msg, self.midi.xfade.fader_in)
-                elif func := getattr(self, f"_function_{key}", None):
-                    GLib.idle_add(func, None, msg)
+        for handler in self.pitchwheel.handlers(msg.channel):
+            handler(msg)
 
     def send(self, midi_name: str, value: int) -> None:
         """Send MIDI pitchwheel message
@@ -61,9 +61,12 @@ class MidiIO:
             if msg.type in ("note_on", "note_off"):
                 self.midi.messages.notes.scan(msg)
             elif msg.type == "control_change":
+                self.midi.send.received(self, msg)
                 self.midi.messages.notes.scan_cc(msg)
                 self.midi.messages.control_change.scan(self.name or "", msg)
             elif msg.type == "pitchwheel":
+                # Motorized fader moved by hand
+                self.midi.send.received(self, msg)
                 self.midi.messages.pitchwheel.scan(msg)
 
 
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import threading
+import time
+import typing
+import weakref
+from collections import deque
+from typing import Any, Hashable
+
+import mido
+from olc.core.dmxloop import LatencyHistogram
+
+if typing.TYPE_CHECKING:
+    from olc.midi.ports import MidiIO, MidiPorts
+
+# Mackie Control LCD: sysex header, then first position and characters
+LCD_HEADER = (0, 0, 102, 20, 18)
+LCD_SIZE = 112
+
+
+def feedback_key(msg: mido.Message) -> tuple[Hashable, int] | None:
+    """Control of a feedback message and its value
+
+    Args:
+        msg: MIDI message
+
+    Returns:
+        (control, value), None if the message is not a control feedback
+    """
+    if msg.type == "control_change":
+        return ("control_change", msg.channel, msg.control), msg.value
+    if msg.type == "pitchwheel":
+        return ("pitchwheel", msg.channel), msg.pitch
+    if msg.type == "note_on":
+        return ("note", msg.channel, msg.note), msg.velocity
+    if msg.type == "note_off":
+        return ("note", msg.channel, msg.note), 0
+    return None
+
+
+def lcd_chars(msg: mido.Message) -> tuple[int, tuple[int, ...]] | None:
+    """First position and characters of a Mackie LCD message, else None"""
+    if msg.type != "sysex" or len(msg.data) < 6:
+        return None
+    if tuple(msg.data[:5]) != LCD_HEADER:
+        return None
+    return msg.data[5], msg.data[6:]
+
+
+class _PortState:  # pylint: disable=too-few-public-methods
+    """Last values sent to a port"""
+
+    def __init__(self) -> None:
+        self.feedback: dict[Hashable, int] = {}
+        # None: unknown character
+        self.lcd: list[int | None] = [None] * LCD_SIZE
+
+
+# pylint: disable=too-many-instance-attributes
+class MidiSend:
+    """Send MIDI messages to every port, from one worker thread
+
+    Messages are sent as soon as they are queued. Feedback with the value
+    last sent on the same control of a port is dropped. Texts of the Mackie
+    LCD queued together are merged and only the changed characters are sent.
+    """
+
+    ports: MidiPorts
+
+    def __init__(self, ports: MidiPorts) -> None:
+        self.ports = ports
+        self._cond = threading.Condition()
+        self._queue: deque[tuple[float, mido.Message]] = deque()
+        # Pending LCD characters by position, time of the oldest one
+        self._lcd: dict[int, int] = {}
+        self._lcd_time = 0.0
+        self._states: weakref.WeakKeyDictionary[MidiIO, _PortState] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._running = True
+        # Statistics
+        self._latency = LatencyHistogram()
+        self._queued = 0
+        self._sent = 0
+        self._deduplicated = 0
+        self._lcd_batches = 0
+        self._max_depth = 0
+        self.thread = threading.Thread(target=self._run, name="MidiSend", daemon=True)
+        self.thread.start()
+
+    def enqueue(self, msg: mido.Message) -> None:
+        """Queue a message to send to every port
+
+        Args:
+            msg: MIDI message
+        """
+        now = time.monotonic()
+        lcd = lcd_chars(msg)
+        with self._cond:
+            self._queued += 1
+            if lcd is None:
+                self._queue.append((now, msg))
+            else:
+                if not self._lcd:
+                    self._lcd_time = now
+                start, chars = lcd
+                for position, char in enumerate(chars, start):
+                    if position < LCD_SIZE:
+                        self._lcd[position] = char
+            depth = len(self._queue) + bool(self._lcd)
+            self._max_depth = max(self._max_depth, depth)
+            self._cond.notify()
+
+    def received(self, port: MidiIO, msg: mido.Message) -> None:
+        """A control of a port moved: its value is no longer the one sent
+
+        Args:
+            port: MIDI port
+            msg: Received MIDI message
+        """
+        if (feedback := feedback_key(msg)) is None:
+            return
+        with self._cond:
+            if (state := self._states.get(port)) is not None:
+                state.feedback[feedback[0]] = feedback[1]
+
+    def forget(self) -> None:
+        """Forget the values sent (controllers were reset)"""
+        with self._cond:
+            self._states.clear()
+
+    def stop(self) -> None:
+        """Send the queued messages and stop the thread"""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self.thread is not threading.current_thread():
+            self.thread.join(timeout=2.0)
+
+    def stats(self) -> dict[str, Any]:
+        """Statistics since start
+
+        Latency (from enqueue to send) is summarized in seconds with count,
+        mean, p50, p99, p999 and max.
+        """
+        with self._cond:
+            return {
+                "queued": self._queued,
+                "sent": self._sent,
+                "deduplicated": self._deduplicated,
+                "lcd_batches": self._lcd_batches,
+                "depth": len(self._queue) + bool(self._lcd),
+                "max_depth": self._max_depth,
+                "latency": self._latency.summary(),
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._queue and not self._lcd:
+                    self._cond.wait()
+                batch = list(self._queue)
+                self._queue.clear()
+                lcd, lcd_time = self._lcd, self._lcd_time
+                self._lcd = {}
+                running = self._running
+            if batch or lcd:
+                self._send(batch, lcd, lcd_time)
+            if not running:
+                with self._cond:
+                    if not self._queue and not self._lcd:
+                        return
+
+    def _send(
+        self,
+        batch: list[tuple[float, mido.Message]],
+        lcd: dict[int, int],
+        lcd_time: float,
+    ) -> None:
+        """Send messages and LCD characters to every port"""
+        sent = deduplicated = lcd_batches = 0
+        for port in list(self.ports.ports):
+            with self._cond:
+                state = self._states.setdefault(port, _PortState())
+            # Values are recorded once sent, a failed send is tried again
+            messages: list[tuple[mido.Message, tuple[Hashable, int] | None]] = []
+            pending: dict[Hashable, int] = {}
+            for _, msg in batch:
+                feedback = feedback_key(msg)
+                if feedback is not None:
+                    control, value = feedback
+                    if pending.get(control, state.feedback.get(control)) == value:
+                        deduplicated += 1
+                        continue
+                    pending[control] = value
+                messages.append((msg, feedback))
+            lcd_messages = _lcd_messages(state.lcd, lcd)
+            lcd_batches += len(lcd_messages)
+            try:
+                for msg, feedback in messages:
+                    port.port.send(msg)
+                    sent += 1
+                    if feedback is not None:
+                        state.feedback[feedback[0]] = feedback[1]
+                for msg in lcd_messages:
+                    port.port.send(msg)
+                    sent += 1
+            except (OSError, ValueError) as err:
+                # Closed or unplugged port
+                print(f"[MidiSend] Error sending to {port.name}: {err}")
+                if lcd_messages:
+                    state.lcd[:] = [None] * LCD_SIZE
+        now = time.monotonic()
+        with self._cond:
+            self._sent += sent
+            self._deduplicated += deduplicated
+            self._lcd_batches += lcd_batches
+            for queued, _ in batch:
+                self._latency.record(now - queued)
+            if lcd:
+                self._latency.record(now - lcd_time)
+
+
+def _lcd_messages(shadow: list[int | None], lcd: dict[int, int]) -> list[mido.Message]:
+    """Sysex messages writing the changed LCD characters, and update the shadow
+
+    Changed characters are sent in one message, unless an unknown character
+    of the display lies between them.
+    """
+    changed = sorted(pos for pos, char in lcd.items() if shadow[pos] != char)
+    for pos in changed:
+        shadow[pos] = lcd[pos]
+    spans: list[list[int]] = []
+    for pos in changed:
+        if spans and all(
+            shadow[gap] is not None for gap in range(spans[-1][1] + 1, pos)
+        ):
+            spans[-1][1] = pos
+        else:
+            spans.append([pos, pos])
+    return [
+        mido.Message(
+            "sysex",
+            data=[*LCD_HEADER, start] + typing.cast(list[int], shadow[start : end + 1]),
+        )
+        for start, end in spans
+    ]
@@ -15,48 +15,156 @@
 from __future__ import annotations
 
 import typing
-from typing import Optional
+from collections import deque
+from typing import Iterator, Mapping, Optional
 
 import numpy as np
-from olc.define import MAX_CHANNELS, NB_UNIVERSES, UNIVERSES, is_int
+from olc.define import is_int
+from olc.layout import LAYOUT, resized
 
 if typing.TYPE_CHECKING:
     from olc.core.app import CoreApplication
     from olc.core.commandline import CoreCommandLine
+    from olc.curve import Curve
     from olc.gtk3.application import Application
 
 
+class _UniverseOutputs(Mapping[int, list[int]]):
+    """[channel, curve] of the patched outputs (1-512) of a universe"""
+
+    def __init__(self, patch: DMXPatch, index: int) -> None:
+        self._patch = patch
+        self._index = index
+
+    def __getitem__(self, output: int) -> list[int]:
+        if not isinstance(output, (int, np.integer)) or not 0 < output <= 512:
+            raise KeyError(output)
+        channel = int(self._patch.output_channels[self._index, output - 1])
+        if not channel:
+            raise KeyError(output)
+        return [channel, int(self._patch.output_curves[self._index, output - 1])]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(
+            (np.flatnonzero(self._patch.output_channels[self._index]) + 1).tolist()
+        )
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._patch.output_channels[self._index]))
+
+
+class _OutputsView(Mapping[int, _UniverseOutputs]):
+    """Patched outputs of each universe with at least one patched output"""
+
+    def __init__(self, patch: DMXPatch) -> None:
+        self._patch = patch
+
+    def __getitem__(self, universe: int) -> _UniverseOutputs:
+        index = self._patch.universe_indexes.get(universe)
+        if index is None or not self._patch.output_channels[index].any():
+            raise KeyError(universe)
+        return _UniverseOutputs(self._patch, index)
+
+    def __iter__(self) -> Iterator[int]:
+        used = self._patch.output_channels.any(axis=1)
+        return iter([universe for universe, i in zip(self._patch.universes, used) if i])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._patch.output_channels.any(axis=1)))
+
+
+class _ChannelsView(Mapping[int, list[list[Optional[int]]]]):
+    """[output, universe] of each channel, [[None, None]] if not patched"""
+
+    def __init__(self, patch: DMXPatch) -> None:
+        self._patch = patch
+
+    def __getitem__(self, channel: int) -> list[list[Optional[int]]]:
+        patch = self._patch
+        if not isinstance(channel, (int, np.integer)):
+            raise KeyError(channel)
+        if not 0 < channel <= patch.max_channels:
+            raise KeyError(channel)
+        if not patch.channel_counts[channel - 1]:
+            return [[None, None]]
+        patch.update_numpy_cache_if_dirty()
+        start, end = patch.channel_indptr[channel - 1 : channel + 1]
+        universes = patch.universes
+        return [
+            [flat % 512 + 1, universes[flat // 512]]
+            for flat in patch.map_dst_flat[start:end].tolist()
+        ]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, self._patch.max_channels + 1))
+
+    def __len__(self) -> int:
+        return self._patch.max_channels
+
+
 # pylint: disable=too-many-instance-attributes
 class DMXPatch:
     """To store and manipulate DMX patch
     Default patch is 1:1 (channel = output)
 
+    The patch is stored in two (universes, 512) tables, the channel (0 if not
+    patched) and the curve of each output. Edits write in these tables. The
+    arrays used to compute the frames are sorted by channel: with
+    `channel_indptr`, they are a CSR index of the outputs of each channel.
+    Edits are queued and moved in these arrays on their next use. They are
+    only rebuilt from the tables after bulk changes (empty patch, resize or
+    many edits).
+
     Attributes:
-        channels: Dictionary of [output (1-512), universe (0-NB_UNIVERSES)] for each
-            channel (1-MAX_CHANNELS).
-            For example, channel 5 could be patched on [1, 0] and [5, 1] i.e. output 1
-            of universe 1 and output 5 of universe 2
-        outputs: Dictionaries of [channel (1-MAX_CHANNELS), curve number] for each
-            output (1-512) of each universe (0-NB_UNIVERSES)
+        channels: [output (1-512), universe] of each channel (1-max_channels).
+            For example, channel 5 could be patched on [1, 1] and [5, 2] i.e. output 1
+            of universe 1 and output 5 of universe 2. Read only view.
+        outputs: [channel (1-max_channels), curve number] of each patched output
+            (1-512) of each universe. Read only view.
         universes: List of universes to use
+        max_channels: Number of channels
+        output_channels: Channel of each output of each universe (0 if not patched)
+        output_curves: Curve number of each output of each universe
+        channel_counts: Number of outputs of each channel (0-indexed)
     """
 
     universes: list[int]
-    channels: dict[int, list[list[Optional[int]]]]
-    outputs: dict[int, dict[int, list[int]]]
-
-    def __init__(self, universes: list[int]) -> None:
-        self.universes = universes
-        self.channels = {}
-        self.outputs = {}
+    max_channels: int
+
+    def __init__(self, universes: list[int], max_channels: int | None = None) -> None:
+        self.universes = list(universes)
+        self.universe_indexes = {universe: i for i, universe in enumerate(universes)}
+        self.max_channels = (
+            LAYOUT.max_channels if max_channels is None else max_channels
+        )
+        self.output_channels = np.zeros((len(self.universes), 512), dtype=np.int32)
+        self.output_curves = np.zeros((len(self.universes), 512), dtype=np.int32)
+        self.channel_counts = np.zeros(self.max_channels, dtype=np.int32)
+        self.channels = _ChannelsView(self)
+        self.outputs = _OutputsView(self)
         self.on_patch_empty_cb: typing.Callable[[], None] | None = None
         self.on_unpatch_cb: typing.Callable[[int, int], None] | None = None
         self._numpy_cache_dirty = True
-        self.is_patched_mask = np.zeros(MAX_CHANNELS, dtype=bool)
+        self._curves_dirty = False
+        # Edits not yet in the cached arrays: (flat output, old, new channel)
+        self._edits: deque[tuple[int, int, int]] = deque()
+        self.is_patched_mask = np.zeros(self.max_channels, dtype=bool)
+        # Indexes of the patched channels (sorted)
+        self.patched_channels = np.array([], dtype=np.intp)
+        # Patched outputs, sorted by channel. Outputs of channel c (0-indexed)
+        # are map_dst_*[channel_indptr[c]:channel_indptr[c + 1]]
+        self.channel_indptr = np.zeros(self.max_channels + 1, dtype=np.intp)
         self.map_src_channels = np.array([], dtype=np.intp)
         self.map_dst_universes = np.array([], dtype=np.intp)
         self.map_dst_outputs = np.array([], dtype=np.intp)
         self.map_dst_curves = np.array([], dtype=np.intp)
+        # Compiled output: flat destination in a (universes * 512) buffer,
+        # curve numbers used by the patch and LUT row offset of each destination
+        self.map_dst_flat = np.array([], dtype=np.intp)
+        self.map_curve_numbers = np.zeros(1, dtype=np.intp)
+        self.map_lut_offsets = np.array([], dtype=np.intp)
+        # Incremented each time the cached arrays are rebuilt
+        self.cache_generation = 0
 
         self.patch_1on1()
 
@@ -68,138 +176,384 @@ class DMXPatch:
         """Test if channel is patched
 
         Args:
-            channel: [1 - MAX_CHANNELS]
+            channel: [1 - max_channels]
 
         Returns:
             True if patched, else False
         """
-        if None in self.channels[channel][0]:
-            return False
-        return True
+        return 0 < channel <= self.max_channels and bool(
+            self.channel_counts[channel - 1]
+        )
+
+    def _output_index(self, output: int, univ: int) -> int:
+        """Row of a universe, checking the output
+
+        Raises:
+            ValueError: universe not in the patch or output not in 1-512
+        """
+        index = self.universe_indexes.get(univ)
+        if index is None:
+            raise ValueError(f"Universe {univ} is not in {self.universes}")
+        if not 0 < output <= 512:
+            raise ValueError(f"Output must be between 1 and 512. Got {output}.")
+        return index
+
+    def get_output(self, output: int, univ: int) -> tuple[int, int] | None:
+        """Channel and curve of an output
+
+        Args:
+            output: Dimmer number (1-512)
+            univ: Universe number
+
+        Returns:
+            (channel, curve) or None if the output is not patched
+        """
+        index = self.universe_indexes.get(univ)
+        if index is None or not 0 < output <= 512:
+            return None
+        channel = int(self.output_channels[index, output - 1])
+        if not channel:
+            return None
+        return channel, int(self.output_curves[index, output - 1])
 
     def patch_empty(self) -> None:
         """Set Dimmers patch to Zero"""
         if self.on_patch_empty_cb:
             self.on_patch_empty_cb()
-        self.outputs = {}
-        for channel in range(1, MAX_CHANNELS + 1):
-            self.channels[channel] = [[None, None]]
+        self.output_channels.fill(0)
+        self.output_curves.fill(0)
+        self.channel_counts.fill(0)
         self._numpy_cache_dirty = True
 
     def patch_1on1(self) -> None:
         """Set patch 1:1"""
         self.patch_empty()
-        for channel in range(1, MAX_CHANNELS + 1):
-            index = int((channel - 1) / 512)
-            univ = self.universes[index]
-            output = channel - (index * 512)
-            self.add_output(channel, output, univ)
+        count = min(self.max_channels, 512 * len(self.universes))
+        self.output_channels.reshape(-1)[:count] = np.arange(1, count + 1)
+        self.channel_counts[:count] = 1
 
     def add_output(self, channel: int, output: int, univ: int, curve: int = 0) -> None:
         """Add an output to a channel
 
+        An output patched on another channel is moved to this one.
+
         Args:
-            channel: Channel number (1-MAX_CHANNELS)
+            channel: Channel number (1-max_channels)
             output: Dimmer number (1-512)
-            univ: Universe number (one of UNIVERSES in define module)
+            univ: Universe number (one of universes)
             curve: Curve number (default 0, Linear Curve)
+
+        Raises:
+            ValueError: channel, output or universe out of the patch
         """
-        if self.channels[channel] == [[None, None]]:
-            self.channels[channel] = [[output, univ]]
-        elif [output, univ] not in self.channels[channel]:
-            self.channels[channel].append([output, univ])
-        if univ not in self.outputs:
-            self.outputs[univ] = {}
-        self.outputs[univ][output] = [channel, curve]
-        self._numpy_cache_dirty = True
+        index = self._output_index(output, univ)
+        if not 0 < channel <= self.max_channels:
+            raise ValueError(
+                f"Channel must be between 1 and {self.max_channels}. Got {channel}."
+            )
+        old = int(self.output_channels[index, output - 1])
+        if old:
+            self.channel_counts[old - 1] -= 1
+        self.output_channels[index, output - 1] = channel
+        self.output_curves[index, output - 1] = curve
+        self.channel_counts[channel - 1] += 1
+        self._edits.append((index * 512 + output - 1, old, channel))
+        if old == channel:
+            self._curves_dirty = True
 
     def unpatch(self, channel: int, output: int, univ: int) -> None:
         """Unpatch an output from a channel
 
         Args:
-            channel: Channel number (1-MAX_CHANNELS)
+            channel: Channel number (1-max_channels)
             output: Dimmer number (1-512)
-            univ: Universe number (one of UNIVERSES in define module)
+            univ: Universe number (one of universes)
+
+        Raises:
+            ValueError: output not patched on channel
         """
-        del self.outputs[univ][output]
-        self.channels[channel].remove([output, univ])
-        if not self.channels[channel]:
-            self.channels[channel] = [[None, None]]
-        index = self.universes.index(univ)
+        index = self._output_index(output, univ)
+        if self.output_channels[index, output - 1] != channel:
+            raise ValueError(f"Output {output}.{univ} is not patched on {channel}")
+        self.output_channels[index, output - 1] = 0
+        self.output_curves[index, output - 1] = 0
+        self.channel_counts[channel - 1] -= 1
         if self.on_unpatch_cb:
             self.on_unpatch_cb(index, output - 1)
+        self._edits.append((index * 512 + output - 1, channel, 0))
+
+    def set_curve(self, output: int, univ: int, curve: int) -> None:
+        """Change the curve of a patched output
+
+        Args:
+            output: Dimmer number (1-512)
+            univ: Universe number (one of universes)
+            curve: Curve number
+
+        Raises:
+            ValueError: output not patched
+        """
+        index = self._output_index(output, univ)
+        if not self.output_channels[index, output - 1]:
+            raise ValueError(f"Output {output}.{univ} is not patched")
+        self.output_curves[index, output - 1] = curve
+        self._curves_dirty = True
+
+    def replace_curve(self, old: int, new: int) -> None:
+        """Outputs using curve `old` use curve `new`"""
+        self.output_curves[self.output_curves == old] = new
+        self._curves_dirty = True
+
+    def resize(self, universes: list[int], max_channels: int) -> None:
+        """Change universes and number of channels
+
+        Outputs of removed universes and removed channels are unpatched.
+
+        Args:
+            universes: Universes to use
+            max_channels: Number of channels
+        """
+        output_channels = np.zeros((len(universes), 512), dtype=np.int32)
+        output_curves = np.zeros((len(universes), 512), dtype=np.int32)
+        for index, universe in enumerate(universes):
+            if (old := self.universe_indexes.get(universe)) is not None:
+                output_channels[index] = self.output_channels[old]
+                output_curves[index] = self.output_curves[old]
+        removed = output_channels > max_channels
+        output_channels[removed] = 0
+        output_curves[removed] = 0
+        self.output_channels = output_channels
+        self.output_curves = output_curves
+        self.channel_counts = np.bincount(
+            output_channels.reshape(-1), minlength=max_channels + 1
+        )[1:].astype(np.int32)
+        self.universes = list(universes)
+        self.universe_indexes = {universe: i for i, universe in enumerate(universes)}
+        self.max_channels = max_channels
         self._numpy_cache_dirty = True
 
     def update_numpy_cache_if_dirty(self) -> None:
         """Update cached mappings if dirty."""
-        if getattr(self, "_numpy_cache_dirty", True) or not hasattr(
-            self, "map_src_channels"
-        ):
+        # Moving many outputs costs more than a rebuild
+        if self._numpy_cache_dirty or len(self._edits) > 16:
             self._update_numpy_cache()
-            self._numpy_cache_dirty = False
+        elif self._edits:
+            self._apply_edits()
+        elif self._curves_dirty:
+            self._update_curves()
 
     def _update_numpy_cache(self) -> None:
         """Update cached arrays for fast block operations."""
-        # 1. Boolean mask of patched channels (True if patched, False if not)
-        mask = np.zeros(MAX_CHANNELS, dtype=bool)
-        for channel in range(1, MAX_CHANNELS + 1):
-            if channel in self.channels:
-                if (
-                    self.channels[channel] != [[None, None]]
-                    and None not in self.channels[channel][0]
-                ):
-                    mask[channel - 1] = True
-        self.is_patched_mask = mask
-
-        # 2. Flat indexing arrays for fast block level distribution
-        src_channels = []
-        dst_universes = []
-        dst_outputs = []
-        dst_curves = []
-
-        for channel, outputs in self.channels.items():
-            if outputs == [[None, None]] or None in outputs[0]:
+        # Edits made from now on are in the tables, or applied after
+        self._numpy_cache_dirty = False
+        self._edits.clear()
+        # 1. Patched outputs, sorted by channel then output
+        flat_channels = self.output_channels.reshape(-1)
+        patched = np.flatnonzero(flat_channels)
+        src_channels = flat_channels[patched].astype(np.intp) - 1
+        order = np.argsort(src_channels, kind="stable")
+        self.map_dst_flat = patched[order]
+        self.map_src_channels = src_channels[order]
+        self.map_dst_universes = self.map_dst_flat // 512
+        self.map_dst_outputs = self.map_dst_flat % 512
+
+        # 2. CSR index, patched channels and their mask
+        self.channel_indptr = np.zeros(self.max_channels + 1, dtype=np.intp)
+        np.cumsum(self.channel_counts, out=self.channel_indptr[1:])
+        self.is_patched_mask = self.channel_counts > 0
+        self.patched_channels = np.flatnonzero(self.is_patched_mask)
+        self._update_curves()
+
+    def _apply_edits(self) -> None:
+        """Move the edited outputs in the cached arrays, without rebuilding them"""
+        curves = self._curves_dirty
+        while self._edits:
+            flat, old, new = self._edits.popleft()
+            if old == new:
                 continue
-            for out in outputs:
-                output = out[0]
-                universe = out[1]
-                if universe and output:
-                    src_channels.append(channel - 1)
-                    dst_universes.append(UNIVERSES.index(universe))
-                    dst_outputs.append(output - 1)
-
-                    # Curve number
-                    curve_numb = 0
-                    if universe in self.outputs and output in self.outputs[universe]:
-                        curve_numb = self.outputs[universe][output][1]
-                    dst_curves.append(curve_numb)
-
-        self.map_src_channels = np.array(src_channels, dtype=np.intp)
-        self.map_dst_universes = np.array(dst_universes, dtype=np.intp)
-        self.map_dst_outputs = np.array(dst_outputs, dtype=np.intp)
-        self.map_dst_curves = np.array(dst_curves, dtype=np.intp)
+            if old:
+                self._move_output(flat, old - 1, insert=False)
+            if new:
+                curves |= not self._move_output(flat, new - 1, insert=True)
+        if curves:
+            self._update_curves()
+        else:
+            self.cache_generation += 1
+
+    def _move_output(self, flat: int, channel: int, insert: bool) -> bool:
+        """Insert or remove an output of a channel (0-indexed) in the cache
+
+        The outputs of a channel are sorted: the output is bisected in them.
+        An output already inserted or removed (edited during a rebuild) is
+        skipped.
+
+        Returns:
+            False if the curve of the inserted output has no LUT row yet
+        """
+        start, end = self.channel_indptr[channel : channel + 2]
+        position = start + int(np.searchsorted(self.map_dst_flat[start:end], flat))
+        if insert == (position < end and self.map_dst_flat[position] == flat):
+            return True
+        arrays = (
+            self.map_dst_flat,
+            self.map_src_channels,
+            self.map_dst_universes,
+            self.map_dst_outputs,
+            self.map_dst_curves,
+            self.map_lut_offsets,
+        )
+        known = True
+        if insert:
+            curve = int(self.output_curves.reshape(-1)[flat])
+            row = int(np.searchsorted(self.map_curve_numbers, curve))
+            known = (
+                row < len(self.map_curve_numbers)
+                and self.map_curve_numbers[row] == curve
+            )
+            values = (flat, channel, flat // 512, flat % 512, curve, row * 256)
+            arrays = tuple(
+                np.insert(array, position, value)
+                for array, value in zip(arrays, values)
+            )
+        else:
+            arrays = tuple(np.delete(array, position) for array in arrays)
+        (
+            self.map_dst_flat,
+            self.map_src_channels,
+            self.map_dst_universes,
+            self.map_dst_outputs,
+            self.map_dst_curves,
+            self.map_lut_offsets,
+        ) = arrays
+        self.channel_indptr[channel + 1 :] += 1 if insert else -1
+        patched = self.channel_indptr[channel + 1] > self.channel_indptr[channel]
+        if patched != self.is_patched_mask[channel]:
+            self.is_patched_mask[channel] = patched
+            index = np.searchsorted(self.patched_channels, channel)
+            self.patched_channels = (
+                np.insert(self.patched_channels, index, channel)
+                if patched
+                else np.delete(self.patched_channels, index)
+            )
+        return known
+
+    def _update_curves(self) -> None:
+        """Curves of the compiled output pipeline (see PatchPipeline)"""
+        self.map_dst_curves = self.output_curves.reshape(-1)[self.map_dst_flat].astype(
+            np.intp
+        )
+        # Curve 0 (linear) always uses the first LUT row
+        curve_numbers, rows = np.unique(
+            np.concatenate(([0], self.map_dst_curves)).astype(np.intp),
+            return_inverse=True,
+        )
+        self.map_curve_numbers = curve_numbers
+        self.map_lut_offsets = (rows[1:] * 256).astype(np.intp)
+        self._curves_dirty = False
+        self.cache_generation += 1
 
     def get_first_patched_channel(self) -> int:
         """Return first patched channel
 
         Returns:
-            Channel number (1-MAX_CHANNELS)
+            Channel number (1-max_channels)
         """
         self.update_numpy_cache_if_dirty()
-        indices = np.nonzero(self.is_patched_mask)[0]
+        indices = self.patched_channels
         return int(indices[0]) + 1 if len(indices) > 0 else 1
 
     def get_last_patched_channel(self) -> int:
         """Return last patched channel
 
         Returns:
-            Channel number (1-MAX_CHANNELS)
+            Channel number (1-max_channels)
         """
         self.update_numpy_cache_if_dirty()
-        indices = np.nonzero(self.is_patched_mask)[0]
+        indices = self.patched_channels
         return int(indices[-1]) + 1 if len(indices) > 0 else 1
 
 
+class PatchPipeline:  # pylint: disable=too-many-instance-attributes
+    """Patched output levels of all universes, computed from channel levels.
+
+    The patch is compiled once per modification into flat destination indices
+    and a stacked (n_curves, 256) curve LUT scaled by the main fader. A frame
+    is then one gather of the channel levels, one LUT take and one scatter
+    into `output`, without allocation.
+
+    `output` is a contiguous (universes, 512) buffer, reallocated by resize().
+    Outputs without patched channel keep their value.
+    """
+
+    def __init__(
+        self,
+        patch: DMXPatch,
+        get_curve: typing.Callable[[int], Curve | None],
+        universes: int | None = None,
+    ) -> None:
+        self.patch = patch
+        self.get_curve = get_curve
+        if universes is None:
+            universes = len(patch.universes)
+        self.output = np.zeros((universes, 512), dtype=np.uint8)
+        self._flat_output = self.output.reshape(-1)
+        self._generation = -1
+        self._linear = np.arange(256, dtype=np.float64)
+        self._indices = np.zeros(0, dtype=np.intp)
+        self._levels = np.zeros(0, dtype=np.uint8)
+        self._scaled = np.zeros((1, 256), dtype=np.float64)
+        self._lut = np.zeros((1, 256), dtype=np.uint8)
+
+    def resize(self, universes: int) -> None:
+        """Reallocate the output buffer for a number of universes"""
+        self.output = resized(self.output, universes)
+        self._flat_output = self.output.reshape(-1)
+
+    def _compile(self) -> None:
+        """Allocate the work buffers for the current patch."""
+        patch = self.patch
+        patch.update_numpy_cache_if_dirty()
+        if self._generation == patch.cache_generation:
+            return
+        size = len(patch.map_src_channels)
+        self._indices = np.zeros(size, dtype=np.intp)
+        self._levels = np.zeros(size, dtype=np.uint8)
+        self._scaled = np.zeros((len(patch.map_curve_numbers), 256), dtype=np.float64)
+        self._lut = np.zeros((len(patch.map_curve_numbers), 256), dtype=np.uint8)
+        self._generation = patch.cache_generation
+
+    def _update_lut(self, main_fader: float) -> None:
+        """Stack the curves, scaled by the main fader.
+
+        Curves are read on every frame as they can be edited live.
+        """
+        for row, number in enumerate(self.patch.map_curve_numbers):
+            curve = self.get_curve(int(number)) if number else None
+            values = self._linear if curve is None else curve.values_array
+            np.multiply(values, main_fader, out=self._scaled[row])
+        np.rint(self._scaled, out=self._scaled)
+        np.copyto(self._lut, self._scaled, casting="unsafe")
+
+    def render(self, levels: np.ndarray, main_fader: float = 1.0) -> np.ndarray:
+        """Compute the patched outputs of the channel levels.
+
+        Args:
+            levels: Level of each channel (uint8)
+            main_fader: Main fader value (0.0-1.0)
+
+        Returns:
+            The output buffer
+        """
+        self._compile()
+        self._update_lut(main_fader)
+        patch = self.patch
+        np.take(levels, patch.map_src_channels, out=self._levels, mode="clip")
+        np.add(self._levels, patch.map_lut_offsets, out=self._indices)
+        np.take(self._lut.reshape(-1), self._indices, out=self._levels, mode="clip")
+        self._flat_output[patch.map_dst_flat] = self._levels
+        return self.output
+
+
 class PatchByOutputs:
     """Manipulate Patch using Outputs order"""
 
@@ -297,7 +651,7 @@ class PatchByOutputs:
 
         # Select next output
         output_index = self.last
-        if output_index < NB_UNIVERSES * 512:
+        if output_index < len(self.patch.universes) * 512:
             output_index += 1
         output, universe = self.get_output_universe(output_index)
         self._set_commandline_string(f"{output}.{universe}")
@@ -327,7 +681,7 @@ class PatchByOutputs:
         self.commandline.set_string(value)
 
     def get_output_universe(self, out: int) -> tuple[Optional[int], Optional[int]]:
-        """Returns output.universe corresponding to output index (1-NB_UNIVERSES * 512)
+        """Returns output.universe corresponding to output index (1-universes * 512)
 
         Args:
             out: output index
@@ -337,9 +691,9 @@ class PatchByOutputs:
         """
         output = None
         universe = None
-        if 0 < out <= (NB_UNIVERSES * 512):
+        if 0 < out <= len(self.patch.universes) * 512:
             univ_index = int((out - 1) / 512)
-            universe = UNIVERSES[univ_index]
+            universe = self.patch.universes[univ_index]
             output = out - (univ_index * 512)
         return (output, universe)
 
@@ -349,8 +703,8 @@ class PatchByOutputs:
         output = None
         if out is None or univ is None:
             return None
-        if (0 < out <= 512) and univ in UNIVERSES:
-            univ_index = UNIVERSES.index(univ)
+        if (0 < out <= 512) and univ in self.patch.universes:
+            univ_index = self.patch.universes.index(univ)
             output = out + (univ_index * 512)
         return output
 
@@ -368,7 +722,7 @@ class PatchByOutputs:
                     universe = int(split[1])
         else:
             output = int(keystring)
-            universe = UNIVERSES[0]
+            universe = self.patch.universes[0]
         return (output, universe)
 
     def _string_to_channel(self) -> Optional[int]:
@@ -14,15 +14,15 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-import threading
-import time
 import typing
 from typing import Optional
 
 import numpy as np
+from olc.core.fades import Transition
 from olc.cue import Cue
-from olc.define import MAX_CHANNELS
-from olc.step import Step
+from olc.indexed_list import IndexedList
+from olc.layout import LAYOUT
+from olc.step import Step, Steps
 
 if typing.TYPE_CHECKING:
     from gi.repository import Gio
@@ -44,7 +44,7 @@ class Sequence:
     index: float
     type_seq: str
     text: str
-    thread: Optional[ThreadGo | ThreadGoBack]
+    transition: Optional[Transition]
     lightshow: typing.Optional[LightShow]
     backend: typing.Any
     _on_go: bool
@@ -61,7 +61,7 @@ class Sequence:
         self.text = text
         self.lightshow = lightshow
         self.cues = set()
-        self.steps: list[Step] = []
+        self.steps = Steps()
         self.position = 0
         self.last = 0
         # Flag to know if we have a Go in progress
@@ -70,8 +70,8 @@ class Sequence:
         self.channels: set[int] = set()
         # Flag for chasers
         self.run = False
-        # Thread for Go and GoBack
-        self.thread = None
+        # Running Go or Go Back (or chaser)
+        self.transition = None
 
         # Step and Cue 0
         cue = Cue(0, 0.0)
@@ -123,14 +123,14 @@ class Sequence:
         """
         if (
             self.on_go
-            and self.thread
+            and self.transition
             and self.app is not None
             and self.app.midi is not None
         ):
             self.app.midi.button_off("playback.go")
             # Switch off Pause Led
-            if not self.thread.pause.is_set():
-                self.thread.pause.set()
+            if not self.transition.pause.is_set():
+                self.transition.pause.set()
                 if self.app is not None and self.app.midi is not None:
                     self.app.midi.button_off("playback.pause")
                 if self.app is not None:
@@ -141,9 +141,9 @@ class Sequence:
                         core.action_registry.get("playback.pause").get_feedback_state(),
                     )
             else:
-                self.thread.pause.set()
-            self.thread.stop()
-            self.thread.join()
+                self.transition.pause.set()
+            self.transition.stop()
+            self.transition.join()
             self.on_go = False
             if self.app is not None and self.app.crossfade is not None:
                 self.app.crossfade.scale_a.set_value(0)
@@ -202,28 +202,16 @@ class Sequence:
             found (bool), step (int)
         """
         found = False
-        step = 0
+        if cue is None:
+            return found, len(self.steps) + 1
         # Cue already exist ?
-        for item in self.steps:
-            if item.cue is not None and item.cue.number == cue:
-                found = True
-                break
-            step += 1
-        step -= 1
+        step = self.steps.position(cue)
+        if step is not None:
+            return True, step if step > 1 else 0
         # If new Cue, find step index
-        if not found:
-            exist = False
-            step = 0
-            for item in self.steps:
-                if item.cue is not None and cue is not None and item.cue.number > cue:
-                    exist = True
-                    break
-                step += 1
-            if not exist:
-                step += 1
-        elif step:
+        step = self.steps.insert_position(cue)
+        if step == len(self.steps):
             step += 1
-
         return found, step
 
     def get_next_cue(self, step: Optional[int] = None) -> Optional[float]:
@@ -254,7 +242,7 @@ class Sequence:
         """Get channel level in next cue
 
         Args:
-            channel: channel number (1 - MAX_CHANNELS)
+            channel: channel number (1 - LAYOUT.max_channels)
             level: level in active cue (0 - 255)
 
         Returns:
@@ -331,36 +319,33 @@ class Sequence:
         if not keystring:
             return
 
-        # Scan all cues
-        for i, step in enumerate(self.steps):
-            # Until we find the good one
-            if float(get_cue(step).number) == float(keystring):
-                # Position to the one just before
-                self.position = i - 1
-                next_step = self.position + 1
+        i = self.steps.position(float(keystring))
+        if i is not None:
+            # Position to the one just before
+            self.position = i - 1
+            next_step = self.position + 1
 
-                # Emit event for GUI (GuiEventBridge) to setup times and view
-                if self.app is not None:
-                    core = getattr(self.app, "core", self.app)
-                    core.emit(
-                        "playback.goto_selected",
-                        {
-                            "old_pos": old_pos,
-                            "next_step": next_step,
-                            "keystring": keystring,
-                            "total_time": self.steps[next_step].total_time,
-                            "time_in": self.steps[next_step].time_in,
-                            "time_out": self.steps[next_step].time_out,
-                            "delay_in": self.steps[next_step].delay_in,
-                            "delay_out": self.steps[next_step].delay_out,
-                            "wait": self.steps[next_step].wait,
-                            "channel_time": self.steps[next_step].channel_time,
-                        },
-                    )
+            # Emit event for GUI (GuiEventBridge) to setup times and view
+            if self.app is not None:
+                core = getattr(self.app, "core", self.app)
+                core.emit(
+                    "playback.goto_selected",
+                    {
+                        "old_pos": old_pos,
+                        "next_step": next_step,
+                        "keystring": keystring,
+                        "total_time": self.steps[next_step].total_time,
+                        "time_in": self.steps[next_step].time_in,
+                        "time_out": self.steps[next_step].time_out,
+                        "delay_in": self.steps[next_step].delay_in,
+                        "delay_out": self.steps[next_step].delay_out,
+                        "wait": self.steps[next_step].wait,
+                        "channel_time": self.steps[next_step].channel_time,
+                    },
+                )
 
-                # Launch Go
-                self.do_go(None, True)
-                break
+            # Launch Go
+            self.do_go(None, True)
 
     def do_go(self, _action: Optional[Gio.SimpleAction], goto: bool = False) -> None:
         """Go
@@ -413,8 +398,8 @@ class Sequence:
         else:
             # Indicates that a Go is in progress
             self.on_go = True
-            self.thread = ThreadGo(goto, self)
-            self.thread.start()
+            self.transition = GoTransition(goto, self)
+            self.transition.start()
 
     def go_back(self, _action: Optional[Gio.SimpleAction], _param: None) -> bool:
         """Go Back
@@ -458,19 +443,19 @@ class Sequence:
             )
 
         self.on_go = True
-        self.thread = ThreadGoBack(self)
-        self.thread.start()
+        self.transition = GoBackTransition(self)
+        self.transition.start()
         return False
 
     def pause(self, _action: Optional[Gio.SimpleAction], _param: None) -> None:
         """Toggle pause"""
-        if self.thread:
-            if self.thread.pause.is_set():
-                self.thread.pause.clear()
+        if self.transition:
+            if self.transition.pause.is_set():
+                self.transition.pause.clear()
                 if self.app is not None and self.app.midi is not None:
                     self.app.midi.button_on("playback.pause")
             else:
-                self.thread.pause.set()
+                self.transition.pause.set()
                 if self.app is not None and self.app.midi is not None:
                     self.app.midi.button_off("playback.pause")
             if self.app is not None:
@@ -483,8 +468,8 @@ class Sequence:
 
 
 # pylint: disable=too-many-instance-attributes
-class ThreadGo(threading.Thread):
-    """Thread object for Go"""
+class GoTransition(Transition):
+    """Transition to the next step (Go)"""
 
     sequence: Sequence
     old_channels_levels: np.ndarray
@@ -498,13 +483,10 @@ class ThreadGo(threading.Thread):
     backend: typing.Any
 
     def __init__(self, goto: bool, sequence: Sequence) -> None:
-        threading.Thread.__init__(self, name="ThreadGo", daemon=True)
-        self._stopevent = threading.Event()
-        self.pause = threading.Event()
-        self.pause.set()
+        super().__init__(sequence.backend.dmx.fades)
         self.sequence = sequence
         # To save channels levels when user sends Go
-        self.old_channels_levels = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+        self.old_channels_levels = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
         next_step = self.sequence.position + 1
         self.total_time = self.sequence.steps[next_step].total_time * 1000
         self.time_in = self.sequence.steps[next_step].time_in * 1000
@@ -513,6 +495,20 @@ class ThreadGo(threading.Thread):
         self.delay_in = self.sequence.steps[next_step].delay_in * 1000
         self.delay_out = self.sequence.steps[next_step].delay_out * 1000
         self.goto = goto
+        # Step, channel times and cue generation of the compiled fade
+        self._fade_step: Step | None = None
+        self._fade_mask: np.ndarray | None = None
+        self._fade_generation = -1
+        # Compiled fade of each channel (ms) and buffers of the ticks
+        self._old = np.zeros(LAYOUT.max_channels, dtype=np.float64)
+        self._diff = np.zeros(LAYOUT.max_channels, dtype=np.float64)
+        self._start = np.zeros(LAYOUT.max_channels, dtype=np.float64)
+        self._end = np.zeros(LAYOUT.max_channels, dtype=np.float64)
+        self._duration = np.ones(LAYOUT.max_channels, dtype=np.float64)
+        self._truncate = np.zeros(LAYOUT.max_channels, dtype=bool)
+        self._progress = np.zeros(LAYOUT.max_channels, dtype=np.float64)
+        self._levels = np.zeros(LAYOUT.max_channels, dtype=np.float64)
+        self._ended = np.zeros(LAYOUT.max_channels, dtype=bool)
 
     @property
     def app(self) -> CoreApplication | None:
@@ -568,33 +564,19 @@ class ThreadGo(threading.Thread):
         if self.app is not None and self.app.midi is not None:
             self.app.midi.button_off("playback.go")
 
-    def run(self) -> None:
+    def begin(self) -> bool:
         self._capture_start_levels()
-        start_pause = None
-        pause_time = 0.0
-        start_time = time.time() * 1000
-        i = (time.time() * 1000) - start_time
-        while i < self.total_time and not self._stopevent.is_set():
-            if not self.pause.is_set():
-                if not start_pause:
-                    start_pause = time.time() * 1000
-                self.pause.wait()
-                pause_time += (time.time() * 1000) - start_pause
-            else:
-                start_pause = None
-                i = (time.time() * 1000) - (start_time + pause_time)
-                self.update_levels(i)
-                time.sleep(0.05)
+        return True
 
-        if self._stopevent.is_set():
-            return
+    def update(self, elapsed: float) -> bool:
+        if elapsed >= self.total_time:
+            return True
+        self.update_levels(elapsed)
+        return False
 
+    def finish(self) -> None:
         self._finalize_go()
 
-    def stop(self) -> None:
-        """Stop"""
-        self._stopevent.set()
-
     def update_levels(self, i: float) -> None:
         """Update levels
 
@@ -642,84 +624,56 @@ class ThreadGo(threading.Thread):
         """
         next_step = self.sequence.position + 1
         step = self.sequence.steps[next_step]
-
-        lvls = self._calculate_transitions_go(i, step)
-        self._apply_channel_times_go(lvls, i, step)
-
-        self.backend.dmx.levels["sequence"][:] = np.clip(lvls, 0, 255).astype(np.uint8)
-        self.backend.dmx.set_levels()
-
-    def _calculate_transitions_go(self, i: float, step: Step) -> np.ndarray:
-        """Calculate fade levels using array operations."""
-        old_levels = self.old_channels_levels.astype(np.int32)
-        next_levels = get_cue(step).channels_array.astype(np.int32)
-        lvls = old_levels.copy()
-
-        # Decays (channels going down)
-        decay_mask = next_levels < old_levels
-        if np.any(decay_mask):
-            progress_mask = (i > self.wait + step.delay_out * 1000) & (
-                i < (step.time_out + step.wait + step.delay_out) * 1000
-            )
-            if np.any(progress_mask & decay_mask):
-                factor = (i - self.wait - step.delay_out * 1000) / (
-                    step.time_out * 1000
-                )
-                diff = (next_levels - old_levels) * factor
-                decay_lvls = np.round(old_levels - np.abs(diff)).astype(np.int32)
-                lvls[progress_mask & decay_mask] = decay_lvls[
-                    progress_mask & decay_mask
-                ]
-
-            end_mask = i >= (step.time_out + step.wait + step.delay_out) * 1000
-            lvls[end_mask & decay_mask] = next_levels[end_mask & decay_mask]
-
-        # Attacks (channels going up)
-        attack_mask = next_levels > old_levels
-        if np.any(attack_mask):
-            progress_mask = (i > self.wait + step.delay_in * 1000) & (
-                i < (step.time_in + step.wait + step.delay_in) * 1000
-            )
-            if np.any(progress_mask & attack_mask):
-                factor = (i - self.wait - step.delay_in * 1000) / (step.time_in * 1000)
-                diff = (next_levels - old_levels) * factor
-                attack_lvls = np.round(old_levels + diff).astype(np.int32)
-                lvls[progress_mask & attack_mask] = attack_lvls[
-                    progress_mask & attack_mask
-                ]
-
-            end_mask = i >= (step.time_in + step.wait + step.delay_in) * 1000
-            lvls[end_mask & attack_mask] = next_levels[end_mask & attack_mask]
-
-        return lvls
-
-    def _apply_channel_times_go(self, lvls: np.ndarray, i: float, step: Step) -> None:
-        """Apply individual channel times."""
-        if not step.channel_time:
-            return
-        old_levels = self.old_channels_levels.astype(np.int32)
-        next_levels = get_cue(step).channels_array.astype(np.int32)
-        for channel, ct in step.channel_time.items():
-            o_lvl = old_levels[channel - 1]
-            n_lvl = next_levels[channel - 1]
-            if n_lvl < o_lvl:  # Decay
-                if i < ct.delay * 1000 + self.wait:
-                    lvl = o_lvl
-                elif i < (ct.delay + ct.time) * 1000 + self.wait:
-                    factor = (i - ct.delay * 1000 - self.wait) / (ct.time * 1000)
-                    lvl = o_lvl - abs(int((n_lvl - o_lvl) * factor))
-                else:
-                    lvl = n_lvl
-                lvls[channel - 1] = lvl
-            elif n_lvl > o_lvl:  # Attack
-                if i < ct.delay * 1000 + self.wait:
-                    lvl = o_lvl
-                elif i < (ct.delay + ct.time) * 1000 + self.wait:
-                    factor = (i - ct.delay * 1000 - self.wait) / (ct.time * 1000)
-                    lvl = int((n_lvl - o_lvl) * factor + o_lvl)
-                else:
-                    lvl = n_lvl
-                lvls[channel - 1] = lvl
+        # Compiled again if the step or its cue has been edited
+        mask = step.channel_times()[0]
+        if (
+            step is not self._fade_step
+            or mask is not self._fade_mask
+            or get_cue(step).generation != self._fade_generation
+        ):
+            self._compile_fade(step)
+
+        # Fade progress of each channel, from its start to its end
+        progress = self._progress
+        np.subtract(i, self._start, out=progress)
+        np.divide(progress, self._duration, out=progress)
+        np.clip(progress, 0.0, 1.0, out=progress)
+        np.greater_equal(i, self._end, out=self._ended)
+        np.copyto(progress, 1.0, where=self._ended)
+        # Channel times truncate the levels, step times round them
+        np.multiply(self._diff, progress, out=progress)
+        np.add(self._old, progress, out=self._levels)
+        np.round(self._levels, out=self._levels)
+        np.trunc(progress, out=progress)
+        np.add(self._old, progress, out=progress)
+        np.copyto(self._levels, progress, where=self._truncate)
+
+        np.copyto(self.backend.dmx.levels["sequence"], self._levels, casting="unsafe")
+
+    def _compile_fade(self, step: Step) -> None:
+        """Start, duration and end of the fade of each channel (ms).
+
+        Channels going up use the time in, channels going down the time out,
+        unless they have a specific channel time.
+        """
+        mask, delays, times = step.channel_times()
+        self._fade_step = step
+        self._fade_mask = mask
+        self._fade_generation = get_cue(step).generation
+        np.copyto(self._old, self.old_channels_levels)
+        np.subtract(get_cue(step).channels_array, self._old, out=self._diff)
+        attack = self._diff > 0
+        wait = step.wait * 1000
+        np.copyto(
+            self._start, np.where(attack, step.delay_in, step.delay_out) * 1000 + wait
+        )
+        duration = np.where(attack, step.time_in, step.time_out) * 1000
+        np.copyto(self._start, delays + wait, where=mask)
+        np.copyto(duration, times, where=mask)
+        np.add(self._start, duration, out=self._end)
+        # Zero durations end at their start
+        np.copyto(self._duration, np.where(duration > 0, duration, 1.0))
+        np.copyto(self._truncate, mask)
 
 
 def _next_step(sequence: Sequence) -> int:
@@ -770,21 +724,23 @@ def _next_step(sequence: Sequence) -> int:
     return next_step
 
 
-class ThreadGoBack(threading.Thread):
-    """Thread Object for Go Back"""
+class GoBackTransition(Transition):
+    """Transition to the previous step (Go Back)"""
 
     sequence: Sequence
     old_channels_levels: np.ndarray
+    go_back_time: float
+    prev_step: int | None
     backend: typing.Any
 
     def __init__(self, sequence: Sequence) -> None:
-        threading.Thread.__init__(self, name="ThreadGoBack", daemon=True)
-        self._stopevent = threading.Event()
-        self.pause = threading.Event()
-        self.pause.set()
+        super().__init__(sequence.backend.dmx.fades)
         self.sequence = sequence
         # To save channels levels when Go Back starts
-        self.old_channels_levels = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+        self.old_channels_levels = np.zeros(LAYOUT.max_channels, dtype=np.uint8)
+        # Read from settings when the Go Back starts (ms)
+        self.go_back_time = 0.0
+        self.prev_step = None
 
     @property
     def app(self) -> CoreApplication | None:
@@ -850,40 +806,33 @@ class ThreadGoBack(threading.Thread):
         if self.app is not None and self.app.midi is not None:
             self.app.midi.button_off("playback.go_back")
 
-    def run(self) -> None:
+    def begin(self) -> bool:
         if self.sequence.last == 2:
-            return
-
-        prev_step = self.sequence.position - 1
+            return False
+        self.prev_step = self.sequence.position - 1
         self._capture_start_levels()
-
-        go_back_time = 0.0
         if self.app is not None:
-            go_back_time = (
+            self.go_back_time = (
                 typing.cast(typing.Any, self.app.settings).get_double("go-back-time")
                 * 1000
             )
-        pause_time = 0.0
-        start_time = time.time() * 1000
-        i = (time.time() * 1000) - start_time
-        start_pause = None
-        while i < go_back_time and not self._stopevent.is_set():
-            if not self.pause.is_set():
-                if not start_pause:
-                    start_pause = time.time() * 1000
-                self.pause.wait()
-                pause_time += (time.time() * 1000) - start_pause
-            else:
-                start_pause = None
-                self.update_levels(go_back_time, i, self.sequence.position)
-                time.sleep(0.05)
-                i = (time.time() * 1000) - (start_time + pause_time)
+        return True
 
-        self._finalize_goback(prev_step)
+    def update(self, elapsed: float) -> bool:
+        if elapsed >= self.go_back_time:
+            return True
+        self.update_levels(self.go_back_time, elapsed, self.sequence.position)
+        return False
 
-    def stop(self) -> None:
-        """Stop"""
-        self._stopevent.set()
+    def finish(self) -> None:
+        assert self.prev_step is not None
+        self._finalize_goback(self.prev_step)
+
+    def cancel(self) -> None:
+        # A stopped Go Back still loads the previous step
+        if self.prev_step is None and not self.begin():
+            return
+        self.finish()
 
     def update_levels(self, go_back_time: float, i: float, position: int) -> None:
         """Update levels
@@ -921,4 +870,24 @@ class ThreadGoBack(threading.Thread):
         lvls = np.round(old_levels + diff).astype(np.int32)
 
         self.backend.dmx.levels["sequence"][:] = np.clip(lvls, 0, 255).astype(np.uint8)
-        self.backend.dmx.set_levels()
+
+
+class Chasers(IndexedList[Sequence]):
+    """Chasers of a show, indexed by number"""
+
+    def _build_index(self) -> None:
+        self._chasers: dict[float, Sequence] = {}
+        for chaser in self:
+            self._chasers.setdefault(chaser.index, chaser)
+
+    def get(self, index: float) -> Sequence | None:
+        """Chaser with a number
+
+        Args:
+            index: Chaser number
+
+        Returns:
+            Chaser or None
+        """
+        self._ensure_index()
+        return self._chasers.get(index)
@@ -14,9 +14,15 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+import bisect
+import math
 import typing
 from typing import Optional
 
+import numpy as np
+from olc.indexed_list import IndexedList
+from olc.layout import LAYOUT
+
 if typing.TYPE_CHECKING:
     from olc.cue import Cue
 
@@ -27,6 +33,9 @@ class Step:
     A Step is used to store times and a Cue in a Sequence
     """
 
+    # Channels with a time, mask, delays and times compiled for the fades
+    _channel_times: tuple[frozenset[int], np.ndarray, np.ndarray, np.ndarray] | None
+
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
@@ -51,6 +60,7 @@ class Step:
             channel_time = {}
         self.channel_time = channel_time
         self.text = text
+        self._channel_times = None
 
         self.update_total_time()
 
@@ -68,6 +78,35 @@ class Step:
                 + self.channel_time[channel].time
                 + self.wait,
             )
+        # Times have changed, channel times are compiled again when needed
+        self._channel_times = None
+
+    def channel_times(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Channel times as arrays aligned with Cue.channels_array
+
+        Compiled once, until the times are updated (update_total_time) or
+        channels are added to or removed from channel_time.
+
+        Returns:
+            Mask of channels with a specific time, their delays and times in ms
+        """
+        compiled = self._channel_times
+        if (
+            compiled is None
+            or compiled[0] != self.channel_time.keys()
+            or len(compiled[1]) != LAYOUT.max_channels
+        ):
+            mask = np.zeros(LAYOUT.max_channels, dtype=bool)
+            delays = np.zeros(LAYOUT.max_channels, dtype=np.float64)
+            times = np.zeros(LAYOUT.max_channels, dtype=np.float64)
+            for channel, channel_time in self.channel_time.items():
+                if 1 <= channel <= LAYOUT.max_channels:
+                    mask[channel - 1] = True
+                    delays[channel - 1] = channel_time.delay * 1000
+                    times[channel - 1] = channel_time.time * 1000
+            compiled = (frozenset(self.channel_time), mask, delays, times)
+            self._channel_times = compiled
+        return compiled[1], compiled[2], compiled[3]
 
     def set_time_in(self, time_in: float) -> None:
         """Set Time In
@@ -133,3 +172,43 @@ class Step:
         self.delay_in = delay
         self.delay_out = delay
         self.update_total_time()
+
+
+class Steps(IndexedList[Step]):
+    """Steps of a Sequence, indexed by cue number"""
+
+    def _build_index(self) -> None:
+        # First step of each cue number
+        self._positions: dict[float, int] = {}
+        # Highest cue number up to each step (steps without cue are ignored)
+        self._maxima: list[float] = []
+        highest = -math.inf
+        for position, step in enumerate(self):
+            if step.cue is not None:
+                self._positions.setdefault(step.cue.number, position)
+                highest = max(highest, step.cue.number)
+            self._maxima.append(highest)
+
+    def position(self, number: float) -> int | None:
+        """Position of the first step of a cue
+
+        Args:
+            number: Cue number
+
+        Returns:
+            Step position or None
+        """
+        self._ensure_index()
+        return self._positions.get(number)
+
+    def insert_position(self, number: float) -> int:
+        """Position of the first step with a higher cue number
+
+        Args:
+            number: Cue number
+
+        Returns:
+            Step position (number of steps if none)
+        """
+        self._ensure_index()
+        return bisect.bisect_right(self._maxima, number)
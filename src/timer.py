@@ -12,42 +12,222 @@
 # GNU General Public License for more details.
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
 import threading
 import time
-from typing import Callable
+from typing import Any, Callable
+
+from olc.core.dmxloop import LatencyHistogram
+
+
+class Job:  # pylint: disable=too-few-public-methods
+    """Function called by a Scheduler, once or periodically"""
+
+    def __init__(
+        self,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+        interval: float | None = None,
+    ) -> None:
+        self.callback = callback
+        self.args = args
+        self.interval = interval
+        self.cancelled = False
+        # Calls, calls ending after the next deadline and periods skipped
+        self.runs = 0
+        self.overruns = 0
+        self.skipped = 0
+
+    def cancel(self) -> None:
+        """Don't call the function anymore"""
+        self.cancelled = True
+
+
+# pylint: disable=too-many-instance-attributes
+class Scheduler:
+    """Call functions from one thread, at monotonic clock deadlines
+
+    Jobs are kept in a heap of deadlines. A periodic job is scheduled from its
+    previous deadline, so it does not drift. When a call ends after the next
+    deadline, the job overruns: the missed periods are skipped instead of
+    being called in a burst. Jobs run one after the other, they must be short.
+
+    The thread is started by the first job.
+    """
+
+    def __init__(self, name: str = "Scheduler") -> None:
+        self.name = name
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int, Job]] = []
+        self._sequence = itertools.count()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._runs = 0
+        self._overruns = 0
+        self._skipped = 0
+        self._errors = 0
+        self._jitter = LatencyHistogram()
+        self._duration = LatencyHistogram()
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> Job:
+        """Call a function once, after a delay
+
+        Args:
+            delay: Delay in seconds
+            callback: Function to call with args
+
+        Returns:
+            Job, to cancel the call
+        """
+        return self._push(time.monotonic() + delay, Job(callback, args))
+
+    def call_every(
+        self, interval: float, callback: Callable[..., Any], *args: Any
+    ) -> Job:
+        """Call a function every interval, first after one interval
+
+        Args:
+            interval: Period in seconds
+            callback: Function to call with args
+
+        Returns:
+            Job, to cancel the calls
+        """
+        if interval <= 0:
+            raise ValueError(f"Interval must be positive. Got {interval}.")
+        return self._push(time.monotonic() + interval, Job(callback, args, interval))
+
+    def _push(self, deadline: float, job: Job) -> Job:
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._sequence), job))
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0][2] is job:
+                # Earlier than the deadline the thread waits for
+                self._cond.notify()
+        return job
+
+    def stop(self) -> None:
+        """Stop the thread, pending jobs are dropped"""
+        with self._cond:
+            self._running = False
+            self._heap.clear()
+            self._cond.notify()
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+
+    @property
+    def jobs(self) -> int:
+        """Number of scheduled jobs"""
+        with self._cond:
+            return sum(not job.cancelled for _, _, job in self._heap)
+
+    def stats(self) -> dict[str, Any]:
+        """Statistics since start
+
+        Jitter (delay of a call after its deadline) and call durations are
+        summarized in seconds with count, mean, p50, p99, p999 and max.
+        """
+        with self._cond:
+            return {
+                "jobs": sum(not job.cancelled for _, _, job in self._heap),
+                "runs": self._runs,
+                "overruns": self._overruns,
+                "skipped": self._skipped,
+                "errors": self._errors,
+                "jitter": self._jitter.summary(),
+                "duration": self._duration.summary(),
+            }
+
+    def _next_job(self) -> tuple[float, Job] | None:
+        """Wait for the next due job, None when stopped"""
+        with self._cond:
+            while self._running:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline, _, job = self._heap[0]
+                if job.cancelled:
+                    heapq.heappop(self._heap)
+                    continue
+                timeout = deadline - time.monotonic()
+                if timeout > 0:
+                    self._cond.wait(timeout)
+                    continue
+                heapq.heappop(self._heap)
+                return deadline, job
+        return None
+
+    def _run(self) -> None:
+        while (item := self._next_job()) is not None:
+            deadline, job = item
+            start = time.monotonic()
+            try:
+                job.callback(*job.args)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                print(f"[{self.name}] Error in {job.callback}: {err}")
+                with self._cond:
+                    self._errors += 1
+            end = time.monotonic()
+            job.runs += 1
+            with self._cond:
+                self._runs += 1
+                self._jitter.record(start - deadline)
+                self._duration.record(end - start)
+                if job.interval is None or job.cancelled or not self._running:
+                    continue
+                deadline += job.interval
+                if deadline <= end:
+                    # Skip the periods missed by this call
+                    missed = math.floor((end - deadline) / job.interval) + 1
+                    deadline += missed * job.interval
+                    job.overruns += 1
+                    job.skipped += missed
+                    self._overruns += 1
+                    self._skipped += missed
+                heapq.heappush(self._heap, (deadline, next(self._sequence), job))
+
+
+# Scheduler of the console timers
+SCHEDULER = Scheduler()
 
 
 class RepeatedTimer:
-    """Call a function every 'interval' seconds"""
+    """Call a function every 'interval' seconds, from the shared scheduler"""
 
     def __init__(
         self, interval: float, function: Callable, *args: object, **kwargs: object
     ) -> None:
-        self._timer: threading.Timer | None = None
+        self._job: Job | None = None
         self.interval = interval
         self.function = function
         self.args = args
         self.kwargs = kwargs
         self.is_running = False
-        self.next_call = time.time()
         self.start()
 
     def _run(self) -> None:
-        self.is_running = False
-        self.start()
         self.function(*self.args, **self.kwargs)
 
     def start(self) -> None:
         """Start function"""
         if not self.is_running:
-            self.next_call += self.interval
-            self._timer = threading.Timer(self.next_call - time.time(), self._run)
-            self._timer.daemon = True
-            self._timer.start()
+            self._job = SCHEDULER.call_every(self.interval, self._run)
             self.is_running = True
 
     def stop(self) -> None:
         """Stop function"""
-        if self._timer is not None:
-            self._timer.cancel()
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
         self.is_running = False
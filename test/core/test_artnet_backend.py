@@ -20,6 +20,7 @@ import struct
 import typing
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from olc.core.backends.artnet import ArtNetManager
 from olc.core.backends.artnet.artnet import Discovery, Listeners, Sender
@@ -37,6 +38,14 @@ from olc.core.backends.artnet.protocol import (
 from olc.core.universe_config import Protocol, UniverseMap
 
 
+def assert_merged(callback_mock: MagicMock, universe: int, expected: list[int]) -> None:
+    """Assert the last merger callback carried the expected universe levels."""
+    callback_mock.assert_called()
+    args = callback_mock.call_args[0]
+    assert args[0] == universe
+    np.testing.assert_array_equal(args[1], expected)
+
+
 class TestArtNetProtocol:
     """Test suite for the Art-Net packet encoders, decoders, and trackers."""
 
@@ -55,6 +64,9 @@ class TestArtNetProtocol:
         decoded.decode(packet)
         assert decoded.universe == 3
         assert decoded.data == list(payload)
+        assert decoded.view.tobytes() == payload
+        # The slots view shares the packet buffer
+        assert not decoded.view.flags.owndata
 
     def test_artdmx_invalid_decoding(self) -> None:
         """Verify malformed payload raises decode error."""
@@ -141,7 +153,8 @@ class TestArtNetProtocol:
 
         # 3. Packet from a non-local IP (e.g. 192.168.1.50) should be processed
         listeners.on_artdmx(packet, ("192.168.1.50", 6454))
-        callback_mock.assert_called_once_with(1, list(payload))
+        assert callback_mock.call_count == 1
+        assert_merged(callback_mock, 1, list(payload))
 
 
 class TestArtNetMerger:
@@ -159,13 +172,13 @@ class TestArtNetMerger:
 
         # Update source 1
         merger.update(universe=1, source_ip="192.168.1.1", data=source1_data)
-        callback_mock.assert_called_with(1, source1_data)
+        assert_merged(callback_mock, 1, source1_data)
 
         # Update source 2 (merging active)
         merger.update(universe=1, source_ip="192.168.1.2", data=source2_data)
         expected = [100] * 512
         expected[10] = 200
-        callback_mock.assert_called_with(1, expected)
+        assert_merged(callback_mock, 1, expected)
 
     def test_ltp_merge(self) -> None:
         """Verify Latest Takes Precedence logic with 2 sources."""
@@ -182,7 +195,7 @@ class TestArtNetMerger:
             merger.update(universe=1, source_ip="192.168.1.2", data=s2_data)
 
         # Source 2 timestamp is newer: it wins completely
-        callback_mock.assert_called_with(1, s2_data)
+        assert_merged(callback_mock, 1, s2_data)
 
     def test_three_sources_limit(self) -> None:
         """Verify that exactly 2 sources are allowed and a 3rd source is dropped."""
@@ -201,6 +214,7 @@ class TestArtNetMerger:
 
         # Third source was completely ignored: callback not triggered with its data
         callback_mock.assert_not_called()
+        assert merger.dropped_packets == 1
 
     def test_cleanup_timeouts(self) -> None:
         """Verify inactive sources are removed after timeout threshold."""
@@ -209,14 +223,46 @@ class TestArtNetMerger:
         with patch("time.time", return_value=100.0):
             merger.update(universe=1, source_ip="192.168.1.1", data=[10] * 512)
             merger.update(universe=1, source_ip="192.168.1.2", data=[20] * 512)
-        assert len(merger.buffers[1]) == 2
+        assert len(merger.buffers[1].sources) == 2
 
         # 5 seconds later: source 1 updates, source 2 is timed out and removed
         with patch("time.time", return_value=105.0):
             merger.update(universe=1, source_ip="192.168.1.1", data=[15] * 512)
 
-        assert len(merger.buffers[1]) == 1
-        assert "192.168.1.2" not in merger.buffers[1]
+        assert len(merger.buffers[1].sources) == 1
+        assert "192.168.1.2" not in merger.buffers[1].sources
+
+    def test_emit_on_change_only(self) -> None:
+        """Verify the callback only fires when the merged output changes."""
+        merger = ArtDmxMerger(mode=MergeMode.HTP)
+        callback_mock = MagicMock()
+        merger.callback = callback_mock
+
+        data = [0] * 512
+        data[3] = 50
+        merger.update(universe=1, source_ip="192.168.1.1", data=data)
+        assert callback_mock.call_count == 1
+        changed = callback_mock.call_args[0][2]
+        assert np.flatnonzero(changed).tolist() == [3]
+
+        # Same levels: no merge output
+        merger.update(universe=1, source_ip="192.168.1.1", data=data)
+        assert callback_mock.call_count == 1
+
+        # A second source only changes the channels it raises
+        merger.update(universe=1, source_ip="192.168.1.2", data=[10] * 4)
+        assert callback_mock.call_count == 2
+        assert np.flatnonzero(callback_mock.call_args[0][2]).tolist() == [0, 1, 2]
+
+    def test_short_packets_padded(self) -> None:
+        """Verify packets shorter than 512 channels clear the remaining slots."""
+        merger = ArtDmxMerger()
+        callback_mock = MagicMock()
+        merger.callback = callback_mock
+
+        merger.update(universe=1, source_ip="192.168.1.1", data=[40] * 512)
+        merger.update(universe=1, source_ip="192.168.1.1", data=[60] * 2)
+        assert_merged(callback_mock, 1, [60] * 2 + [0] * 510)
 
 
 class TestArtNetDiscovery:
@@ -404,11 +450,12 @@ class TestArtNetManager:
         callback_mock = MagicMock()
         manager = ArtNetManager(umap, on_dmx_received=callback_mock)
 
-        dmx_data = [255] * 512
+        dmx_data = np.full(512, 255, dtype=np.uint8)
+        changed = np.ones(512, dtype=np.bool_)
 
         # Trigger listener update callback
-        manager._handle_incoming_dmx(1, dmx_data)
-        callback_mock.assert_called_once_with(1, dmx_data)
+        manager._handle_incoming_dmx(1, dmx_data, changed)
+        callback_mock.assert_called_once_with(1, dmx_data, changed)
 
         manager.stop()
 
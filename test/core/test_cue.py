@@ -14,7 +14,14 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 """Unit tests for Cue and CueChannels class."""
 
-from olc.cue import Cue
+import copy
+import gc
+import threading
+import time
+
+import numpy as np
+from olc.cue import Cue, CueStore, PackedLevels
+from olc.define import MAX_CHANNELS
 
 
 def test_cue_channels_initialization() -> None:
@@ -88,3 +95,120 @@ def test_cue_channels_reassignment() -> None:
     assert 5 not in cue.channels
     assert cue.channels_array[4] == 0
     assert cue.channels_array[9] == 180
+
+
+def test_cue_generation() -> None:
+    """Test that every change of the levels increments the generation."""
+    cue = Cue(sequence=1, number=1.0, channels={5: 150})
+    generation = cue.generation
+    cue.set_level(5, 100)
+    assert cue.generation > generation
+    generation = cue.generation
+    del cue.channels[5]
+    assert cue.generation > generation
+    generation = cue.generation
+    cue.channels = {1: 10}
+    assert cue.generation > generation
+
+
+def test_cue_store_rows() -> None:
+    """Cues share the store arrays, rows are reused once a cue is deleted."""
+    store = CueStore(capacity=2)
+    cues = [Cue(1, float(n), {n + 1: n * 10}, store=store) for n in range(5)]
+    assert len(store) == 5
+    assert len(store.levels) >= 5
+    for n, cue in enumerate(cues):
+        assert cue.channels_array.base is store.levels
+        assert cue.channels_array[n] == n * 10
+        assert dict(cue.channels) == {n + 1: n * 10}
+
+    del cues[1:], cue
+    gc.collect()
+    assert len(store) == 1
+    cue = Cue(1, 9.0, store=store)
+    assert not cue.channels
+    assert not cue.channels_array.any()
+
+
+def test_cue_row_released_without_collection() -> None:
+    """A deleted cue frees its row at once, its channels view keeps it."""
+    store = CueStore()
+    gc.disable()
+    try:
+        cue = Cue(1, 1.0, {1: 10}, store=store)
+        channels = Cue(1, 2.0, {2: 20}, store=store).channels
+        assert len(store) == 2
+        del cue
+        assert len(store) == 1
+        assert dict(channels) == {2: 20}
+        channels[3] = 30
+        del channels
+        assert len(store) == 0
+    finally:
+        gc.enable()
+
+
+def test_cue_channels_readers_lock() -> None:
+    """Levels are read under the store lock (arrays may be reallocated)."""
+    store = CueStore()
+    cue = Cue(1, 1.0, {1: 10}, store=store)
+    results: list[object] = []
+    with store.lock:
+        readers = [
+            threading.Thread(target=lambda: results.append(cue.channels[1])),
+            threading.Thread(target=lambda: results.append(1 in cue.channels)),
+            threading.Thread(target=lambda: results.append(len(cue.channels))),
+        ]
+        for reader in readers:
+            reader.start()
+        time.sleep(0.05)
+        assert not results
+    for reader in readers:
+        reader.join(1.0)
+    assert sorted(results, key=str) == [1, 10, True]
+
+
+def test_cue_store_matrix() -> None:
+    """Levels of several cues are gathered in one array."""
+    store = CueStore()
+    first = Cue(1, 1.0, {1: 10, 3: 30}, store=store)
+    second = Cue(1, 2.0, {2: 20}, store=store)
+    matrix = store.matrix([first, None, second])
+    assert matrix.shape == (3, MAX_CHANNELS)
+    assert matrix[:, :3].tolist() == [[10, 0, 30], [0, 0, 0], [0, 20, 0]]
+    # A copy, not views of the store
+    matrix[0, 0] = 1
+    assert first.channels[1] == 10
+
+
+def test_cue_channels_mapping() -> None:
+    """The levels behave as a dictionary, zero levels included."""
+    cue = Cue(1, 1.0, {3: 0, 1: 100, MAX_CHANNELS + 5: 7})
+    assert cue.channels == {1: 100, 3: 0, MAX_CHANNELS + 5: 7}
+    assert 3 in cue.channels
+    assert 2 not in cue.channels
+    assert len(cue.channels) == 3
+    assert cue.get_level(2) == 0
+    assert cue.channels.get(MAX_CHANNELS + 5) == 7
+    assert not cue.channels_array[2]
+
+    copied = copy.deepcopy(cue.channels)
+    assert isinstance(copied, dict)
+    cue.channels[1] = 50
+    assert copied[1] == 100
+
+    other = Cue(1, 2.0, cue.channels)
+    assert other.channels == cue.channels
+    other.channels[3] = 1
+    assert cue.channels[3] == 0
+
+
+def test_cue_packed_levels() -> None:
+    """Packed levels are loaded into the store row."""
+    packed = PackedLevels(
+        np.array([2, 5], dtype="<u2"), np.array([20, 50], dtype=np.uint8)
+    )
+    cue = Cue(1, 1.0, packed)
+    assert cue.channels == {2: 20, 5: 50}
+    assert cue.channels_array[[1, 4]].tolist() == [20, 50]
+    assert cue.generation == 0
@@ -2,7 +2,7 @@ import time
 from unittest.mock import MagicMock
 
 import pytest
-from olc.core.dmxloop import DMXLoop
+from olc.core.dmxloop import DMXLoop, LatencyHistogram
 
 
 class TestDMXLoop:
@@ -143,3 +143,75 @@ class TestDMXLoop:
         # Since the function takes 30ms for a 10ms period,
         # jitter will accumulate and late_count should explode.
         assert loop.late_count > 0
+
+    def test_stats(self) -> None:
+        """Test jitter and send duration histograms."""
+
+        def send() -> None:
+            time.sleep(0.002)
+
+        loop = DMXLoop(send_fn=send, hz=100)
+        loop.start()
+        time.sleep(0.1)
+        loop.stop()
+
+        stats = loop.stats()
+        assert stats["frames"] == loop.frame_count
+        assert stats["send"]["count"] == loop.frame_count
+        assert stats["jitter"]["count"] == loop.frame_count
+        assert 0.002 <= stats["send"]["p50"] <= stats["send"]["max"]
+        assert stats["send"]["p50"] <= stats["send"]["p99"] <= stats["send"]["p999"]
+
+    def test_precise_mode(self) -> None:
+        """Test absolute deadlines and skipped ticks in precise mode."""
+        mock_send = MagicMock()
+        loop = DMXLoop(send_fn=mock_send, hz=100, precise=True)
+        loop.start()
+        time.sleep(0.1)
+        loop.stop()
+        assert 5 <= mock_send.call_count <= 15
+
+        def slow_send() -> None:
+            time.sleep(0.03)
+
+        loop = DMXLoop(send_fn=slow_send, hz=100, precise=True)
+        loop.start()
+        time.sleep(0.1)
+        loop.stop()
+        # Missed ticks are skipped, not sent in a burst
+        assert loop.missed_count > 0
+        assert loop.frame_count <= 5
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram."""
+
+    def test_percentiles(self) -> None:
+        """Percentiles are bounded by their logarithmic bin."""
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50.0) == 0.0
+        for _ in range(990):
+            histogram.record(0.001)
+        for _ in range(9):
+            histogram.record(0.010)
+        histogram.record(0.5)
+
+        summary = histogram.summary()
+        assert summary["count"] == 1000
+        assert summary["max"] == 0.5
+        assert summary["p50"] == pytest.approx(0.001, rel=0.13)
+        assert summary["p99"] == pytest.approx(0.001, rel=0.13)
+        assert summary["p999"] == pytest.approx(0.010, rel=0.13)
+        assert histogram.percentile(100.0) == 0.5
+
+        histogram.reset()
+        assert histogram.count == 0
+        assert histogram.percentile(99.0) == 0.0
+
+    def test_out_of_range(self) -> None:
+        """Durations outside the bins are still counted."""
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(100.0)
+        assert histogram.percentile(50.0) <= 1e-6
+        assert histogram.percentile(100.0) == 100.0
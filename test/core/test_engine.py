@@ -1,10 +1,20 @@
+import multiprocessing
+import socket
+import sys
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
-from olc.core.engine import CoreEngine
+import zmq
+from olc.core import sharding
+from olc.core.engine import CHANGE_BURST, CoreEngine
+from olc.core.monitor import DELTA, FLAG_ARTNET, FULL, decode_universe, universe_topic
+from olc.core.senders import ARTNET_PORT
+from olc.core.sharding import ShardedOutput
 from olc.core.universe_config import Protocol, UniverseMap
+from olc.core.universe_data import DMXUniverse
 
 
 def _make_engine(num_universes: int = 4, hz: float = 100.0) -> CoreEngine:
@@ -90,6 +100,17 @@ class TestCoreEngineDataOps:
         # Other universes untouched
         assert engine.universe(0)[10] == 0
 
+    def test_set_universe(self) -> None:
+        """set_universe() copies consecutive levels from the first channel."""
+        engine = _make_engine()
+        generation = engine.universe(2).generation
+        engine.set_universe(2, bytes(range(256)) * 3)
+        assert engine.universe(2).array.tolist() == list(range(256)) * 2
+        assert engine.universe(2).generation == generation + 1
+        # Same levels: the universe is left unchanged
+        engine.set_universe(2, memoryview(bytes(range(10))))
+        assert engine.universe(2).generation == generation + 1
+
     def test_set_channels_wrong_universe(self) -> None:
         """set_channels() on unknown universe raises KeyError."""
         engine = _make_engine(2)
@@ -130,6 +151,45 @@ class TestCoreEngineMergers:
         # Source 1 wrote last -> 50 wins
         assert engine.universe(0)[10] == 50
 
+    def test_htp_write_races_set_channels(self) -> None:
+        """Merged writes and direct writes never publish a mixed frame."""
+        engine = _make_engine(1)
+        engine._add_htp_merger(0, num_sources=1)
+        frames = engine._frames  # pylint: disable=protected-access
+        publish = frames.publish
+        mixed: list[np.ndarray] = []
+
+        def checked_publish(row: int, data: np.ndarray) -> None:
+            if np.unique(data).size > 1:
+                mixed.append(data.copy())
+            publish(row, data)
+
+        frames.publish = checked_publish  # type: ignore[method-assign]
+        levels = [dict.fromkeys(range(512), 100 + level) for level in range(100)]
+        everything = dict.fromkeys(range(512), 7)
+        done = threading.Event()
+
+        def merged() -> None:
+            for index in range(3000):
+                engine._htp_write(0, 0, levels[index % 100])
+            done.set()
+
+        # Switch threads as often as possible to interleave the writers
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        thread = threading.Thread(target=merged)
+        try:
+            thread.start()
+            while not done.is_set():
+                engine.set_channels(0, everything)
+                frames.acquire()
+            thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert not mixed
+        frames.acquire()
+        assert np.unique(frames.output[0]).size == 1
+
 
 class TestCoreEngineSenders:
     """Test that senders are called on every tick."""
@@ -163,6 +223,140 @@ class TestCoreEngineSenders:
         assert len(engine._slots[1].senders) == 1  # pylint: disable=protected-access
 
 
+class TestCoreEngineRefresh:
+    """Test the throttling of unchanged universes."""
+
+    def test_unchanged_universe_throttled(self) -> None:
+        """Changes are sent in a burst, then only at the refresh rate."""
+        engine = CoreEngine(UniverseMap(2), refresh_hz=1.0)
+        mock_sender = MagicMock()
+        engine._slots[0].senders = [mock_sender]  # pylint: disable=protected-access
+
+        for _ in range(CHANGE_BURST + 2):
+            engine._send_all()  # pylint: disable=protected-access
+        assert mock_sender.send.call_count == CHANGE_BURST
+
+        engine.set_channels(0, {0: 255})
+        engine._send_all()  # pylint: disable=protected-access
+        assert mock_sender.send.call_count == CHANGE_BURST + 1
+        assert engine.send_counters[0] == {
+            "sent": CHANGE_BURST + 1,
+            "skipped": 2,
+        }
+
+        # Keep-alive once the refresh interval has elapsed
+        engine._slots[0].burst = 0  # pylint: disable=protected-access
+        engine._slots[0].last_sent -= 1.0  # pylint: disable=protected-access
+        engine._send_all()  # pylint: disable=protected-access
+        assert mock_sender.send.call_count == CHANGE_BURST + 2
+
+    def test_every_tick_by_default(self) -> None:
+        """Without refresh rate, every universe is sent on every tick."""
+        engine = _make_engine(2)
+        for _ in range(5):
+            engine._send_all()  # pylint: disable=protected-access
+        assert engine.send_counters[1] == {"sent": 5, "skipped": 0}
+
+    def test_sacn_terminated_on_stop(self) -> None:
+        """sACN streams are terminated when the engine stops."""
+        umap = UniverseMap(4)
+        umap.enable_protocol(1, Protocol.SACN)
+        engine = CoreEngine(umap, hz=100.0, no_listen=True, loopback=True)
+        sender = engine._slots[1].senders[0]  # pylint: disable=protected-access
+        with patch.object(sender, "terminate") as mock_terminate:
+            engine.start()
+            time.sleep(0.05)
+            engine.stop()
+        mock_terminate.assert_called_once_with(
+            engine._slots[1].frame  # pylint: disable=protected-access
+        )
+
+
+class TestCoreEngineFrames:
+    """Test the frames published by the writers to the DMX loop."""
+
+    def test_frame_sent_on_tick(self) -> None:
+        """Senders get the frame published before the tick."""
+        engine = _make_engine(2)
+        mock_sender = MagicMock()
+        engine._slots[1].senders = [mock_sender]  # pylint: disable=protected-access
+
+        engine.set_channels(1, {5: 55})
+        frame = mock_sender.send.call_args
+        assert frame is None
+        engine._send_all()  # pylint: disable=protected-access
+        frame = mock_sender.send.call_args[0][0]
+        assert frame[5] == 55
+        assert frame is not engine.universe(1)
+
+        # Later writes do not change the frame being sent
+        engine.set_channels(1, {5: 66})
+        assert frame[5] == 55
+        engine._send_all()  # pylint: disable=protected-access
+        assert frame[5] == 66
+
+    def test_grow_universes(self) -> None:
+        """Added universes get a slot, the others keep their frame and senders."""
+        engine = _make_engine(2)
+        universe = engine.universe(1)
+        mock_sender = MagicMock()
+        engine._slots[1].senders = [mock_sender]  # pylint: disable=protected-access
+        engine.set_channels(1, {5: 55})
+        engine._send_all()  # pylint: disable=protected-access
+
+        engine.grow_universes(4)
+        engine.grow_universes(3)
+        assert len(engine.universe_map) == 4
+        assert engine.universe(1) is universe
+        # pylint: disable-next=protected-access
+        assert engine._slots[1].senders == [mock_sender]
+        # pylint: disable-next=protected-access
+        assert engine._slots[1].frame[5] == 55
+        added = MagicMock()
+        engine._slots[3].senders = [added]  # pylint: disable=protected-access
+        universe.set_channels({6: 66})
+        engine.set_channels(3, {0: 33})
+        engine._send_all()  # pylint: disable=protected-access
+        frame = mock_sender.send.call_args[0][0]
+        assert (frame[5], frame[6]) == (55, 66)
+        assert added.send.call_args[0][0][0] == 33
+
+    def test_tick_callback_writes_same_frame(self) -> None:
+        """Writes of a tick callback are sent in the same frame."""
+        engine = _make_engine(1)
+        mock_sender = MagicMock()
+        engine._slots[0].senders = [mock_sender]  # pylint: disable=protected-access
+
+        def failing() -> None:
+            raise ValueError("fade error")
+
+        def write() -> None:
+            engine.set_channels(0, {2: 42})
+
+        engine.add_tick_callback(failing)
+        engine.add_tick_callback(write)
+        engine.add_tick_callback(write)
+        engine._send_all()  # pylint: disable=protected-access
+        assert mock_sender.send.call_args[0][0][2] == 42
+
+        engine.remove_tick_callback(write)
+        engine.remove_tick_callback(failing)
+        engine.set_channels(0, {2: 0})
+        engine._send_all()  # pylint: disable=protected-access
+        assert mock_sender.send.call_args[0][0][2] == 0
+
+    def test_writers_not_blocked_by_loop(self) -> None:
+        """Writes do not wait for the engine lock held by the loop."""
+        engine = _make_engine(2)
+        with engine._lock:  # pylint: disable=protected-access
+            engine.set_channels(0, {1: 10})
+            engine._on_sacn_dmx_received(  # pylint: disable=protected-access
+                1, np.full(512, 3, dtype=np.uint8)
+            )
+        assert engine.universe(0)[1] == 10
+        assert engine.universe(1)[511] == 3
+
+
 class TestCoreEngineMetrics:
     """Test metrics delegated from DMXLoop."""
 
@@ -213,16 +407,17 @@ class TestCoreEngineZMQ:
 
     @patch("zmq.Context")
     def test_zmq_pub_created(self, mock_zmq_context: MagicMock) -> None:
-        """CoreEngine creates a ZeroMQ PUB socket if monitor_port is provided."""
+        """CoreEngine creates a ZeroMQ XPUB socket if monitor_port is provided."""
         mock_ctx_instance = mock_zmq_context.return_value
         mock_socket = MagicMock()
+        mock_socket.recv.side_effect = zmq.Again
         mock_ctx_instance.socket.return_value = mock_socket
 
         umap = UniverseMap(2)
         engine = CoreEngine(umap, monitor_port=5555)
 
         # socket created and bound
-        mock_ctx_instance.socket.assert_called_once()
+        mock_ctx_instance.socket.assert_called_once_with(zmq.XPUB)
         mock_socket.bind.assert_called_once_with("tcp://127.0.0.1:5555")
 
         # Context and socket cleaned up on stop
@@ -230,25 +425,6 @@ class TestCoreEngineZMQ:
         mock_socket.close.assert_called_once()
         mock_ctx_instance.term.assert_called_once()
 
-    @patch("zmq.Context")
-    def test_zmq_publish_throttled(self, mock_zmq_context: MagicMock) -> None:
-        """ZeroMQ messages are sent at the specified fps, not on every tick."""
-        mock_ctx_instance = mock_zmq_context.return_value
-        mock_socket = MagicMock()
-        mock_ctx_instance.socket.return_value = mock_socket
-
-        umap = UniverseMap(1)
-        # engine runs at 100hz, monitor at 10fps
-        engine = CoreEngine(umap, hz=100.0, monitor_port=5555, monitor_fps=10.0)
-
-        engine.start()
-        # Sleep for ~0.2 seconds. Loop runs ~20 times. Monitor should run ~2 times.
-        time.sleep(0.25)
-        engine.stop()
-
-        # Should be called around 2-3 times, definitely not 20 times.
-        assert 1 <= mock_socket.send_multipart.call_count <= 4
-
     @patch("zmq.Context")
     def test_zmq_pub_bind_failure(self, mock_zmq_context: MagicMock) -> None:
         """CoreEngine does not crash if ZeroMQ bind fails."""
@@ -261,12 +437,80 @@ class TestCoreEngineZMQ:
         # Should not raise exception
         engine = CoreEngine(umap, monitor_port=5555)
 
-        # Publisher and context should be None
-        assert engine._zmq_pub is None
-        assert engine._zmq_ctx is None
+        # No publisher, context terminated
+        assert engine._monitor is None  # pylint: disable=protected-access
+        mock_ctx_instance.term.assert_called_once()
 
         engine.stop()
 
+    def test_zmq_universe_subscription(self) -> None:
+        """Subscribers only receive the universes they subscribed to."""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        umap = UniverseMap(4)
+        umap.enable_protocol(2, Protocol.ARTNET)
+        engine = CoreEngine(
+            umap, hz=100.0, monitor_port=port, monitor_fps=50.0, no_listen=True
+        )
+        ctx = zmq.Context()
+        sub = ctx.socket(zmq.SUB)
+        sub.connect(f"tcp://127.0.0.1:{port}")
+        sub.setsockopt(zmq.SUBSCRIBE, universe_topic(2))
+        sub.setsockopt(zmq.RCVTIMEO, 2000)
+        engine.set_channels(2, {0: 10, 100: 20})
+        engine.start()
+        try:
+            frame = np.zeros(512, dtype=np.uint8)
+            topic, packet = sub.recv_multipart()
+            assert topic == universe_topic(2)
+            header = decode_universe(packet, frame)
+            assert header.kind == FULL
+            assert header.flags == FLAG_ARTNET
+            assert frame[0] == 10 and frame[100] == 20
+
+            # Changes are sent as deltas
+            engine.set_channels(2, {5: 55})
+            while True:
+                topic, packet = sub.recv_multipart()
+                assert topic == universe_topic(2)
+                header = decode_universe(packet, frame)
+                if frame[5] == 55:
+                    break
+            assert header.kind == DELTA
+            assert header.count == 1
+        finally:
+            engine.stop()
+            sub.close(linger=0)
+            ctx.term()
+
+    def test_zmq_grown_universe(self) -> None:
+        """Universes added to the engine are published."""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        engine = CoreEngine(
+            UniverseMap(2), hz=100.0, monitor_port=port, monitor_fps=50.0
+        )
+        ctx = zmq.Context()
+        sub = ctx.socket(zmq.SUB)
+        sub.connect(f"tcp://127.0.0.1:{port}")
+        sub.setsockopt(zmq.SUBSCRIBE, universe_topic(5))
+        sub.setsockopt(zmq.RCVTIMEO, 2000)
+        engine.start()
+        try:
+            engine.grow_universes(6)
+            engine.set_channels(5, {3: 33})
+            frame = np.zeros(512, dtype=np.uint8)
+            topic, packet = sub.recv_multipart()
+            assert topic == universe_topic(5)
+            decode_universe(packet, frame)
+            assert frame[3] == 33
+        finally:
+            engine.stop()
+            sub.close(linger=0)
+            ctx.term()
+
 
 class TestCoreEngineNoTransmit:
     """Test suite for the no_transmit passive (listen-only) monitor mode."""
@@ -346,3 +590,161 @@ class TestCoreEngineNoListen:
         # Universe array should remain untouched (all zeros)
         assert np.all(engine.universe(1).array == 0)
         assert np.all(engine.universe(2).array == 0)
+
+
+class TestCoreEngineSharded:
+    """Test suite for the multi-process sharded output mode."""
+
+    def test_sharded_universes_share_memory(self) -> None:
+        """Universe buffers are rows of the block read by the workers."""
+        umap = UniverseMap(5)
+        umap.enable_protocol(1, Protocol.ARTNET)
+        engine = CoreEngine(umap, workers=2, no_listen=True, loopback=True)
+        shards = engine._shards  # pylint: disable=protected-access
+
+        assert engine.workers == 2
+        # Network senders live in the workers
+        assert engine._slots[1].senders == []  # pylint: disable=protected-access
+        engine.set_channels(3, {0: 42, 511: 7})
+        # Published to the workers on the next tick
+        assert shards._frames[3, 0] == 0  # pylint: disable=protected-access
+        engine._send_all()  # pylint: disable=protected-access
+        assert shards._frames[3, 0] == 42  # pylint: disable=protected-access
+        assert shards._frames[3, 511] == 7  # pylint: disable=protected-access
+        # Round-robin split of the universes
+        assert shards._owner == {0: 0, 1: 1, 2: 0, 3: 1, 4: 0}  # pylint: disable=protected-access
+
+    def test_sharded_workers_clamped(self) -> None:
+        """There are never more workers than universes."""
+        engine = CoreEngine(UniverseMap(2), workers=8, no_listen=True)
+        assert engine.workers == 2
+        assert _make_engine(2).workers == 0
+
+    def test_sharded_sync_from_config(self) -> None:
+        """Sync packets are sent by the main process for the whole map."""
+        umap = UniverseMap(3)
+        umap.enable_protocol(2, Protocol.SACN)
+        umap[2].sacn.sync_address = 7000
+        engine = CoreEngine(umap, workers=1, no_listen=True, loopback=True)
+        shards = engine._shards  # pylint: disable=protected-access
+        assert shards.sync_addresses == {7000}
+        assert not shards.artnet_sync
+
+        umap.enable_protocol(1, Protocol.ARTNET)
+        umap[1].artnet.sync_active = True
+        engine.reload_universe(1)
+        assert shards.artnet_sync
+
+    def test_sharded_output_sent_by_workers(self) -> None:
+        """Workers send the frames written by the main process."""
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            receiver.bind(("127.0.0.1", ARTNET_PORT))
+        except OSError:
+            receiver.close()
+            pytest.skip("Art-Net port not available")
+        receiver.settimeout(1.0)
+
+        umap = UniverseMap(4)
+        for uid in range(4):
+            umap.enable_protocol(uid, Protocol.ARTNET)
+        engine = CoreEngine(umap, hz=100.0, workers=2, no_listen=True, loopback=True)
+        engine.set_channels(3, {0: 99})
+        engine.start()
+        try:
+            received = {}
+            while len(received) < 4:
+                packet = receiver.recv(1024)
+                received[packet[14]] = packet[18]
+            assert received == {0: 0, 1: 0, 2: 0, 3: 99}
+            assert engine._shards.is_running  # pylint: disable=protected-access
+        finally:
+            engine.stop()
+            receiver.close()
+        assert not engine._shards.is_running  # pylint: disable=protected-access
+
+    def test_sharded_grow_universes(self) -> None:
+        """Workers are restarted on a block holding the added universes."""
+        engine = CoreEngine(UniverseMap(2), workers=2, no_listen=True, loopback=True)
+        shards = engine._shards  # pylint: disable=protected-access
+        engine.set_channels(1, {0: 11})
+        engine.start()
+        try:
+            engine.grow_universes(5)
+            grown = engine._shards  # pylint: disable=protected-access
+            assert grown is not shards
+            assert not shards.is_running
+            assert grown.is_running
+            assert engine.workers == 2
+            engine.set_channels(4, {0: 44})
+            deadline = time.monotonic() + 2.0
+            while grown.frames[4, 0] != 44 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert grown.frames[1, 0] == 11
+            assert grown.frames[4, 0] == 44
+        finally:
+            engine.stop()
+
+    def test_sharded_worker_died(self) -> None:
+        """The main process sends the output once a worker died."""
+        umap = UniverseMap(4)
+        for uid in range(4):
+            umap.enable_protocol(uid, Protocol.ARTNET)
+        engine = CoreEngine(umap, hz=100.0, workers=2, no_listen=True, loopback=True)
+        shards = engine._shards  # pylint: disable=protected-access
+        engine.start()
+        try:
+            shards._processes[0].kill()  # pylint: disable=protected-access
+            shards._processes[0].join()  # pylint: disable=protected-access
+            deadline = time.monotonic() + 2.0
+            while engine.workers and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert engine.workers == 0
+            assert not shards.is_running
+            assert all(
+                len(engine._slots[uid].senders) == 1  # pylint: disable=protected-access
+                for uid in range(4)
+            )
+            # Ticks no longer wait for the workers
+            frames = engine.frame_count
+            time.sleep(0.2)
+            assert engine.frame_count - frames > 10
+        finally:
+            engine.stop()
+
+    def test_sharded_resync_after_slow_tick(self) -> None:
+        """A worker too slow for one tick is back in step on the next ones."""
+        if sharding._CONTEXT.get_start_method() != "fork":  # pylint: disable=protected-access
+            pytest.skip("Patched senders need forked workers")
+        sent = multiprocessing.RawArray("i", 1)
+
+        class SlowSender:
+            """Records the level sent, the third frame takes too long"""
+
+            def send(self, universe: DMXUniverse) -> None:
+                level = int(universe.array[0])
+                if level == 3:
+                    time.sleep(0.5)
+                sent[0] = level
+
+            def close(self) -> None:
+                """Nothing to close"""
+
+        with patch("olc.core.engine._build_senders", lambda *_, **__: [SlowSender()]):
+            shards = ShardedOutput(list(UniverseMap(1)), workers=1, tick_timeout=0.2)
+            shards.start()
+        try:
+            for level in range(1, 10):
+                shards.frames[0, :] = level
+                if level == 3:
+                    assert not shards.tick()
+                    # Next tick once the worker is done with this one
+                    time.sleep(0.4)
+                    continue
+                assert shards.tick()
+                # The frame is out when tick() returns
+                assert sent[0] == level
+            assert shards.missed_ticks == 1
+        finally:
+            shards.stop()
@@ -0,0 +1,176 @@
+import threading
+
+import pytest
+from olc.core.fades import FadeScheduler, Transition
+
+
+class Ramp(Transition):
+    """Transition recording its updates, over after `duration` ms."""
+
+    def __init__(self, scheduler: FadeScheduler, duration: float) -> None:
+        super().__init__(scheduler)
+        self.duration = duration
+        self.updates: list[float] = []
+        self.finished = False
+        self.cancelled = False
+
+    def update(self, elapsed: float) -> bool:
+        if elapsed >= self.duration:
+            return True
+        self.updates.append(elapsed)
+        return False
+
+    def finish(self) -> None:
+        self.finished = True
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TestFadeScheduler:
+    """Test suite for FadeScheduler."""
+
+    def test_deadline_driven(self) -> None:
+        """Time spent is computed from the first tick, whatever the tick rate."""
+        renders = []
+        scheduler = FadeScheduler(lambda: renders.append(True))
+        ramp = Ramp(scheduler, 100)
+        ramp.start()
+        assert ramp.is_alive()
+
+        scheduler.tick(10.0)
+        scheduler.tick(10.025)
+        scheduler.tick(10.09)
+        assert ramp.updates == pytest.approx([0.0, 25.0, 90.0])
+        scheduler.tick(10.125)
+        assert ramp.finished
+        assert not ramp.is_alive()
+        assert len(scheduler) == 0
+        assert len(renders) == 4
+        # Nothing to render without transitions
+        scheduler.tick(10.15)
+        assert len(renders) == 4
+
+    def test_one_render_per_tick(self) -> None:
+        """All transitions are updated before a single render."""
+        renders = []
+        scheduler = FadeScheduler(lambda: renders.append(True))
+        ramps = [Ramp(scheduler, 1000) for _ in range(10)]
+        for ramp in ramps:
+            ramp.start()
+        scheduler.tick(1.0)
+        scheduler.tick(1.5)
+        assert len(renders) == 2
+        assert all(ramp.updates == pytest.approx([0.0, 500.0]) for ramp in ramps)
+
+    def test_pause(self) -> None:
+        """Paused time is not counted (pauses are seen on the ticks)."""
+        scheduler = FadeScheduler()
+        ramp = Ramp(scheduler, 1000)
+        ramp.start()
+        scheduler.tick(0.0)
+        ramp.pause.clear()
+        scheduler.tick(0.1)
+        scheduler.tick(0.5)
+        ramp.pause.set()
+        scheduler.tick(0.6)
+        assert ramp.updates == pytest.approx([0.0, 100.0])
+
+    def test_stop(self) -> None:
+        """A stopped transition is cancelled and joins at once."""
+        scheduler = FadeScheduler()
+        ramp = Ramp(scheduler, 1000)
+        ramp.start()
+        scheduler.tick(0.0)
+        ramp.stop()
+        ramp.join(timeout=1.0)
+        assert ramp.cancelled
+        assert not ramp.finished
+        assert not ramp.is_alive()
+        # Stopping twice does nothing
+        ramp.cancelled = False
+        ramp.stop()
+        assert not ramp.cancelled
+
+    def test_begin_drops_transition(self) -> None:
+        """A transition refusing to begin is dropped without finish."""
+        scheduler = FadeScheduler()
+        ramp = Ramp(scheduler, 100)
+        ramp.begin = lambda: False  # type: ignore[method-assign]
+        ramp.start()
+        scheduler.tick(0.0)
+        assert not ramp.is_alive()
+        assert not ramp.finished
+        assert not ramp.updates
+
+    def test_add_during_tick(self) -> None:
+        """A transition started by another one begins on the next tick."""
+        scheduler = FadeScheduler()
+        follow = Ramp(scheduler, 100)
+
+        class Chain(Ramp):
+            def finish(self) -> None:
+                super().finish()
+                follow.start()
+                # Joining from the tick does not block
+                self.join()
+
+        chain = Chain(scheduler, 0)
+        chain.start()
+        scheduler.tick(0.0)
+        assert chain.finished
+        assert not follow.updates
+        scheduler.tick(0.05)
+        assert follow.updates == pytest.approx([0.0])
+
+    def test_join_waits_for_end(self) -> None:
+        """join() from another thread returns once the transition is over."""
+        scheduler = FadeScheduler()
+        ramp = Ramp(scheduler, 10)
+        ramp.start()
+        joined = threading.Event()
+
+        def wait() -> None:
+            ramp.join()
+            joined.set()
+
+        waiter = threading.Thread(target=wait)
+        waiter.start()
+        scheduler.tick(0.0)
+        assert not joined.wait(0.05)
+        scheduler.tick(0.02)
+        assert joined.wait(1.0)
+        waiter.join()
+
+    def test_poll(self) -> None:
+        """poll() only ticks when the scheduler was not ticked recently."""
+        scheduler = FadeScheduler()
+        ramp = Ramp(scheduler, 10_000)
+        ramp.start()
+        scheduler.poll(0.05)
+        assert len(ramp.updates) == 1
+        scheduler.poll(60.0)
+        assert len(ramp.updates) == 1
+
+    def test_error_drops_transition(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """A failing transition is dropped once, the others keep running."""
+        renders = []
+        scheduler = FadeScheduler(lambda: renders.append(True))
+        ramp = Ramp(scheduler, 1000)
+        broken = Ramp(scheduler, 1000)
+
+        def fail(_elapsed: float) -> bool:
+            raise RuntimeError("Boom")
+
+        broken.update = fail  # type: ignore[method-assign]
+        ramp.start()
+        broken.start()
+        scheduler.tick(0.0)
+        scheduler.tick(0.05)
+        assert not broken.is_alive()
+        assert not broken.finished
+        # join() does not wait for a dropped transition
+        assert broken._done.is_set()  # pylint: disable=protected-access
+        assert ramp.updates == pytest.approx([0.0, 50.0])
+        assert len(renders) == 2
+        assert capsys.readouterr().out.count("Boom") == 1
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the show edits journal."""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import queue
+import threading
+import time
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+import pytest
+from olc.core.app import CoreApplication
+from olc.core.journal import Journal, Record, decode, encode, replay
+from olc.fader import FaderType
+
+
+def _journaled_app(directory: pathlib.Path) -> tuple[CoreApplication, Journal]:
+    app = CoreApplication(MagicMock())
+    journal = Journal(
+        str(directory), lambda: {"groups": len(app.lightshow.groups)}, idle=3600
+    )
+    app.journal = journal
+    journal.start()
+    return app, journal
+
+
+def test_encode_decode_round_trip() -> None:
+    """Tuples, int keys and enums survive the JSON encoding"""
+    value = [(1.0, 2), {1: 255, 3: 0}, FaderType.PRESET, "text", None, True]
+    assert decode(encode(value)) == value
+    assert isinstance(decode(encode((1, 2))), tuple)
+
+
+def test_encode_rejects_objects() -> None:
+    """Objects can not be journaled"""
+    with pytest.raises(TypeError):
+        encode(object())
+
+
+def test_actions_are_journaled(tmp_path: pathlib.Path) -> None:
+    """Undoable actions, undo and redo are appended and recovered"""
+    app, journal = _journaled_app(tmp_path)
+    try:
+        app.action_registry.execute("group.new", 1.0)
+        app.action_registry.execute("group.new", 2.0)
+        app.history.undo()
+        app.history.redo()
+        assert journal.pending == 4
+    finally:
+        journal.close()
+
+    recovery = Journal.recover(str(tmp_path))
+    assert recovery is not None
+    assert recovery.snapshot is not None
+    assert recovery.records == [
+        Record("do", "group.new", (1.0,), {}),
+        Record("do", "group.new", (2.0,), {}),
+        Record("undo"),
+        Record("redo"),
+    ]
+
+    fresh = CoreApplication(MagicMock())
+    assert replay(fresh, recovery.records) == 4
+    assert [group.index for group in fresh.lightshow.groups] == [1.0, 2.0]
+
+
+def test_recover_ignores_truncated_record(tmp_path: pathlib.Path) -> None:
+    """A record interrupted while written is not replayed"""
+    app, journal = _journaled_app(tmp_path)
+    app.action_registry.execute("group.new", 1.0)
+    journal.close()
+    segment = next(tmp_path.glob("journal-*.log"))
+    with open(segment, "a", encoding="utf-8") as file:
+        file.write('{"op": "do", "name": "group.new", "ar')
+
+    recovery = Journal.recover(str(tmp_path))
+    assert recovery is not None
+    assert len(recovery.records) == 1
+
+
+def test_compaction_rotates_files(tmp_path: pathlib.Path) -> None:
+    """A compaction starts a new segment and removes the older files"""
+    app, journal = _journaled_app(tmp_path)
+    try:
+        app.action_registry.execute("group.new", 1.0)
+        assert journal.compact(wait=True)
+        assert journal.pending == 0
+        names = sorted(os.listdir(tmp_path))
+        assert names == ["journal-00000002.log", "snapshot-00000002.olcb"]
+        # Nothing left to replay on the snapshot
+        assert Journal.recover(str(tmp_path)) is None
+        app.action_registry.execute("group.new", 2.0)
+    finally:
+        journal.close()
+    recovery = Journal.recover(str(tmp_path))
+    assert recovery is not None
+    assert recovery.snapshot == str(tmp_path / "snapshot-00000002.olcb")
+    assert recovery.records == [Record("do", "group.new", (2.0,), {})]
+
+
+def test_undo_before_snapshot_compacts(tmp_path: pathlib.Path) -> None:
+    """Undoing an action older than the snapshot takes a new snapshot"""
+    app, journal = _journaled_app(tmp_path)
+    try:
+        app.action_registry.execute("group.new", 1.0)
+        journal.compact(wait=True)
+        app.history.undo()
+        assert journal.pending == 0
+        # Snapshot written by the compactor, not by the undo
+        snapshot = tmp_path / "snapshot-00000003.olcb"
+        deadline = time.monotonic() + 2.0
+        while not snapshot.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert snapshot.exists()
+        assert Journal.recover(str(tmp_path)) is None
+    finally:
+        journal.close()
+
+
+def test_compaction_collects_on_dispatch_thread(tmp_path: pathlib.Path) -> None:
+    """With dispatch, the compactor does not collect the show itself"""
+    dispatched: queue.Queue[Callable[[], bool]] = queue.Queue()
+    threads: list[str] = []
+
+    def collect() -> dict[str, Any]:
+        threads.append(threading.current_thread().name)
+        return {}
+
+    journal = Journal(str(tmp_path), collect, idle=3600, dispatch=dispatched.put)
+    journal.start()
+    try:
+        journal.request_compaction()
+        callback = dispatched.get(timeout=2.0)
+        # Requested again before the main loop ran: dispatched once
+        journal.request_compaction()
+        time.sleep(0.1)
+        assert dispatched.empty()
+        assert callback() is False
+        assert threads == [threading.current_thread().name] * 2
+        snapshot = tmp_path / "snapshot-00000002.olcb"
+        deadline = time.monotonic() + 2.0
+        while not snapshot.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert snapshot.exists()
+    finally:
+        journal.close()
+
+
+def test_close_discard_removes_files(tmp_path: pathlib.Path) -> None:
+    """A clean exit leaves nothing to recover"""
+    app, journal = _journaled_app(tmp_path)
+    app.action_registry.execute("group.new", 1.0)
+    journal.close(discard=True)
+    assert not os.listdir(tmp_path)
+    assert Journal.recover(str(tmp_path)) is None
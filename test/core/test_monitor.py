@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from olc.core.monitor import (
+    DELTA,
+    FULL,
+    HEADER,
+    decode_universe,
+    encode_universe,
+    universe_topic,
+)
+
+
+class TestMonitorPackets:
+    """Test suite for the binary monitor packets."""
+
+    def test_full_round_trip(self) -> None:
+        """A packet without previous frame carries the 512 channels."""
+        frame = np.arange(512, dtype=np.uint32).astype(np.uint8)
+        packet = encode_universe(7, frame, 1234, 44.0, 3)
+        assert len(packet) == HEADER.size + 512
+
+        decoded = np.zeros(512, dtype=np.uint8)
+        header = decode_universe(packet, decoded)
+        assert header.kind == FULL
+        assert header.universe == 7
+        assert header.frames == 1234
+        assert header.hz == 44.0
+        assert header.flags == 3
+        np.testing.assert_array_equal(decoded, frame)
+
+    def test_delta_round_trip(self) -> None:
+        """Only the changed channels are sent against the previous frame."""
+        previous = np.zeros(512, dtype=np.uint8)
+        frame = previous.copy()
+        frame[[0, 300, 511]] = [1, 2, 3]
+        packet = encode_universe(1, frame, 0, 40.0, 0, previous)
+        assert len(packet) == HEADER.size + 3 * 3
+
+        decoded = previous.copy()
+        header = decode_universe(packet, decoded)
+        assert header.kind == DELTA
+        assert header.count == 3
+        np.testing.assert_array_equal(decoded, frame)
+
+    def test_large_change_sent_full(self) -> None:
+        """A delta larger than the frame falls back to a full packet."""
+        previous = np.zeros(512, dtype=np.uint8)
+        frame = np.full(512, 9, dtype=np.uint8)
+        packet = encode_universe(1, frame, 0, 40.0, 0, previous)
+        assert len(packet) == HEADER.size + 512
+
+    def test_malformed_packets(self) -> None:
+        """Invalid packets raise ValueError."""
+        frame = np.zeros(512, dtype=np.uint8)
+        with pytest.raises(ValueError):
+            decode_universe(b"OLCM", frame)
+        packet = encode_universe(1, frame, 0, 40.0, 0)
+        with pytest.raises(ValueError):
+            decode_universe(b"XXXX" + packet[4:], frame)
+        with pytest.raises(ValueError):
+            decode_universe(packet[:-1], frame)
+
+    def test_universe_topic(self) -> None:
+        """Universe topics have a fixed size, so prefixes match one universe."""
+        assert universe_topic(1) == b"u\x00\x01"
+        assert universe_topic(258) == b"u\x01\x02"
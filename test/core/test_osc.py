@@ -18,12 +18,15 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock
 
+import pytest
 from olc.core.osc import (
     CoreOSCServer,
     EngineOSCServer,
+    build_bundle,
     build_message,
     make_method,
     parse_message,
+    parse_packet,
 )
 
 
@@ -65,6 +68,35 @@ class TestOSCCodec:
         assert address == "/test/path"
         assert args == [10, 0.5, "world", True]
 
+    def test_encode_decode_blob(self) -> None:
+        """Blobs must be decoded as views of the received data."""
+        data = bytes(range(5))
+        msg = build_message("/test/path", data, 7)
+        address, args = parse_message(msg)
+        assert address == "/test/path"
+        assert isinstance(args[0], memoryview)
+        assert args[0] == data
+        assert args[1] == 7
+
+    def test_invalid_blob_size(self) -> None:
+        """A blob larger than the message must be rejected."""
+        msg = build_message("/test/path", b"abcd")
+        with pytest.raises(ValueError):
+            parse_message(msg[:-4])
+
+    def test_parse_bundle(self) -> None:
+        """Bundles, nested or not, must yield their messages in order."""
+        packet = build_bundle(
+            build_message("/a", 1),
+            build_bundle(build_message("/b", "x"), build_message("/c", b"\x01")),
+        )
+        messages = [(address, list(args)) for address, args in parse_packet(packet)]
+        assert messages == [("/a", [1]), ("/b", ["x"]), ("/c", [b"\x01"])]
+
+    def test_parse_packet_message(self) -> None:
+        """A plain message must be parsed as a single message packet."""
+        assert list(parse_packet(build_message("/a", 2))) == [("/a", [2])]
+
 
 class TestOSCServerDispatch:
     """Test suite for the OSC server routing and dispatch."""
@@ -122,6 +154,71 @@ class TestOSCServerDispatch:
         server.dispatch("/some/unknown/path", [])
         assert server.fallback_triggered
 
+    def test_dispatch_exact_before_pattern(self) -> None:
+        """Exact addresses must win over patterns, patterns keep their order."""
+
+        class MockServer(CoreOSCServer):
+            def __init__(self) -> None:
+                super().__init__(port=9999)
+                self.calls: list[str] = []
+
+            @make_method("/olc/*")
+            def on_any(self, _address: str, _args: list) -> None:
+                self.calls.append("any")
+
+            @make_method("/olc/fader/?")
+            def on_fader(self, _address: str, _args: list) -> None:
+                self.calls.append("fader")
+
+            @make_method("/olc/go")
+            def on_go(self, _address: str, _args: list) -> None:
+                self.calls.append("go")
+
+        server = MockServer()
+        server.dispatch("/olc/go", [])
+        server.dispatch("/olc/fader/1", [])
+        # Cached resolution
+        server.dispatch("/olc/fader/1", [])
+        assert server.calls == ["go", "any", "any"]
+
+    def test_dispatch_cache_reset_by_delegate(self) -> None:
+        """Handlers registered later must be used for cached addresses."""
+
+        class MockDelegate:
+            def __init__(self) -> None:
+                self.triggered = False
+
+            @make_method("/delegate/*")
+            def on_test(self, _address: str, _args: list) -> None:
+                self.triggered = True
+
+        server = CoreOSCServer(port=9999)
+        server.dispatch("/delegate/test", [])
+        delegate = MockDelegate()
+        server.register_delegate(delegate)
+        server.dispatch("/delegate/test", [])
+        assert delegate.triggered
+
+    def test_dispatch_packet_bundle(self) -> None:
+        """All messages of a bundle must be dispatched."""
+
+        class MockServer(CoreOSCServer):
+            def __init__(self) -> None:
+                super().__init__(port=9999)
+                self.values: list[int] = []
+
+            @make_method("/olc/fader/*")
+            def on_fader(self, _address: str, args: list) -> None:
+                self.values.append(args[0])
+
+        server = MockServer()
+        server.dispatch_packet(
+            build_bundle(
+                build_message("/olc/fader/1", 1), build_message("/olc/fader/2", 2)
+            )
+        )
+        assert server.values == [1, 2]
+
     def test_delegate_harvesting(self) -> None:
         """OSC Server must dynamically harvest decorated methods from registered
         delegates.
@@ -162,6 +259,18 @@ class TestEngineOSCServer:
         server.dispatch("/olc/universe/1/set_channels", [channels_json])
         mock_engine.set_channels.assert_called_once_with(1, {5: 200, 6: 100})
 
+    def test_set_channels_blob(self) -> None:
+        """A blob must be written as a whole universe."""
+        mock_engine = MagicMock()
+        server = EngineOSCServer(port=9999, engine=mock_engine)
+
+        levels = bytes(range(256)) * 2
+        server.dispatch_packet(build_message("/olc/universe/1/set_channels", levels))
+        uid, data = mock_engine.set_universe.call_args.args
+        assert uid == 1
+        assert data == levels
+        mock_engine.set_channels.assert_not_called()
+
     def test_blackout(self) -> None:
         """Blackout endpoint must trigger engine blackout."""
         mock_engine = MagicMock()
@@ -169,3 +278,24 @@ class TestEngineOSCServer:
 
         server.dispatch("/olc/universe/3/blackout", [])
         mock_engine.blackout.assert_called_once_with(3)
+
+    def test_stats(self) -> None:
+        """Stats endpoint must reply with the loop timing statistics."""
+        mock_engine = MagicMock()
+        histogram = {"p50": 0.001, "p99": 0.002, "p999": 0.003, "max": 0.004}
+        mock_engine.timing_stats = {
+            "hz": 44.0,
+            "effective_hz": 43.9,
+            "frames": 100,
+            "late": 2,
+            "missed": 1,
+            "jitter": histogram,
+            "send": histogram,
+        }
+        server = EngineOSCServer(port=9999, engine=mock_engine)
+
+        server.dispatch("/olc/engine/stats", [])
+        args = mock_engine.send_osc.call_args.args
+        assert args[0] == "/olc/engine/stats"
+        assert args[1:6] == (44.0, 43.9, 100, 2, 1)
+        assert args[6:] == pytest.approx((1.0, 2.0, 3.0, 4.0) * 2)
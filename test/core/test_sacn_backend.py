@@ -22,11 +22,13 @@ import typing
 from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from olc.core.backends.sacn import SacnManager
 from olc.core.backends.sacn.merge import MergeMode, SacnMerger
 from olc.core.backends.sacn.network import SacnNetwork, SacnProtocol
 from olc.core.backends.sacn.protocol import (
+    START_CODE_PER_ADDRESS_PRIORITY,
     SacnDecodeError,
     SacnDiscoveryPacket,
     SacnPacket,
@@ -57,6 +59,14 @@ def background_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
         t.join()
 
 
+def assert_merged(callback_mock: MagicMock, universe: int, expected: list[int]) -> None:
+    """Assert the last merger callback carried the expected universe levels."""
+    callback_mock.assert_called()
+    args = callback_mock.call_args[0]
+    assert args[0] == universe
+    np.testing.assert_array_equal(args[1], expected)
+
+
 class TestSacnProtocol:
     """Test suite for native sACN packet encoders, decoders, and errors."""
 
@@ -267,6 +277,17 @@ class TestSacnProtocol:
         decoded.decode(raw)
         assert decoded.sync_address == 1500
 
+    def test_sacn_packet_view_decoding(self) -> None:
+        """Verify decoded DMX slots are exposed without copying the packet."""
+        data = [i % 256 for i in range(512)]
+        raw = SacnPacket(data=data).encode()
+
+        decoded = SacnPacket()
+        decoded.decode(raw)
+        assert decoded.view.tobytes() == bytes(data)
+        assert not decoded.view.flags.owndata
+        assert decoded.data == data
+
 
 class TestSacnMerger:
     """Test suite for sACN priority merging, timeouts, and terminated flags."""
@@ -283,11 +304,11 @@ class TestSacnMerger:
 
         # Source 1 at priority 100
         merger.update(cid1, "Source 1", 100, data1)
-        callback_mock.assert_called_with(2, data1)
+        assert_merged(callback_mock, 2, data1)
 
         # Source 2 at priority 150 (wins completely)
         merger.update(cid2, "Source 2", 150, data2)
-        callback_mock.assert_called_with(2, data2)
+        assert_merged(callback_mock, 2, data2)
 
         # Update Source 1 at priority 100: no changes to output
         callback_mock.reset_mock()
@@ -310,7 +331,7 @@ class TestSacnMerger:
 
         expected = [50] * 512
         expected[10] = 80
-        callback_mock.assert_called_with(2, expected)
+        assert_merged(callback_mock, 2, expected)
 
     def test_equal_priority_ltp_merge(self) -> None:
         """Verify equal highest priority sources LTP merge."""
@@ -328,7 +349,7 @@ class TestSacnMerger:
             merger.update(cid2, "S2", 100, data2)
 
         # S2 timestamp is newer: it wins completely
-        callback_mock.assert_called_with(2, data2)
+        assert_merged(callback_mock, 2, data2)
 
     def test_stream_terminated_option(self) -> None:
         """Verify stream terminated flag instantly purges a source."""
@@ -350,7 +371,7 @@ class TestSacnMerger:
         merger.update(cid1, "S1", 150, data1, stream_terminated=True)
 
         assert cid1 not in merger.sources
-        callback_mock.assert_called_with(2, data2)
+        assert_merged(callback_mock, 2, data2)
 
     def test_inactivity_timeout_purging(self) -> None:
         """Verify timed out sources are purged."""
@@ -375,6 +396,105 @@ class TestSacnMerger:
         assert len(merger.sources) == 1
         assert cid1 not in merger.sources
 
+    def test_changed_mask(self) -> None:
+        """Verify the callback reports only modified slots in its diff mask."""
+        callback_mock = MagicMock()
+        merger = SacnMerger(universe=2, callback=callback_mock)
+
+        cid1 = b"\x01" * 16
+        data = [10] * 512
+        merger.update(cid1, "S1", 100, data)
+        assert callback_mock.call_args[0][2].all()
+
+        data[3] = 200
+        data[300] = 0
+        merger.update(cid1, "S1", 100, data)
+        changed = callback_mock.call_args[0][2]
+        assert np.flatnonzero(changed).tolist() == [3, 300]
+        assert merger.output[3] == 200
+
+    def test_per_address_priority(self) -> None:
+        """Verify per-address priorities (0xDD) select the winner per slot."""
+        callback_mock = MagicMock()
+        merger = SacnMerger(universe=2, callback=callback_mock)
+
+        cid1 = b"\x01" * 16
+        cid2 = b"\x02" * 16
+        merger.update(cid1, "S1", 100, [10] * 512)
+        merger.update(cid2, "S2", 100, [20] * 512)
+
+        # S1 claims slots 0-9 at priority 150, and doesn't drive slots 10-19
+        priorities = [100] * 512
+        priorities[0:10] = [150] * 10
+        priorities[10:20] = [0] * 10
+        merger.update_priorities(cid1, "S1", 100, priorities)
+
+        # S2 doesn't drive slot 20
+        priorities = [100] * 512
+        priorities[20] = 0
+        merger.update_priorities(cid2, "S2", 100, priorities)
+
+        expected = [20] * 512
+        expected[0:10] = [10] * 10
+        expected[20] = 10
+        assert_merged(callback_mock, 2, expected)
+
+    def test_per_address_priority_timeout(self) -> None:
+        """Verify stale per-address priorities fall back to universe priority."""
+        merger = SacnMerger(universe=2, timeout=2.0)
+
+        cid1 = b"\x01" * 16
+        cid2 = b"\x02" * 16
+        with patch("time.time", return_value=100.0):
+            merger.update(cid1, "S1", 100, [10] * 512)
+            merger.update(cid2, "S2", 100, [20] * 512)
+            merger.update_priorities(cid1, "S1", 100, [150] * 512)
+        assert merger.output[0] == 10
+
+        # Levels keep flowing but 0xDD packets stopped
+        with patch("time.time", return_value=103.0):
+            merger.update(cid1, "S1", 100, [10] * 512)
+            merger.update(cid2, "S2", 100, [20] * 512)
+        assert merger.output[0] == 20
+
+    def test_max_sources(self) -> None:
+        """Verify packets from sources beyond the matrix capacity are dropped."""
+        merger = SacnMerger(universe=2, max_sources=2)
+
+        merger.update(b"\x01" * 16, "S1", 100, [10] * 512)
+        merger.update(b"\x02" * 16, "S2", 100, [20] * 512)
+        merger.update(b"\x03" * 16, "S3", 100, [30] * 512)
+
+        assert len(merger.sources) == 2
+        assert merger.dropped_packets == 1
+        assert merger.output[0] == 20
+
+        # A terminated source frees its row
+        merger.update(b"\x02" * 16, "S2", 100, [20] * 512, stream_terminated=True)
+        merger.update(b"\x03" * 16, "S3", 100, [30] * 512)
+        assert merger.output[0] == 30
+
+    def test_manager_per_address_priority_packet(self) -> None:
+        """Verify SacnManager routes 0xDD packets to the merger priorities."""
+        umap = UniverseMap(2)
+        umap.enable_protocol(1, Protocol.SACN)
+
+        with patch("olc.core.backends.sacn.SacnNetwork"):
+            manager = SacnManager(umap)
+            cid = b"\x09" * 16
+            levels = SacnPacket(cid=cid, universe=1, data=[50] * 512)
+            manager.read_packet(levels.encode(), ("192.168.1.5", 5568))
+            priorities = SacnPacket(
+                cid=cid,
+                universe=1,
+                data=[0] * 512,
+                start_code=START_CODE_PER_ADDRESS_PRIORITY,
+            )
+            manager.read_packet(priorities.encode(), ("192.168.1.5", 5568))
+
+        # Source doesn't drive any slot anymore
+        assert not manager.mergers[1].output.any()
+
 
 class TestSacnNetwork:
     """Test suite for SacnNetwork socket setup, multicast, and reader loops."""
@@ -675,14 +795,15 @@ class TestSacnManager:
             # Verify that the packet was NOT merged immediately
             callback_mock.assert_not_called()
             assert cid in manager.pending_dmx
-            assert manager.pending_dmx[cid][1] == data
+            np.testing.assert_array_equal(manager.pending_dmx[cid][1], data)
 
             # Receive sACN Sync Packet for synchronization universe 2000
             sync_packet = SacnSyncPacket(cid=cid, sync_address=2000)
             manager.read_packet(sync_packet.encode(), ("192.168.1.5", 5568))
 
             # Verify that the packet was merged and released instantly!
-            callback_mock.assert_called_once_with(1, data)
+            assert callback_mock.call_count == 1
+            assert_merged(callback_mock, 1, data)
             assert cid not in manager.pending_dmx
 
     def test_manager_sync_timeout_fallback(self) -> None:
@@ -717,7 +838,8 @@ class TestSacnManager:
                 manager._check_pending_timeouts()
 
             # Verify that it committed automatically
-            callback_mock.assert_called_once_with(1, data)
+            assert callback_mock.call_count == 1
+            assert_merged(callback_mock, 1, data)
 
     def test_engine_sync_packet_transmission(self) -> None:
         """Verify that CoreEngine calls send_sync when universes have sync addresses."""
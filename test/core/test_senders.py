@@ -1,11 +1,16 @@
 # pylint: disable=protected-access
+import socket
 import struct
 import sys
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pytest
+from olc.core.batch import HAS_SENDMMSG, BatchTransmitter, DatagramBatch
 from olc.core.senders import (
     ARTNET_PORT,
     SACN_PORT,
+    SACN_TERMINATE_COUNT,
     ArtNetSender,
     SACNSender,
     _build_artnet_header,
@@ -184,6 +189,23 @@ class TestSACNSender:  # pylint: disable=too-few-public-methods
                     assert args[1] == ("239.255.0.1", SACN_PORT)
 
 
+class TestSACNTerminate:  # pylint: disable=too-few-public-methods
+    """Test the sACN stream termination."""
+
+    def test_terminate_burst(self) -> None:
+        """Three packets are sent with the Stream_Terminated option."""
+        with patch("olc.core.senders._HAS_SENDMSG", False):
+            sender = SACNSender(universe=1, multicast=False)
+            mock_sock = MagicMock()
+            sender._socks = [mock_sock]
+            sender.terminate(DMXUniverse(1))
+
+        assert mock_sock.sendto.call_count == SACN_TERMINATE_COUNT
+        for call in mock_sock.sendto.call_args_list:
+            assert call[0][0][112] & 0x40
+        assert not sender._header[112] & 0x40
+
+
 # Run send-msg path only on non-Windows platforms
 if sys.platform != "win32":
 
@@ -207,3 +229,84 @@ if sys.platform != "win32":
                 buffers = mock_sock.sendmsg.call_args[0][0]
                 assert len(buffers) == 2
                 assert isinstance(buffers[1], memoryview)
+
+
+@pytest.mark.skipif(not HAS_SENDMMSG, reason="sendmmsg() not available")
+class TestBatchTransmit:
+    """Test the batched sendmmsg() transmit path."""
+
+    @staticmethod
+    def _receiver() -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(("127.0.0.1", 0))
+        sock.settimeout(1.0)
+        return sock
+
+    def test_datagram_batch_flush(self) -> None:
+        """Every datagram is received with the current buffer content."""
+        receiver = self._receiver()
+        port = receiver.getsockname()[1]
+        sender_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        header = bytearray(b"HDR")
+        data = np.arange(4, dtype=np.uint8)
+        batch = DatagramBatch(sender_sock)
+        batch.add([header, data], ("127.0.0.1", port))
+        batch.add([header], ("127.0.0.1", port))
+        try:
+            assert batch.flush() == 2
+            assert receiver.recv(64) == b"HDR\x00\x01\x02\x03"
+            assert receiver.recv(64) == b"HDR"
+            # Buffers are patched in place between flushes
+            header[0] = ord("X")
+            data[:] = 9
+            assert batch.flush() == 2
+            assert receiver.recv(64) == b"XDR\x09\x09\x09\x09"
+        finally:
+            receiver.close()
+            sender_sock.close()
+
+    def test_transmitter_artnet_frame(self) -> None:
+        """Staged Art-Net senders are flushed with their sequence number."""
+        receiver = self._receiver()
+        port = receiver.getsockname()[1]
+        sender = ArtNetSender(ip="127.0.0.1", universe=3, port=port)
+        univ = DMXUniverse()
+        univ.set_channels({0: 255})
+        transmitter = BatchTransmitter()
+        try:
+            transmitter.stage(sender, univ)
+            assert transmitter.flush() == 1
+            packet = receiver.recv(1024)
+            assert packet[:18] == bytes(_build_artnet_header(1, 3))
+            assert packet[18] == 255
+            transmitter.stage(sender, univ)
+            transmitter.flush()
+            assert receiver.recv(1024)[12] == 2
+        finally:
+            transmitter.close()
+            sender.close()
+            receiver.close()
+
+    def test_transmitter_skips_unstaged(self) -> None:
+        """Registered senders not staged for a frame are not sent."""
+        receiver = self._receiver()
+        port = receiver.getsockname()[1]
+        senders = [
+            ArtNetSender(ip="127.0.0.1", universe=u, port=port) for u in range(3)
+        ]
+        univ = DMXUniverse()
+        transmitter = BatchTransmitter()
+        try:
+            for sender in senders:
+                transmitter.stage(sender, univ)
+            assert transmitter.flush() == 3
+            for _ in range(3):
+                receiver.recv(1024)
+            transmitter.stage(senders[2], univ)
+            assert transmitter.flush() == 1
+            assert receiver.recv(1024)[14] == 2
+        finally:
+            transmitter.close()
+            for sender in senders:
+                sender.close()
+            receiver.close()
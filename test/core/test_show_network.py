@@ -47,6 +47,8 @@ def test_universes_serialization_deserialization() -> None:
 
     lightshow = MagicMock()
     lightshow.app = app
+    # Universes without protocol are only saved if the show uses them
+    lightshow.universes = [1, 2, 3, 4]
 
     # Serialize
     file_mock = MagicMock(spec=Gio.File)
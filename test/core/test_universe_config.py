@@ -163,6 +163,17 @@ class TestUniverseMap:
         with pytest.raises(KeyError, match=err_msg):
             _ = umap[999]
 
+    def test_grow(self) -> None:
+        """Added universes have no protocol, the others keep theirs"""
+        umap = UniverseMap(num_universes=2)
+        umap.enable_protocol(1, Protocol.ARTNET)
+        umap.grow(4)
+        umap.grow(3)
+        assert len(umap) == 4
+        assert umap[1].protocols == {Protocol.ARTNET}
+        assert umap[3].universe_id == 3
+        assert umap[3].protocols == set()
+
     def test_iteration(self) -> None:
         """Test iteration over universe map"""
         umap = UniverseMap(num_universes=3)
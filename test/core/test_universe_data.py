@@ -1,5 +1,6 @@
 import numpy as np
-from olc.core.universe_data import NUM_CHANNELS, DMXUniverse
+import pytest
+from olc.core.universe_data import NUM_CHANNELS, DMXUniverse, FrameStore
 
 
 class TestDMXUniverse:
@@ -45,6 +46,21 @@ class TestDMXUniverse:
         assert univ[0] == 0
         assert univ[511] == 0
 
+    def test_apply_partial_array_and_mask(self) -> None:
+        """Test partial copies used by the receive path."""
+        univ = DMXUniverse()
+        univ.apply_array(np.frombuffer(bytes([50] * 24), dtype=np.uint8))
+        assert univ[23] == 50
+        assert univ[24] == 0
+
+        arr = np.full(NUM_CHANNELS, 200, dtype=np.uint8)
+        mask = np.zeros(NUM_CHANNELS, dtype=np.bool_)
+        mask[30] = True
+        univ.apply_mask(arr, mask)
+        assert univ[30] == 200
+        assert univ[0] == 50
+        assert univ[31] == 0
+
     def test_snapshot_and_diff(self) -> None:
         """Test snapshot creation and difference calculation."""
         univ = DMXUniverse()
@@ -59,3 +75,78 @@ class TestDMXUniverse:
         assert len(diff_indices) == 2
         assert 5 in diff_indices
         assert 10 in diff_indices
+
+    def test_generation(self) -> None:
+        """Test that writes increment the generation counter."""
+        univ = DMXUniverse()
+        assert univ.generation == 0
+        univ[1] = 10
+        univ.set_channels({2: 20})
+        univ.blackout()
+        assert univ.generation == 3
+        arr = np.zeros(512, dtype=np.uint8)
+        univ.apply_array(arr)
+        assert univ.generation == 3  # Same content
+        arr[7] = 1
+        univ.apply_array(arr)
+        assert univ.generation == 4
+        univ.array[8] = 1
+        univ.touch()
+        assert univ.generation == 5
+
+    def test_external_buffer(self) -> None:
+        """Test a universe stored in an existing buffer."""
+        block = np.zeros((2, 512), dtype=np.uint8)
+        univ = DMXUniverse(1, buffer=block[1])
+        univ[3] = 30
+        assert block[1, 3] == 30
+        with pytest.raises(ValueError):
+            DMXUniverse(1, buffer=np.zeros(10, dtype=np.uint8))
+
+
+class TestFrameStore:
+    """Test suite for the triple-buffered FrameStore."""
+
+    def test_publish_acquire(self) -> None:
+        """Published frames reach the output block on acquire only."""
+        store = FrameStore(2)
+        univ = DMXUniverse(1, store=store, row=1)
+        univ.set_channels({0: 10, 511: 20})
+        assert store.output[1, 0] == 0
+        store.acquire()
+        assert store.output[1, 0] == 10
+        assert store.output[1, 511] == 20
+        assert not store.output[0].any()
+
+    def test_resize_keeps_frames(self) -> None:
+        """Universes added to a store start blank, the others keep their frame."""
+        store = FrameStore(2)
+        univ = DMXUniverse(1, store=store, row=1)
+        univ.set_channels({0: 10})
+        store.acquire()
+        univ.set_channels({0: 20})
+        store.resize(3)
+        assert store.output.shape == (3, 512)
+        assert store.output[1, 0] == 10
+        added = DMXUniverse(2, store=store, row=2)
+        added.set_channels({1: 30})
+        store.acquire()
+        assert store.output[1, 0] == 20
+        assert store.output[2, 1] == 30
+        with pytest.raises(ValueError):
+            store.resize(2)
+
+    def test_claimed_buffer_not_overwritten(self) -> None:
+        """A writer never reuses the buffer claimed by the reader."""
+        store = FrameStore(1)
+        univ = DMXUniverse(0, store=store)
+        univ.set_all(1)
+        claimed = store._front[0]  # pylint: disable=protected-access
+        store._reading[0] = claimed  # pylint: disable=protected-access
+        for level in range(2, 6):
+            univ.set_all(level)
+            assert store._front[0] != claimed  # pylint: disable=protected-access
+            assert np.all(store._frames[claimed] == 1)  # pylint: disable=protected-access
+        store._reading[0] = -1  # pylint: disable=protected-access
+        store.acquire()
+        assert np.all(store.output[0] == 5)
@@ -62,10 +62,10 @@ def test_pause_action_execution() -> None:
     app = CoreApplication(settings)
 
     mock_playback = MagicMock()
-    # Mock thread and pause event to check paused state
-    mock_thread = MagicMock()
-    mock_thread.pause.is_set.return_value = False  # False means paused
-    mock_playback.thread = mock_thread
+    # Mock transition and pause event to check paused state
+    mock_transition = MagicMock()
+    mock_transition.pause.is_set.return_value = False  # False means paused
+    mock_playback.transition = mock_transition
     mock_playback.on_go = True
     app.lightshow.main_playback = mock_playback
 
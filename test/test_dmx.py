@@ -16,8 +16,10 @@
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+from olc.curve import LimitCurve
 from olc.define import MAX_CHANNELS, UNIVERSES
 from olc.dmx import Dmx
+from olc.patch import DMXPatch
 
 
 def test_dmx_send_triggers_callbacks() -> None:
@@ -84,3 +86,45 @@ def test_dmx_send_triggers_callbacks() -> None:
 
         # Verify engine.universe was updated
         assert engine.universe(UNIVERSES[0]).array[:] == list(dmx.frame[0])
+
+
+def test_dmx_set_levels_applies_patch_curves_and_main_fader() -> None:
+    """Test that Dmx.set_levels() renders the compiled patch into the frame."""
+    lightshow = MagicMock()
+    lightshow.patch = DMXPatch(UNIVERSES)
+    lightshow.independents.dmx = np.zeros(MAX_CHANNELS, dtype=np.uint8)
+    lightshow.main_playback.on_go = False
+    limit = LimitCurve(128)
+    lightshow.curves.get_curve.side_effect = lambda n: limit if n == 1 else None
+
+    with patch("olc.dmx.RepeatedTimer"):
+        dmx = Dmx(backend=None, lightshow=lightshow)
+
+    # Channel 1 on outputs 1 and 10 of the second universe, output 10 limited
+    lightshow.patch.patch_empty()
+    lightshow.patch.add_output(1, 1, UNIVERSES[1])
+    lightshow.patch.add_output(1, 10, UNIVERSES[1], curve=1)
+    lightshow.patch.add_output(2, 3, UNIVERSES[0])
+    dmx.levels["sequence"][0] = 255
+    dmx.levels["faders"][1] = 100
+    dmx.levels["user"][1] = 40
+
+    dmx.set_levels()
+    assert dmx.frame[1][0] == 255
+    assert dmx.frame[1][9] == 128
+    # User level overrides the other playbacks
+    assert dmx.frame[0][2] == 40
+
+    # Main fader scales after the curve
+    dmx.main_fader.set_level(0.5)
+    dmx.set_levels()
+    assert dmx.frame[1][0] == 128
+    assert dmx.frame[1][9] == 64
+    assert dmx.frame[0][2] == 20
+
+    # Patch changes are compiled again
+    lightshow.patch.unpatch(1, 10, UNIVERSES[1])
+    lightshow.patch.add_output(1, 10, UNIVERSES[1])
+    dmx.frame[1][9] = 0
+    dmx.set_levels()
+    assert dmx.frame[1][9] == 128
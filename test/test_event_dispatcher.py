@@ -16,7 +16,9 @@
 
 from __future__ import annotations
 
-from olc.core.event import EventDispatcher
+import threading
+
+from olc.core.event import EventDispatcher, latest
 
 
 def test_subscribe_and_emit() -> None:
@@ -82,3 +84,91 @@ def test_callback_exception_isolation() -> None:
     dispatcher.emit("test.event")
 
     assert second_callback_called is True
+
+
+def test_async_delivery_on_dispatch_thread() -> None:
+    """Asynchronous events are delivered in order by the dispatch thread."""
+    dispatcher = EventDispatcher()
+    received: list[tuple[int, str]] = []
+    dispatcher.subscribe(
+        "test.event",
+        lambda value: received.append((value, threading.current_thread().name)),
+    )
+    dispatcher.set_async("test.event")
+    for value in range(5):
+        dispatcher.emit("test.event", value)
+    assert dispatcher.flush(timeout=5)
+    dispatcher.stop_dispatch()
+
+    assert [value for value, _ in received] == [0, 1, 2, 3, 4]
+    assert {name for _, name in received} == {"EventDispatcher"}
+
+
+def test_async_coalescing() -> None:
+    """A pending payload is replaced by a newer one with the same key."""
+    dispatcher = EventDispatcher()
+    received: list[tuple[int, int]] = []
+    release = threading.Event()
+    dispatcher.subscribe("blocker", lambda: release.wait(5))
+    dispatcher.subscribe(
+        "level", lambda channel, level: received.append((channel, level))
+    )
+    dispatcher.set_async("blocker")
+    dispatcher.set_async("level", coalesce=lambda channel, _level: channel)
+
+    # The dispatch thread is busy: levels stay pending
+    dispatcher.emit("blocker")
+    dispatcher.emit("level", 1, 10)
+    dispatcher.emit("level", 2, 20)
+    dispatcher.emit("level", 1, 11)
+    release.set()
+    assert dispatcher.flush(timeout=5)
+
+    assert received == [(1, 11), (2, 20)]
+    stats = dispatcher.dispatch_stats()["level"]
+    assert stats["emitted"] == 3
+    assert stats["coalesced"] == 1
+    (listener,) = stats["listeners"].values()
+    assert listener["latency"]["count"] == 2
+    assert listener["duration"]["count"] == 2
+    dispatcher.stop_dispatch()
+
+
+def test_async_latest_and_backlog() -> None:
+    """`latest` keeps one payload, the backlog drops the oldest ones."""
+    dispatcher = EventDispatcher()
+    progress: list[int] = []
+    values: list[int] = []
+    release = threading.Event()
+    dispatcher.subscribe("blocker", lambda: release.wait(5))
+    dispatcher.subscribe("progress", progress.append)
+    dispatcher.subscribe("value", values.append)
+    dispatcher.set_async("blocker")
+    dispatcher.set_async("progress", coalesce=latest)
+    dispatcher.set_async("value", max_backlog=2)
+
+    dispatcher.emit("blocker")
+    for value in range(4):
+        dispatcher.emit("progress", value)
+        dispatcher.emit("value", value)
+    release.set()
+    assert dispatcher.flush(timeout=5)
+
+    assert progress == [3]
+    assert values == [2, 3]
+    assert dispatcher.dispatch_stats()["value"]["dropped"] == 2
+    dispatcher.stop_dispatch()
+
+
+def test_stop_dispatch_restores_sync() -> None:
+    """Events are synchronous again once the dispatch thread is stopped."""
+    dispatcher = EventDispatcher()
+    received: list[int] = []
+    dispatcher.subscribe("test.event", received.append)
+    dispatcher.set_async("test.event")
+    dispatcher.emit("test.event", 1)
+    dispatcher.stop_dispatch()
+    assert received == [1]
+
+    dispatcher.emit("test.event", 2)
+    assert received == [1, 2]
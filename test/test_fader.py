@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+from olc.core.fades import FadeScheduler
+from olc.cue import Cue
+from olc.define import MAX_CHANNELS
+from olc.fader import ChaserTransition
+from olc.sequence import Sequence
+from olc.step import Step
+
+
+def _chaser_fader(level: float = 1.0) -> SimpleNamespace:
+    """Fader with a chaser of two steps on channels 1 and 2."""
+    chaser = Sequence(2)
+    chaser.insert_step(1, Step(2, Cue(2, 1, {1: 200, 2: 0}), time_in=1, time_out=2))
+    chaser.insert_step(2, Step(2, Cue(2, 2, {1: 0, 2: 100}), time_in=1, time_out=2))
+    return SimpleNamespace(
+        contents=chaser,
+        channels={1, 2},
+        level=level,
+        dmx=np.zeros(MAX_CHANNELS, dtype=np.uint8),
+        fader_bank=SimpleNamespace(lightshow=None, update_levels=MagicMock()),
+    )
+
+
+def test_chaser_levels() -> None:
+    """Test attacks on time in and decays on time out of a chaser step."""
+    fader = _chaser_fader(level=0.5)
+    transition = ChaserTransition(fader, FadeScheduler())  # type: ignore[arg-type]
+    transition.compile(fader.contents)
+    assert transition.matrix.shape == (fader.contents.last, 2)
+
+    # Step 1 to step 2, half of time in and a quarter of time out
+    transition.update_levels(1000, 2000, 500, 1)
+    assert fader.dmx[0] == round((200 - abs(int((0 - 200 - 1) / 2000 * 500))) * 0.5)
+    assert fader.dmx[1] == round(int((100 + 1) / 1000 * 500) * 0.5)
+    fader.fader_bank.update_levels.assert_called_once()
+
+    # Times over
+    transition.update_levels(1000, 2000, 2000, 1)
+    assert fader.dmx[0] == 0
+    assert fader.dmx[1] == 50
+
+
+def test_chaser_recompiled_on_cue_change() -> None:
+    """Test that editing a cue of a running chaser updates its levels."""
+    fader = _chaser_fader()
+    transition = ChaserTransition(fader, FadeScheduler())  # type: ignore[arg-type]
+    transition.compile(fader.contents)
+    fader.contents.steps[2].cue.set_level(2, 255)
+    transition.compile(fader.contents)
+    transition.update_levels(1000, 2000, 1000, 1)
+    assert fader.dmx[1] == 255
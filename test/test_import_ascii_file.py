@@ -9,6 +9,7 @@ from gi.repository import Gio  # noqa: E402
 from olc.core.lightshow import LightShow  # noqa: E402
 from olc.files.file_type import FileType  # noqa: E402
 from olc.files.import_file import ImportFile  # noqa: E402
+from olc.files.stream import open_show  # noqa: E402
 
 FILE_PATH = "test/sample.asc"
 gfile = Gio.File.new_for_path(FILE_PATH)
@@ -46,3 +47,23 @@ def test_import(monkeypatch: pytest.MonkeyPatch) -> None:
         31: 255,
     }
     assert imported.data.data["sequences"][2]["label"] == "Chaser 1"
+
+
+def test_import_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Streamed ASCII file importation parses the same data"""
+
+    mock_app = MagicMock()
+    monkeypatch.setattr("olc.files.import_file.App", lambda: mock_app, raising=False)
+    monkeypatch.setattr("olc.core.lightshow.App", lambda: mock_app, raising=False)
+
+    lightshow = LightShow()
+    whole = ImportFile(lightshow, gfile, FileType.ASCII)
+    _success, data, _etag = gfile.load_contents(None)
+    whole.parser.contents = str(from_bytes(data).best())
+    whole.parser.parse()
+
+    streamed = ImportFile(lightshow, gfile, FileType.ASCII)
+    with open_show(FILE_PATH) as text:
+        streamed.parser.parse_stream(text)
+
+    assert streamed.data.data == whole.data.data
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the cue, step, group and chaser lookup indexes."""
+
+from __future__ import annotations
+
+import random
+from unittest.mock import MagicMock
+
+from olc.cue import Cue, Cues
+from olc.group import Group, Groups
+from olc.sequence import Chasers, Sequence
+from olc.step import Step
+
+
+def _linear_get_step(steps: list[Step], cue: float | None) -> tuple[bool, int]:
+    """Cue step search by linear scan (previous implementation)"""
+    found = False
+    step = 0
+    for item in steps:
+        if item.cue is not None and item.cue.number == cue:
+            found = True
+            break
+        step += 1
+    step -= 1
+    if not found:
+        exist = False
+        step = 0
+        for item in steps:
+            if item.cue is not None and cue is not None and item.cue.number > cue:
+                exist = True
+                break
+            step += 1
+        if not exist:
+            step += 1
+    elif step:
+        step += 1
+    return found, step
+
+
+def test_get_step_matches_linear_scan() -> None:
+    """Indexed step lookup gives the results of a scan, after every change."""
+    rng = random.Random(4)
+    sequence = Sequence(1)
+    sequence.add_step(Step(1, Cue(1, 0.0)))
+    for number in sorted(rng.sample(range(1, 200), 60)):
+        sequence.add_step(Step(1, Cue(1, number / 2)))
+    # Unsorted end step, as after an import
+    sequence.add_step(Step(1, Cue(1, 0.0)))
+    sequence.add_step(Step(1))
+
+    for _ in range(5):
+        for number in [None, -1.0, 0.0, 0.5, 1.0, 50.25, 99.5, 100.0, 500.0] + [
+            rng.randrange(0, 210) / 2 for _ in range(30)
+        ]:
+            assert sequence.get_step(number) == _linear_get_step(sequence.steps, number)
+        del sequence.steps[rng.randrange(1, len(sequence.steps))]
+        sequence.steps.insert(3, Step(1, Cue(1, 0.75)))
+
+
+def test_goto_finds_step() -> None:
+    """Goto starts a Go from the step before the cue."""
+    sequence = Sequence(1)
+    sequence.do_go = MagicMock()  # type: ignore[method-assign]
+    del sequence.steps[1:]
+    for number in (1.0, 2.0, 2.5, 3.0):
+        sequence.add_step(Step(1, Cue(1, number)))
+    sequence.goto("2.5")
+    assert sequence.position == 2
+    sequence.do_go.assert_called_once_with(None, True)
+    sequence.goto("7")
+    assert sequence.position == 2
+
+
+def test_cues_index() -> None:
+    """Cues stay sorted and indexed on insertion and removal."""
+    cues = Cues()
+    numbers = [3.0, 1.0, 2.0, 1.5, 10.0]
+    for number in numbers:
+        cues.add(Cue(0, number))
+    cues.add(Cue(1, 2.0))
+    assert [cue.number for cue in cues] == [1.0, 1.5, 2.0, 2.0, 3.0, 10.0]
+    assert cues.get(2.0, 1) is not None and cues.get(2.0, 1).sequence == 1
+    assert cues.get(2.0, 0) is not None and cues.get(2.0, 0).sequence == 0
+
+    cues.remove(cues.get(2.0, 0))  # type: ignore[arg-type]
+    assert cues.get(2.0, 0) is None
+    assert cues.get(2.0, 1) is not None
+    popped = cues.pop(0)
+    assert popped.number == 1.0 and cues.get(1.0, 0) is None
+    del cues[-2:]
+    assert cues.get(10.0, 0) is None and cues.get(3.0, 0) is None
+    assert [cue.number for cue in cues] == [1.5, 2.0]
+    cues.add(Cue(0, 1.75))
+    assert [cue.number for cue in cues] == [1.5, 1.75, 2.0]
+    cues.clear()
+    assert cues.get(1.5, 0) is None and not cues
+
+
+def test_groups_index() -> None:
+    """Groups stay sorted and indexed on insertion and removal."""
+    groups = Groups(MagicMock())
+    for index in (4.0, 1.0, 2.5):
+        groups.add(Group(index, {}))
+    assert [group.index for group in groups] == [1.0, 2.5, 4.0]
+    assert groups.get(2.5) is groups[1]
+    assert groups.get_next_index() == 5.0
+
+    groups.remove(groups[1])
+    assert groups.get(2.5) is None
+    assert groups.pop(-1).index == 4.0
+    assert groups.get(4.0) is None
+    groups.add(Group(3.0, {}))
+    assert [group.index for group in groups] == [1.0, 3.0]
+    del groups[0]
+    assert groups.get(1.0) is None and groups.get(3.0) is groups[0]
+
+
+def test_chasers_index() -> None:
+    """Chasers are found by number after list changes."""
+    chasers = Chasers()
+    first, second = Sequence(2, "Chaser"), Sequence(5, "Chaser")
+    chasers.append(first)
+    chasers.append(second)
+    assert chasers.get(5) is second
+    chasers.remove(second)
+    assert chasers.get(5) is None
+    chasers.insert(0, second)
+    assert chasers.get(5) is second and chasers.get(2) is first
+    del chasers[:]
+    assert chasers.get(2) is None
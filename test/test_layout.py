@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+# pylint: disable=protected-access, redefined-outer-name
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from olc.core.lightshow import LightShow
+from olc.cue import CUE_STORE, Cue
+from olc.define import MAX_CHANNELS, UNIVERSES
+from olc.dmx import Dmx
+from olc.layout import LAYOUT, ShowLayout
+
+
+@pytest.fixture
+def lightshow() -> Iterator[LightShow]:
+    """Light show, the default layout is restored after the test"""
+    yield LightShow()
+    LAYOUT.resize(UNIVERSES, MAX_CHANNELS)
+
+
+def test_layout_checks() -> None:
+    """Channels must fit in the outputs of distinct universes"""
+    layout = ShowLayout([3, 1], 1024)
+    assert layout.universe_index(1) == 1
+    assert layout.outputs == 1024
+    with pytest.raises(ValueError):
+        layout.universe_index(2)
+    with pytest.raises(ValueError):
+        layout.resize([1, 2], 1025)
+    with pytest.raises(ValueError):
+        layout.resize([1, 1], 512)
+    with pytest.raises(ValueError):
+        layout.resize([], 1)
+    calls = []
+    layout.connect(lambda: calls.append(layout.max_channels))
+    assert layout.resize([1], 10)
+    assert not layout.resize([1], 10)
+    assert calls == [10]
+
+
+def test_set_layout_resizes_show(lightshow: LightShow) -> None:
+    """Show arrays follow the layout, removed channels are unpatched"""
+    lightshow.set_layout(range(1, 33), 16384)
+    assert lightshow.max_channels == 16384
+    assert len(lightshow.independents.dmx) == 16384
+    assert len(CUE_STORE.levels[0]) == 16384
+    lightshow.patch.add_output(16384, 512, 32)
+    lightshow.patch.update_numpy_cache_if_dirty()
+    assert lightshow.patch.is_patched_mask[16383]
+
+    lightshow.set_layout([1, 2], 600)
+    assert lightshow.universes == [1, 2]
+    assert len(lightshow.patch.channels) == 600
+    assert 32 not in lightshow.patch.outputs
+    lightshow.patch.update_numpy_cache_if_dirty()
+    assert len(lightshow.patch.is_patched_mask) == 600
+    # Channels 1-600 are still patched 1:1
+    assert lightshow.patch.patched_channels[-1] == 599
+
+
+def test_cue_levels_survive_layout_change(lightshow: LightShow) -> None:
+    """Cue levels outside of the layout are kept and played again"""
+    lightshow.set_layout(range(1, 33), 8192)
+    cue = Cue(1, 1.0, {1: 10, 8000: 200})
+    assert cue.channels_array[7999] == 200
+    lightshow.set_layout(UNIVERSES, MAX_CHANNELS)
+    assert len(cue.channels_array) == MAX_CHANNELS
+    assert cue.channels == {1: 10, 8000: 200}
+    lightshow.set_layout(range(1, 17), 8000)
+    assert cue.channels_array[7999] == 200
+    assert cue.channels == {1: 10, 8000: 200}
+
+
+def test_dmx_follows_layout(lightshow: LightShow) -> None:
+    """Frames of all universes, only patched channels are rendered"""
+    lightshow.main_playback = MagicMock(on_go=False)
+    with patch("olc.dmx.RepeatedTimer"):
+        dmx = Dmx(backend=None, lightshow=lightshow)
+    lightshow.set_layout(range(1, 33), 16384)
+    assert len(dmx.frame) == 32
+    assert len(dmx.levels["user"]) == 16384
+    assert dmx.levels["user"][-1] == -1
+
+    lightshow.patch.patch_empty()
+    lightshow.patch.add_output(16000, 7, 32)
+    dmx.levels["sequence"][:] = 100
+    dmx.levels["sequence"][15999] = 255
+    dmx.set_levels()
+    assert dmx.frame[31][6] == 255
+    assert not np.any(np.concatenate(dmx.frame[:31]))
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for MIDI input lookup tables and fader coalescing."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import mido
+from olc.midi.control_change import MidiControlChanges
+from olc.midi.dispatch import IdleCoalescer
+from olc.midi.pitchwheel import MidiPitchWheel
+
+
+def test_coalescer_keeps_latest_value() -> None:
+    """Only the last callback of each key is called, once"""
+    calls = []
+    pending = IdleCoalescer()
+    with patch("olc.midi.dispatch.GLib.idle_add") as mock_idle_add:
+        for value in range(5):
+            pending.post("fader_1", calls.append, ("fader_1", value))
+        pending.post("fader_2", calls.append, ("fader_2", 0))
+        mock_idle_add.assert_called_once_with(pending.flush)
+    assert pending.flush() is False
+    assert calls == [("fader_1", 4), ("fader_2", 0)]
+    assert pending.coalesced == 4
+    assert not pending.flush()
+    assert len(calls) == 2
+
+
+def test_control_change_faders_are_coalesced() -> None:
+    """Fader moves are coalesced, relative controls are not"""
+    control_change = MidiControlChanges(MagicMock(), MagicMock())
+    control_change.control_change["fader_3"] = [1, 7]
+    with (
+        patch("olc.midi.control_change.GLib.idle_add") as mock_idle_add,
+        patch.object(control_change, "_function_fader") as mock_fader,
+    ):
+        for value in (10, 20, 30):
+            control_change.scan(
+                "port",
+                mido.Message("control_change", channel=1, control=7, value=value),
+            )
+        for value in (1, 2):
+            control_change.scan(
+                "port",
+                mido.Message("control_change", channel=0, control=16, value=value),
+            )
+        # One flush of the faders, each knob step
+        assert mock_idle_add.call_count == 3
+        control_change.pending.flush()
+    mock_fader.assert_called_once()
+    msg, index = mock_fader.call_args[0]
+    assert (msg.value, index) == (30, 3)
+
+
+def test_pitchwheel_moves_first_fader_of_channel() -> None:
+    """Faders of the other pages learnt on the same channel are ignored"""
+    pitchwheel = MidiPitchWheel(MagicMock(), MagicMock())
+    with (
+        patch("olc.midi.dispatch.GLib.idle_add"),
+        patch.object(pitchwheel, "_update_fader") as mock_update,
+    ):
+        pitchwheel.scan(mido.Message("pitchwheel", channel=2, pitch=100))
+        pitchwheel.pending.flush()
+        mock_update.assert_called_once()
+        assert mock_update.call_args[0][1] == 2
+        pitchwheel.reset()
+        pitchwheel.scan(mido.Message("pitchwheel", channel=2, pitch=100))
+        pitchwheel.pending.flush()
+        mock_update.assert_called_once()
@@ -66,13 +66,12 @@ def test_midi_notes_scan_cc() -> None:
 
     # Scan a CC message
     msg_scan = mido.Message("control_change", channel=1, control=50, value=127)
-    with patch.object(notes, "_dispatch") as mock_dispatch:
+    with patch.object(notes, "go") as mock_go:
         notes.scan_cc(msg_scan)
 
-        # _dispatch should be called with the action name and a simulated note message
-        mock_dispatch.assert_called_once()
-        key, simulated_msg = mock_dispatch.call_args[0]
-        assert key == "playback.go"
+        # The go handler is called with a simulated note message
+        mock_go.assert_called_once()
+        simulated_msg = mock_go.call_args[0][0]
         assert simulated_msg.type == "note_on"
         assert simulated_msg.velocity == 127
         assert simulated_msg.channel == 1
@@ -159,3 +158,28 @@ def test_midi_notes_send_cc_prioritized() -> None:
     assert sent_msg.channel == 1
     assert sent_msg.control == 50
     assert sent_msg.value == 127
+
+
+def test_midi_notes_lookup_follows_mapping() -> None:
+    """Notes are looked up by (channel, note), the table follows the mapping"""
+    app = MagicMock()
+    app.core.lightshow.fader_bank.active_page = 2
+    notes = MidiNotes(MagicMock(), app)
+    with (
+        patch.object(notes, "go") as mock_go,
+        patch.object(notes, "flash") as mock_flash,
+    ):
+        notes.scan(mido.Message("note_on", channel=0, note=94, velocity=127))
+        mock_go.assert_called_once()
+        # Flash 2 of each page is on note 25, only the active page flashes
+        notes.scan(mido.Message("note_on", channel=0, note=25, velocity=127))
+        assert mock_flash.call_args[0][1] == 2
+        mock_flash.assert_called_once()
+
+        notes.notes["playback.go"] = [3, 10]
+        notes.scan(mido.Message("note_on", channel=0, note=94, velocity=127))
+        notes.scan(mido.Message("note_on", channel=3, note=10, velocity=127))
+        assert mock_go.call_count == 2
+        notes.reset()
+        notes.scan(mido.Message("note_on", channel=3, note=10, velocity=127))
+        assert mock_go.call_count == 2
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the MIDI output worker."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import mido
+import pytest
+from olc.midi.send import LCD_HEADER, MidiSend
+
+
+class _Port:
+    """MIDI port recording the sent messages"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.port = MagicMock()
+        self.sent: list[mido.Message] = []
+        self.event = threading.Event()
+        self.port.send.side_effect = self._send
+
+    def _send(self, msg: mido.Message) -> None:
+        self.sent.append(msg)
+        self.event.set()
+
+
+@pytest.fixture
+def port() -> _Port:
+    """A MIDI port"""
+    return _Port("Controller")
+
+
+@pytest.fixture
+def send(port: _Port) -> Iterator[MidiSend]:
+    """MIDI output worker sending to one port"""
+    midi_send = MidiSend(MagicMock(ports=[port]))
+    yield midi_send
+    midi_send.stop()
+
+
+def _wait(send: MidiSend, queued: int) -> None:
+    """Wait until the worker sent `queued` messages"""
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline:
+        stats = send.stats()
+        if stats["queued"] == queued and stats["depth"] == 0:
+            time.sleep(0.01)
+            return
+        time.sleep(0.001)
+    raise TimeoutError
+
+
+def test_feedback_deduplicated(send: MidiSend, port: _Port) -> None:
+    """A value already sent on a control is dropped, until the control moves"""
+    for pitch in (100, 100, 200, 200):
+        send.enqueue(mido.Message("pitchwheel", channel=1, pitch=pitch))
+    send.enqueue(mido.Message("control_change", channel=0, control=48, value=3))
+    _wait(send, 5)
+    assert [msg.type for msg in port.sent] == [
+        "pitchwheel",
+        "pitchwheel",
+        "control_change",
+    ]
+    assert send.stats()["deduplicated"] == 2
+
+    # Fader moved by hand, the feedback moves it back
+    send.received(port, mido.Message("pitchwheel", channel=1, pitch=-5))
+    send.enqueue(mido.Message("pitchwheel", channel=1, pitch=200))
+    _wait(send, 6)
+    assert port.sent[-1].pitch == 200
+
+    send.forget()
+    send.enqueue(mido.Message("control_change", channel=0, control=48, value=3))
+    _wait(send, 7)
+    assert len(port.sent) == 5
+
+
+def test_lcd_texts_merged(send: MidiSend, port: _Port) -> None:
+    """Only the changed characters of the LCD are sent"""
+    header = list(LCD_HEADER)
+    send.enqueue(mido.Message("sysex", data=header + [0] + [ord(c) for c in "Fader1|"]))
+    _wait(send, 1)
+    with send._cond:  # pylint: disable=protected-access
+        send.enqueue(
+            mido.Message("sysex", data=header + [0] + [ord(c) for c in "Fader1|"])
+        )
+        send.enqueue(
+            mido.Message("sysex", data=header + [5] + [ord(c) for c in "9|Other"])
+        )
+    _wait(send, 3)
+    assert len(port.sent) == 2
+    # "1" became "9", "|" did not change but is between changed characters
+    assert list(port.sent[1].data) == header + [5] + [ord(c) for c in "9|Other"]
+    assert send.stats()["lcd_batches"] == 2
+
+
+def test_failed_send_not_recorded(send: MidiSend, port: _Port) -> None:
+    """Feedback that could not be sent is sent again with the same value"""
+    record = port.port.send.side_effect
+    failures = [OSError("Port unplugged")]
+
+    def unplugged_once(msg: mido.Message) -> None:
+        if failures:
+            raise failures.pop()
+        record(msg)
+
+    port.port.send.side_effect = unplugged_once
+    send.enqueue(mido.Message("control_change", channel=0, control=48, value=3))
+    _wait(send, 1)
+    assert not port.sent
+    send.enqueue(mido.Message("control_change", channel=0, control=48, value=3))
+    _wait(send, 2)
+    assert len(port.sent) == 1
+    send.enqueue(mido.Message("control_change", channel=0, control=48, value=3))
+    _wait(send, 3)
+    assert len(port.sent) == 1
+    assert send.stats()["deduplicated"] == 1
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Binary show container"""
+
+import json
+import mmap
+import pathlib
+
+import numpy as np
+import pytest
+from olc.cue import Cue, PackedLevels
+from olc.files.file_type import FileType, show_file_type
+from olc.files.olc.binary import (
+    binary_to_json,
+    json_to_binary,
+    pack_show,
+    unpack_show,
+)
+
+SHOW = {
+    "application": "olc",
+    "version": "0.8.5.beta",
+    "patch": {1: [{"output": 1, "universe": 1}]},
+    "sequences": {
+        1: {
+            "label": "Main Playback",
+            "steps": {1: {"cue": 1.0, "time_in": 5.0, "time_out": 5.0}},
+            "cues": {1.0: {"label": "Entrée", "channels": {7: 255, 3: 12, 20: 0}}},
+        },
+        2: {"label": "Chaser", "steps": {}, "cues": {}},
+    },
+    "cues": {2.5: {"label": "Preset", "channels": {1: 1}}, 3.0: {"channels": {}}},
+    "groups": {1: {"label": "Group", "channels": [1, 2]}},
+}
+
+
+def test_pack_unpack() -> None:
+    """Cue levels are stored as packed arrays"""
+    show = unpack_show(pack_show(SHOW))
+    levels = show["sequences"]["1"]["cues"]["1.0"]["channels"]
+    assert isinstance(levels, PackedLevels)
+    assert levels.channels.dtype == np.dtype("<u2")
+    assert levels.levels.dtype == np.uint8
+    assert levels.to_dict() == {7: 255, 3: 12, 20: 0}
+    assert list(levels) == [7, 3, 20]
+    assert levels[3] == 12
+    with pytest.raises(KeyError):
+        _ = levels[4]
+    assert show["cues"]["2.5"]["channels"].to_dict() == {1: 1}
+    assert not show["cues"]["3.0"]["channels"]
+    assert show["groups"] == {"1": {"label": "Group", "channels": [1, 2]}}
+    # Input is not modified
+    assert SHOW["cues"][2.5]["channels"] == {1: 1}
+
+
+def test_json_round_trip() -> None:
+    """Binary and JSON shows convert losslessly"""
+    text = json.dumps(SHOW, indent=2, ensure_ascii=False)
+    binary = json_to_binary(text)
+    assert binary_to_json(binary) == text
+    assert json_to_binary(binary_to_json(binary)) == binary
+
+
+def test_memory_map(tmp_path: pathlib.Path) -> None:
+    """Cue blocks are views of the mapped file, loaded into the cue array"""
+    path = tmp_path / "show.olcb"
+    path.write_bytes(pack_show(SHOW))
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    show = unpack_show(buffer)
+    levels = show["sequences"]["1"]["cues"]["1.0"]["channels"]
+    assert not levels.channels.flags.owndata
+    cue = Cue(1, 1.0, levels)
+    assert cue.channels == {7: 255, 3: 12, 20: 0}
+    assert cue.channels_array[6] == 255
+    assert cue.channels_array[2] == 12
+    assert cue.channels_array.sum() == 267
+    del show, levels
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b"OLCX" + bytes(16), pack_show(SHOW)[:-4], pack_show(SHOW)[:30]]
+)
+def test_invalid(data: bytes) -> None:
+    """Invalid or truncated shows raise ValueError"""
+    with pytest.raises(ValueError):
+        unpack_show(data)
+
+
+def test_file_type() -> None:
+    """File types from names"""
+    assert FileType.from_name("show.asc") is FileType.ASCII
+    assert FileType.from_name("Show.OLC") is FileType.OLC
+    assert FileType.from_name("show.olcb") is FileType.OLC_BINARY
+    assert FileType.from_name("show.txt") is None
+    assert show_file_type("show.olcb") is FileType.OLC_BINARY
+    assert show_file_type("show") is FileType.OLC
+    assert show_file_type(None) is FileType.OLC
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the DMX patch store."""
+
+import numpy as np
+import pytest
+from olc.patch import DMXPatch
+
+
+def test_patch_1on1_views() -> None:
+    """Default patch is 1:1, channels and outputs are views of the tables"""
+    patch = DMXPatch([1, 2], 600)
+    assert patch.channels[1] == [[1, 1]]
+    assert patch.channels[513] == [[1, 2]]
+    assert patch.outputs[2][88] == [600, 0]
+    assert 89 not in patch.outputs[2]
+    assert len(patch.outputs[2]) == 88
+    assert list(patch.outputs) == [1, 2]
+    assert len(patch.channels) == 600
+    with pytest.raises(KeyError):
+        _ = patch.channels[601]
+
+
+def test_add_output_moves_output() -> None:
+    """An output belongs to one channel, channels keep their outputs sorted"""
+    patch = DMXPatch([1, 2], 1024)
+    patch.patch_empty()
+    assert not patch.outputs
+    patch.add_output(5, 10, 2, 3)
+    patch.add_output(5, 1, 1)
+    assert patch.channels[5] == [[1, 1], [10, 2]]
+    patch.add_output(7, 10, 2)
+    assert patch.channels[5] == [[1, 1]]
+    assert patch.get_output(10, 2) == (7, 0)
+    assert patch.is_patched(7)
+    assert not patch.is_patched(0)
+    with pytest.raises(ValueError):
+        patch.unpatch(5, 10, 2)
+    with pytest.raises(ValueError):
+        patch.add_output(5, 1, 3)
+    patch.unpatch(5, 1, 1)
+    assert patch.channels[5] == [[None, None]]
+    assert list(patch.outputs) == [2]
+
+
+def test_cache_is_a_csr_index() -> None:
+    """Compiled arrays are sorted by channel and indexed by channel_indptr"""
+    patch = DMXPatch([1, 2], 1024)
+    patch.patch_empty()
+    patch.add_output(3, 512, 2)
+    patch.add_output(1, 7, 1)
+    patch.add_output(3, 2, 1)
+    patch.update_numpy_cache_if_dirty()
+    assert patch.map_src_channels.tolist() == [0, 2, 2]
+    assert patch.map_dst_flat.tolist() == [6, 1, 1023]
+    assert patch.channel_indptr[:5].tolist() == [0, 1, 1, 3, 3]
+    assert patch.patched_channels.tolist() == [0, 2]
+    assert patch.get_last_patched_channel() == 3
+
+
+def test_edits_are_moved_in_cache() -> None:
+    """Edits update the cached arrays as a rebuild from the tables would"""
+    rng = np.random.default_rng(3)
+    patch = DMXPatch([1, 2, 5], 300)
+    patch.update_numpy_cache_if_dirty()
+    for _ in range(200):
+        for _ in range(rng.integers(1, 4)):
+            output = int(rng.integers(1, 513))
+            univ = int(rng.choice(patch.universes))
+            channel = patch.get_output(output, univ)
+            if channel is not None and rng.random() < 0.4:
+                patch.unpatch(channel[0], output, univ)
+            else:
+                curve = int(rng.choice([0, 0, 3, 7]))
+                patch.add_output(int(rng.integers(1, 301)), output, univ, curve)
+        patch.update_numpy_cache_if_dirty()
+        cached = [
+            patch.map_dst_flat,
+            patch.map_src_channels,
+            patch.map_dst_universes,
+            patch.channel_indptr,
+            patch.patched_channels,
+            patch.map_curve_numbers[patch.map_lut_offsets // 256],
+        ]
+        patch.invalidate_cache()
+        patch.update_numpy_cache_if_dirty()
+        rebuilt = [
+            patch.map_dst_flat,
+            patch.map_src_channels,
+            patch.map_dst_universes,
+            patch.channel_indptr,
+            patch.patched_channels,
+            patch.map_curve_numbers[patch.map_lut_offsets // 256],
+        ]
+        for array, expected in zip(cached, rebuilt):
+            np.testing.assert_array_equal(array, expected)
+
+
+def test_curve_changes_keep_outputs() -> None:
+    """Curve edits only update the curves of the compiled arrays"""
+    patch = DMXPatch([1], 512)
+    patch.update_numpy_cache_if_dirty()
+    flat = patch.map_dst_flat
+    patch.set_curve(3, 1, 2)
+    patch.update_numpy_cache_if_dirty()
+    assert patch.map_dst_flat is flat
+    assert patch.map_curve_numbers.tolist() == [0, 2]
+    assert patch.map_lut_offsets[2] == 256
+    patch.replace_curve(2, 0)
+    assert patch.outputs[1][3] == [3, 0]
+    patch.patch_empty()
+    with pytest.raises(ValueError):
+        patch.set_curve(3, 1, 2)
+
+
+def test_resize_keeps_universes() -> None:
+    """Outputs of kept universes stay patched, removed channels are unpatched"""
+    patch = DMXPatch([1, 2], 1024)
+    patch.resize([2, 3], 600)
+    assert patch.channels[513] == [[1, 2]]
+    assert patch.channels[1] == [[None, None]]
+    assert 89 not in patch.outputs[2]
+    assert np.count_nonzero(patch.channel_counts) == 88
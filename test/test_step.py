@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+from olc.channel_time import ChannelTime
+from olc.step import Step
+
+
+def test_step_channel_times() -> None:
+    """Test that channel times are compiled once, until the times change."""
+    step = Step(1, channel_time={3: ChannelTime(1.0, 2.0)})
+    mask, delays, times = step.channel_times()
+    assert mask.nonzero()[0].tolist() == [2]
+    assert delays[2] == 1000.0
+    assert times[2] == 2000.0
+    assert step.channel_times()[0] is mask
+
+    step.channel_time[3].time = 4.0
+    step.update_total_time()
+    mask, _delays, times = step.channel_times()
+    assert times[2] == 4000.0
+
+    step.channel_time[5] = ChannelTime(0.0, 1.0)
+    assert step.channel_times()[0].nonzero()[0].tolist() == [2, 4]
+
+    # Same number of channel times, another channel
+    del step.channel_time[3]
+    step.channel_time[7] = ChannelTime(0.0, 3.0)
+    mask, _delays, times = step.channel_times()
+    assert mask.nonzero()[0].tolist() == [4, 6]
+    assert times[6] == 3000.0
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Streaming reading of show files"""
+
+import gzip
+import io
+import json
+import pathlib
+
+import pytest
+from olc.files.stream import (
+    detect_encoding,
+    iter_json_members,
+    open_show,
+    open_text,
+)
+
+
+def test_detect_encoding() -> None:
+    """Encoding is detected on the prefix, ASCII is read as UTF-8"""
+    assert detect_encoding(b"CUE 1\nTEXT Cue\n") == "utf-8"
+    text = "TEXT Entrée Public, Noir Salle à la vidéo\n" * 20
+    assert detect_encoding(text.encode("utf-8")) == "utf_8"
+    # A multi-byte character cut at the end of the prefix is ignored
+    assert detect_encoding(text.encode("utf-8") + "é".encode("utf-8")[:1]) == "utf_8"
+
+
+def test_open_text() -> None:
+    """The prefix is replayed before the rest of the stream"""
+    contents = "".join(f"CUE {i}\n$$TEXT Entrée {i}\n" for i in range(1000))
+    text = open_text(io.BytesIO(contents.encode("utf-8")), prefix_size=100)
+    assert list(text) == contents.splitlines(keepends=True)
+
+
+def test_open_show(tmp_path: pathlib.Path) -> None:
+    """Compressed shows are decoded while read"""
+    path = tmp_path / "show.olc"
+    with gzip.open(path, "wb") as f:
+        f.write(b'{"application": "olc"}')
+    with open_show(str(path), compressed=True) as text:
+        assert text.read() == '{"application": "olc"}'
+    plain = tmp_path / "show.asc"
+    plain.write_text("CUE 1\n", encoding="utf-8")
+    with pytest.raises(gzip.BadGzipFile):
+        open_show(str(plain), compressed=True)
+
+
+@pytest.mark.parametrize("depth", [0, 3])
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+def test_iter_json_members(chunk_size: int, depth: int) -> None:
+    """Members are decoded one by one, whatever the chunk boundaries"""
+    data = {
+        "application": "olc",
+        "version": 1234567890,
+        "ratio": -12.5e3,
+        "patch": {"1": [{"output": 1, "universe": 0}]},
+        "sequences": {"1": {"label": "Entrée", "cues": {"1.0": {"1": 255}}}},
+        "empty": {},
+        "flag": True,
+        "none": None,
+    }
+    text = io.StringIO(json.dumps(data, indent=4))
+    members = list(iter_json_members(text, chunk_size=chunk_size, depth=depth))
+    assert members == list(data.items())
+
+
+def test_iter_json_members_hook() -> None:
+    """object_hook applies to the member values, streamed or not"""
+    text = io.StringIO('{"cues": {"1": {"2": {"4": 5}}}}')
+
+    def hook(obj: dict) -> dict:
+        return {int(k): v for k, v in obj.items()}
+
+    assert dict(iter_json_members(text, object_hook=hook)) == {"cues": {1: {2: {4: 5}}}}
+
+
+@pytest.mark.parametrize(
+    "contents",
+    ["", "[1, 2]", '{"a": 1', '{"a": {"b": 1}', '{"a" 1}', '{"a": 1 "b": 2}', "{1: 2}"],
+)
+def test_iter_json_members_invalid(contents: str) -> None:
+    """Invalid or truncated JSON raises JSONDecodeError"""
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_members(io.StringIO(contents), chunk_size=2))
+
+
+def test_iter_json_members_empty() -> None:
+    """Empty object"""
+    assert not list(iter_json_members(io.StringIO(" { } ")))
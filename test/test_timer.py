@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Open Lighting Console
+# Copyright (c) 2026 Mika Cousin <mika.cousin@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the timers scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Iterator
+
+import pytest
+from olc.timer import SCHEDULER, RepeatedTimer, Scheduler
+
+
+@pytest.fixture
+def scheduler() -> Iterator[Scheduler]:
+    """A scheduler, stopped after the test"""
+    sched = Scheduler("TestScheduler")
+    yield sched
+    sched.stop()
+
+
+def test_call_later_and_every(scheduler: Scheduler) -> None:
+    """Jobs run on one thread, cancelled ones are not called"""
+    called = threading.Event()
+    ticks: list[float] = []
+    threads: set[str] = set()
+    scheduler.call_later(0.01, called.set)
+    cancelled = scheduler.call_later(0.01, ticks.append, -1.0)
+    cancelled.cancel()
+
+    def tick() -> None:
+        threads.add(threading.current_thread().name)
+        ticks.append(time.monotonic())
+
+    job = scheduler.call_every(0.01, tick)
+    assert called.wait(1.0)
+    time.sleep(0.1)
+    job.cancel()
+    count = len(ticks)
+    time.sleep(0.05)
+    assert len(ticks) == count
+    assert count >= 3
+    assert -1.0 not in ticks
+    assert threads == {"TestScheduler"}
+    assert scheduler.jobs == 0
+    with pytest.raises(ValueError):
+        scheduler.call_every(0, tick)
+
+
+def test_earlier_job_wakes_thread(scheduler: Scheduler) -> None:
+    """A job due before the one the thread waits for is not delayed"""
+    called = threading.Event()
+    scheduler.call_later(10.0, called.set)
+    start = time.monotonic()
+    scheduler.call_later(0.01, called.set)
+    assert called.wait(1.0)
+    assert time.monotonic() - start < 0.5
+    assert scheduler.jobs == 1
+
+
+def test_overrun_skips_missed_periods(scheduler: Scheduler) -> None:
+    """A periodic call longer than its period skips the missed periods"""
+    done = threading.Event()
+    runs: list[float] = []
+
+    def slow() -> None:
+        runs.append(time.monotonic())
+        if len(runs) == 1:
+            time.sleep(0.055)
+        elif len(runs) == 3:
+            done.set()
+
+    job = scheduler.call_every(0.02, slow)
+    assert done.wait(1.0)
+    job.cancel()
+    assert job.overruns >= 1
+    assert job.skipped >= 2
+    # No burst of late calls after the overrun
+    assert runs[2] - runs[1] > 0.01
+    stats = scheduler.stats()
+    assert stats["overruns"] == job.overruns
+    assert stats["skipped"] == job.skipped
+    assert stats["jitter"]["count"] == stats["runs"] >= 3
+    assert stats["duration"]["max"] >= 0.05
+
+
+def test_error_does_not_stop_job(scheduler: Scheduler) -> None:
+    """An exception is reported and the job keeps running"""
+    done = threading.Event()
+    runs: list[int] = []
+
+    def failing() -> None:
+        runs.append(1)
+        if len(runs) == 3:
+            done.set()
+        raise RuntimeError("Boom")
+
+    job = scheduler.call_every(0.01, failing)
+    assert done.wait(1.0)
+    job.cancel()
+    assert scheduler.stats()["errors"] >= 2
+
+
+def test_repeated_timer_uses_shared_scheduler() -> None:
+    """RepeatedTimer runs on the shared scheduler thread until stopped"""
+    threads: list[str] = []
+    called = threading.Event()
+
+    def tick(value: int, key: str = "") -> None:
+        threads.append(f"{threading.current_thread().name}:{value}:{key}")
+        called.set()
+
+    timer = RepeatedTimer(0.01, tick, 1, key="a")
+    assert timer.is_running
+    assert called.wait(1.0)
+    timer.stop()
+    assert not timer.is_running
+    count = len(threads)
+    time.sleep(0.05)
+    assert len(threads) == count
+    assert threads[0] == f"{SCHEDULER.name}:1:a"